@@ -0,0 +1,139 @@
+"""Sync vs async database stack benchmark.
+
+Serves the same read workload (`GET /users/{id}` over seeded users) through
+the sync router (threadpool + Session) and the async router (event loop +
+AsyncSession), in-process, and reports throughput and latency percentiles at
+increasing concurrency. Requires DATABASE_URL to point at PostgreSQL.
+
+Usage (from the project root):
+
+    python -m benchmarks.database_stacks --seed 1000 --concurrency 10 50 200
+"""
+import argparse
+import asyncio
+import itertools
+import time
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import func, insert, select
+
+from tech.api import async_users_router, users_router
+from tech.domain.security import get_cpf_blind_index
+from tech.infra.databases.database import (
+    dispose_async_engine,
+    engine,
+    get_async_engine,
+    get_pool_stats,
+)
+from tech.infra.metrics import percentile
+from tech.infra.repositories.sql_alchemy_models import SQLAlchemyUser
+
+
+def build_app(router) -> FastAPI:
+    app = FastAPI()
+    app.include_router(router.router, prefix='/users')
+    return app
+
+
+def seed_users(count: int) -> list:
+    """
+    Makes sure at least `count` users exist and returns their ids.
+
+    Args:
+        count (int): The number of users the workload reads from.
+
+    Returns:
+        list: Ids of up to `count` users.
+    """
+    with engine.begin() as connection:
+        existing = connection.scalar(select(func.count()).select_from(SQLAlchemyUser))
+        rows = [
+            {
+                'username': f'bench{n}',
+                'email': f'bench{n}@example.com',
+                'password': 'not-a-real-hash',
+                'cpf': f'{n:011d}',
+                'cpf_index': get_cpf_blind_index(f'{n:011d}'),
+            }
+            for n in range(existing, count)
+        ]
+        if rows:
+            connection.execute(insert(SQLAlchemyUser), rows)
+        return list(connection.scalars(select(SQLAlchemyUser.id).limit(count)))
+
+
+async def run_level(app: FastAPI, ids: list, concurrency: int, requests: int) -> dict:
+    """
+    Sends `requests` GETs with `concurrency` callers in flight.
+
+    Args:
+        app (FastAPI): The application under test.
+        ids (list): User ids to read, cycled through.
+        concurrency (int): The number of concurrent callers.
+        requests (int): The total number of requests.
+
+    Returns:
+        dict: Throughput, latency percentiles and failed requests.
+    """
+    transport = httpx.ASGITransport(app=app)
+    user_ids = itertools.cycle(ids)
+    durations = []
+    failures = 0
+
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        async def caller(share: int):
+            nonlocal failures
+            for _ in range(share):
+                started = time.perf_counter()
+                response = await client.get(f'/users/{next(user_ids)}')
+                durations.append(time.perf_counter() - started)
+                failures += response.status_code != 200
+
+        shares = [requests // concurrency + (n < requests % concurrency)
+                  for n in range(concurrency)]
+        started = time.perf_counter()
+        await asyncio.gather(*(caller(share) for share in shares))
+        elapsed = time.perf_counter() - started
+
+    durations.sort()
+    return {
+        'requests_per_sec': requests / elapsed,
+        'p50_ms': percentile(durations, 0.50) * 1000,
+        'p99_ms': percentile(durations, 0.99) * 1000,
+        'failures': failures,
+    }
+
+
+async def run(args) -> None:
+    ids = seed_users(args.seed)
+    stacks = {
+        'sync': (build_app(users_router), lambda: get_pool_stats(engine)),
+        'async': (build_app(async_users_router), lambda: get_pool_stats(get_async_engine())),
+    }
+
+    print(f'{"stack":<6} {"conc":>5} {"req/s":>9} {"p50 ms":>9} '
+          f'{"p99 ms":>9} {"fail":>5} {"pool p99 wait ms":>17}')
+    for concurrency in args.concurrency:
+        for name, (app, pool_stats) in stacks.items():
+            level = await run_level(app, ids, concurrency, args.requests)
+            wait = pool_stats().get('checkout_wait', {}).get('p99_ms', 0.0)
+            print(f'{name:<6} {concurrency:>5} {level["requests_per_sec"]:>9.1f} '
+                  f'{level["p50_ms"]:>9.1f} {level["p99_ms"]:>9.1f} '
+                  f'{level["failures"]:>5} {wait:>17.1f}')
+    await dispose_async_engine()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seed', type=int, default=1000,
+                        help='number of users the workload reads from')
+    parser.add_argument('--concurrency', type=int, nargs='+',
+                        default=[10, 50, 200])
+    parser.add_argument('--requests', type=int, default=2000,
+                        help='requests per stack and concurrency level')
+    asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == '__main__':
+    main()
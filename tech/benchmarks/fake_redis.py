@@ -0,0 +1,104 @@
+"""In-process server speaking enough of the Redis protocol for the user cache.
+
+Supports PING, AUTH, SELECT, GET, SET (with EX/PX), DEL, SCAN (with MATCH,
+returning every match in one step) and FLUSHDB, so the Redis backend can be
+tested and benchmarked without a live Redis. `latency` adds a fixed delay to
+every reply to mimic a network hop.
+
+Usage:
+
+    with FakeRedisServer() as server:
+        backend = RedisBackend(server.url)
+"""
+import fnmatch
+import socketserver
+import threading
+import time
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b'*'):
+            return line.split()
+        parts = []
+        for _ in range(int(line[1:-2])):
+            length = int(self.rfile.readline()[1:-2])
+            parts.append(self.rfile.read(length + 2)[:-2])
+        return parts
+
+    def handle(self):
+        while True:
+            command = self._read_command()
+            if command is None:
+                return
+            reply = self.server.execute(command)
+            if self.server.latency:
+                time.sleep(self.server.latency)
+            self.wfile.write(reply)
+
+
+class FakeRedisServer(socketserver.ThreadingTCPServer):
+    """A threaded RESP server keeping its data in a dict."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0):
+        super().__init__((host, port), _Handler)
+        self.latency = latency
+        self.data = {}
+        self.commands = []
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f'redis://{host}:{port}/0'
+
+    def execute(self, command) -> bytes:
+        name, args = command[0].upper().decode(), command[1:]
+        with self._lock:
+            self.commands.append(name)
+            if name in ('PING', 'AUTH', 'SELECT', 'FLUSHDB'):
+                if name == 'FLUSHDB':
+                    self.data.clear()
+                return b'+PONG\r\n' if name == 'PING' else b'+OK\r\n'
+            if name == 'GET':
+                entry = self.data.get(args[0])
+                if entry is not None and entry[1] is not None and time.monotonic() >= entry[1]:
+                    del self.data[args[0]]
+                    entry = None
+                if entry is None:
+                    return b'$-1\r\n'
+                return b'$%d\r\n%s\r\n' % (len(entry[0]), entry[0])
+            if name == 'SET':
+                expires = None
+                if len(args) >= 4:
+                    unit = args[2].upper()
+                    expires = time.monotonic() + int(args[3]) / (1000 if unit == b'PX' else 1)
+                self.data[args[0]] = (args[1], expires)
+                return b'+OK\r\n'
+            if name == 'DEL':
+                removed = sum(self.data.pop(key, None) is not None for key in args)
+                return b':%d\r\n' % removed
+            reply = self._scan(args) if name == 'SCAN' else None
+        return reply or b"-ERR unknown command '%s'\r\n" % name.encode()
+
+    def _scan(self, args) -> bytes:
+        pattern = args[args.index(b'MATCH') + 1] if b'MATCH' in args else b'*'
+        keys = [key for key in self.data if fnmatch.fnmatchcase(key, pattern)]
+        chunks = [b'$%d\r\n%s\r\n' % (len(key), key) for key in keys]
+        return b'*2\r\n$1\r\n0\r\n*%d\r\n%s' % (len(keys), b''.join(chunks))
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,98 @@
+"""Password hashing benchmark.
+
+Reports throughput and latency percentiles of `get_password_hash` and
+`verify_password` at increasing concurrency, for a given argon2 profile.
+
+Usage (from the project root):
+
+    python -m benchmarks.hashing --profile balanced --max-concurrency 4
+    python -m benchmarks.hashing --calibrate 150
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tech.domain.security import (
+    HASH_PROFILES,
+    available_cpus,
+    calibrate_profile,
+    configure_password_hashing,
+    get_password_hash,
+    verify_password,
+)
+from tech.infra.metrics import percentile
+
+
+def run_level(operation, concurrency: int, iterations: int) -> dict:
+    """
+    Runs `iterations` calls of `operation` on `concurrency` threads.
+
+    argon2-cffi releases the GIL while hashing, so threads are enough to
+    load every core.
+
+    Args:
+        operation (Callable[[], object]): The call to benchmark.
+        concurrency (int): The number of concurrent callers.
+        iterations (int): The total number of calls.
+
+    Returns:
+        dict: Throughput and latency percentiles for this level.
+    """
+    def timed(_):
+        started = time.perf_counter()
+        operation()
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        durations = sorted(pool.map(timed, range(iterations)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        'concurrency': concurrency,
+        'ops_per_sec': iterations / elapsed,
+        'p50_ms': percentile(durations, 0.50) * 1000,
+        'p99_ms': percentile(durations, 0.99) * 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--profile', default='recommended',
+                        choices=sorted(HASH_PROFILES))
+    parser.add_argument('--calibrate', type=float, metavar='TARGET_MS',
+                        help='calibrate a profile for this per-hash target '
+                             'and benchmark it instead of --profile')
+    parser.add_argument('--max-concurrency', type=int,
+                        default=available_cpus())
+    parser.add_argument('--iterations', type=int, default=20,
+                        help='operations per concurrency level')
+    args = parser.parse_args(argv)
+
+    if args.calibrate:
+        profile = calibrate_profile(args.calibrate)
+        print(f'calibrated for {args.calibrate:g} ms: {profile}')
+    else:
+        profile = HASH_PROFILES[args.profile]
+        print(f'profile {args.profile}: {profile}')
+    configure_password_hashing(profile)
+
+    stored = get_password_hash('benchmark-password')
+    operations = {
+        'get_password_hash': lambda: get_password_hash('benchmark-password'),
+        'verify_password': lambda: verify_password('benchmark-password',
+                                                   stored),
+    }
+
+    print(f'{"operation":<18} {"conc":>4} {"ops/s":>9} '
+          f'{"p50 ms":>9} {"p99 ms":>9}')
+    for name, operation in operations.items():
+        for concurrency in range(1, args.max_concurrency + 1):
+            level = run_level(operation, concurrency, args.iterations)
+            print(f'{name:<18} {level["concurrency"]:>4} '
+                  f'{level["ops_per_sec"]:>9.1f} {level["p50_ms"]:>9.1f} '
+                  f'{level["p99_ms"]:>9.1f}')
+
+
+if __name__ == '__main__':
+    main()
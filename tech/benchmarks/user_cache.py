@@ -0,0 +1,108 @@
+"""User cache backend benchmark.
+
+Serves lookups by ID and by CPF over a key space through each cache backend
+(memory, shared-memory, redis, two-tier) and reports hit ratio, throughput and latency
+percentiles. The remote tier is an in-process fake Redis server with a
+configurable per-reply latency, so no live Redis or database is needed; every
+miss is answered by a loader that sleeps `--load-ms` to stand in for the
+database.
+
+Usage (from the project root):
+
+    python -m benchmarks.user_cache --users 10000 --lookups 50000 --latency-ms 0.3
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.fake_redis import FakeRedisServer
+from tech.domain.entities.users import User
+from tech.infra.cache.backends import MemoryBackend, TwoTierBackend
+from tech.infra.cache.memory_cache import MemoryCache
+from tech.infra.cache.redis_backend import RedisBackend
+from tech.infra.cache.shared_memory_backend import SharedMemoryBackend
+from tech.infra.cache.user_cache import UserCache
+from tech.infra.metrics import percentile
+
+
+def make_user(user_id: int) -> User:
+    return User(username=f'bench{user_id}', password='not-a-real-hash', cpf=f'{user_id:011d}',
+                email=f'bench{user_id}@example.com', id=user_id)
+
+
+def run_backend(name: str, backend, args) -> dict:
+    """
+    Runs the lookup workload through one backend.
+
+    Args:
+        name (str): The label reported for the backend.
+        backend (CacheBackend): The backend under test.
+        args (argparse.Namespace): The workload options.
+
+    Returns:
+        dict: Hit ratio, throughput and latency percentiles.
+    """
+    cache = UserCache(backend, negative_ttl=5)
+    loads = 0
+
+    def load(user_id):
+        nonlocal loads
+        loads += 1
+        time.sleep(args.load_ms / 1000)
+        return make_user(user_id)
+
+    rng = random.Random(42)
+    durations = []
+    started = time.perf_counter()
+    for _ in range(args.lookups):
+        # A skewed key choice: most lookups hit a small set of hot users.
+        user_id = int(rng.paretovariate(1.2)) % args.users + 1
+        begin = time.perf_counter()
+        if rng.random() < 0.5:
+            cache.get_by_id(user_id, lambda: load(user_id))
+        else:
+            cache.get_by_cpf(f'{user_id:011d}', lambda: load(user_id))
+        durations.append(time.perf_counter() - begin)
+    elapsed = time.perf_counter() - started
+    durations.sort()
+    return {
+        'backend': name,
+        'db_loads': loads,
+        'lookups_per_sec': args.lookups / elapsed,
+        'p50_ms': percentile(durations, 0.50) * 1000,
+        'p99_ms': percentile(durations, 0.99) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=10000)
+    parser.add_argument('--lookups', type=int, default=50000)
+    parser.add_argument('--latency-ms', type=float, default=0.3, help='Fake Redis reply latency.')
+    parser.add_argument('--load-ms', type=float, default=1.0, help='Simulated database lookup time.')
+    parser.add_argument('--max-entries', type=int, default=2000)
+    args = parser.parse_args()
+
+    segment = os.path.join(tempfile.gettempdir(), f'users-cache-bench-{os.getpid()}')
+    with FakeRedisServer(latency=args.latency_ms / 1000) as server:
+        backends = {
+            'memory': lambda: MemoryBackend(MemoryCache(args.max_entries, 60)),
+            'shared-memory': lambda: SharedMemoryBackend(segment, slots=args.max_entries * 2, ttl=60),
+            'redis': lambda: RedisBackend(server.url, ttl=60),
+            'two-tier': lambda: TwoTierBackend(
+                MemoryBackend(MemoryCache(args.max_entries, 5)), RedisBackend(server.url, ttl=60), near_ttl=5
+            ),
+        }
+        print(f"{'backend':>13} {'db loads':>9} {'lookups/s':>11} {'p50 ms':>8} {'p99 ms':>8}")
+        for name, build in backends.items():
+            server.data.clear()
+            result = run_backend(name, build(), args)
+            print(f"{result['backend']:>13} {result['db_loads']:>9} {result['lookups_per_sec']:>11.0f} "
+                  f"{result['p50_ms']:>8.3f} {result['p99_ms']:>8.3f}")
+    os.unlink(segment)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""Add cpf blind index column
+
+Revision ID: 3b8d52e1c4f7
+Revises: 9277bb2509b3
+Create Date: 2026-10-17 09:12:41.218503
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from tech.domain.security import get_cpf_index_key
+from tech.infra.databases.cpf_index_backfill import backfill_cpf_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8d52e1c4f7'
+down_revision: Union[str, None] = '9277bb2509b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('cpf_index', sa.String(length=64), nullable=True))
+
+    backfill_cpf_index(op.get_bind(), get_cpf_index_key())
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index('ix_users_cpf_index', ['cpf_index'], unique=True)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index('ix_users_cpf_index')
+        batch_op.drop_column('cpf_index')
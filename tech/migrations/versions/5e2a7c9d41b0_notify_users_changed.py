@@ -0,0 +1,54 @@
+"""Notify users_changed on every users write
+
+Revision ID: 5e2a7c9d41b0
+Revises: 3b8d52e1c4f7
+Create Date: 2026-10-17 15:40:07.512930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e2a7c9d41b0'
+down_revision: Union[str, None] = '3b8d52e1c4f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # LISTEN/NOTIFY only exists on PostgreSQL; other databases run without
+    # cross-process cache invalidation.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_users_changed() RETURNS trigger AS $$
+        DECLARE
+            changed users%ROWTYPE;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                changed := OLD;
+            ELSE
+                changed := NEW;
+            END IF;
+            PERFORM pg_notify(
+                'users_changed',
+                json_build_object('id', changed.id, 'cpf_index', changed.cpf_index)::text
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER users_changed
+        AFTER INSERT OR UPDATE OR DELETE ON users
+        FOR EACH ROW EXECUTE FUNCTION notify_users_changed()
+    """)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('DROP TRIGGER IF EXISTS users_changed ON users')
+    op.execute('DROP FUNCTION IF EXISTS notify_users_changed()')
@@ -1,18 +1,47 @@
+from contextlib import asynccontextmanager
 from http import HTTPStatus
 
 from fastapi import FastAPI
 
-from tech.api import  users_router, auth_router
+from tech.api import  users_router, async_users_router, auth_router, metrics_router
+from tech.domain.security import shutdown_hashing_service
+from tech.infra.cache.invalidation_listener import start_user_cache_listener
+from tech.infra.cache.user_cache import get_user_cache
+from tech.infra.databases.database import dispose_async_engine
+from tech.infra.settings.settings import Settings
+from tech.interfaces.gateways.cognito_gateway import get_cognito_gateway
 from tech.interfaces.schemas.message_schema import (
     Message,
 )
 
 
-app = FastAPI()
-app.include_router(users_router.router, prefix='/users', tags=['users'])
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = Settings()
+    get_cognito_gateway()
+    listener = None
+    if settings.USERS_CACHE_LISTEN:
+        listener = start_user_cache_listener(settings.DATABASE_URL, get_user_cache())
+    app.state.user_cache_listener = listener
+    yield
+    if listener is not None:
+        listener.stop()
+    get_cognito_gateway().client.close()
+    get_cognito_gateway.cache_clear()
+    shutdown_hashing_service()
+    await dispose_async_engine()
+
+
+app = FastAPI(lifespan=lifespan)
+if Settings().DATABASE_STACK == 'async':
+    app.include_router(async_users_router.router, prefix='/users', tags=['users'])
+else:
+    app.include_router(users_router.router, prefix='/users', tags=['users'])
 
 app.include_router(auth_router.router, prefix='/auth', tags=['auth'])
 
+app.include_router(metrics_router.router, prefix='/metrics', tags=['metrics'])
+
 
 
 @app.get('/', status_code=HTTPStatus.OK, response_model=Message)
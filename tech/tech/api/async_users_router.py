@@ -0,0 +1,308 @@
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from tech.domain.security import HashingService, get_hashing_service
+from tech.infra.cache.memory_cache import get_user_count_cache
+from tech.infra.cache.user_cache import UserCache, get_user_cache, stale_response_headers
+from tech.infra.databases.database import get_async_session, get_async_user_loader, get_user_exporter, settings
+from tech.infra.databases.user_export import UserExporter
+from tech.infra.repositories.user_loader import AsyncUserLoader
+from tech.interfaces.gateways.async_user_gateway import AsyncUserGateway
+from tech.interfaces.schemas.user_schema import UserBatchSchema, UserPatchSchema, UserSchema
+from tech.use_cases.users.create_user_use_case import AsyncCreateUserUseCase
+from tech.use_cases.users.bulk_import_users_use_case import AsyncBulkImportUsersUseCase
+from tech.use_cases.users.count_users_use_case import AsyncCountUsersUseCase
+from tech.use_cases.users.export_users_use_case import ExportUsersUseCase
+from tech.use_cases.users.list_users_use_case import AsyncListUsersUseCase
+from tech.use_cases.users.get_user_use_case import AsyncGetUserUseCase
+from tech.use_cases.users.get_user_by_cpf_use_case import AsyncGetUserByCpfUseCase
+from tech.use_cases.users.get_users_batch_use_case import AsyncGetUsersBatchUseCase
+from tech.use_cases.users.update_user_use_case import AsyncUpdateUserUseCase
+from tech.use_cases.users.patch_user_use_case import AsyncPatchUserUseCase
+from tech.use_cases.users.delete_user_use_case import AsyncDeleteUserUseCase
+from tech.interfaces.controllers.async_user_controller import AsyncUserController
+
+router = APIRouter()
+
+def get_async_user_controller(
+    session: AsyncSession = Depends(get_async_session),
+    hashing_service: HashingService = Depends(get_hashing_service),
+    user_loader: Optional[AsyncUserLoader] = Depends(get_async_user_loader),
+    user_cache: Optional[UserCache] = Depends(get_user_cache),
+) -> AsyncUserController:
+    """
+    Creates and injects an instance of AsyncUserController with its required dependencies.
+
+    Args:
+        session (AsyncSession): The async SQLAlchemy session for database operations.
+        hashing_service (HashingService): The shared service used to hash passwords.
+        user_loader (AsyncUserLoader): The lookup batcher, when USERS_LOOKUP_BATCHING is enabled.
+        user_cache (UserCache): The user cache, when USERS_CACHE_ENABLED is set.
+
+    Returns:
+        AsyncUserController: The controller instance containing all user-related use cases.
+    """
+    user_gateway = AsyncUserGateway(session, user_loader, user_cache, get_user_count_cache())
+    return AsyncUserController(
+        create_user_use_case=AsyncCreateUserUseCase(user_gateway, hashing_service),
+        list_users_use_case=AsyncListUsersUseCase(user_gateway, settings.USERS_PAGE_SIZE_MAX),
+        get_user_use_case=AsyncGetUserUseCase(user_gateway),
+        get_user_by_cpf_use_case=AsyncGetUserByCpfUseCase(user_gateway),
+        update_user_use_case=AsyncUpdateUserUseCase(user_gateway, hashing_service),
+        delete_user_use_case=AsyncDeleteUserUseCase(user_gateway),
+        patch_user_use_case=AsyncPatchUserUseCase(user_gateway, hashing_service),
+        count_users_use_case=AsyncCountUsersUseCase(user_gateway, settings.USERS_COUNT_EXACT_THRESHOLD),
+        bulk_import_users_use_case=AsyncBulkImportUsersUseCase(
+            user_gateway, hashing_service, settings.USERS_BULK_BATCH_SIZE
+        ),
+        get_users_batch_use_case=AsyncGetUsersBatchUseCase(user_gateway, settings.USERS_BATCH_MAX),
+    )
+
+def get_async_user_export_controller(
+    controller: AsyncUserController = Depends(get_async_user_controller),
+    user_exporter: UserExporter = Depends(get_user_exporter),
+) -> AsyncUserController:
+    """
+    Extends the user controller with the export use case.
+
+    Only the export route depends on this, so picking the replica that serves
+    the export does not happen on every other users request.
+
+    Args:
+        controller (AsyncUserController): The controller built by `get_async_user_controller`.
+        user_exporter (UserExporter): The exporter streaming users from a replica or the primary.
+
+    Returns:
+        AsyncUserController: The controller, able to export users.
+    """
+    controller.export_users_use_case = ExportUsersUseCase(user_exporter)
+    return controller
+
+@router.post("/", status_code=201)
+async def create_user(user: UserSchema, controller: AsyncUserController = Depends(get_async_user_controller)):
+    """
+    API endpoint to create a new user.
+
+    Args:
+        user (UserSchema): The user's data required for registration.
+        controller (AsyncUserController): The controller responsible for processing the request.
+
+    Returns:
+        dict: The created user's public information.
+    """
+    return await controller.create_user(user)
+
+@router.post("/bulk")
+async def bulk_import_users(
+    request: Request,
+    format: Literal['ndjson', 'csv'] = 'ndjson',
+    controller: AsyncUserController = Depends(get_async_user_controller)
+):
+    """
+    API endpoint to create many users from a streamed NDJSON or CSV body.
+
+    The body is read as it arrives and imported in batches of
+    USERS_BULK_BATCH_SIZE rows: passwords are hashed across the hashing pool and
+    each batch is merged with one statement. Rows that are invalid or clash with
+    an existing user are reported without failing the others.
+
+    Args:
+        request (Request): The request carrying one user per line.
+        format (str): 'ndjson' or 'csv' (with a header line). Defaults to 'ndjson'.
+        controller (AsyncUserController): The controller responsible for processing the request.
+
+    Returns:
+        dict: The counts per outcome and the result of every row.
+    """
+    return await controller.bulk_import_users(request.stream(), format)
+
+@router.post("/batch")
+async def get_users_batch(batch: UserBatchSchema, controller: AsyncUserController = Depends(get_async_user_controller)):
+    """
+    API endpoint to retrieve many users by ID and/or CPF in one call.
+
+    Each kind of key is resolved with a single query. Up to USERS_BATCH_MAX ids
+    and CPFs (combined) are accepted.
+
+    Args:
+        batch (UserBatchSchema): The `ids` and `cpfs` to look up.
+        controller (AsyncUserController): The controller responsible for processing the request.
+
+    Returns:
+        dict: `ids` and `cpfs`, mapping every requested key to the user's public
+        information, or to null when it was not found.
+    """
+    return await controller.get_users_batch(batch)
+
+@router.get("/count")
+async def count_users(
+    mode: Literal['auto', 'exact', 'approximate'] = 'auto',
+    controller: AsyncUserController = Depends(get_async_user_controller)
+):
+    """
+    API endpoint to count users without scanning a large table.
+
+    `approximate` reads PostgreSQL's planner statistics, `exact` runs
+    `count(*)`, and `auto` (the default) counts exactly only while the table is
+    small. Results are cached in-process for USERS_COUNT_CACHE_TTL seconds.
+
+    Args:
+        mode (str): 'auto', 'exact' or 'approximate'. Defaults to 'auto'.
+        controller (AsyncUserController): The controller responsible for processing the request.
+
+    Returns:
+        dict: The `count` and whether it is `exact`.
+    """
+    return await controller.count_users(mode)
+
+@router.get("/export")
+async def export_users(
+    format: Literal['csv', 'ndjson'] = 'csv',
+    controller: AsyncUserController = Depends(get_async_user_export_controller)
+):
+    """
+    API endpoint to export every user as CSV or NDJSON.
+
+    The body is streamed straight from the database (`COPY ... TO STDOUT` on
+    PostgreSQL) on a dedicated connection, so memory use stays flat however
+    large the table is. Password hashes are never exported.
+
+    Args:
+        format (str): 'csv' or 'ndjson'. Defaults to 'csv'.
+        controller (AsyncUserController): The controller responsible for processing the request.
+
+    Returns:
+        StreamingResponse: The users ordered by ID.
+    """
+    return await controller.export_users(format)
+
+@router.get("/{user_id}")
+async def get_user(user_id: int, response: Response, controller: AsyncUserController = Depends(get_async_user_controller)):
+    """
+    API endpoint to retrieve a user by their unique ID.
+
+    Args:
+        user_id (int): The unique identifier of the user.
+        response (Response): The response, given `Age` and `Warning` headers when
+            a stale cached user is served.
+        controller (AsyncUserController): The controller responsible for processing the request.
+
+    Returns:
+        dict: The retrieved user's public information.
+
+    Raises:
+        HTTPException: If no user is found with the given ID.
+    """
+    user = await controller.get_user(user_id)
+    response.headers.update(stale_response_headers())
+    return user
+
+@router.get("/cpf/{cpf}")
+async def get_user_by_cpf(cpf: str, response: Response, controller: AsyncUserController = Depends(get_async_user_controller)):
+    """
+    API endpoint to retrieve a user by their CPF.
+
+    Args:
+        cpf (str): The CPF (Cadastro de Pessoas Físicas) of the user.
+        response (Response): The response, given `Age` and `Warning` headers when
+            a stale cached user is served.
+        controller (AsyncUserController): The controller responsible for processing the request.
+
+    Returns:
+        dict: The retrieved user's public information.
+
+    Raises:
+        HTTPException: If no user is found with the given CPF.
+    """
+    user = await controller.get_user_by_cpf(cpf)
+    response.headers.update(stale_response_headers())
+    return user
+
+@router.get("/")
+async def list_users(
+    response: Response,
+    limit: int = 10,
+    skip: int = 0,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    controller: AsyncUserController = Depends(get_async_user_controller)
+):
+    """
+    API endpoint to retrieve a list of users with pagination.
+
+    Sending `cursor` (empty for the first page) switches to keyset pagination:
+    users are ordered by ID and the response carries the `next_cursor` to send
+    for the following page. `limit` is capped at USERS_PAGE_SIZE_MAX.
+
+    Args:
+        response (Response): The response whose headers are set.
+        limit (int): The max number of users to return. Defaults to 10.
+        skip (int): The number of users to skip before retrieving. Defaults to 0.
+            Ignored in cursor mode.
+        cursor (Optional[str]): The opaque cursor of the page to read.
+        include_total (bool): Whether to add the `auto` user count as the
+            X-Total-Count response header.
+        controller (AsyncUserController): The controller responsible for processing the request.
+
+    Returns:
+        dict: A paginated list of users, or `items` and `next_cursor` in cursor mode.
+    """
+    if include_total:
+        response.headers['X-Total-Count'] = str((await controller.count_users('auto'))['count'])
+    if cursor is not None:
+        return await controller.list_users_page(limit, cursor)
+    return await controller.list_users(limit, skip)
+
+
+@router.put("/{user_id}")
+async def update_user(user_id: int, user: UserSchema, controller: AsyncUserController = Depends(get_async_user_controller)):
+    """
+    API endpoint to update a user's information.
+
+    Args:
+        user_id (int): The unique identifier of the user.
+        user (UserSchema): The updated user information.
+        controller (AsyncUserController): The controller responsible for processing the request.
+
+    Returns:
+        dict: The updated user's public information.
+
+    Raises:
+        HTTPException: If the user is not found or if the update fails.
+    """
+    return await controller.update_user(user_id, user)
+
+@router.patch("/{user_id}")
+async def patch_user(user_id: int, user: UserPatchSchema, controller: AsyncUserController = Depends(get_async_user_controller)):
+    """
+    API endpoint to partially update a user's information.
+
+    Args:
+        user_id (int): The unique identifier of the user.
+        user (UserPatchSchema): The fields to change.
+        controller (AsyncUserController): The controller responsible for processing the request.
+
+    Returns:
+        dict: The updated user's public information.
+
+    Raises:
+        HTTPException: If the user is not found.
+    """
+    return await controller.patch_user(user_id, user)
+
+@router.delete("/{user_id}")
+async def delete_user(user_id: int, controller: AsyncUserController = Depends(get_async_user_controller)):
+    """
+    API endpoint to delete a user by their unique ID.
+
+    Args:
+        user_id (int): The unique identifier of the user.
+        controller (AsyncUserController): The controller responsible for processing the request.
+
+    Returns:
+        dict: A confirmation message indicating the user was deleted.
+
+    Raises:
+        HTTPException: If the user is not found.
+    """
+    return await controller.delete_user(user_id)
@@ -1,28 +1,26 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from tech.infra.databases.database import get_session
 from tech.interfaces.controllers.auth_controller import AuthController
 from tech.use_cases.authenticate.authenticate_user_use_case import AuthenticateUserUseCase
-from tech.interfaces.gateways.cognito_gateway import CognitoGateway
+from tech.interfaces.gateways.cognito_gateway import CognitoGateway, get_cognito_gateway
 from tech.interfaces.schemas.auth_schema import AuthRequest, AuthResponse
 
 router = APIRouter()
 
 
-def get_auth_controller(session: Session = Depends(get_session)) -> AuthController:
+def get_auth_controller(cognito_gateway: CognitoGateway = Depends(get_cognito_gateway)) -> AuthController:
     """Creates and returns an instance of the AuthController with its dependencies.
 
     This function follows the dependency injection pattern to create an AuthController
-    with all its required dependencies. It creates a CognitoGateway and an
-    AuthenticateUserUseCase, then injects them into the AuthController.
+    with all its required dependencies. It wraps the shared CognitoGateway in an
+    AuthenticateUserUseCase, then injects it into the AuthController.
 
     Args:
-        session (Session): The database session provided by FastAPI dependency injection.
+        cognito_gateway (CognitoGateway): The application-wide gateway provided by
+            FastAPI dependency injection.
 
     Returns:
         AuthController: A fully configured AuthController instance with all dependencies.
     """
-    cognito_gateway = CognitoGateway()
     authenticate_user_use_case = AuthenticateUserUseCase(cognito_gateway)
     return AuthController(authenticate_user_use_case)
 
@@ -0,0 +1,121 @@
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.orm import Session
+from tech.domain.security import HashingService, current_hash_prefix, get_hashing_service
+from tech.infra.cache.user_cache import get_user_cache
+from tech.infra.databases.database import (
+    engine,
+    get_async_engine,
+    get_async_replicas,
+    get_async_user_loader,
+    get_pool_stats,
+    get_session,
+    get_user_loader,
+    replicas,
+    settings,
+)
+from tech.interfaces.gateways.cognito_gateway import CognitoGateway, get_cognito_gateway
+from tech.interfaces.gateways.user_gateway import UserGateway
+
+router = APIRouter()
+
+
+@router.get("/hashing")
+def hashing_metrics(hashing_service: HashingService = Depends(get_hashing_service)):
+    """
+    API endpoint exposing the saturation of the password hashing backend.
+
+    Args:
+        hashing_service (HashingService): The shared password hashing service.
+
+    Returns:
+        dict: Queue depth, in-flight operations and per-hash latency.
+    """
+    return hashing_service.stats()
+
+
+@router.get("/database")
+def database_metrics():
+    """
+    API endpoint exposing the state of the database connection pool.
+
+    Returns:
+        dict: Connections in use, overflow, waiters and checkout wait times
+            of the engine serving the configured database stack, plus reads
+            served and health per replica when replicas are configured.
+    """
+    if settings.DATABASE_STACK == 'async':
+        stats, replica_set = get_pool_stats(get_async_engine()), get_async_replicas()
+    else:
+        stats, replica_set = get_pool_stats(engine), replicas
+    if replica_set:
+        stats['replicas'] = replica_set.stats()
+    return stats
+
+
+@router.get("/lookups")
+def lookup_metrics():
+    """
+    API endpoint exposing how single-user lookups are being coalesced.
+
+    Returns:
+        dict: Whether batching is enabled and, per kind of lookup, the number
+            and size of batches, duplicates shared and the latency added.
+    """
+    loader = get_async_user_loader() if settings.DATABASE_STACK == 'async' else get_user_loader()
+    if loader is None:
+        return {'enabled': False}
+    return {'enabled': True, **loader.stats()}
+
+
+@router.get("/cache")
+def cache_metrics(request: Request):
+    """
+    API endpoint exposing the effectiveness of the in-process user cache.
+
+    Returns:
+        dict: Whether the cache is enabled, its size, hit, miss, expiration
+            and eviction counters, and the state of its invalidation listener.
+    """
+    user_cache = get_user_cache()
+    if user_cache is None:
+        return {'enabled': False}
+    listener = getattr(request.app.state, 'user_cache_listener', None)
+    return {'enabled': True, **user_cache.stats(), 'listener': listener.stats() if listener else None}
+
+
+@router.get("/tokens")
+def token_metrics(cognito_gateway: CognitoGateway = Depends(get_cognito_gateway)):
+    """
+    API endpoint exposing the effectiveness of the verified-token cache.
+
+    Args:
+        cognito_gateway (CognitoGateway): The shared Cognito gateway.
+
+    Returns:
+        dict: Verified tokens cached, hit, miss, expiration and eviction
+            counters, and the number of revoked tokens.
+    """
+    return cognito_gateway.token_cache.stats()
+
+
+@router.get("/password-hashes")
+def password_hash_metrics(
+    session: Session = Depends(get_session),
+    hashing_service: HashingService = Depends(get_hashing_service),
+):
+    """
+    API endpoint reporting how many stored hashes still use legacy parameters.
+
+    Args:
+        session (Session): The SQLAlchemy session for database operations.
+        hashing_service (HashingService): The shared service, which applies the current profile.
+
+    Returns:
+        dict: The current hash parameters and the number of stale hashes left.
+    """
+    prefix = current_hash_prefix()
+    return {
+        "current_parameters": prefix,
+        "legacy_hashes": UserGateway(session).count_legacy_password_hashes(prefix),
+        "rehashed_by_this_process": hashing_service.stats()["rehashed"],
+    }
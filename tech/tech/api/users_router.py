@@ -1,38 +1,85 @@
-from fastapi import APIRouter, Depends
+from typing import Iterator, Literal, Optional
+from anyio import from_thread
+from fastapi import APIRouter, Depends, Request, Response
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from tech.infra.databases.database import get_session
+from tech.domain.security import HashingService, get_hashing_service
+from tech.infra.cache.memory_cache import get_user_count_cache
+from tech.infra.cache.user_cache import UserCache, get_user_cache, stale_response_headers
+from tech.infra.databases.database import get_session, get_user_exporter, get_user_loader, settings
+from tech.infra.databases.user_export import UserExporter
+from tech.infra.repositories.user_loader import UserLoader
 from tech.interfaces.gateways.user_gateway import UserGateway
-from tech.interfaces.schemas.user_schema import UserSchema
+from tech.interfaces.schemas.user_schema import UserBatchSchema, UserPatchSchema, UserSchema
 from tech.use_cases.users.create_user_use_case import CreateUserUseCase
+from tech.use_cases.users.bulk_import_users_use_case import BulkImportUsersUseCase
+from tech.use_cases.users.count_users_use_case import CountUsersUseCase
+from tech.use_cases.users.export_users_use_case import ExportUsersUseCase
 from tech.use_cases.users.list_users_use_case import ListUsersUseCase
 from tech.use_cases.users.get_user_use_case import GetUserUseCase
 from tech.use_cases.users.get_user_by_cpf_use_case import GetUserByCpfUseCase
+from tech.use_cases.users.get_users_batch_use_case import GetUsersBatchUseCase
 from tech.use_cases.users.update_user_use_case import UpdateUserUseCase
+from tech.use_cases.users.patch_user_use_case import PatchUserUseCase
 from tech.use_cases.users.delete_user_use_case import DeleteUserUseCase
 from tech.interfaces.controllers.user_controller import UserController
 
 router = APIRouter()
 
-def get_user_controller(session: Session = Depends(get_session)) -> UserController:
+def get_user_controller(
+    session: Session = Depends(get_session),
+    hashing_service: HashingService = Depends(get_hashing_service),
+    user_loader: Optional[UserLoader] = Depends(get_user_loader),
+    user_cache: Optional[UserCache] = Depends(get_user_cache),
+) -> UserController:
     """
     Creates and injects an instance of UserController with its required dependencies.
 
     Args:
         session (Session): The SQLAlchemy session for database operations.
+        hashing_service (HashingService): The shared service used to hash passwords.
+        user_loader (UserLoader): The lookup batcher, when USERS_LOOKUP_BATCHING is enabled.
+        user_cache (UserCache): The user cache, when USERS_CACHE_ENABLED is set.
 
     Returns:
         UserController: The controller instance containing all user-related use cases.
     """
-    user_gateway = UserGateway(session)
+    user_gateway = UserGateway(session, user_loader, user_cache, get_user_count_cache())
     return UserController(
-        create_user_use_case=CreateUserUseCase(user_gateway),
-        list_users_use_case=ListUsersUseCase(user_gateway),
+        create_user_use_case=CreateUserUseCase(user_gateway, hashing_service),
+        list_users_use_case=ListUsersUseCase(user_gateway, settings.USERS_PAGE_SIZE_MAX),
         get_user_use_case=GetUserUseCase(user_gateway),
         get_user_by_cpf_use_case=GetUserByCpfUseCase(user_gateway),
-        update_user_use_case=UpdateUserUseCase(user_gateway),
+        update_user_use_case=UpdateUserUseCase(user_gateway, hashing_service),
         delete_user_use_case=DeleteUserUseCase(user_gateway),
+        patch_user_use_case=PatchUserUseCase(user_gateway, hashing_service),
+        count_users_use_case=CountUsersUseCase(user_gateway, settings.USERS_COUNT_EXACT_THRESHOLD),
+        bulk_import_users_use_case=BulkImportUsersUseCase(
+            user_gateway, hashing_service, settings.USERS_BULK_BATCH_SIZE
+        ),
+        get_users_batch_use_case=GetUsersBatchUseCase(user_gateway, settings.USERS_BATCH_MAX),
     )
 
+def get_user_export_controller(
+    controller: UserController = Depends(get_user_controller),
+    user_exporter: UserExporter = Depends(get_user_exporter),
+) -> UserController:
+    """
+    Extends the user controller with the export use case.
+
+    Only the export route depends on this, so picking the replica that serves
+    the export does not happen on every other users request.
+
+    Args:
+        controller (UserController): The controller built by `get_user_controller`.
+        user_exporter (UserExporter): The exporter streaming users from a replica or the primary.
+
+    Returns:
+        UserController: The controller, able to export users.
+    """
+    controller.export_users_use_case = ExportUsersUseCase(user_exporter)
+    return controller
+
 @router.post("/", status_code=201)
 def create_user(user: UserSchema, controller: UserController = Depends(get_user_controller)):
     """
@@ -47,13 +94,121 @@ def create_user(user: UserSchema, controller: UserController = Depends(get_user_
     """
     return controller.create_user(user)
 
+def _body_chunks(request: Request) -> Iterator[bytes]:
+    """
+    Iterates the request body from a worker thread, pulling each chunk from the
+    event loop only when the previous one has been consumed.
+
+    Args:
+        request (Request): The request whose body is read.
+
+    Returns:
+        Iterator[bytes]: The body, chunk by chunk.
+    """
+    chunks = request.stream()
+
+    async def next_chunk():
+        return await chunks.__anext__()
+
+    while True:
+        try:
+            yield from_thread.run(next_chunk)
+        except StopAsyncIteration:
+            return
+
+@router.post("/bulk")
+async def bulk_import_users(
+    request: Request,
+    format: Literal['ndjson', 'csv'] = 'ndjson',
+    controller: UserController = Depends(get_user_controller)
+):
+    """
+    API endpoint to create many users from a streamed NDJSON or CSV body.
+
+    The body is read as it arrives and imported in batches of
+    USERS_BULK_BATCH_SIZE rows: passwords are hashed across the hashing pool and
+    each batch is merged with one statement. Rows that are invalid or clash with
+    an existing user are reported without failing the others.
+
+    Args:
+        request (Request): The request carrying one user per line.
+        format (str): 'ndjson' or 'csv' (with a header line). Defaults to 'ndjson'.
+        controller (UserController): The controller responsible for processing the request.
+
+    Returns:
+        dict: The counts per outcome and the result of every row.
+    """
+    return await run_in_threadpool(controller.bulk_import_users, _body_chunks(request), format)
+
+@router.post("/batch")
+def get_users_batch(batch: UserBatchSchema, controller: UserController = Depends(get_user_controller)):
+    """
+    API endpoint to retrieve many users by ID and/or CPF in one call.
+
+    Each kind of key is resolved with a single query. Up to USERS_BATCH_MAX ids
+    and CPFs (combined) are accepted.
+
+    Args:
+        batch (UserBatchSchema): The `ids` and `cpfs` to look up.
+        controller (UserController): The controller responsible for processing the request.
+
+    Returns:
+        dict: `ids` and `cpfs`, mapping every requested key to the user's public
+        information, or to null when it was not found.
+    """
+    return controller.get_users_batch(batch)
+
+@router.get("/count")
+def count_users(
+    mode: Literal['auto', 'exact', 'approximate'] = 'auto',
+    controller: UserController = Depends(get_user_controller)
+):
+    """
+    API endpoint to count users without scanning a large table.
+
+    `approximate` reads PostgreSQL's planner statistics, `exact` runs
+    `count(*)`, and `auto` (the default) counts exactly only while the table is
+    small. Results are cached in-process for USERS_COUNT_CACHE_TTL seconds.
+
+    Args:
+        mode (str): 'auto', 'exact' or 'approximate'. Defaults to 'auto'.
+        controller (UserController): The controller responsible for processing the request.
+
+    Returns:
+        dict: The `count` and whether it is `exact`.
+    """
+    return controller.count_users(mode)
+
+@router.get("/export")
+def export_users(
+    format: Literal['csv', 'ndjson'] = 'csv',
+    controller: UserController = Depends(get_user_export_controller)
+):
+    """
+    API endpoint to export every user as CSV or NDJSON.
+
+    The body is streamed straight from the database (`COPY ... TO STDOUT` on
+    PostgreSQL) on a dedicated connection, so memory use stays flat however
+    large the table is. Password hashes are never exported.
+
+    Args:
+        format (str): 'csv' or 'ndjson'. Defaults to 'csv'.
+        controller (UserController): The controller responsible for processing the request.
+
+    Returns:
+        StreamingResponse: The users ordered by ID.
+    """
+    return controller.export_users(format)
+
 @router.get("/{user_id}")
-def get_user(user_id: int, controller: UserController = Depends(get_user_controller)):
+def get_user(user_id: int, response: Response, controller: UserController = Depends(get_user_controller)):
     """
     API endpoint to retrieve a user by their unique ID.
 
     Args:
         user_id (int): The unique identifier of the user.
+        response (Response): The response, given `Age` and `Warning` headers when
+            a stale cached user is served.
         controller (UserController): The controller responsible for processing the request.
 
     Returns:
@@ -62,15 +217,19 @@ def get_user(user_id: int, controller: UserController = Depends(get_user_control
     Raises:
         HTTPException: If no user is found with the given ID.
     """
-    return controller.get_user(user_id)
+    user = controller.get_user(user_id)
+    response.headers.update(stale_response_headers())
+    return user
 
 @router.get("/cpf/{cpf}")
-def get_user_by_cpf(cpf: str, controller: UserController = Depends(get_user_controller)):
+def get_user_by_cpf(cpf: str, response: Response, controller: UserController = Depends(get_user_controller)):
     """
     API endpoint to retrieve a user by their CPF.
 
     Args:
         cpf (str): The CPF (Cadastro de Pessoas Físicas) of the user.
+        response (Response): The response, given `Age` and `Warning` headers when
+            a stale cached user is served.
         controller (UserController): The controller responsible for processing the request.
 
     Returns:
@@ -79,25 +238,43 @@ def get_user_by_cpf(cpf: str, controller: UserController = Depends(get_user_cont
     Raises:
         HTTPException: If no user is found with the given CPF.
     """
-    return controller.get_user_by_cpf(cpf)
+    user = controller.get_user_by_cpf(cpf)
+    response.headers.update(stale_response_headers())
+    return user
 
 @router.get("/")
 def list_users(
+    response: Response,
     limit: int = 10,
     skip: int = 0,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
     controller: UserController = Depends(get_user_controller)
 ):
     """
     API endpoint to retrieve a list of users with pagination.
 
+    Sending `cursor` (empty for the first page) switches to keyset pagination:
+    users are ordered by ID and the response carries the `next_cursor` to send
+    for the following page. `limit` is capped at USERS_PAGE_SIZE_MAX.
+
     Args:
+        response (Response): The response whose headers are set.
         limit (int): The max number of users to return. Defaults to 10.
         skip (int): The number of users to skip before retrieving. Defaults to 0.
+            Ignored in cursor mode.
+        cursor (Optional[str]): The opaque cursor of the page to read.
+        include_total (bool): Whether to add the `auto` user count as the
+            X-Total-Count response header.
         controller (UserController): The controller responsible for processing the request.
 
     Returns:
-        dict: A paginated list of users.
+        dict: A paginated list of users, or `items` and `next_cursor` in cursor mode.
     """
+    if include_total:
+        response.headers['X-Total-Count'] = str((controller.count_users('auto'))['count'])
+    if cursor is not None:
+        return controller.list_users_page(limit, cursor)
     return controller.list_users(limit, skip)
 
 
@@ -119,6 +296,27 @@ def update_user(user_id: int, user: UserSchema, controller: UserController = Dep
     """
     return controller.update_user(user_id, user)
 
+@router.patch("/{user_id}")
+def patch_user(user_id: int, user: UserPatchSchema, controller: UserController = Depends(get_user_controller)):
+    """
+    API endpoint to partially update a user's information.
+
+    Only the fields sent in the body are changed; the password is re-hashed only
+    when a new one is supplied.
+
+    Args:
+        user_id (int): The unique identifier of the user.
+        user (UserPatchSchema): The fields to change.
+        controller (UserController): The controller responsible for processing the request.
+
+    Returns:
+        dict: The updated user's public information.
+
+    Raises:
+        HTTPException: If the user is not found.
+    """
+    return controller.patch_user(user_id, user)
+
 @router.delete("/{user_id}")
 def delete_user(user_id: int, controller: UserController = Depends(get_user_controller)):
     """
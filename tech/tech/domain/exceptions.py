@@ -0,0 +1,16 @@
+class UserAlreadyExistsError(ValueError):
+    """
+    Raised when a user cannot be stored because a unique field is already taken.
+
+    It subclasses ValueError so existing handlers keep mapping it to a client error.
+    """
+
+    def __init__(self, field: str):
+        """
+        Initializes the error with the conflicting field.
+
+        Args:
+            field (str): The field already in use: 'username', 'email' or 'cpf'.
+        """
+        super().__init__(f'User already exists: {field} is already in use')
+        self.field = field
@@ -1,6 +1,185 @@
+import asyncio
+import hashlib
+import hmac
+import os
+import re
+import threading
+import time
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from functools import lru_cache
+from statistics import median
+from typing import Callable, List, NamedTuple, Optional
+
+from argon2.low_level import ARGON2_VERSION
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+from tech.infra.metrics import LatencyWindow
+
+HASHING_BACKENDS = ('inline', 'thread', 'process')
+
+
+class HashProfile(NamedTuple):
+    """Argon2 cost parameters. `memory_cost` is given in KiB."""
+
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+
+
+HASH_PROFILES = {
+    # argon2-cffi defaults, i.e. what PasswordHash.recommended() uses.
+    'recommended': HashProfile(time_cost=3, memory_cost=65536, parallelism=4),
+    # OWASP minimums for a single core; sized for small pods.
+    'balanced': HashProfile(time_cost=2, memory_cost=19456, parallelism=1),
+    'low-memory': HashProfile(time_cost=4, memory_cost=9216, parallelism=1),
+}
+
+MIN_CALIBRATION_MEMORY_COST = 7168
+
+
+def build_password_hash(profile: HashProfile) -> PasswordHash:
+    """
+    Builds a pwdlib PasswordHash that hashes with the given argon2 profile.
+
+    Args:
+        profile (HashProfile): The argon2 cost parameters.
+
+    Returns:
+        PasswordHash: A hasher producing argon2id hashes with those costs.
+    """
+    return PasswordHash((
+        Argon2Hasher(
+            time_cost=profile.time_cost,
+            memory_cost=profile.memory_cost,
+            parallelism=profile.parallelism,
+        ),
+    ))
+
+
+pwd_profile = HASH_PROFILES['recommended']
+pwd_context = build_password_hash(pwd_profile)
+
+
+def configure_password_hashing(profile: HashProfile) -> None:
+    """
+    Replaces the module-level hasher so new hashes use the given profile.
+
+    Also used as the initializer of process pool workers.
+
+    Args:
+        profile (HashProfile): The argon2 cost parameters.
+    """
+    global pwd_context, pwd_profile
+    pwd_context = build_password_hash(profile)
+    pwd_profile = profile
+
+
+def current_hash_prefix() -> str:
+    """
+    Returns the prefix shared by every hash made with the current profile.
+
+    Argon2 encodes its parameters in the hash itself, so any stored hash
+    that does not start with this prefix was made with legacy parameters.
+
+    Returns:
+        str: The argon2id prefix, e.g. `$argon2id$v=19$m=65536,t=3,p=4$`.
+    """
+    return (
+        f'$argon2id$v={ARGON2_VERSION}$m={pwd_profile.memory_cost},'
+        f't={pwd_profile.time_cost},p={pwd_profile.parallelism}$'
+    )
+
+
+def measure_hash_time(profile: HashProfile, samples: int = 3) -> float:
+    """
+    Measures the median time of one hash with the given profile on this host.
+
+    Args:
+        profile (HashProfile): The argon2 cost parameters to measure.
+        samples (int): How many hashes to time.
+
+    Returns:
+        float: The median duration in seconds.
+    """
+    hasher = build_password_hash(profile)
+    durations = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hasher.hash('calibration-password')
+        durations.append(time.perf_counter() - started)
+    return median(durations)
+
+
+def calibrate_profile(
+    target_ms: float,
+    memory_cost: int = HASH_PROFILES['balanced'].memory_cost,
+    max_time_cost: int = 10,
+    measure: Callable[[HashProfile], float] = measure_hash_time,
+) -> HashProfile:
+    """
+    Picks argon2 parameters so one hash takes about `target_ms` on one core.
+
+    Starts from one pass at `memory_cost`. If that alone is over budget the
+    memory cost is halved (down to a floor); otherwise passes are added
+    until the budget is used, since argon2 time grows linearly with them.
 
-pwd_context = PasswordHash.recommended()
+    Args:
+        target_ms (float): The target duration of one hash in milliseconds.
+        memory_cost (int): The preferred memory cost in KiB.
+        max_time_cost (int): The upper bound for the number of passes.
+        measure (Callable[[HashProfile], float]): Times one hash in seconds.
+
+    Returns:
+        HashProfile: The calibrated single-lane profile.
+
+    Raises:
+        ValueError: If the target is not positive.
+    """
+    if target_ms <= 0:
+        raise ValueError('Calibration target must be a positive duration.')
+
+    target = target_ms / 1000
+    per_pass = measure(HashProfile(1, memory_cost, 1))
+    while per_pass > target and memory_cost > MIN_CALIBRATION_MEMORY_COST:
+        memory_cost = max(MIN_CALIBRATION_MEMORY_COST, memory_cost // 2)
+        per_pass = measure(HashProfile(1, memory_cost, 1))
+
+    time_cost = int(target // per_pass) if per_pass > 0 else max_time_cost
+    return HashProfile(
+        time_cost=min(max(time_cost, 1), max_time_cost),
+        memory_cost=memory_cost,
+        parallelism=1,
+    )
+
+
+def resolve_hash_profile(name: str, target_ms: float) -> HashProfile:
+    """
+    Resolves a profile name from Settings into argon2 parameters.
+
+    Args:
+        name (str): A key of `HASH_PROFILES`, or `calibrated`.
+        target_ms (float): The per-hash target used by `calibrated`.
+
+    Returns:
+        HashProfile: The resolved parameters.
+
+    Raises:
+        ValueError: If the profile name is unknown.
+    """
+    if name == 'calibrated':
+        return calibrate_profile(target_ms)
+    if name not in HASH_PROFILES:
+        raise ValueError(
+            f'Unknown hash profile: {name}. Expected one of '
+            f'{", ".join([*HASH_PROFILES, "calibrated"])}.'
+        )
+    return HASH_PROFILES[name]
 
 
 def get_password_hash(password: str):
@@ -11,9 +190,437 @@ def verify_password(plain_password: str, hashed_password: str):
     return pwd_context.verify(plain_password, hashed_password)
 
 
-def get_cpf_hash(cpf: str):
-    return pwd_context.hash(cpf)
+def verify_and_update_password(plain_password: str, hashed_password: str):
+    """
+    Verifies a password and re-hashes it if the stored hash is stale.
+
+    Args:
+        plain_password (str): The plain text password.
+        hashed_password (str): The stored hash.
+
+    Returns:
+        tuple: Whether the password matched, and a new hash made with the
+            current profile when the stored one used legacy parameters.
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def password_hash_needs_rehash(hashed_password: str) -> bool:
+    """
+    Tells whether a stored hash was made with legacy parameters.
+
+    This only parses the hash, so it is cheap enough to call anywhere.
+
+    Args:
+        hashed_password (str): The stored hash.
+
+    Returns:
+        bool: True if the hash does not match the current profile.
+    """
+    return not hashed_password.startswith(current_hash_prefix())
+
+
+@lru_cache
+def get_cpf_index_key() -> bytes:
+    """
+    Returns the secret key of the CPF blind index, read once from Settings.
+
+    Returns:
+        bytes: The HMAC key.
+    """
+    from tech.infra.settings.settings import Settings
+
+    return Settings().CPF_INDEX_KEY.encode('utf-8')
+
+
+def get_cpf_blind_index(cpf: str, key: Optional[bytes] = None) -> str:
+    """
+    Computes the keyed blind index of a CPF.
+
+    Unlike a salted password hash the result is deterministic, so it can be
+    stored in an indexed column and looked up by equality, while the CPF
+    cannot be recovered from it without the key. Formatting characters are
+    ignored, so `123.456.789-01` and `12345678901` share an index.
+
+    Args:
+        cpf (str): The CPF, with or without punctuation.
+        key (Optional[bytes]): The HMAC key. Defaults to `CPF_INDEX_KEY`.
+
+    Returns:
+        str: The hex encoded HMAC-SHA256 of the CPF digits.
+    """
+    digits = re.sub(r'\D', '', cpf)
+    return hmac.new(
+        key or get_cpf_index_key(), digits.encode('utf-8'), hashlib.sha256
+    ).hexdigest()
+
+
+def verify_cpf(plain_cpf: str, cpf_index: str,
+               key: Optional[bytes] = None) -> bool:
+    """
+    Checks a CPF against a stored blind index in constant time.
+
+    Args:
+        plain_cpf (str): The CPF to check.
+        cpf_index (str): The stored blind index.
+        key (Optional[bytes]): The HMAC key. Defaults to `CPF_INDEX_KEY`.
+
+    Returns:
+        bool: True if the CPF produces the stored index.
+    """
+    return hmac.compare_digest(get_cpf_blind_index(plain_cpf, key), cpf_index)
+
+
+_OPERATIONS = {
+    'hash': get_password_hash,
+    'verify': verify_password,
+    'verify_and_update': verify_and_update_password,
+}
+
+
+def _run_timed(operation: str, *args):
+    """
+    Runs a hashing operation and measures how long the hasher itself took.
+
+    Lives at module level so it can be pickled into process pool workers.
+
+    Args:
+        operation (str): The key of the operation in `_OPERATIONS`.
+        *args: The arguments forwarded to the operation.
+
+    Returns:
+        tuple: The operation result and its duration in seconds.
+    """
+    started = time.perf_counter()
+    result = _OPERATIONS[operation](*args)
+    return result, time.perf_counter() - started
+
+
+def available_cpus() -> int:
+    """
+    Returns the number of CPUs this process is allowed to run on.
+
+    Returns:
+        int: The CPU affinity count, falling back to `os.cpu_count()`.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover
+        return os.cpu_count() or 1
+
+
+class _InlineExecutor(Executor):
+    """Executor that runs each submitted call immediately on the caller."""
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+
+class HashingService:
+    """
+    Runs argon2 password hashing on a dedicated, bounded backend.
+
+    Hashing is CPU bound, so running it on the request threads lets a burst
+    of signups starve every other endpoint. This service moves the work to
+    one of three backends: `inline` (caller's thread), `thread` (a private
+    thread pool) or `process` (a process pool sized to the available cores).
+    It keeps track of queue depth and latency so saturation is visible.
+    """
+
+    def __init__(self, backend: str = 'process',
+                 max_workers: Optional[int] = None,
+                 profile: Optional[HashProfile] = None):
+        """
+        Initializes the service. The executor itself is created lazily.
+
+        Args:
+            backend (str): One of `inline`, `thread` or `process`.
+            max_workers (Optional[int]): The pool size. Defaults to the number
+                of available CPUs. Ignored by the inline backend.
+            profile (Optional[HashProfile]): The argon2 costs for new hashes.
+                When omitted the current module-level hasher is used.
+
+        Raises:
+            ValueError: If the backend name is unknown.
+        """
+        if backend not in HASHING_BACKENDS:
+            raise ValueError(
+                f'Unknown hashing backend: {backend}. '
+                f'Expected one of {", ".join(HASHING_BACKENDS)}.'
+            )
+        self.backend = backend
+        self.profile = profile
+        if profile is not None:
+            configure_password_hashing(profile)
+        self.max_workers = (
+            1 if backend == 'inline' else max_workers or available_cpus()
+        )
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._submitted = 0
+        self._failed = 0
+        self._rehashed = 0
+        self.hash_latency = LatencyWindow()
+        self.queue_wait = LatencyWindow()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = self._create_executor()
+        return self._executor
+
+    def _create_executor(self) -> Executor:
+        if self.backend == 'thread':
+            return ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix='password-hashing',
+            )
+        if self.backend == 'process':
+            if self.profile is None:
+                return ProcessPoolExecutor(max_workers=self.max_workers)
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=configure_password_hashing,
+                initargs=(self.profile,),
+            )
+        return _InlineExecutor()
+
+    def _submit(self, operation: str, *args) -> Future:
+        """
+        Submits an operation to the backend and unwraps its timing.
+
+        Args:
+            operation (str): The key of the operation in `_OPERATIONS`.
+            *args: The arguments forwarded to the operation.
+
+        Returns:
+            Future: A future resolving to the operation result.
+        """
+        submitted_at = time.perf_counter()
+        with self._lock:
+            self._pending += 1
+            self._submitted += 1
+
+        result = Future()
+
+        def _on_done(timed: Future):
+            with self._lock:
+                self._pending -= 1
+            if timed.exception() is not None:
+                with self._lock:
+                    self._failed += 1
+                result.set_exception(timed.exception())
+                return
+            value, duration = timed.result()
+            total = time.perf_counter() - submitted_at
+            self.hash_latency.record(duration)
+            self.queue_wait.record(max(0.0, total - duration))
+            result.set_result(value)
+
+        try:
+            timed = self._get_executor().submit(_run_timed, operation, *args)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+                self._failed += 1
+            raise
+        timed.add_done_callback(_on_done)
+        return result
+
+    def hash(self, password: str) -> str:
+        """
+        Hashes a password on the backend, blocking until it is done.
+
+        Args:
+            password (str): The plain text password.
+
+        Returns:
+            str: The argon2 hash.
+        """
+        return self._submit('hash', password).result()
+
+    def hash_many(self, passwords: List[str]) -> List[str]:
+        """
+        Hashes several passwords, submitting them all before waiting so they
+        are spread across every worker of the backend.
+
+        Args:
+            passwords (List[str]): The plain text passwords.
+
+        Returns:
+            List[str]: The argon2 hashes, in the same order.
+        """
+        futures = [self._submit('hash', password) for password in passwords]
+        return [future.result() for future in futures]
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verifies a password on the backend, blocking until it is done.
+
+        Args:
+            plain_password (str): The plain text password.
+            hashed_password (str): The stored hash.
+
+        Returns:
+            bool: True if the password matches the hash.
+        """
+        future = self._submit('verify', plain_password, hashed_password)
+        return future.result()
+
+    def verify_and_update(self, plain_password: str, hashed_password: str):
+        """
+        Verifies a password and re-hashes it when the stored hash is stale.
+
+        Args:
+            plain_password (str): The plain text password.
+            hashed_password (str): The stored hash.
+
+        Returns:
+            tuple: Whether the password matched, and the replacement hash
+                when the stored one used legacy parameters (else None).
+        """
+        future = self._submit('verify_and_update', plain_password,
+                              hashed_password)
+        return self._count_rehash(future.result())
+
+    async def averify_and_update(self, plain_password: str,
+                                 hashed_password: str):
+        """
+        Awaitable variant of `verify_and_update`.
+
+        Args:
+            plain_password (str): The plain text password.
+            hashed_password (str): The stored hash.
+
+        Returns:
+            tuple: Whether the password matched, and the replacement hash
+                when the stored one used legacy parameters (else None).
+        """
+        return self._count_rehash(await asyncio.wrap_future(
+            self._submit('verify_and_update', plain_password, hashed_password)
+        ))
+
+    def _count_rehash(self, outcome):
+        if outcome[1] is not None:
+            with self._lock:
+                self._rehashed += 1
+        return outcome
+
+    async def ahash(self, password: str) -> str:
+        """
+        Awaitable variant of `hash` that does not block the event loop
+        (except with the inline backend, which runs on the caller).
+
+        Args:
+            password (str): The plain text password.
+
+        Returns:
+            str: The argon2 hash.
+        """
+        return await asyncio.wrap_future(self._submit('hash', password))
+
+    async def ahash_many(self, passwords: List[str]) -> List[str]:
+        """
+        Awaitable variant of `hash_many`.
+
+        Args:
+            passwords (List[str]): The plain text passwords.
+
+        Returns:
+            List[str]: The argon2 hashes, in the same order.
+        """
+        return list(await asyncio.gather(*(
+            asyncio.wrap_future(self._submit('hash', password)) for password in passwords
+        )))
+
+    async def averify(self, plain_password: str,
+                      hashed_password: str) -> bool:
+        """
+        Awaitable variant of `verify`.
+
+        Args:
+            plain_password (str): The plain text password.
+            hashed_password (str): The stored hash.
+
+        Returns:
+            bool: True if the password matches the hash.
+        """
+        return await asyncio.wrap_future(
+            self._submit('verify', plain_password, hashed_password)
+        )
+
+    def stats(self) -> dict:
+        """
+        Reports backend saturation and latency.
+
+        `queue_depth` counts operations waiting for a free worker; `hash` is
+        the time argon2 itself took and `queue_wait` the time spent waiting
+        for a worker.
+
+        Returns:
+            dict: The current counters and latency summaries.
+        """
+        with self._lock:
+            pending = self._pending
+            submitted = self._submitted
+            failed = self._failed
+            rehashed = self._rehashed
+        return {
+            'backend': self.backend,
+            'workers': self.max_workers,
+            'profile': self.profile._asdict() if self.profile else None,
+            'submitted': submitted,
+            'failed': failed,
+            'rehashed': rehashed,
+            'in_flight': min(pending, self.max_workers),
+            'queue_depth': max(0, pending - self.max_workers),
+            'hash': self.hash_latency.snapshot(),
+            'queue_wait': self.queue_wait.snapshot(),
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts the backend down, releasing its threads or processes.
+
+        Args:
+            wait (bool): Whether to wait for pending operations to finish.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+@lru_cache
+def get_hashing_service() -> HashingService:
+    """
+    Returns the application-wide hashing service configured from Settings.
+
+    Returns:
+        HashingService: The shared hashing service.
+    """
+    from tech.infra.settings.settings import Settings
+
+    settings = Settings()
+    return HashingService(
+        backend=settings.PASSWORD_HASH_BACKEND,
+        max_workers=settings.PASSWORD_HASH_WORKERS,
+        profile=resolve_hash_profile(
+            settings.PASSWORD_HASH_PROFILE,
+            settings.PASSWORD_HASH_TARGET_MS,
+        ),
+    )
 
 
-def verify_cpf(plain_cpf: str, hashed_cpf: str):
-    return pwd_context.verify(plain_cpf, hashed_cpf)
+def shutdown_hashing_service() -> None:
+    """Shuts the shared hashing service down if it was ever created."""
+    if get_hashing_service.cache_info().currsize:
+        get_hashing_service().shutdown()
+        get_hashing_service.cache_clear()
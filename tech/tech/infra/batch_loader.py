@@ -0,0 +1,250 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+from tech.infra.metrics import LatencyWindow
+
+
+class _Batch(object):
+    """Keys collected during one window, each with the future of its result."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.futures = {}
+        self.full = threading.Event()
+        self.timer = None
+
+
+class _BatchStats(object):
+    """Counters shared by the thread and asyncio loaders."""
+
+    def __init__(self, window: float, max_batch: int):
+        self.window = window
+        self.max_batch = max_batch
+        self.window_wait = LatencyWindow()
+        self._stats_lock = threading.Lock()
+        self._batches = 0
+        self._keys = 0
+        self._deduplicated = 0
+        self._largest = 0
+        self._failed = 0
+
+    def _record_batch(self, batch: _Batch) -> None:
+        self.window_wait.record(time.perf_counter() - batch.started)
+        with self._stats_lock:
+            self._batches += 1
+            self._keys += len(batch.futures)
+            self._largest = max(self._largest, len(batch.futures))
+
+    def _record_duplicate(self) -> None:
+        with self._stats_lock:
+            self._deduplicated += 1
+
+    def _record_failure(self) -> None:
+        with self._stats_lock:
+            self._failed += 1
+
+    def stats(self) -> dict:
+        """
+        Reports how well lookups are being coalesced.
+
+        `window_wait` is the latency the loader adds: the time a batch spent
+        collecting keys before its query was sent.
+
+        Returns:
+            dict: Batch and key counts, batch sizes and the added latency.
+        """
+        with self._stats_lock:
+            batches, keys = self._batches, self._keys
+            deduplicated = self._deduplicated
+            largest, failed = self._largest, self._failed
+        return {
+            'window_ms': self.window * 1000,
+            'max_batch': self.max_batch,
+            'batches': batches,
+            'keys': keys,
+            'deduplicated': deduplicated,
+            'failed_batches': failed,
+            'avg_batch_size': round(keys / batches, 2) if batches else 0.0,
+            'max_batch_size': largest,
+            'window_wait': self.window_wait.snapshot(),
+        }
+
+
+class BatchLoader(_BatchStats):
+    """
+    Coalesces concurrent single-key lookups made from worker threads.
+
+    The first caller of a batch waits up to `window` seconds (or until
+    `max_batch` distinct keys have arrived), then runs `load_many` once for
+    every key collected and hands each caller its own result. Callers asking
+    for a key that is already queued or being loaded share that lookup.
+    """
+
+    def __init__(self,
+                 load_many: Callable[[List[Hashable]], Dict[Hashable, Any]],
+                 window: float = 0.002, max_batch: int = 100):
+        """
+        Initializes the loader.
+
+        Args:
+            load_many (Callable): Loads many keys at once, returning a
+                mapping of the keys found to their values.
+            window (float): The longest time, in seconds, a batch collects
+                keys.
+            max_batch (int): The number of distinct keys that sends a batch
+                early.
+        """
+        super().__init__(window, max_batch)
+        self.load_many = load_many
+        self._lock = threading.Lock()
+        self._batch: Optional[_Batch] = None
+        self._in_flight: Dict[Hashable, Future] = {}
+
+    def load(self, key: Hashable) -> Any:
+        """
+        Loads one key as part of the current batch, blocking until it is done.
+
+        Args:
+            key (Hashable): The key to load.
+
+        Returns:
+            Any: The value loaded for the key, or None when it was not found.
+        """
+        leader = False
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is None:
+                batch = self._batch
+                if batch is None:
+                    batch = self._batch = _Batch()
+                    leader = True
+                future = batch.futures.get(key)
+                if future is None:
+                    future = batch.futures[key] = Future()
+                    if len(batch.futures) >= self.max_batch:
+                        self._close(batch)
+                        batch.full.set()
+                else:
+                    self._record_duplicate()
+            else:
+                self._record_duplicate()
+
+        if leader:
+            batch.full.wait(self.window)
+            with self._lock:
+                if self._batch is batch:
+                    self._close(batch)
+            self._dispatch(batch)
+        return future.result()
+
+    def _close(self, batch: _Batch) -> None:
+        self._batch = None
+        self._in_flight.update(batch.futures)
+
+    def _dispatch(self, batch: _Batch) -> None:
+        self._record_batch(batch)
+        keys = list(batch.futures)
+        try:
+            results = self.load_many(keys)
+        except Exception as error:
+            self._record_failure()
+            results, failure = {}, error
+        else:
+            failure = None
+        with self._lock:
+            for key in batch.futures:
+                self._in_flight.pop(key, None)
+        for key, future in batch.futures.items():
+            if failure is not None:
+                future.set_exception(failure)
+            else:
+                future.set_result(results.get(key))
+
+
+class AsyncBatchLoader(_BatchStats):
+    """
+    Asyncio twin of BatchLoader.
+
+    The batch is sent by a timer on the event loop, so no caller has to wait
+    on behalf of the others.
+    """
+
+    def __init__(self,
+                 load_many: Callable[[List[Hashable]],
+                                     Awaitable[Dict[Hashable, Any]]],
+                 window: float = 0.002, max_batch: int = 100):
+        """
+        Initializes the loader.
+
+        Args:
+            load_many (Callable): Coroutine function loading many keys at once,
+                returning a mapping of the keys found to their values.
+            window (float): The longest time, in seconds, a batch collects
+                keys.
+            max_batch (int): The number of distinct keys that sends a batch
+                early.
+        """
+        super().__init__(window, max_batch)
+        self.load_many = load_many
+        self._batch: Optional[_Batch] = None
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self._tasks = set()
+
+    async def load(self, key: Hashable) -> Any:
+        """
+        Loads one key as part of the current batch.
+
+        Args:
+            key (Hashable): The key to load.
+
+        Returns:
+            Any: The value loaded for the key, or None when it was not found.
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            batch = self._batch
+            if batch is None:
+                batch = self._batch = _Batch()
+                batch.timer = loop.call_later(self.window, self._flush, batch)
+            future = batch.futures.get(key)
+            if future is None:
+                future = batch.futures[key] = loop.create_future()
+                if len(batch.futures) >= self.max_batch:
+                    batch.timer.cancel()
+                    self._flush(batch)
+            else:
+                self._record_duplicate()
+        else:
+            self._record_duplicate()
+        return await asyncio.shield(future)
+
+    def _flush(self, batch: _Batch) -> None:
+        if self._batch is batch:
+            self._batch = None
+        self._in_flight.update(batch.futures)
+        task = asyncio.get_running_loop().create_task(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: _Batch) -> None:
+        self._record_batch(batch)
+        keys = list(batch.futures)
+        try:
+            results = await self.load_many(keys)
+        except Exception as error:
+            self._record_failure()
+            results, failure = {}, error
+        else:
+            failure = None
+        for key, future in batch.futures.items():
+            self._in_flight.pop(key, None)
+            if future.done():
+                continue
+            if failure is not None:
+                future.set_exception(failure)
+            else:
+                future.set_result(results.get(key))
@@ -0,0 +1,181 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Sequence
+
+from tech.infra.cache.memory_cache import MISSING, MemoryCache
+
+
+class CacheBackend(ABC):
+    """
+    Byte store behind the user cache.
+
+    Values are serialized by the caller, so a backend only moves bytes and a
+    hit costs one lookup plus one decode whichever backend serves it.
+    """
+
+    #: Whether calls may block on the network, so async callers should run
+    #: them off the event loop.
+    blocking = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Returns the value stored under a key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[bytes]: The value, or None when absent, expired or unreachable.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """
+        Stores a value.
+
+        Args:
+            key (str): The cache key.
+            value (bytes): The serialized value.
+            ttl (Optional[float]): Seconds the value stays valid; the backend's
+                default when None.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, keys: Sequence[str]) -> None:
+        """
+        Drops keys everywhere the backend stores them.
+
+        Args:
+            keys (Sequence[str]): The cache keys.
+        """
+        pass
+
+    def evict_local(self, keys: Sequence[str]) -> None:
+        """
+        Drops keys from the copies held by this process only.
+
+        Used when another process announces a write it has already applied to
+        any shared tier.
+
+        Args:
+            keys (Sequence[str]): The cache keys.
+        """
+        self.delete(keys)
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Drops every entry the backend holds, in every tier, including the ones
+        shared with other processes.
+        """
+        pass
+
+    def clear_local(self) -> None:
+        """
+        Drops every entry held by this process only, leaving any tier shared
+        with other processes alone.
+        """
+        self.clear()
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """
+        Reports the backend counters.
+
+        Returns:
+            dict: Backend-specific size and hit counters.
+        """
+        pass
+
+
+class MemoryBackend(CacheBackend):
+    """
+    In-process backend: a bounded LRU + TTL MemoryCache.
+    """
+
+    def __init__(self, cache: MemoryCache):
+        """
+        Initializes the backend.
+
+        Args:
+            cache (MemoryCache): The store holding the entries.
+        """
+        self.cache = cache
+
+    def get(self, key: str) -> Optional[bytes]:
+        value = self.cache.get(key)
+        return None if value is MISSING else value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        self.cache.set(key, value, ttl=ttl)
+
+    def delete(self, keys: Sequence[str]) -> None:
+        for key in keys:
+            self.cache.delete(key)
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+    def stats(self) -> dict:
+        return {'backend': 'memory', **self.cache.stats()}
+
+
+class TwoTierBackend(CacheBackend):
+    """
+    A near in-process tier in front of a far shared tier.
+
+    Reads try the near tier first and copy far hits into it, for at most
+    `near_ttl` seconds so entries invalidated by other processes do not
+    linger. Writes and deletes go to both tiers.
+    """
+
+    def __init__(self, near: CacheBackend, far: CacheBackend, near_ttl: Optional[float] = None):
+        """
+        Initializes the backend.
+
+        Args:
+            near (CacheBackend): The per-process tier.
+            far (CacheBackend): The tier shared by every process.
+            near_ttl (Optional[float]): The longest time, in seconds, a value
+                stays in the near tier; the near tier's default when None.
+        """
+        self.near = near
+        self.far = far
+        self.near_ttl = near_ttl
+        self.blocking = far.blocking
+
+    def _near_ttl(self, ttl: Optional[float]) -> Optional[float]:
+        if ttl is None:
+            return self.near_ttl
+        return ttl if self.near_ttl is None else min(ttl, self.near_ttl)
+
+    def get(self, key: str) -> Optional[bytes]:
+        value = self.near.get(key)
+        if value is None:
+            value = self.far.get(key)
+            if value is not None:
+                self.near.set(key, value, ttl=self.near_ttl)
+        return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        self.far.set(key, value, ttl=ttl)
+        self.near.set(key, value, ttl=self._near_ttl(ttl))
+
+    def delete(self, keys: Sequence[str]) -> None:
+        self.near.delete(keys)
+        self.far.delete(keys)
+
+    def evict_local(self, keys: Sequence[str]) -> None:
+        self.near.evict_local(keys)
+
+    def clear(self) -> None:
+        self.near.clear()
+        self.far.clear()
+
+    def clear_local(self) -> None:
+        self.near.clear_local()
+
+    def stats(self) -> dict:
+        return {'backend': 'two-tier', 'near': self.near.stats(), 'far': self.far.stats()}
@@ -0,0 +1,154 @@
+import json
+import logging
+import threading
+from typing import Callable, Optional
+
+from sqlalchemy import make_url
+from tech.infra.cache.user_cache import UserCache
+
+USERS_CHANGED_CHANNEL = 'users_changed'
+
+logger = logging.getLogger(__name__)
+
+
+def _connect(dsn: str):
+    import psycopg
+
+    return psycopg.connect(dsn, autocommit=True)
+
+
+class UserCacheInvalidationListener(object):
+    """
+    Evicts local cache entries for users written by any process.
+
+    A trigger on `users` (see migration 5e2a7c9d41b0) sends a `users_changed`
+    notification with the ID and CPF blind index of every row inserted,
+    updated or deleted. This listener keeps a dedicated connection in LISTEN
+    mode on a background thread and evicts those keys as notifications arrive.
+    Notifications sent while it is disconnected are lost, so the entries held
+    by this process are cleared whenever the connection is (re-)established.
+    """
+
+    def __init__(self, dsn: str, user_cache: UserCache, channel: str = USERS_CHANGED_CHANNEL,
+                 poll_timeout: float = 1.0, reconnect_delay: float = 1.0,
+                 connect: Callable = _connect):
+        """
+        Initializes the listener.
+
+        Args:
+            dsn (str): The libpq connection string of the primary database.
+            user_cache (UserCache): The cache to evict entries from.
+            channel (str): The notification channel to listen on.
+            poll_timeout (float): The longest time, in seconds, the thread waits
+                for a notification before checking whether it should stop.
+            reconnect_delay (float): Seconds to wait before reconnecting after an error.
+            connect (Callable): Opens an autocommit connection from a DSN.
+        """
+        self.dsn = dsn
+        self.user_cache = user_cache
+        self.channel = channel
+        self.poll_timeout = poll_timeout
+        self.reconnect_delay = reconnect_delay
+        self.connect = connect
+        self.notifications = 0
+        self.connections = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def handle(self, payload: str) -> None:
+        """
+        Evicts the entries named by one notification.
+
+        Args:
+            payload (str): The JSON payload, `{"id": ..., "cpf_index": ...}`.
+                A payload that cannot be read clears this process's entries.
+        """
+        self.notifications += 1
+        try:
+            change = json.loads(payload)
+            user_id, cpf_index = int(change['id']), change.get('cpf_index')
+        except (ValueError, TypeError, KeyError):
+            logger.warning('Unreadable %s payload %r; clearing the user cache', self.channel, payload)
+            self.user_cache.clear_local()
+            return
+        self.user_cache.invalidate_index(user_id, cpf_index)
+
+    def listen_once(self) -> None:
+        """
+        Connects, listens and handles notifications until stopped or disconnected.
+        """
+        with self.connect(self.dsn) as connection:
+            connection.execute(f'LISTEN {self.channel}')
+            self.connections += 1
+            self.user_cache.clear_local()
+            while not self._stop.is_set():
+                for notification in connection.notifies(timeout=self.poll_timeout):
+                    self.handle(notification.payload)
+                    if self._stop.is_set():
+                        break
+
+    def run(self) -> None:
+        """
+        Listens until stopped, reconnecting after errors.
+        """
+        while not self._stop.is_set():
+            try:
+                self.listen_once()
+            except Exception:
+                logger.exception('Lost the %s listener connection; reconnecting', self.channel)
+                self._stop.wait(self.reconnect_delay)
+
+    def start(self) -> None:
+        """
+        Starts listening on a daemon thread.
+        """
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name='user-cache-listener', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the listener and waits for its thread to finish.
+
+        Args:
+            timeout (Optional[float]): The longest time, in seconds, to wait.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout if timeout is not None else self.poll_timeout * 2)
+            self._thread = None
+
+    def stats(self) -> dict:
+        """
+        Reports the listener counters.
+
+        Returns:
+            dict: The channel, the notifications handled and the connections made.
+        """
+        return {
+            'channel': self.channel,
+            'running': self._thread is not None and self._thread.is_alive(),
+            'notifications': self.notifications,
+            'connections': self.connections,
+        }
+
+
+def start_user_cache_listener(database_url: str, user_cache: Optional[UserCache]) -> Optional[UserCacheInvalidationListener]:
+    """
+    Starts the invalidation listener when there is a cache to keep fresh.
+
+    Args:
+        database_url (str): The SQLAlchemy URL of the primary database.
+        user_cache (Optional[UserCache]): The process-wide user cache.
+
+    Returns:
+        Optional[UserCacheInvalidationListener]: The running listener, or None
+        when caching is disabled or the database is not PostgreSQL.
+    """
+    url = make_url(database_url)
+    if user_cache is None or url.get_backend_name() != 'postgresql':
+        return None
+    dsn = url.set(drivername='postgresql').render_as_string(hide_password=False)
+    listener = UserCacheInvalidationListener(dsn, user_cache)
+    listener.start()
+    return listener
@@ -0,0 +1,130 @@
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Hashable, Optional
+
+MISSING = object()
+
+
+class MemoryCache:
+    """
+    Bounded, thread-safe in-process cache with LRU eviction and a TTL.
+
+    Once `max_entries` is reached the least recently used entry makes room
+    for the new one. Hits, misses,
+    expirations and evictions are counted for the metrics endpoint.
+    """
+
+    def __init__(self, max_entries: int, ttl: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_entries (int): The most entries kept at once.
+            ttl (float): Seconds an entry stays valid.
+            clock (Callable[[], float]): Monotonic clock, injectable for tests.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expirations = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Returns a cached value if it has not expired, marking it recently used.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            Any: The cached value, or MISSING when absent or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() >= entry[1]:
+                del self._entries[key]
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Stores a value, evicting the least recently used entry when the cache
+        is full.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to cache.
+            ttl (Optional[float]): Seconds this entry stays valid, when it should
+                differ from the cache's `ttl`.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, self._clock() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Drops an entry if present.
+
+        Args:
+            key (Hashable): The cache key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Drops every entry.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Reports the size and effectiveness of the cache.
+
+        Returns:
+            dict: Entry count and limits, plus hit, miss, expiration and eviction counters.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_ratio': round(self._hits / lookups, 4) if lookups else 0.0,
+                'expirations': self._expirations,
+                'evictions': self._evictions,
+            }
+
+
+@lru_cache
+def get_user_count_cache() -> MemoryCache:
+    """
+    Returns the process-wide cache of user counts, configured from Settings.
+
+    Returns:
+        MemoryCache: The shared cache of the exact and estimated counts.
+    """
+    from tech.infra.settings.settings import Settings
+
+    return MemoryCache(max_entries=8, ttl=Settings().USERS_COUNT_CACHE_TTL)
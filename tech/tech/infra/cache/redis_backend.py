@@ -0,0 +1,243 @@
+import logging
+import queue
+import re
+import socket
+import threading
+from typing import List, Optional, Sequence
+from urllib.parse import urlparse
+
+from tech.infra.cache.backends import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+
+class RespError(Exception):
+    """An error reply from the server."""
+
+
+def encode_command(*parts) -> bytes:
+    """
+    Encodes a command as a RESP array of bulk strings.
+
+    Args:
+        *parts: The command name and arguments, as str, bytes or int.
+
+    Returns:
+        bytes: The wire representation.
+    """
+    chunks = [b'*%d\r\n' % len(parts)]
+    for part in parts:
+        if isinstance(part, str):
+            data = part.encode()
+        elif isinstance(part, int):
+            data = str(part).encode()
+        else:
+            data = part
+        chunks.append(b'$%d\r\n%s\r\n' % (len(data), data))
+    return b''.join(chunks)
+
+
+class RespConnection(object):
+    """
+    One blocking connection speaking RESP2, enough for GET, SET, DEL and SCAN.
+    """
+
+    def __init__(self, host: str, port: int, timeout: float, db: int = 0, password: Optional[str] = None):
+        """
+        Opens the connection and selects the database.
+
+        Args:
+            host (str): The server host.
+            port (int): The server port.
+            timeout (float): Seconds to wait when connecting and for each reply.
+            db (int): The logical database to select.
+            password (Optional[str]): The password to authenticate with.
+        """
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.reader = self.sock.makefile('rb')
+        if password:
+            self.execute('AUTH', password)
+        if db:
+            self.execute('SELECT', db)
+
+    def execute(self, *parts):
+        """
+        Sends one command and reads its reply.
+
+        Args:
+            *parts: The command name and arguments.
+
+        Returns:
+            The decoded reply: bytes, int, None or a list of those.
+
+        Raises:
+            RespError: If the server replied with an error.
+        """
+        self.sock.sendall(encode_command(*parts))
+        return self._read_reply()
+
+    def _read_reply(self):
+        line = self.reader.readline()
+        if not line.endswith(b'\r\n'):
+            raise ConnectionError('Connection closed by the cache server')
+        kind, body = line[:1], line[1:-2]
+        if kind == b'+':
+            return body
+        if kind == b'-':
+            raise RespError(body.decode(errors='replace'))
+        if kind == b':':
+            return int(body)
+        if kind == b'$':
+            length = int(body)
+            if length < 0:
+                return None
+            data = self.reader.read(length + 2)
+            return data[:-2]
+        if kind == b'*':
+            count = int(body)
+            return None if count < 0 else [self._read_reply() for _ in range(count)]
+        raise ConnectionError(f'Unexpected reply from the cache server: {line!r}')
+
+    def close(self) -> None:
+        """
+        Closes the connection.
+        """
+        try:
+            self.reader.close()
+        finally:
+            self.sock.close()
+
+
+class RedisBackend(CacheBackend):
+    """
+    Remote backend for any server speaking the Redis protocol.
+
+    Connections are pooled and reused. The cache is an optimization, so a
+    failed call is logged, counted and treated as a miss instead of failing
+    the request; its connection is discarded.
+    """
+
+    blocking = True
+
+    def __init__(self, url: str = 'redis://localhost:6379/0', ttl: float = 60.0,
+                 timeout: float = 0.1, pool_size: int = 10, prefix: str = 'users:'):
+        """
+        Initializes the backend; connections are opened on first use.
+
+        Args:
+            url (str): `redis://[:password@]host:port/db`.
+            ttl (float): Seconds a value stays valid unless a TTL is given.
+            timeout (float): Seconds to wait when connecting and for each reply.
+            pool_size (int): The most idle connections kept open.
+            prefix (str): Prepended to every key, to share a server with others.
+        """
+        parsed = urlparse(url)
+        self.host = parsed.hostname or 'localhost'
+        self.port = parsed.port or 6379
+        self.db = int(parsed.path.lstrip('/') or 0)
+        self.password = parsed.password
+        self.ttl = ttl
+        self.timeout = timeout
+        self.prefix = prefix
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+
+    def _connection(self) -> RespConnection:
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return RespConnection(self.host, self.port, self.timeout, self.db, self.password)
+
+    def _release(self, connection: RespConnection) -> None:
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def _execute(self, *parts):
+        connection = None
+        try:
+            connection = self._connection()
+            reply = connection.execute(*parts)
+        except (OSError, RespError) as error:
+            if connection is not None:
+                connection.close()
+            with self._lock:
+                self._errors += 1
+            logger.warning('Cache server %s failed: %s', parts[0], error)
+            return None
+        self._release(connection)
+        return reply
+
+    def get(self, key: str) -> Optional[bytes]:
+        value = self._execute('GET', self.prefix + key)
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        milliseconds = int(ttl * 1000)
+        if milliseconds <= 0:
+            return
+        self._execute('SET', self.prefix + key, value, 'PX', milliseconds)
+
+    def delete(self, keys: Sequence[str]) -> None:
+        if keys:
+            self._execute('DEL', *(self.prefix + key for key in keys))
+
+    def evict_local(self, keys: Sequence[str]) -> None:
+        # Nothing is held locally; the writer already deleted the shared keys.
+        pass
+
+    def clear(self) -> None:
+        # SCAN walks the keyspace in steps, so unlike KEYS it never blocks
+        # the server; only keys under this backend's prefix are deleted.
+        pattern = re.sub(r'([*?\[\]\\])', r'\\\1', self.prefix) + '*'
+        cursor = b'0'
+        while True:
+            reply = self._execute('SCAN', cursor, 'MATCH', pattern, 'COUNT', 1000)
+            if reply is None:
+                return
+            cursor, keys = reply
+            if keys:
+                self._execute('DEL', *keys)
+            if cursor == b'0':
+                return
+
+    def clear_local(self) -> None:
+        # Nothing is held locally.
+        pass
+
+    def close(self) -> None:
+        """
+        Closes every idle connection.
+        """
+        connections: List[RespConnection] = []
+        while True:
+            try:
+                connections.append(self._pool.get_nowait())
+            except queue.Empty:
+                break
+        for connection in connections:
+            connection.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'backend': 'redis',
+                'server': f'{self.host}:{self.port}/{self.db}',
+                'ttl': self.ttl,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_ratio': round(self._hits / lookups, 4) if lookups else 0.0,
+                'errors': self._errors,
+            }
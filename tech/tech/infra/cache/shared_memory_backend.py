@@ -0,0 +1,233 @@
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional, Sequence
+
+from tech.infra.cache.backends import CacheBackend
+
+MAGIC = b'USRC'
+HEADER = struct.Struct('<4sIII')
+HEADER_SIZE = 64
+VERSION = 1
+
+SLOT_HEADER = struct.Struct('<B3xIQdH6x')
+KEY_MAX = 96
+EMPTY, USED = 0, 1
+
+
+class SharedMemoryBackend(CacheBackend):
+    """
+    Cache backend in a memory-mapped file shared by every worker of a pod.
+
+    The segment is a fixed array of `slots` slots of `slot_size` bytes. A key
+    is hashed (BLAKE2b) to a bucket and may live in any of the `probe` slots
+    from there; when all of them hold live entries, the one closest to expiry
+    is evicted. Each slot stores the key, its hash, its expiry time and the
+    serialized value, so a hit is a copy out of the mapping. Every operation
+    holds an `flock` on the file (shared for reads, exclusive for writes), so
+    writes, evictions and invalidations made by one worker are immediately
+    visible to the others. Values that do not fit a slot are not cached.
+    Every worker must use the same `slots` and `slot_size`; opening a segment
+    created with another geometry raises ValueError.
+
+    Put the file on a tmpfs such as /dev/shm so the pages never hit the disk.
+    """
+
+    def __init__(self, path: str, slots: int = 16384, slot_size: int = 1024, ttl: float = 60.0,
+                 probe: int = 8, clock: Callable[[], float] = time.time):
+        """
+        Opens the segment, creating it when needed.
+
+        Args:
+            path (str): The file backing the segment.
+            slots (int): The number of slots.
+            slot_size (int): The size of each slot in bytes, header and key included.
+            ttl (float): Seconds a value stays valid unless a TTL is given.
+            probe (int): The number of consecutive slots a key may occupy.
+            clock (Callable[[], float]): Wall clock shared by all processes,
+                injectable for tests.
+        """
+        if slot_size <= SLOT_HEADER.size + KEY_MAX:
+            raise ValueError(f'slot_size must be larger than {SLOT_HEADER.size + KEY_MAX} bytes')
+        self.path = path
+        self.slots = slots
+        self.slot_size = slot_size
+        self.ttl = ttl
+        self.probe = min(probe, slots)
+        self._clock = clock
+        self._capacity = slot_size - SLOT_HEADER.size - KEY_MAX
+        self._size = HEADER_SIZE + slots * slot_size
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._oversized = 0
+        self._open()
+
+    def _open(self) -> None:
+        # flock is held per open file, so each process (including ones forked
+        # after the backend was created) needs a descriptor of its own.
+        self._pid = os.getpid()
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            header = self._read_header()
+            expected = (MAGIC, VERSION, self.slots, self.slot_size)
+            resized = os.fstat(self._fd).st_size != self._size
+            if header is None or (header == expected and resized):
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, self._size)
+                os.pwrite(self._fd, HEADER.pack(*expected), 0)
+                header = expected
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        if header != expected:
+            # Resetting the segment here would wipe it for the workers that
+            # created it, which would then reset it back for this one.
+            os.close(self._fd)
+            raise ValueError(
+                f'{self.path} holds a version {header[1]} segment of '
+                f'{header[2]} slots of {header[3]} bytes, not version '
+                f'{VERSION} with {self.slots} slots of {self.slot_size} bytes'
+            )
+        self._map = mmap.mmap(self._fd, self._size)
+
+    def _read_header(self) -> Optional[tuple]:
+        header = os.pread(self._fd, HEADER.size, 0)
+        if len(header) < HEADER.size or header[:len(MAGIC)] != MAGIC:
+            return None
+        return HEADER.unpack(header)
+
+    @contextmanager
+    def _locked(self, mode: int):
+        with self._lock:
+            if self._pid != os.getpid():
+                self.close()
+                self._open()
+            fcntl.flock(self._fd, mode)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _hash(key: bytes) -> int:
+        return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little')
+
+    def _offsets(self, key_hash: int):
+        start = key_hash % self.slots
+        for step in range(self.probe):
+            yield HEADER_SIZE + ((start + step) % self.slots) * self.slot_size
+
+    def _slot(self, offset: int):
+        return SLOT_HEADER.unpack_from(self._map, offset)
+
+    def _find(self, key: bytes, key_hash: int) -> Optional[int]:
+        for offset in self._offsets(key_hash):
+            state, _, stored_hash, _, key_len = self._slot(offset)
+            if state == USED and stored_hash == key_hash and key_len == len(key):
+                start = offset + SLOT_HEADER.size
+                if self._map[start:start + key_len] == key:
+                    return offset
+        return None
+
+    def get(self, key: str) -> Optional[bytes]:
+        raw = key.encode()
+        key_hash = self._hash(raw)
+        with self._locked(fcntl.LOCK_SH):
+            offset = self._find(raw, key_hash)
+            value = None
+            if offset is not None:
+                _, value_len, _, expires, _ = self._slot(offset)
+                if self._clock() < expires:
+                    start = offset + SLOT_HEADER.size + KEY_MAX
+                    value = self._map[start:start + value_len]
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        raw = key.encode()
+        if ttl <= 0:
+            return
+        if len(raw) > KEY_MAX or len(value) > self._capacity:
+            with self._lock:
+                self._oversized += 1
+            return
+        key_hash = self._hash(raw)
+        now = self._clock()
+        with self._locked(fcntl.LOCK_EX):
+            offset = self._find(raw, key_hash)
+            if offset is None:
+                offset = self._victim(key_hash, now)
+            SLOT_HEADER.pack_into(self._map, offset, USED, len(value), key_hash, now + ttl, len(raw))
+            start = offset + SLOT_HEADER.size
+            self._map[start:start + len(raw)] = raw
+            start += KEY_MAX
+            self._map[start:start + len(value)] = value
+
+    def _victim(self, key_hash: int, now: float) -> int:
+        victim, soonest = None, None
+        for offset in self._offsets(key_hash):
+            state, _, _, expires, _ = self._slot(offset)
+            if state == EMPTY or expires <= now:
+                return offset
+            if soonest is None or expires < soonest:
+                victim, soonest = offset, expires
+        self._evictions += 1
+        return victim
+
+    def delete(self, keys: Sequence[str]) -> None:
+        with self._locked(fcntl.LOCK_EX):
+            for key in keys:
+                raw = key.encode()
+                offset = self._find(raw, self._hash(raw))
+                if offset is not None:
+                    self._map[offset] = EMPTY
+
+    def clear(self) -> None:
+        with self._locked(fcntl.LOCK_EX):
+            for slot in range(self.slots):
+                self._map[HEADER_SIZE + slot * self.slot_size] = EMPTY
+
+    def clear_local(self) -> None:
+        # Every entry lives in the segment shared with the other workers.
+        pass
+
+    def close(self) -> None:
+        """
+        Unmaps the segment; the file is left for the other workers.
+        """
+        self._map.close()
+        os.close(self._fd)
+
+    def stats(self) -> dict:
+        now = self._clock()
+        with self._locked(fcntl.LOCK_SH):
+            entries = sum(
+                1 for slot in range(self.slots)
+                if self._map[HEADER_SIZE + slot * self.slot_size] == USED
+                and self._slot(HEADER_SIZE + slot * self.slot_size)[3] > now
+            )
+            lookups = self._hits + self._misses
+            return {
+                'backend': 'shared-memory',
+                'path': self.path,
+                'entries': entries,
+                'slots': self.slots,
+                'slot_size': self.slot_size,
+                'ttl': self.ttl,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_ratio': round(self._hits / lookups, 4) if lookups else 0.0,
+                'evictions': self._evictions,
+                'oversized': self._oversized,
+            }
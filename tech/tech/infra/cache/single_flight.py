@@ -0,0 +1,83 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time across threads.
+
+    Callers arriving while a call for the same key is running wait for it and
+    share its result (or exception) instead of starting their own, so a burst
+    of misses on one hot key causes a single query.
+    """
+
+    def __init__(self):
+        """
+        Initializes the group with no calls in flight.
+        """
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Calls `fn` unless a call for `key` is already running.
+
+        Args:
+            key (Hashable): Identifies the work being done.
+            fn (Callable[[], Any]): The call to run.
+
+        Returns:
+            Any: The result of the call, whichever caller ran it.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result()
+        try:
+            future.set_result(fn())
+        except BaseException as error:
+            future.set_exception(error)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return future.result()
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio twin of SingleFlight.
+    """
+
+    def __init__(self):
+        """
+        Initializes the group with no calls in flight.
+        """
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Awaits `fn` unless a call for `key` is already running.
+
+        Args:
+            key (Hashable): Identifies the work being done.
+            fn (Callable[[], Awaitable[Any]]): The coroutine function to run.
+
+        Returns:
+            Any: The result of the call, whichever caller ran it.
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self.shared += 1
+            return await asyncio.shield(future)
+        future = self._calls[key] = asyncio.ensure_future(fn())
+        future.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(future)
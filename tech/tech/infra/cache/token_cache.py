@@ -0,0 +1,110 @@
+import copy
+import hashlib
+import threading
+import time
+from typing import Callable
+
+from tech.infra.cache.memory_cache import MISSING, MemoryCache
+
+REVOKED = object()
+
+
+class VerifiedTokenCache:
+    """
+    Bounded cache of verified JWTs, keyed by the SHA-256 digest of the token.
+
+    A verified token maps to the user data extracted from it and is kept
+    until the token's `exp`, so repeated checks of the same token skip the
+    signature verification. Tokens themselves are never stored. Revoked
+    tokens are remembered, outside the LRU so they cannot be evicted, until
+    they expire; a lookup for one returns REVOKED.
+    """
+
+    def __init__(self, max_entries: int, clock: Callable[[], float] = time.time):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_entries (int): The most verified tokens kept at once; 0 disables
+                caching but keeps revocation working.
+            clock (Callable[[], float]): Wall clock, comparable with `exp`,
+                injectable for tests.
+        """
+        self._clock = clock
+        self._entries = MemoryCache(max_entries, 0, clock=clock)
+        self._revoked = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str):
+        """
+        Returns the user data of a token verified earlier.
+
+        Args:
+            token (str): The raw JWT.
+
+        Returns:
+            The user data, REVOKED when the token was revoked, or None when it
+            was not verified yet or has expired.
+        """
+        digest = self._digest(token)
+        if self._revoked and digest in self._revoked:
+            with self._lock:
+                expires_at = self._revoked.get(digest)
+                if expires_at is not None and self._clock() < expires_at:
+                    return REVOKED
+                self._revoked.pop(digest, None)
+        user_data = self._entries.get(digest)
+        return None if user_data is MISSING else copy.deepcopy(user_data)
+
+    def put(self, token: str, user_data: dict, expires_at: float) -> None:
+        """
+        Stores the user data of a verified token until it expires.
+
+        Args:
+            token (str): The raw JWT.
+            user_data (dict): What verification returned for the token.
+            expires_at (float): The token's `exp`, in seconds since the epoch.
+        """
+        digest = self._digest(token)
+        if digest in self._revoked:
+            return
+        self._entries.set(digest, copy.deepcopy(user_data), ttl=expires_at - self._clock())
+
+    def revoke(self, token: str, expires_at: float) -> None:
+        """
+        Drops a token and rejects it until it expires.
+
+        Args:
+            token (str): The raw JWT.
+            expires_at (float): The token's `exp`, after which it is rejected anyway.
+        """
+        digest = self._digest(token)
+        now = self._clock()
+        with self._lock:
+            self._revoked = {key: until for key, until in self._revoked.items() if until > now}
+            if expires_at > now:
+                self._revoked[digest] = expires_at
+        self._entries.delete(digest)
+
+    def clear(self) -> None:
+        """
+        Drops every verified token; revocations are kept.
+        """
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Reports the size and effectiveness of the cache.
+
+        Returns:
+            dict: The verified-token cache counters and the number of revoked tokens.
+        """
+        stats = self._entries.stats()
+        del stats['ttl']
+        with self._lock:
+            stats['revoked'] = len(self._revoked)
+        return stats
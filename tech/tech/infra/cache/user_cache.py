@@ -0,0 +1,504 @@
+import asyncio
+import copy
+import json
+import logging
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from datetime import datetime
+from functools import lru_cache
+from typing import Awaitable, Callable, Iterable, List, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+from tech.domain.entities.users import User
+from tech.domain.security import get_cpf_blind_index
+from tech.infra.cache.backends import CacheBackend, MemoryBackend, TwoTierBackend
+from tech.infra.cache.memory_cache import MISSING, MemoryCache
+from tech.infra.cache.single_flight import AsyncSingleFlight, SingleFlight
+
+NOT_FOUND = b''
+STORED_AT = struct.Struct('<d')
+
+STALE_WARNING = '110 - "Response is Stale"'
+REVALIDATION_FAILED_WARNING = '111 - "Revalidation Failed"'
+
+# Set when the current request was answered with a stale entry: (age in
+# seconds, Warning header value).
+stale_read: ContextVar[Optional[Tuple[float, str]]] = ContextVar('stale_read', default=None)
+
+logger = logging.getLogger(__name__)
+
+
+def stale_response_headers() -> dict:
+    """
+    Returns the headers flagging a response built from a stale cache entry.
+
+    Returns:
+        dict: `Age` and `Warning` when the current request was served stale,
+        otherwise empty.
+    """
+    served = stale_read.get()
+    if served is None:
+        return {}
+    age, warning = served
+    return {'Age': str(int(age)), 'Warning': warning}
+
+
+def encode_user(user: User) -> bytes:
+    """
+    Serializes a user for the cache.
+
+    The password hash is left out: cached reads only feed responses, and the
+    record may live in Redis or a shared-memory file.
+
+    Args:
+        user (User): The user entity.
+
+    Returns:
+        bytes: Compact JSON with every field of the entity but the password.
+    """
+    return json.dumps({
+        'id': user.id,
+        'username': user.username,
+        'email': user.email,
+        'cpf': str(user.cpf),
+        'created_at': user.created_at.isoformat() if user.created_at else None,
+        'updated_at': user.updated_at.isoformat() if user.updated_at else None,
+    }, separators=(',', ':')).encode()
+
+
+def decode_user(value: bytes) -> User:
+    """
+    Rebuilds a user serialized by `encode_user`.
+
+    Args:
+        value (bytes): The cached bytes.
+
+    Returns:
+        User: A new user entity, without its password hash.
+    """
+    data = json.loads(value)
+    user = User(username=data['username'], password=None, cpf=data['cpf'],
+                email=data['email'], id=data['id'])
+    user.created_at = datetime.fromisoformat(data['created_at']) if data['created_at'] else None
+    user.updated_at = datetime.fromisoformat(data['updated_at']) if data['updated_at'] else None
+    return user
+
+
+class UserCache:
+    """
+    Read-through cache of users, keyed by ID and by CPF.
+
+    The user is stored under its ID; the CPF key (its blind index, never the
+    plain CPF) only points at that ID, so invalidating the ID also retires
+    every CPF that led to it. Misses are loaded once per key however many
+    callers are waiting, and a load that raced with a write is not kept.
+    Users are stored serialized, so callers always receive their own entity,
+    and without their password hash; read it from the repository instead.
+
+    Keys that do not exist are remembered too, for `negative_ttl` seconds, so
+    repeated checks for unregistered CPFs or IDs stop reaching the database.
+    Creating a user drops the negative entries of its ID and CPF.
+
+    With a `ttl`, a user older than it is stale. For `stale_while_revalidate`
+    more seconds it is still served while `refresh` reloads it in the
+    background; for `stale_if_error` more seconds it is served when loading
+    it from the database fails. Stale answers are flagged in `stale_read`.
+    """
+
+    def __init__(self, cache: CacheBackend, negative_ttl: float = 0.0, ttl: Optional[float] = None,
+                 stale_while_revalidate: float = 0.0, stale_if_error: float = 0.0,
+                 refresh: Optional[Callable[[int], Optional[User]]] = None,
+                 clock: Callable[[], float] = time.time):
+        """
+        Initializes the user cache.
+
+        Args:
+            cache (CacheBackend): The backend holding the serialized entries.
+            negative_ttl (float): Seconds a not-found result is remembered.
+                Zero disables negative caching.
+            ttl (Optional[float]): Seconds a user is fresh. None leaves expiry to
+                the backend and never serves stale entries.
+            stale_while_revalidate (float): Seconds past `ttl` a user is served
+                while it is refreshed in the background.
+            stale_if_error (float): Seconds past `ttl` a user is served when the
+                database cannot be read.
+            refresh (Optional[Callable[[int], Optional[User]]]): Reads a user by ID
+                with a session of its own, for background refreshes.
+            clock (Callable[[], float]): Wall clock shared by all processes,
+                injectable for tests.
+        """
+        self.cache = cache
+        self.negative_ttl = negative_ttl
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate if refresh else 0.0
+        self.stale_if_error = stale_if_error
+        self.refresh = refresh
+        self.negative_hits = 0
+        self.stale_hits = 0
+        self.stale_on_error = 0
+        self.refreshes = 0
+        self.flight = SingleFlight()
+        self.async_flight = AsyncSingleFlight()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._refreshing = set()
+        self._refresher: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def _id_key(user_id: int) -> str:
+        return f'id:{user_id}'
+
+    @staticmethod
+    def _cpf_key(cpf: str) -> str:
+        return f'cpf:{get_cpf_blind_index(cpf)}'
+
+    @property
+    def _stored_ttl(self) -> Optional[float]:
+        # Stale entries must outlive the TTL for as long as they may be served.
+        if self.ttl is None:
+            return None
+        return self.ttl + max(self.stale_while_revalidate, self.stale_if_error)
+
+    async def _off_loop(self, fn: Callable, *args):
+        # Network backends are called from a worker thread so a slow cache
+        # server never stalls the event loop.
+        if self.cache.blocking:
+            return await asyncio.to_thread(fn, *args)
+        return fn(*args)
+
+    def _negative_hit(self):
+        self.negative_hits += 1
+        return None, 0.0
+
+    def _cached_by_id(self, user_id: int) -> Tuple[object, float]:
+        value = self.cache.get(self._id_key(user_id))
+        if value is None:
+            return MISSING, 0.0
+        if value == NOT_FOUND:
+            return self._negative_hit()
+        stored_at, = STORED_AT.unpack_from(value)
+        return decode_user(value[STORED_AT.size:]), max(self._clock() - stored_at, 0.0)
+
+    def _cached_by_cpf(self, cpf: str) -> Tuple[object, float]:
+        user_id = self.cache.get(self._cpf_key(cpf))
+        if user_id is None:
+            return MISSING, 0.0
+        if user_id == NOT_FOUND:
+            return self._negative_hit()
+        user, age = self._cached_by_id(int(user_id))
+        if user is None or user is MISSING or user.cpf != cpf:
+            return MISSING, 0.0
+        return user, age
+
+    def _store(self, key: str, user: Optional[User], generation: int) -> Optional[User]:
+        if generation != self._generation:
+            return user
+        if user is None:
+            written = [key]
+            self.cache.set(key, NOT_FOUND, ttl=self.negative_ttl)
+        else:
+            written = [self._id_key(user.id), self._cpf_key(user.cpf)]
+            stored_at = STORED_AT.pack(self._clock())
+            self.cache.set(written[0], stored_at + encode_user(user), ttl=self._stored_ttl)
+            self.cache.set(written[1], str(user.id).encode(), ttl=self._stored_ttl)
+        # A write may have been invalidated while the entries were being
+        # stored; take them back out rather than hold the backend's lock
+        # across network calls.
+        if generation != self._generation:
+            self.cache.delete(written)
+        return user
+
+    def _is_fresh(self, age: float) -> bool:
+        return self.ttl is None or age < self.ttl
+
+    def _serve_stale(self, user: User, age: float, window: float, warning: str) -> bool:
+        if user is MISSING or age >= self.ttl + window:
+            return False
+        stale_read.set((age, warning))
+        return True
+
+    def _schedule_refresh(self, user_id: int) -> None:
+        with self._lock:
+            if user_id in self._refreshing:
+                return
+            self._refreshing.add(user_id)
+            if self._refresher is None:
+                self._refresher = ThreadPoolExecutor(max_workers=2, thread_name_prefix='user-cache-refresh')
+        self._refresher.submit(self._run_refresh, user_id)
+
+    def _run_refresh(self, user_id: int) -> None:
+        try:
+            generation = self._generation
+            self._store(self._id_key(user_id), self.refresh(user_id), generation)
+            self.refreshes += 1
+        except Exception:
+            logger.exception('Background refresh of user %s failed', user_id)
+        finally:
+            with self._lock:
+                self._refreshing.discard(user_id)
+
+    def _resolve(self, key: str, user, age: float, load: Callable[[], Optional[User]]) -> Optional[User]:
+        if user is not None and user is not MISSING and self._is_fresh(age):
+            return user
+        if user is None:
+            return None
+        if self._serve_stale(user, age, self.stale_while_revalidate, STALE_WARNING):
+            self.stale_hits += 1
+            self._schedule_refresh(user.id)
+            return user
+        generation = self._generation
+        try:
+            return copy.copy(self.flight.do(key, lambda: self._store(key, load(), generation)))
+        except (SQLAlchemyError, OSError):
+            if not self._serve_stale(user, age, self.stale_if_error, REVALIDATION_FAILED_WARNING):
+                raise
+            self.stale_on_error += 1
+            return user
+
+    async def _aresolve(self, key: str, user, age: float,
+                        load: Callable[[], Awaitable[Optional[User]]]) -> Optional[User]:
+        if user is not None and user is not MISSING and self._is_fresh(age):
+            return user
+        if user is None:
+            return None
+        if self._serve_stale(user, age, self.stale_while_revalidate, STALE_WARNING):
+            self.stale_hits += 1
+            self._schedule_refresh(user.id)
+            return user
+        generation = self._generation
+
+        async def fill():
+            return await self._off_loop(self._store, key, await load(), generation)
+
+        try:
+            return copy.copy(await self.async_flight.do(key, fill))
+        except (SQLAlchemyError, OSError):
+            if not self._serve_stale(user, age, self.stale_if_error, REVALIDATION_FAILED_WARNING):
+                raise
+            self.stale_on_error += 1
+            return user
+
+    def get_by_id(self, user_id: int, load: Callable[[], Optional[User]]) -> Optional[User]:
+        """
+        Returns the cached user with the given ID, loading it on a miss.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+            load (Callable[[], Optional[User]]): Reads the user from the database.
+
+        Returns:
+            Optional[User]: The user, or None if it does not exist.
+        """
+        user, age = self._cached_by_id(user_id)
+        return self._resolve(self._id_key(user_id), user, age, load)
+
+    def get_by_cpf(self, cpf: str, load: Callable[[], Optional[User]]) -> Optional[User]:
+        """
+        Returns the cached user with the given CPF, loading it on a miss.
+
+        Args:
+            cpf (str): The CPF of the user.
+            load (Callable[[], Optional[User]]): Reads the user from the database.
+
+        Returns:
+            Optional[User]: The user, or None if it does not exist.
+        """
+        user, age = self._cached_by_cpf(cpf)
+        return self._resolve(self._cpf_key(cpf), user, age, load)
+
+    async def aget_by_id(self, user_id: int, load: Callable[[], Awaitable[Optional[User]]]) -> Optional[User]:
+        """
+        Awaitable variant of `get_by_id`.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+            load (Callable[[], Awaitable[Optional[User]]]): Reads the user from the database.
+
+        Returns:
+            Optional[User]: The user, or None if it does not exist.
+        """
+        user, age = await self._off_loop(self._cached_by_id, user_id)
+        return await self._aresolve(self._id_key(user_id), user, age, load)
+
+    async def aget_by_cpf(self, cpf: str, load: Callable[[], Awaitable[Optional[User]]]) -> Optional[User]:
+        """
+        Awaitable variant of `get_by_cpf`.
+
+        Args:
+            cpf (str): The CPF of the user.
+            load (Callable[[], Awaitable[Optional[User]]]): Reads the user from the database.
+
+        Returns:
+            Optional[User]: The user, or None if it does not exist.
+        """
+        user, age = await self._off_loop(self._cached_by_cpf, cpf)
+        return await self._aresolve(self._cpf_key(cpf), user, age, load)
+
+    def _keys(self, changes: Iterable[Tuple[Optional[int], Optional[str]]]) -> List[str]:
+        keys = []
+        for user_id, cpf_index in changes:
+            if user_id is not None:
+                keys.append(self._id_key(user_id))
+            if cpf_index:
+                keys.append(f'cpf:{cpf_index}')
+        return keys
+
+    def _evict(self, keys: List[str], local: bool = False) -> None:
+        with self._lock:
+            self._generation += 1
+        if keys:
+            (self.cache.evict_local if local else self.cache.delete)(keys)
+
+    def invalidate(self, user_id: Optional[int], cpf: Optional[str] = None) -> None:
+        """
+        Drops what is cached for a user after it was written.
+
+        Args:
+            user_id (Optional[int]): The ID of the user written.
+            cpf (Optional[str]): A CPF the user now has, if it may have changed.
+        """
+        self.invalidate_many([(user_id, cpf)])
+
+    def invalidate_many(self, users: Iterable[Tuple[Optional[int], Optional[str]]]) -> None:
+        """
+        Drops what is cached for many written users in one backend call.
+
+        Args:
+            users (Iterable[Tuple[Optional[int], Optional[str]]]): The ID of each
+                user written and a CPF it now has, if it may have changed.
+        """
+        self._evict(self._keys(
+            (user_id, get_cpf_blind_index(cpf) if cpf else None) for user_id, cpf in users
+        ))
+
+    async def ainvalidate_many(self, users: Iterable[Tuple[Optional[int], Optional[str]]]) -> None:
+        """
+        Awaitable variant of `invalidate_many`.
+
+        Args:
+            users (Iterable[Tuple[Optional[int], Optional[str]]]): The ID of each
+                user written and a CPF it now has, if it may have changed.
+        """
+        await self._off_loop(self.invalidate_many, list(users))
+
+    def invalidate_index(self, user_id: Optional[int], cpf_index: Optional[str] = None) -> None:
+        """
+        Drops this process's copies of a user written by another process,
+        which announces the blind index of the CPF rather than the CPF itself.
+
+        Args:
+            user_id (Optional[int]): The ID of the user written.
+            cpf_index (Optional[str]): The blind index of a CPF the user now has.
+        """
+        self._evict(self._keys([(user_id, cpf_index)]), local=True)
+
+    def clear_local(self) -> None:
+        """
+        Drops every entry held by this process, for when writes announced by
+        other processes may have been missed. Tiers shared with them are kept,
+        since those writers update them directly.
+        """
+        with self._lock:
+            self._generation += 1
+        self.cache.clear_local()
+
+    def stats(self) -> dict:
+        """
+        Reports the cache counters.
+
+        Returns:
+            dict: The backend's counters, the lookups answered by a remembered
+            not-found result or a stale entry, the background refreshes and the
+            lookups that shared another caller's load.
+        """
+        return {
+            **self.cache.stats(),
+            'negative_ttl': self.negative_ttl,
+            'negative_hits': self.negative_hits,
+            'stale_while_revalidate': self.stale_while_revalidate,
+            'stale_if_error': self.stale_if_error,
+            'stale_hits': self.stale_hits,
+            'stale_on_error': self.stale_on_error,
+            'refreshes': self.refreshes,
+            'single_flight_shared': self.flight.shared + self.async_flight.shared,
+        }
+
+
+def create_cache_backend(settings) -> CacheBackend:
+    """
+    Builds the backend selected by USERS_CACHE_BACKEND.
+
+    Args:
+        settings (Settings): The application settings.
+
+    Returns:
+        CacheBackend: `memory` (per process), `shared-memory` (per pod),
+        `redis` (shared) or `two-tier` (a short-lived memory tier in front of
+        the shared one).
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    from tech.infra.cache.redis_backend import RedisBackend
+    from tech.infra.cache.shared_memory_backend import SharedMemoryBackend
+
+    name = settings.USERS_CACHE_BACKEND
+    if name == 'memory':
+        return MemoryBackend(MemoryCache(settings.USERS_CACHE_MAX_ENTRIES, settings.USERS_CACHE_TTL))
+    if name == 'shared-memory':
+        return SharedMemoryBackend(
+            settings.USERS_CACHE_SHARED_PATH,
+            slots=settings.USERS_CACHE_SHARED_SLOTS,
+            slot_size=settings.USERS_CACHE_SHARED_SLOT_SIZE,
+            ttl=settings.USERS_CACHE_TTL,
+        )
+    if name not in ('redis', 'two-tier'):
+        raise ValueError(
+            f"Unknown USERS_CACHE_BACKEND '{name}'; expected memory, shared-memory, redis or two-tier"
+        )
+    far = RedisBackend(
+        settings.USERS_CACHE_REDIS_URL,
+        ttl=settings.USERS_CACHE_TTL,
+        timeout=settings.USERS_CACHE_REDIS_TIMEOUT,
+        pool_size=settings.USERS_CACHE_REDIS_POOL_SIZE,
+    )
+    if name == 'redis':
+        return far
+    near = MemoryBackend(MemoryCache(settings.USERS_CACHE_MAX_ENTRIES, settings.USERS_CACHE_NEAR_TTL))
+    return TwoTierBackend(near, far, near_ttl=settings.USERS_CACHE_NEAR_TTL)
+
+
+def _load_user_from_primary(user_id: int) -> Optional[User]:
+    from sqlalchemy.orm import Session
+    from tech.infra.databases.database import engine
+    from tech.infra.repositories.sql_alchemy_user_repository import SQLAlchemyUserRepository
+
+    with Session(engine) as session:
+        return SQLAlchemyUserRepository(session).get_by_id(user_id)
+
+
+@lru_cache
+def get_user_cache() -> Optional[UserCache]:
+    """
+    Returns the process-wide user cache, configured from Settings.
+
+    Returns:
+        Optional[UserCache]: The shared cache, or None unless USERS_CACHE_ENABLED is set.
+    """
+    from tech.infra.settings.settings import Settings
+
+    settings = Settings()
+    if not settings.USERS_CACHE_ENABLED:
+        return None
+    return UserCache(
+        create_cache_backend(settings),
+        settings.USERS_CACHE_NEGATIVE_TTL,
+        ttl=settings.USERS_CACHE_TTL,
+        stale_while_revalidate=settings.USERS_CACHE_STALE_WHILE_REVALIDATE,
+        stale_if_error=settings.USERS_CACHE_STALE_IF_ERROR,
+        refresh=_load_user_from_primary,
+    )
@@ -0,0 +1,73 @@
+"""Backfill of the CPF blind index column.
+
+Fills `users.cpf_index` for rows written before the column existed, in
+batches keyed by primary key so it can run against a live table. The Alembic
+migration that adds the column runs it once; run it again by hand after
+rotating `CPF_INDEX_KEY` (with `--all`) or to finish an interrupted run:
+
+    python -m tech.infra.databases.cpf_index_backfill [--all]
+"""
+import argparse
+
+from sqlalchemy import Connection, create_engine, text
+
+from tech.domain.security import get_cpf_blind_index, get_cpf_index_key
+from tech.infra.settings.settings import Settings
+
+def backfill_cpf_index(connection: Connection, key: bytes,
+                       batch_size: int = 1000,
+                       only_missing: bool = True) -> int:
+    """
+    Computes and stores the blind index of every CPF, batch by batch.
+
+    Args:
+        connection (Connection): An open SQLAlchemy connection.
+        key (bytes): The HMAC key of the blind index.
+        batch_size (int): How many rows are read and updated per round trip.
+        only_missing (bool): Skip rows that already have an index.
+
+    Returns:
+        int: The number of rows updated.
+    """
+    missing_filter = 'AND cpf_index IS NULL' if only_missing else ''
+    select_batch = text(
+        'SELECT id, cpf FROM users '
+        f'WHERE id > :after AND cpf IS NOT NULL {missing_filter} '
+        'ORDER BY id LIMIT :batch_size'
+    )
+    update_row = text('UPDATE users SET cpf_index = :cpf_index WHERE id = :id')
+
+    updated = 0
+    after = 0
+    while True:
+        rows = connection.execute(
+            select_batch, {'after': after, 'batch_size': batch_size}
+        ).all()
+        if not rows:
+            return updated
+        connection.execute(update_row, [
+            {'id': row.id, 'cpf_index': get_cpf_blind_index(row.cpf, key)}
+            for row in rows
+        ])
+        updated += len(rows)
+        after = rows[-1].id
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--all', action='store_true',
+                        help='recompute every row, e.g. after a key rotation')
+    args = parser.parse_args(argv)
+
+    engine = create_engine(Settings().DATABASE_URL)
+    with engine.begin() as connection:
+        updated = backfill_cpf_index(
+            connection, get_cpf_index_key(), args.batch_size,
+            only_missing=not args.all,
+        )
+    print(f'{updated} rows updated')
+
+
+if __name__ == '__main__':
+    main()
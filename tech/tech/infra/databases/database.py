@@ -1,22 +1,240 @@
+from functools import lru_cache
+from typing import List, Optional
+
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from fastapi import Request
+from sqlalchemy import Engine, create_engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import Session
+from tech.infra.databases.pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool
+from tech.infra.databases.routing import ReadYourWritesWindow, ReplicaSet, RoutingSession
+from tech.infra.databases.user_export import UserExporter
+from tech.infra.repositories.user_loader import AsyncUserLoader, UserLoader
 from tech.infra.settings.settings import Settings
-from pydantic_settings import BaseSettings
 
 
-class Settings(BaseSettings):
-    DATABASE_URL: str = "sqlite:///:memory:"  # Default for testing
+def _pool_options(settings: Settings) -> dict:
+    """
+    Builds the QueuePool options shared by the sync and async engines.
+
+    Args:
+        settings (Settings): The application settings holding the pool options.
+
+    Returns:
+        dict: Keyword arguments for `create_engine`/`create_async_engine`.
+    """
+    return {
+        'pool_size': settings.DATABASE_POOL_SIZE,
+        'max_overflow': settings.DATABASE_MAX_OVERFLOW,
+        'pool_timeout': settings.DATABASE_POOL_TIMEOUT,
+        'pool_pre_ping': settings.DATABASE_POOL_PRE_PING,
+        'pool_recycle': settings.DATABASE_POOL_RECYCLE,
+    }
+
+
+def create_database_engine(url: str, settings: Settings) -> Engine:
+    """
+    Creates an engine whose connection pool is sized and tuned from Settings.
+
+    SQLite (used by tests) keeps SQLAlchemy's default pool, since it does not
+    support the QueuePool options.
+
+    Args:
+        url (str): The database URL.
+        settings (Settings): The application settings holding the pool options.
+
+    Returns:
+        Engine: The configured engine.
+    """
+    if make_url(url).get_backend_name() == 'sqlite':
+        return create_engine(url)
+    return create_engine(url, poolclass=InstrumentedQueuePool, **_pool_options(settings))
+
+
+def create_async_database_engine(url: str, settings: Settings) -> AsyncEngine:
+    """
+    Creates an asyncio engine with the same pool options as the sync one.
+
+    psycopg 3 serves both stacks, so the `postgresql+psycopg` URL is used
+    unchanged; SQLAlchemy picks its async dialect.
+
+    Args:
+        url (str): The database URL.
+        settings (Settings): The application settings holding the pool options.
+
+    Returns:
+        AsyncEngine: The configured async engine.
+    """
+    if make_url(url).get_backend_name() == 'sqlite':
+        return create_async_engine(url)
+    return create_async_engine(
+        url, poolclass=InstrumentedAsyncQueuePool, **_pool_options(settings)
+    )
+
+
+def get_pool_stats(engine: Engine) -> dict:
+    """
+    Reports the live state of an engine's connection pool.
+
+    Args:
+        engine (Engine): The engine to inspect.
+
+    Returns:
+        dict: The pool statistics, or its plain status line for pools that
+            are not instrumented.
+    """
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        return engine.pool.stats()
+    return {'status': engine.pool.status()}
+
+
+def get_replica_urls(settings: Settings) -> List[str]:
+    """
+    Parses the comma-separated DATABASE_REPLICA_URLS setting.
+
+    Args:
+        settings (Settings): The application settings.
+
+    Returns:
+        List[str]: The replica URLs, empty when no replica is configured.
+    """
+    return [url.strip() for url in settings.DATABASE_REPLICA_URLS.split(',') if url.strip()]
+
+
+def get_client_id(request: Request) -> Optional[str]:
+    """
+    Identifies the client for the read-your-writes window.
 
-    class Config:
-        env_file = ".env"
+    Args:
+        request (Request): The incoming request.
 
+    Returns:
+        Optional[str]: The X-Client-Id header, falling back to the client address.
+    """
+    client_id = request.headers.get('x-client-id')
+    if client_id:
+        return client_id
+    return request.client.host if request.client else None
 
 
 load_dotenv()
-engine = create_engine(Settings().DATABASE_URL)
+settings = Settings()
+engine = create_database_engine(settings.DATABASE_URL, settings)
+replicas = ReplicaSet(
+    [create_database_engine(url, settings) for url in get_replica_urls(settings)],
+    health_interval=settings.DATABASE_REPLICA_HEALTH_INTERVAL,
+)
+read_your_writes = ReadYourWritesWindow(settings.DATABASE_READ_YOUR_WRITES_SECONDS)
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    """
+    Returns the process-wide async engine, created on first use.
+
+    It is created lazily so the sync stack never needs an async driver.
+
+    Returns:
+        AsyncEngine: The shared async engine.
+    """
+    return create_async_database_engine(settings.DATABASE_URL, settings)
+
+
+@lru_cache
+def get_async_replicas() -> ReplicaSet:
+    """
+    Returns the async replica engines, created on first use.
+
+    Returns:
+        ReplicaSet: The replicas, wrapping the sync facade of each async engine.
+    """
+    return ReplicaSet(
+        [create_async_database_engine(url, settings).sync_engine for url in get_replica_urls(settings)],
+        health_interval=settings.DATABASE_REPLICA_HEALTH_INTERVAL,
+    )
+
+
+async def dispose_async_engine() -> None:
+    """
+    Closes the async engines' pooled connections if they were ever created.
+    """
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+        get_async_engine.cache_clear()
+    if get_async_replicas.cache_info().currsize:
+        for replica in get_async_replicas().engines:
+            await AsyncEngine(replica).dispose()
+        get_async_replicas.cache_clear()
+
+
+def get_user_exporter() -> UserExporter:
+    """
+    Returns an exporter reading from a healthy replica, or the primary.
+
+    Returns:
+        UserExporter: The exporter bound to the chosen engine.
+    """
+    return UserExporter(replicas.choose() or engine)
+
+
+@lru_cache
+def get_user_loader() -> Optional[UserLoader]:
+    """
+    Returns the process-wide lookup batcher of the sync stack.
+
+    Batched lookups read from the primary, so they never miss a write a client
+    has just made.
+
+    Returns:
+        Optional[UserLoader]: The loader, or None unless USERS_LOOKUP_BATCHING is enabled.
+    """
+    if not settings.USERS_LOOKUP_BATCHING:
+        return None
+    return UserLoader(
+        lambda: Session(engine),
+        settings.USERS_LOOKUP_BATCH_WINDOW_MS / 1000,
+        settings.USERS_LOOKUP_BATCH_MAX,
+    )
+
+
+@lru_cache
+def get_async_user_loader() -> Optional[AsyncUserLoader]:
+    """
+    Returns the process-wide lookup batcher of the async stack.
+
+    Returns:
+        Optional[AsyncUserLoader]: The loader, or None unless USERS_LOOKUP_BATCHING is enabled.
+    """
+    if not settings.USERS_LOOKUP_BATCHING:
+        return None
+    return AsyncUserLoader(
+        lambda: AsyncSession(get_async_engine(), expire_on_commit=False),
+        settings.USERS_LOOKUP_BATCH_WINDOW_MS / 1000,
+        settings.USERS_LOOKUP_BATCH_MAX,
+    )
+
+
+def get_session(request: Request):  # pragma: no cover
+    if not replicas:
+        with Session(engine) as session:
+            yield session
+        return
+    with RoutingSession(engine, replicas, read_your_writes, get_client_id(request)) as session:
+        yield session
 
 
-def get_session():  # pragma: no cover
-    with Session(engine) as session:
+async def get_async_session(request: Request):  # pragma: no cover
+    async_replicas = get_async_replicas()
+    if not async_replicas:
+        async with AsyncSession(get_async_engine(), expire_on_commit=False) as session:
+            yield session
+        return
+    async with AsyncSession(
+        sync_session_class=RoutingSession,
+        primary=get_async_engine().sync_engine,
+        replicas=async_replicas,
+        read_your_writes=read_your_writes,
+        client_id=get_client_id(request),
+        expire_on_commit=False,
+    ) as session:
         yield session
@@ -0,0 +1,67 @@
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from tech.infra.metrics import LatencyWindow
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that measures how long callers wait to check out a connection.
+
+    When every connection is busy, requests queue inside `connect()` without
+    any trace. This pool records that wait (including connection creation and
+    pre-ping) and counts checkouts that gave up after `pool_timeout`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_wait = LatencyWindow()
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._timeouts = 0
+
+    def connect(self):
+        started = time.perf_counter()
+        with self._lock:
+            self._waiting += 1
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            with self._lock:
+                self._timeouts += 1
+            raise
+        finally:
+            with self._lock:
+                self._waiting -= 1
+            self.checkout_wait.record(time.perf_counter() - started)
+
+    def stats(self) -> dict:
+        """
+        Reports the live state of the pool.
+
+        Returns:
+            dict: Pool limits, connections in use, overflow, callers waiting
+                for a connection, checkout timeouts and checkout wait times.
+        """
+        with self._lock:
+            waiting = self._waiting
+            timeouts = self._timeouts
+        return {
+            'pool_size': self.size(),
+            'max_overflow': self._max_overflow,
+            'checked_out': self.checkedout(),
+            'checked_in': self.checkedin(),
+            'overflow': max(0, self.overflow()),
+            'waiting': waiting,
+            'checkout_timeouts': timeouts,
+            'checkout_wait': self.checkout_wait.snapshot(),
+        }
+
+
+class InstrumentedAsyncQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """
+    Asyncio flavour of InstrumentedQueuePool, used by the async engine.
+    """
@@ -0,0 +1,213 @@
+import itertools
+import threading
+import time
+from typing import Callable, List, Optional
+
+from sqlalchemy import Engine, Select, event, text
+from sqlalchemy.orm import Session
+
+
+class ReplicaSet:
+    """
+    Round-robin selection over read replicas with health checks.
+
+    A replica is taken out of rotation passively, as soon as one of its
+    connections fails, and brought back actively: once `health_interval`
+    seconds have passed, the next time it is chosen it must answer a
+    `SELECT 1` before it serves queries again.
+    """
+
+    def __init__(self, engines: List[Engine], health_interval: float = 5.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initializes the replica set.
+
+        Args:
+            engines (List[Engine]): One engine per replica.
+            health_interval (float): Seconds an unhealthy replica stays out of rotation.
+            clock (Callable[[], float]): Monotonic clock, injectable for tests.
+        """
+        self.engines = list(engines)
+        self.health_interval = health_interval
+        self._clock = clock
+        self._cycle = itertools.cycle(range(len(self.engines)))
+        self._down_until = {}
+        self._lock = threading.Lock()
+        self.reads = [0] * len(self.engines)
+        self.failovers = 0
+        for engine in self.engines:
+            event.listen(engine, 'handle_error', self._on_error)
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def _on_error(self, context) -> None:
+        if context.is_disconnect or context.connection is None:
+            self.mark_unhealthy(context.engine)
+
+    def mark_unhealthy(self, engine: Engine) -> None:
+        """
+        Takes a replica out of rotation for `health_interval` seconds.
+
+        Args:
+            engine (Engine): The failing replica.
+        """
+        with self._lock:
+            self._down_until[engine] = self._clock() + self.health_interval
+
+    def _probe(self, engine: Engine) -> bool:
+        try:
+            with engine.connect() as connection:
+                connection.execute(text('SELECT 1'))
+            return True
+        except Exception:
+            return False
+
+    def choose(self) -> Optional[Engine]:
+        """
+        Picks the next healthy replica.
+
+        Returns:
+            Optional[Engine]: A replica, or None when every replica is down.
+        """
+        for _ in range(len(self.engines)):
+            with self._lock:
+                index = next(self._cycle)
+                engine = self.engines[index]
+                down_until = self._down_until.get(engine)
+            if down_until is not None:
+                if self._clock() < down_until:
+                    continue
+                if not self._probe(engine):
+                    self.mark_unhealthy(engine)
+                    continue
+                with self._lock:
+                    self._down_until.pop(engine, None)
+            with self._lock:
+                self.reads[index] += 1
+            return engine
+        with self._lock:
+            self.failovers += 1
+        return None
+
+    def stats(self) -> dict:
+        """
+        Reports reads served and health per replica.
+
+        Returns:
+            dict: Per-replica read counts and health, and how many reads fell
+                back to the primary because no replica was healthy.
+        """
+        now = self._clock()
+        with self._lock:
+            return {
+                'replicas': [
+                    {
+                        'url': engine.url.render_as_string(hide_password=True),
+                        'healthy': self._down_until.get(engine, now) <= now,
+                        'reads': self.reads[index],
+                    }
+                    for index, engine in enumerate(self.engines)
+                ],
+                'primary_fallbacks': self.failovers,
+            }
+
+
+class ReadYourWritesWindow:
+    """
+    Remembers which clients wrote recently, so their reads stay on the primary
+    until replication has had time to catch up.
+    """
+
+    def __init__(self, seconds: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Initializes the window.
+
+        Args:
+            seconds (float): How long a client stays pinned after a write.
+            clock (Callable[[], float]): Monotonic clock, injectable for tests.
+        """
+        self.seconds = seconds
+        self._clock = clock
+        self._pinned = {}
+        self._lock = threading.Lock()
+
+    def pin(self, client_id: Optional[str]) -> None:
+        """
+        Pins a client to the primary for the next `seconds` seconds.
+
+        Args:
+            client_id (Optional[str]): The client that wrote; ignored when unknown.
+        """
+        if not client_id or self.seconds <= 0:
+            return
+        now = self._clock()
+        with self._lock:
+            self._pinned[client_id] = now + self.seconds
+            if len(self._pinned) > 10000:
+                self._pinned = {
+                    client: until for client, until in self._pinned.items() if until > now
+                }
+
+    def is_pinned(self, client_id: Optional[str]) -> bool:
+        """
+        Tells whether a client wrote within the window.
+
+        Args:
+            client_id (Optional[str]): The client issuing the read.
+
+        Returns:
+            bool: True if the client's reads must go to the primary.
+        """
+        if not client_id:
+            return False
+        with self._lock:
+            until = self._pinned.get(client_id)
+        return until is not None and self._clock() < until
+
+
+class RoutingSession(Session):
+    """
+    Session that sends plain SELECTs to a replica and everything else to the primary.
+
+    Once a session writes (flush, INSERT/UPDATE/DELETE or raw SQL) it stays on
+    the primary for the rest of its life, and committing the write pins the
+    client to the primary for the read-your-writes window. Locking reads
+    (`SELECT ... FOR UPDATE`) always go to the primary. Repositories and
+    use cases are unchanged: routing happens when the session picks a bind.
+    """
+
+    def __init__(self, primary: Engine, replicas: ReplicaSet,
+                 read_your_writes: ReadYourWritesWindow,
+                 client_id: Optional[str] = None, **kwargs):
+        """
+        Initializes the session.
+
+        Args:
+            primary (Engine): The engine for writes and pinned reads.
+            replicas (ReplicaSet): The replicas serving reads.
+            read_your_writes (ReadYourWritesWindow): The per-client pin window.
+            client_id (Optional[str]): The client this session serves.
+        """
+        kwargs.pop('bind', None)
+        super().__init__(bind=primary, **kwargs)
+        self.primary = primary
+        self.replicas = replicas
+        self.read_your_writes = read_your_writes
+        self.client_id = client_id
+        self.wrote = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or not isinstance(clause, Select):
+            self.wrote = True
+            return self.primary
+        if clause._for_update_arg is not None:
+            return self.primary
+        if self.wrote or self.read_your_writes.is_pinned(self.client_id):
+            return self.primary
+        return self.replicas.choose() or self.primary
+
+    def commit(self) -> None:
+        super().commit()
+        if self.wrote:
+            self.read_your_writes.pin(self.client_id)
@@ -0,0 +1,73 @@
+import math
+import threading
+from collections import deque
+from typing import Sequence
+
+
+def percentile(sorted_samples: Sequence[float], fraction: float) -> float:
+    """
+    Returns the nearest-rank percentile of an already sorted sequence.
+
+    Args:
+        sorted_samples (Sequence[float]): Samples sorted in ascending order.
+        fraction (float): The percentile expressed as a fraction (0.5 for p50).
+
+    Returns:
+        float: The sample at the requested rank, or 0.0 for an empty sequence.
+    """
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_samples)))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+
+class LatencyWindow:
+    """
+    Thread-safe recorder for latency samples.
+
+    Keeps lifetime totals plus a bounded window of the most recent samples,
+    which is what the percentiles in the snapshot are computed from.
+    """
+
+    def __init__(self, size: int = 1024):
+        """
+        Initializes an empty window.
+
+        Args:
+            size (int): The number of recent samples kept for percentiles.
+        """
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, seconds: float) -> None:
+        """
+        Records a single latency sample.
+
+        Args:
+            seconds (float): The measured duration in seconds.
+        """
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+            self.total += seconds
+
+    def snapshot(self) -> dict:
+        """
+        Summarises the recorded samples in milliseconds.
+
+        Returns:
+            dict: Sample count, lifetime average and recent p50/p99/max.
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+            count = self.count
+            total = self.total
+        return {
+            'count': count,
+            'avg_ms': round(total / count * 1000, 3) if count else 0.0,
+            'p50_ms': round(percentile(samples, 0.50) * 1000, 3),
+            'p99_ms': round(percentile(samples, 0.99) * 1000, 3),
+            'max_ms': round(samples[-1] * 1000, 3) if samples else 0.0,
+        }
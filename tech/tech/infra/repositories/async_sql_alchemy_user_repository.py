@@ -0,0 +1,380 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, func, insert, select, text, update
+from sqlalchemy.exc import IntegrityError
+from typing import Optional, List
+from tech.domain.entities.users import User
+from tech.domain.exceptions import UserAlreadyExistsError
+from tech.domain.security import get_cpf_blind_index
+from tech.interfaces.repositories.async_user_repository import AsyncUserRepository
+from tech.infra.repositories.sql_alchemy_models import SQLAlchemyUser
+from tech.infra.repositories.unique_violations import conflicting_field
+from tech.infra.repositories.user_bulk_insert import insert_users
+
+class AsyncSQLAlchemyUserRepository(AsyncUserRepository):
+    """
+    AsyncSession implementation of the AsyncUserRepository interface.
+
+    Mirrors SQLAlchemyUserRepository statement for statement, but awaits the
+    database instead of blocking a worker thread, so the number of requests in
+    flight is bounded by the connection pool rather than by the threadpool.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize the repository with an async SQLAlchemy session.
+
+        Args:
+            session (AsyncSession): The session used for database operations. It
+                                    should be created with `expire_on_commit=False`,
+                                    since expired attributes cannot be lazily
+                                    reloaded under asyncio.
+        """
+        self.session = session
+
+    def _to_domain_user(self, db_user: SQLAlchemyUser) -> User:
+        """
+        Convert a SQLAlchemyUser instance to a domain User instance.
+
+        Args:
+            db_user (SQLAlchemyUser): The SQLAlchemy model instance to convert.
+
+        Returns:
+            User: The domain model instance corresponding to the given SQLAlchemy model.
+        """
+        return User(
+            id=db_user.id,
+            username=db_user.username,
+            email=db_user.email,
+            password=db_user.password,
+            cpf=db_user.cpf
+        )
+
+    async def add(self, user: User) -> User:
+        """
+        Add a new user with a single `INSERT ... RETURNING id`.
+
+        Args:
+            user (User): The domain User object to be added.
+
+        Returns:
+            User: The added User object with an updated `id` field.
+
+        Raises:
+            UserAlreadyExistsError: If the username, email or CPF is already in use.
+        """
+        values = {**user.__dict__, 'cpf_index': get_cpf_blind_index(user.cpf)}
+        values.pop('id', None)
+        try:
+            user.id = await self.session.scalar(
+                insert(SQLAlchemyUser).values(**values).returning(SQLAlchemyUser.id)
+            )
+            await self.session.commit()
+        except IntegrityError as error:
+            await self.session.rollback()
+            field = conflicting_field(error)
+            if field is None:
+                raise
+            raise UserAlreadyExistsError(field) from error
+        return user
+
+    async def add_many(self, users: List[User]) -> List[Optional[str]]:
+        """
+        Add many users in one transaction, skipping the ones that already exist.
+
+        Runs `insert_users` through `run_sync`; the async driver has no COPY
+        support there, so the staging table is filled with one executemany.
+
+        Args:
+            users (List[User]): The domain User objects to be added. Each one that
+                                is inserted gets its `id` field set.
+
+        Returns:
+            List[Optional[str]]: For each user, None when it was added, otherwise
+            the field ('username', 'email' or 'cpf') that is already in use.
+        """
+        try:
+            conflicts = await self.session.run_sync(insert_users, users)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return conflicts
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """
+        Fetch a user by their unique ID.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+
+        Returns:
+            Optional[User]: The User object if found, or None otherwise.
+        """
+        db_user = await self.session.scalar(select(SQLAlchemyUser).where(SQLAlchemyUser.id == user_id))
+        return self._to_domain_user(db_user) if db_user else None
+
+    async def get_by_id_for_update(self, user_id: int) -> Optional[User]:
+        """
+        Fetch a user with `SELECT ... FOR UPDATE`, on the primary.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+
+        Returns:
+            Optional[User]: The User object if found, or None otherwise.
+        """
+        db_user = await self.session.scalar(
+            select(SQLAlchemyUser).where(SQLAlchemyUser.id == user_id).with_for_update()
+        )
+        return self._to_domain_user(db_user) if db_user else None
+
+    async def get_by_username_or_email_or_cpf(self, username: str, email: str, cpf: str) -> Optional[User]:
+        """
+        Fetch a user by username, email, or CPF (matched through its blind index).
+
+        Args:
+            username (str): The username to search for.
+            email (str): The email address to search for.
+            cpf (str): The CPF to search for.
+
+        Returns:
+            Optional[User]: The User object if found, or None if no matching user exists.
+        """
+        db_user = await self.session.scalar(
+            select(SQLAlchemyUser).where(
+                (SQLAlchemyUser.username == username) |
+                (SQLAlchemyUser.email == email) |
+                (SQLAlchemyUser.cpf_index == get_cpf_blind_index(cpf))
+            )
+        )
+        return self._to_domain_user(db_user) if db_user else None
+
+    async def get_by_cpf(self, cpf: str) -> Optional[User]:
+        """
+        Fetch a user by their CPF through the blind index.
+
+        Args:
+            cpf (str): The CPF of the user.
+
+        Returns:
+            Optional[User]: The User object if found, or None otherwise.
+        """
+        db_user = await self.session.scalar(
+            select(SQLAlchemyUser).where(SQLAlchemyUser.cpf_index == get_cpf_blind_index(cpf))
+        )
+        return self._to_domain_user(db_user) if db_user else None
+
+    async def list_users(self, limit: int, skip: int) -> List[User]:
+        """
+        Retrieve a page of users ordered by ID, using LIMIT/OFFSET.
+
+        Args:
+            limit (int): The maximum number of users to retrieve.
+            skip (int): The number of users to skip.
+
+        Returns:
+            List[User]: A list of User objects within the specified range.
+        """
+        db_users = (await self.session.scalars(
+            select(SQLAlchemyUser).order_by(SQLAlchemyUser.id).limit(limit).offset(skip)
+        )).all()
+        return [self._to_domain_user(db_user) for db_user in db_users]
+
+    async def list_users_after(self, after_id: Optional[int], limit: int) -> List[User]:
+        """
+        Retrieve the users whose ID follows `after_id` (keyset pagination).
+
+        Args:
+            after_id (Optional[int]): The last ID of the previous page, or None for the first page.
+            limit (int): The maximum number of users to retrieve.
+
+        Returns:
+            List[User]: Up to `limit` users ordered by ID.
+        """
+        statement = select(SQLAlchemyUser).order_by(SQLAlchemyUser.id).limit(limit)
+        if after_id is not None:
+            statement = statement.where(SQLAlchemyUser.id > after_id)
+        db_users = (await self.session.scalars(statement)).all()
+        return [self._to_domain_user(db_user) for db_user in db_users]
+
+    async def get_by_ids(self, user_ids: List[int]) -> List[User]:
+        """
+        Fetch every user whose ID is in the given list with a single query.
+
+        Args:
+            user_ids (List[int]): The IDs to look up.
+
+        Returns:
+            List[User]: The users found, in no particular order.
+        """
+        if not user_ids:
+            return []
+        db_users = await self.session.scalars(select(SQLAlchemyUser).where(SQLAlchemyUser.id.in_(user_ids)))
+        return [self._to_domain_user(db_user) for db_user in db_users]
+
+    async def get_by_cpfs(self, cpfs: List[str]) -> List[User]:
+        """
+        Fetch every user whose CPF is in the given list with a single query.
+
+        The CPFs are matched through their blind indexes, so the lookup is served
+        by the unique index on `cpf_index`.
+
+        Args:
+            cpfs (List[str]): The CPFs to look up.
+
+        Returns:
+            List[User]: The users found, in no particular order.
+        """
+        if not cpfs:
+            return []
+        cpf_indexes = [get_cpf_blind_index(cpf) for cpf in cpfs]
+        db_users = await self.session.scalars(
+            select(SQLAlchemyUser).where(SQLAlchemyUser.cpf_index.in_(cpf_indexes))
+        )
+        return [self._to_domain_user(db_user) for db_user in db_users]
+
+    async def count_users(self) -> int:
+        """
+        Count every user exactly with `SELECT count(*)`.
+
+        Returns:
+            int: The number of users.
+        """
+        return await self.session.scalar(select(func.count()).select_from(SQLAlchemyUser))
+
+    async def estimate_user_count(self) -> Optional[int]:
+        """
+        Estimate the number of users from the planner statistics.
+
+        Reads `pg_class.reltuples`, which autovacuum/ANALYZE keep up to date, so
+        the cost is a single catalog lookup however large the table is.
+
+        Returns:
+            Optional[int]: The estimate, or None when the database is not
+                PostgreSQL or the table has never been analyzed.
+        """
+        if self.session.bind.dialect.name != 'postgresql':
+            return None
+        estimate = await self.session.scalar(
+            text("SELECT reltuples FROM pg_class WHERE oid = 'users'::regclass")
+        )
+        if estimate is None or estimate < 0:
+            return None
+        return int(estimate)
+
+    async def update(self, user: User) -> Optional[User]:
+        """
+        Update an existing user's information with a single `UPDATE ... RETURNING`.
+
+        Args:
+            user (User): The domain User object with updated information.
+
+        Returns:
+            Optional[User]: The updated User object, or None if no user with the given ID exists.
+
+        Raises:
+            UserAlreadyExistsError: If the username, email or CPF is already in use.
+        """
+        try:
+            db_user = await self.session.scalar(
+                update(SQLAlchemyUser)
+                .where(SQLAlchemyUser.id == user.id)
+                .values(
+                    username=user.username,
+                    password=user.password,
+                    cpf=user.cpf,
+                    cpf_index=get_cpf_blind_index(user.cpf),
+                    email=user.email,
+                )
+                .returning(SQLAlchemyUser)
+            )
+            updated_user = self._to_domain_user(db_user) if db_user else None
+            await self.session.commit()
+        except IntegrityError as error:
+            await self.session.rollback()
+            field = conflicting_field(error)
+            if field is None:
+                raise
+            raise UserAlreadyExistsError(field) from error
+        return updated_user
+
+    async def update_fields(self, user_id: int, changes: dict) -> None:
+        """
+        Write only the changed columns of an existing user in a single UPDATE.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+            changes (dict): The new column values, keyed by field name.
+
+        Raises:
+            UserAlreadyExistsError: If a new username, email or CPF is already in use.
+        """
+        values = dict(changes)
+        if 'cpf' in values:
+            values['cpf_index'] = get_cpf_blind_index(values['cpf'])
+        try:
+            await self.session.execute(
+                update(SQLAlchemyUser)
+                .where(SQLAlchemyUser.id == user_id)
+                .values(**values)
+            )
+            await self.session.commit()
+        except IntegrityError as error:
+            await self.session.rollback()
+            field = conflicting_field(error)
+            if field is None:
+                raise
+            raise UserAlreadyExistsError(field) from error
+
+    async def get_password_hash(self, user_id: int) -> Optional[str]:
+        """
+        Fetch only the password hash of a user.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+
+        Returns:
+            Optional[str]: The stored hash, or None if no user with the given ID exists.
+        """
+        return await self.session.scalar(
+            select(SQLAlchemyUser.password).where(SQLAlchemyUser.id == user_id)
+        )
+
+    async def update_password(self, user_id: int, stale_hash: str, hashed_password: str) -> bool:
+        """
+        Replace a stale password hash of a user with a single conditional UPDATE.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+            stale_hash (str): The hash the new one was computed from.
+            hashed_password (str): The new password hash.
+
+        Returns:
+            bool: True if the stale hash was still stored and was replaced.
+        """
+        updated_id = await self.session.scalar(
+            update(SQLAlchemyUser)
+            .where(SQLAlchemyUser.id == user_id, SQLAlchemyUser.password == stale_hash)
+            .values(password=hashed_password)
+            .returning(SQLAlchemyUser.id)
+        )
+        await self.session.commit()
+        return updated_id is not None
+
+    async def delete(self, user_id: int) -> bool:
+        """
+        Delete a user with a single `DELETE ... RETURNING id`.
+
+        Args:
+            user_id (int): The unique identifier of the user to delete.
+
+        Returns:
+            bool: True if the user existed and was deleted, False otherwise.
+        """
+        deleted_id = await self.session.scalar(
+            delete(SQLAlchemyUser)
+            .where(SQLAlchemyUser.id == user_id)
+            .returning(SQLAlchemyUser.id)
+        )
+        await self.session.commit()
+        return deleted_id is not None
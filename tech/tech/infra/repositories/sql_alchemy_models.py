@@ -13,6 +13,7 @@ class SQLAlchemyUser(object):
     username = Column(String, unique=True, nullable=False)
     password = Column(String, nullable=False)
     cpf = Column(String, unique=True, nullable=False)
+    cpf_index = Column(String(64), unique=True, index=True)
     email = Column(String, unique=True, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,9 +1,14 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import delete, func, insert, select, text, update
+from sqlalchemy.exc import IntegrityError
 from typing import Optional, List
 from tech.domain.entities.users import User
+from tech.domain.exceptions import UserAlreadyExistsError
+from tech.domain.security import get_cpf_blind_index
 from tech.interfaces.repositories.user_repository import UserRepository
 from tech.infra.repositories.sql_alchemy_models import SQLAlchemyUser
+from tech.infra.repositories.unique_violations import conflicting_field
+from tech.infra.repositories.user_bulk_insert import insert_users
 
 class SQLAlchemyUserRepository(UserRepository):
     """
@@ -49,22 +54,58 @@ class SQLAlchemyUserRepository(UserRepository):
         """
         Add a new user to the database.
 
-        Converts the domain User object into a SQLAlchemyUser object and persists it
-        in the database. Updates the `id` of the User object with the generated ID.
+        Issues a single `INSERT ... RETURNING id`; the unique constraints on
+        username, email and the CPF blind index are the source of truth for
+        duplicates, so there is no pre-check query and no refresh afterwards.
 
         Args:
             user (User): The domain User object to be added.
 
         Returns:
             User: The added User object with an updated `id` field.
+
+        Raises:
+            UserAlreadyExistsError: If the username, email or CPF is already in use.
         """
-        db_user = SQLAlchemyUser(**user.__dict__)
-        self.session.add(db_user)
-        self.session.commit()
-        self.session.refresh(db_user)
-        user.id = db_user.id
+        values = {**user.__dict__, 'cpf_index': get_cpf_blind_index(user.cpf)}
+        values.pop('id', None)
+        try:
+            user.id = self.session.scalar(
+                insert(SQLAlchemyUser).values(**values).returning(SQLAlchemyUser.id)
+            )
+            self.session.commit()
+        except IntegrityError as error:
+            self.session.rollback()
+            field = conflicting_field(error)
+            if field is None:
+                raise
+            raise UserAlreadyExistsError(field) from error
         return user
 
+    def add_many(self, users: List[User]) -> List[Optional[str]]:
+        """
+        Add many users in one transaction, skipping the ones that already exist.
+
+        The users go through a staging table and a single
+        `INSERT ... SELECT ... ON CONFLICT DO NOTHING` (see `insert_users`), so a
+        conflicting row is reported instead of aborting the whole batch.
+
+        Args:
+            users (List[User]): The domain User objects to be added. Each one that
+                                is inserted gets its `id` field set.
+
+        Returns:
+            List[Optional[str]]: For each user, None when it was added, otherwise
+            the field ('username', 'email' or 'cpf') that is already in use.
+        """
+        try:
+            conflicts = insert_users(self.session, users)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return conflicts
+
     def get_by_id(self, user_id: int) -> Optional[User]:
         """
         Fetch a user by their unique ID.
@@ -78,12 +119,30 @@ class SQLAlchemyUserRepository(UserRepository):
         db_user = self.session.scalar(select(SQLAlchemyUser).where(SQLAlchemyUser.id == user_id))
         return self._to_domain_user(db_user) if db_user else None
 
+    def get_by_id_for_update(self, user_id: int) -> Optional[User]:
+        """
+        Fetch a user with `SELECT ... FOR UPDATE`.
+
+        The locking read is routed to the primary and keeps concurrent writers
+        off the row until the session commits.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+
+        Returns:
+            Optional[User]: The User object if found, or None if no user with the given ID exists.
+        """
+        db_user = self.session.scalar(
+            select(SQLAlchemyUser).where(SQLAlchemyUser.id == user_id).with_for_update()
+        )
+        return self._to_domain_user(db_user) if db_user else None
+
     def get_by_username_or_email_or_cpf(self, username: str, email: str, cpf: str) -> Optional[User]:
         """
         Fetch a user by username, email, or CPF.
 
         This method checks if a user with any of the given identifiers (username, email, or CPF)
-        already exists in the database.
+        already exists in the database. The CPF is matched through its blind index.
 
         Args:
             username (str): The username to search for.
@@ -97,7 +156,7 @@ class SQLAlchemyUserRepository(UserRepository):
             select(SQLAlchemyUser).where(
                 (SQLAlchemyUser.username == username) |
                 (SQLAlchemyUser.email == email) |
-                (SQLAlchemyUser.cpf == cpf)
+                (SQLAlchemyUser.cpf_index == get_cpf_blind_index(cpf))
             )
         )
         return self._to_domain_user(db_user) if db_user else None
@@ -106,13 +165,18 @@ class SQLAlchemyUserRepository(UserRepository):
         """
         Fetch a user by their CPF.
 
+        The lookup is an equality match on the keyed blind index of the CPF, which
+        is served by the unique B-tree index on `cpf_index`.
+
         Args:
             cpf (str): The CPF (Cadastro de Pessoas Físicas, Brazilian tax ID) of the user.
 
         Returns:
             Optional[User]: The User object if found, or None if no user with the given CPF exists.
         """
-        db_user = self.session.scalar(select(SQLAlchemyUser).where(SQLAlchemyUser.cpf == cpf))
+        db_user = self.session.scalar(
+            select(SQLAlchemyUser).where(SQLAlchemyUser.cpf_index == get_cpf_blind_index(cpf))
+        )
         return self._to_domain_user(db_user) if db_user else None
 
     def list_users(self, limit: int, skip: int) -> List[User]:
@@ -120,7 +184,8 @@ class SQLAlchemyUserRepository(UserRepository):
         Retrieve a list of users with pagination.
 
         This method returns a subset of users based on the limit and skip values,
-        which can be used for pagination.
+        ordered by ID so that consecutive pages are stable. Postgres still reads
+        and discards `skip` rows; prefer `list_users_after` for deep pages.
 
         Args:
             limit (int): The maximum number of users to retrieve.
@@ -129,44 +194,245 @@ class SQLAlchemyUserRepository(UserRepository):
         Returns:
             List[User]: A list of User objects within the specified range.
         """
-        db_users = self.session.scalars(select(SQLAlchemyUser).limit(limit).offset(skip)).all()
+        db_users = self.session.scalars(
+            select(SQLAlchemyUser).order_by(SQLAlchemyUser.id).limit(limit).offset(skip)
+        ).all()
+        return [self._to_domain_user(db_user) for db_user in db_users]
+
+    def list_users_after(self, after_id: Optional[int], limit: int) -> List[User]:
+        """
+        Retrieve the users whose ID follows `after_id` (keyset pagination).
+
+        The query is `WHERE id > :after_id ORDER BY id LIMIT :limit`, which is a
+        range scan on the primary key index: every page costs the same as the
+        first, however deep it is.
+
+        Args:
+            after_id (Optional[int]): The last ID of the previous page, or None for the first page.
+            limit (int): The maximum number of users to retrieve.
+
+        Returns:
+            List[User]: Up to `limit` users ordered by ID.
+        """
+        statement = select(SQLAlchemyUser).order_by(SQLAlchemyUser.id).limit(limit)
+        if after_id is not None:
+            statement = statement.where(SQLAlchemyUser.id > after_id)
+        db_users = self.session.scalars(statement).all()
+        return [self._to_domain_user(db_user) for db_user in db_users]
+
+    def get_by_ids(self, user_ids: List[int]) -> List[User]:
+        """
+        Fetch every user whose ID is in the given list with a single query.
+
+        Args:
+            user_ids (List[int]): The IDs to look up.
+
+        Returns:
+            List[User]: The users found, in no particular order.
+        """
+        if not user_ids:
+            return []
+        db_users = self.session.scalars(select(SQLAlchemyUser).where(SQLAlchemyUser.id.in_(user_ids)))
+        return [self._to_domain_user(db_user) for db_user in db_users]
+
+    def get_by_cpfs(self, cpfs: List[str]) -> List[User]:
+        """
+        Fetch every user whose CPF is in the given list with a single query.
+
+        The CPFs are matched through their blind indexes, so the lookup is served
+        by the unique index on `cpf_index`.
+
+        Args:
+            cpfs (List[str]): The CPFs to look up.
+
+        Returns:
+            List[User]: The users found, in no particular order.
+        """
+        if not cpfs:
+            return []
+        cpf_indexes = [get_cpf_blind_index(cpf) for cpf in cpfs]
+        db_users = self.session.scalars(
+            select(SQLAlchemyUser).where(SQLAlchemyUser.cpf_index.in_(cpf_indexes))
+        )
         return [self._to_domain_user(db_user) for db_user in db_users]
 
-    def update(self, user: User) -> User:
+    def count_users(self) -> int:
+        """
+        Count every user exactly with `SELECT count(*)`.
+
+        Returns:
+            int: The number of users.
+        """
+        return self.session.scalar(select(func.count()).select_from(SQLAlchemyUser))
+
+    def estimate_user_count(self) -> Optional[int]:
+        """
+        Estimate the number of users from the planner statistics.
+
+        Reads `pg_class.reltuples`, which autovacuum/ANALYZE keep up to date, so
+        the cost is a single catalog lookup however large the table is.
+
+        Returns:
+            Optional[int]: The estimate, or None when the database is not
+                PostgreSQL or the table has never been analyzed.
+        """
+        if self.session.bind.dialect.name != 'postgresql':
+            return None
+        estimate = self.session.scalar(
+            text("SELECT reltuples FROM pg_class WHERE oid = 'users'::regclass")
+        )
+        if estimate is None or estimate < 0:
+            return None
+        return int(estimate)
+
+    def update(self, user: User) -> Optional[User]:
         """
         Update an existing user's information in the database.
 
-        Finds the user in the database by their ID and updates their fields with the
-        values provided in the domain User object. Only fields present in the domain
-        User are updated.
+        Issues a single `UPDATE ... WHERE id = ... RETURNING` statement, so the
+        row is neither loaded before the write nor refreshed after it. A
+        missing user is detected from the statement returning no row.
 
         Args:
             user (User): The domain User object with updated information.
 
         Returns:
-            User: The updated User object.
+            Optional[User]: The updated User object, or None if no user with the given ID exists.
+
+        Raises:
+            UserAlreadyExistsError: If the username, email or CPF is already in use.
         """
-        db_user = self.session.scalar(select(SQLAlchemyUser).where(SQLAlchemyUser.id == user.id))
-        if db_user:
-            db_user.username = user.username
-            db_user.password = user.password
-            db_user.cpf = user.cpf
-            db_user.email = user.email
+        try:
+            db_user = self.session.scalar(
+                update(SQLAlchemyUser)
+                .where(SQLAlchemyUser.id == user.id)
+                .values(
+                    username=user.username,
+                    password=user.password,
+                    cpf=user.cpf,
+                    cpf_index=get_cpf_blind_index(user.cpf),
+                    email=user.email,
+                )
+                .returning(SQLAlchemyUser)
+            )
+            updated_user = self._to_domain_user(db_user) if db_user else None
             self.session.commit()
-            self.session.refresh(db_user)
-        return user
+        except IntegrityError as error:
+            self.session.rollback()
+            field = conflicting_field(error)
+            if field is None:
+                raise
+            raise UserAlreadyExistsError(field) from error
+        return updated_user
+
+    def update_fields(self, user_id: int, changes: dict) -> None:
+        """
+        Write only the changed columns of an existing user.
+
+        Issues a single UPDATE restricted to the given columns, without loading
+        the row first or refreshing it afterwards. When the CPF changes its
+        blind index is updated with it.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+            changes (dict): The new column values, keyed by field name.
+
+        Raises:
+            UserAlreadyExistsError: If a new username, email or CPF is already in use.
+        """
+        values = dict(changes)
+        if 'cpf' in values:
+            values['cpf_index'] = get_cpf_blind_index(values['cpf'])
+        try:
+            self.session.execute(
+                update(SQLAlchemyUser)
+                .where(SQLAlchemyUser.id == user_id)
+                .values(**values)
+            )
+            self.session.commit()
+        except IntegrityError as error:
+            self.session.rollback()
+            field = conflicting_field(error)
+            if field is None:
+                raise
+            raise UserAlreadyExistsError(field) from error
+
+    def get_password_hash(self, user_id: int) -> Optional[str]:
+        """
+        Fetch only the password hash of a user.
 
-    def delete(self, user: User):
+        Args:
+            user_id (int): The unique identifier of the user.
+
+        Returns:
+            Optional[str]: The stored hash, or None if no user with the given ID exists.
+        """
+        return self.session.scalar(
+            select(SQLAlchemyUser.password).where(SQLAlchemyUser.id == user_id)
+        )
+
+    def update_password(self, user_id: int, stale_hash: str, hashed_password: str) -> bool:
+        """
+        Replace a stale password hash of a user.
+
+        Issues a single `UPDATE ... WHERE id = ... AND password = ... RETURNING id`,
+        so migrating a stale hash does not rewrite the rest of the row or
+        reload it, and a hash changed since it was read is left alone.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+            stale_hash (str): The hash the new one was computed from.
+            hashed_password (str): The new password hash.
+
+        Returns:
+            bool: True if the stale hash was still stored and was replaced.
+        """
+        updated_id = self.session.scalar(
+            update(SQLAlchemyUser)
+            .where(SQLAlchemyUser.id == user_id, SQLAlchemyUser.password == stale_hash)
+            .values(password=hashed_password)
+            .returning(SQLAlchemyUser.id)
+        )
+        self.session.commit()
+        return updated_id is not None
+
+    def count_legacy_password_hashes(self, current_prefix: str) -> int:
+        """
+        Count users whose password hash was made with legacy parameters.
+
+        Argon2 encodes its parameters at the start of each hash, so every hash
+        that does not start with the current prefix still needs migrating.
+
+        Args:
+            current_prefix (str): The prefix shared by hashes made with the
+                                  current argon2 parameters.
+
+        Returns:
+            int: The number of users still on legacy parameters.
+        """
+        return self.session.scalar(
+            select(func.count())
+            .select_from(SQLAlchemyUser)
+            .where(~SQLAlchemyUser.password.startswith(current_prefix, autoescape=True))
+        )
+
+    def delete(self, user_id: int) -> bool:
         """
         Delete a user from the database.
 
-        Finds the user in the database by their ID and removes them from the database.
-        If the user does not exist, no action is taken.
+        Issues a single `DELETE ... WHERE id = ... RETURNING id` statement; a
+        missing user is detected from the statement returning no row.
 
         Args:
-            user (User): The domain User object representing the user to delete.
+            user_id (int): The unique identifier of the user to delete.
+
+        Returns:
+            bool: True if the user existed and was deleted, False otherwise.
         """
-        db_user = self.session.scalar(select(SQLAlchemyUser).where(SQLAlchemyUser.id == user.id))
-        if db_user:
-            self.session.delete(db_user)
-            self.session.commit()
+        deleted_id = self.session.scalar(
+            delete(SQLAlchemyUser)
+            .where(SQLAlchemyUser.id == user_id)
+            .returning(SQLAlchemyUser.id)
+        )
+        self.session.commit()
+        return deleted_id is not None
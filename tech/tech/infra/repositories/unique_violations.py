@@ -0,0 +1,51 @@
+import re
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+
+CONSTRAINT_FIELDS = {
+    'users_username_key': 'username',
+    'users_email_key': 'email',
+    'uq_users_cpf': 'cpf',
+    'ix_users_cpf_index': 'cpf',
+}
+
+COLUMN_FIELDS = {
+    'username': 'username',
+    'email': 'email',
+    'cpf': 'cpf',
+    'cpf_index': 'cpf',
+}
+
+_COLUMN_PATTERNS = (
+    re.compile(r'UNIQUE constraint failed: users\.(\w+)'),
+    re.compile(r'Key \((\w+)\)='),
+)
+
+
+def conflicting_field(error: IntegrityError) -> Optional[str]:
+    """
+    Maps a unique violation on the users table to the user field that caused it.
+
+    PostgreSQL reports the violated constraint by name (psycopg's `diag`);
+    SQLite and older drivers only describe the column in the message, so that
+    is parsed as a fallback. The CPF blind index is reported as 'cpf'.
+
+    Args:
+        error (IntegrityError): The error raised by the INSERT or UPDATE.
+
+    Returns:
+        Optional[str]: 'username', 'email' or 'cpf', or None if the error is not
+            a unique violation on one of those fields.
+    """
+    diag = getattr(error.orig, 'diag', None)
+    constraint = getattr(diag, 'constraint_name', None)
+    if constraint in CONSTRAINT_FIELDS:
+        return CONSTRAINT_FIELDS[constraint]
+
+    message = str(error.orig)
+    for pattern in _COLUMN_PATTERNS:
+        match = pattern.search(message)
+        if match and match.group(1) in COLUMN_FIELDS:
+            return COLUMN_FIELDS[match.group(1)]
+    return None
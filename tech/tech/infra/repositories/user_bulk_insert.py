@@ -0,0 +1,130 @@
+from typing import List, Optional, Sequence
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, case, delete, insert, or_, select, true
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from tech.domain.entities.users import User
+from tech.domain.security import get_cpf_blind_index
+from tech.infra.repositories.sql_alchemy_models import SQLAlchemyUser
+
+STAGED_COLUMNS = ('username', 'email', 'password', 'cpf', 'cpf_index', 'created_at', 'updated_at')
+
+users_staging = Table(
+    'users_staging',
+    MetaData(),
+    Column('row_number', Integer, primary_key=True),
+    Column('username', String),
+    Column('email', String),
+    Column('password', String),
+    Column('cpf', String),
+    Column('cpf_index', String(64)),
+    Column('created_at', DateTime),
+    Column('updated_at', DateTime),
+    prefixes=['TEMPORARY'],
+)
+
+_UPSERT_INSERTS = {
+    'postgresql': postgresql_insert,
+    'sqlite': sqlite_insert,
+}
+
+
+def _staged_rows(users: Sequence[User]) -> List[tuple]:
+    return [
+        (
+            row_number, user.username, user.email, user.password, user.cpf,
+            get_cpf_blind_index(user.cpf), user.created_at, user.updated_at,
+        )
+        for row_number, user in enumerate(users)
+    ]
+
+
+def _load_staging(session: Session, rows: List[tuple]) -> None:
+    connection = session.connection()
+    users_staging.create(connection, checkfirst=True)
+    session.execute(delete(users_staging))
+    if connection.dialect.name == 'postgresql' and connection.dialect.driver == 'psycopg':
+        columns = ', '.join(column.name for column in users_staging.columns)
+        driver_connection = connection.connection.driver_connection
+        with driver_connection.cursor() as cursor:
+            with cursor.copy(f'COPY users_staging ({columns}) FROM STDIN') as copy:
+                for row in rows:
+                    copy.write_row(row)
+        return
+    names = [column.name for column in users_staging.columns]
+    session.execute(insert(users_staging), [dict(zip(names, row)) for row in rows])
+
+
+def _conflicting_fields(session: Session, row_numbers: List[int]) -> dict:
+    staged = users_staging.c
+    field = case(
+        (SQLAlchemyUser.username == staged.username, 'username'),
+        (SQLAlchemyUser.email == staged.email, 'email'),
+        else_='cpf',
+    )
+    rows = session.execute(
+        select(staged.row_number, field)
+        .join(SQLAlchemyUser, or_(
+            SQLAlchemyUser.username == staged.username,
+            SQLAlchemyUser.email == staged.email,
+            SQLAlchemyUser.cpf_index == staged.cpf_index,
+        ))
+        .where(staged.row_number.in_(row_numbers))
+    )
+    fields = {}
+    for row_number, conflict in rows:
+        fields.setdefault(row_number, conflict)
+    return fields
+
+
+def insert_users(session: Session, users: Sequence[User]) -> List[Optional[str]]:
+    """
+    Inserts many users at once, skipping the ones that already exist.
+
+    The users are loaded into a temporary staging table (with COPY on
+    PostgreSQL and psycopg 3, a single executemany elsewhere) and merged with
+    one `INSERT ... SELECT ... ON CONFLICT DO NOTHING RETURNING`. Rows that were
+    skipped are then matched against `users` to report which field clashed,
+    whether with an existing user or an earlier row of the same batch. The
+    caller owns the transaction.
+
+    Args:
+        session (Session): The session whose transaction is used.
+        users (Sequence[User]): The users to insert, with hashed passwords.
+            The `id` of each inserted user is set.
+
+    Returns:
+        List[Optional[str]]: For each user, None when it was inserted, otherwise
+        the field ('username', 'email' or 'cpf') that is already in use.
+    """
+    if not users:
+        return []
+    rows = _staged_rows(users)
+    _load_staging(session, rows)
+
+    staged = users_staging.c
+    upsert = _UPSERT_INSERTS[session.connection().dialect.name]
+    merge = (
+        upsert(SQLAlchemyUser)
+        .from_select(
+            list(STAGED_COLUMNS),
+            # The WHERE clause keeps SQLite from parsing ON CONFLICT as a join constraint.
+            select(*(staged[name] for name in STAGED_COLUMNS)).where(true()).order_by(staged.row_number),
+        )
+        .on_conflict_do_nothing()
+        .returning(SQLAlchemyUser.id, SQLAlchemyUser.username, SQLAlchemyUser.email, SQLAlchemyUser.cpf_index)
+    )
+    # A row is matched to the user it created by all of its unique values, so
+    # a duplicate later in the batch never claims the ID of the row that won.
+    inserted = {tuple(row[1:]): row[0] for row in session.execute(merge)}
+
+    skipped = []
+    for row_number, (user, row) in enumerate(zip(users, rows)):
+        user.id = inserted.pop((user.username, user.email, row[5]), None)
+        if user.id is None:
+            skipped.append(row_number)
+    fields = _conflicting_fields(session, skipped) if skipped else {}
+    session.execute(delete(users_staging))
+    return [None if user.id is not None else fields.get(row_number, 'username')
+            for row_number, user in enumerate(users)]
@@ -0,0 +1,143 @@
+import copy
+from typing import Callable, Dict, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from tech.domain.entities.users import User
+from tech.domain.security import get_cpf_blind_index
+from tech.infra.batch_loader import AsyncBatchLoader, BatchLoader
+from tech.infra.repositories.async_sql_alchemy_user_repository import AsyncSQLAlchemyUserRepository
+from tech.infra.repositories.sql_alchemy_user_repository import SQLAlchemyUserRepository
+
+
+def _by_requested_cpf(cpfs: List[str], users: List[User]) -> Dict[str, User]:
+    # Match through the blind index, as the query did, so a formatted CPF
+    # finds the user stored with bare digits.
+    by_index = {get_cpf_blind_index(user.cpf): user for user in users}
+    return {cpf: by_index.get(get_cpf_blind_index(cpf)) for cpf in cpfs}
+
+
+class UserLoader(object):
+    """
+    Coalesces concurrent single-user lookups into `get_by_ids`/`get_by_cpfs`.
+
+    Lookups run on sessions of their own, since a batch serves many requests.
+    Every caller gets its own copy of the user, so one request changing the
+    entity it received cannot affect another.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], window: float = 0.002, max_batch: int = 100):
+        """
+        Initializes the loader.
+
+        Args:
+            session_factory (Callable[[], Session]): Opens the session each batch is read with.
+            window (float): The longest time, in seconds, a batch collects keys.
+            max_batch (int): The number of distinct keys that sends a batch early.
+        """
+        self.session_factory = session_factory
+        self.by_id = BatchLoader(self._load_ids, window, max_batch)
+        self.by_cpf = BatchLoader(self._load_cpfs, window, max_batch)
+
+    def get_by_id(self, user_id: int) -> Optional[User]:
+        """
+        Fetch a user by ID as part of the current batch.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+
+        Returns:
+            Optional[User]: The user, or None if it does not exist.
+        """
+        return copy.copy(self.by_id.load(user_id))
+
+    def get_by_cpf(self, cpf: str) -> Optional[User]:
+        """
+        Fetch a user by CPF as part of the current batch.
+
+        Args:
+            cpf (str): The CPF of the user.
+
+        Returns:
+            Optional[User]: The user, or None if it does not exist.
+        """
+        return copy.copy(self.by_cpf.load(cpf))
+
+    def stats(self) -> dict:
+        """
+        Reports batching for each kind of lookup.
+
+        Returns:
+            dict: The `by_id` and `by_cpf` loader statistics.
+        """
+        return {'by_id': self.by_id.stats(), 'by_cpf': self.by_cpf.stats()}
+
+    def _load_ids(self, user_ids: List[int]) -> Dict[int, User]:
+        with self.session_factory() as session:
+            return {user.id: user for user in SQLAlchemyUserRepository(session).get_by_ids(user_ids)}
+
+    def _load_cpfs(self, cpfs: List[str]) -> Dict[str, User]:
+        with self.session_factory() as session:
+            users = SQLAlchemyUserRepository(session).get_by_cpfs(cpfs)
+        return _by_requested_cpf(cpfs, users)
+
+
+class AsyncUserLoader(object):
+    """
+    Asyncio twin of UserLoader.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession], window: float = 0.002, max_batch: int = 100):
+        """
+        Initializes the loader.
+
+        Args:
+            session_factory (Callable[[], AsyncSession]): Opens the session each batch is read with.
+            window (float): The longest time, in seconds, a batch collects keys.
+            max_batch (int): The number of distinct keys that sends a batch early.
+        """
+        self.session_factory = session_factory
+        self.by_id = AsyncBatchLoader(self._load_ids, window, max_batch)
+        self.by_cpf = AsyncBatchLoader(self._load_cpfs, window, max_batch)
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """
+        Fetch a user by ID as part of the current batch.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+
+        Returns:
+            Optional[User]: The user, or None if it does not exist.
+        """
+        return copy.copy(await self.by_id.load(user_id))
+
+    async def get_by_cpf(self, cpf: str) -> Optional[User]:
+        """
+        Fetch a user by CPF as part of the current batch.
+
+        Args:
+            cpf (str): The CPF of the user.
+
+        Returns:
+            Optional[User]: The user, or None if it does not exist.
+        """
+        return copy.copy(await self.by_cpf.load(cpf))
+
+    def stats(self) -> dict:
+        """
+        Reports batching for each kind of lookup.
+
+        Returns:
+            dict: The `by_id` and `by_cpf` loader statistics.
+        """
+        return {'by_id': self.by_id.stats(), 'by_cpf': self.by_cpf.stats()}
+
+    async def _load_ids(self, user_ids: List[int]) -> Dict[int, User]:
+        async with self.session_factory() as session:
+            users = await AsyncSQLAlchemyUserRepository(session).get_by_ids(user_ids)
+        return {user.id: user for user in users}
+
+    async def _load_cpfs(self, cpfs: List[str]) -> Dict[str, User]:
+        async with self.session_factory() as session:
+            users = await AsyncSQLAlchemyUserRepository(session).get_by_cpfs(cpfs)
+        return _by_requested_cpf(cpfs, users)
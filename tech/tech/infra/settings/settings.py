@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -8,3 +10,51 @@ class Settings(BaseSettings):
     )
 
     DATABASE_URL: str
+    CPF_INDEX_KEY: str
+
+    DATABASE_POOL_SIZE: int = 20
+    DATABASE_MAX_OVERFLOW: int = 20
+    DATABASE_POOL_TIMEOUT: float = 10.0
+    DATABASE_POOL_PRE_PING: bool = True
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_STACK: str = 'sync'
+    DATABASE_REPLICA_URLS: str = ''
+    DATABASE_REPLICA_HEALTH_INTERVAL: float = 5.0
+    DATABASE_READ_YOUR_WRITES_SECONDS: float = 2.0
+
+    USERS_PAGE_SIZE_MAX: int = 100
+    USERS_COUNT_CACHE_TTL: float = 30.0
+    USERS_COUNT_EXACT_THRESHOLD: int = 10000
+    USERS_BULK_BATCH_SIZE: int = 1000
+    USERS_BATCH_MAX: int = 100
+    USERS_LOOKUP_BATCHING: bool = False
+    USERS_LOOKUP_BATCH_WINDOW_MS: float = 2.0
+    USERS_LOOKUP_BATCH_MAX: int = 100
+    USERS_CACHE_ENABLED: bool = False
+    USERS_CACHE_MAX_ENTRIES: int = 10000
+    USERS_CACHE_TTL: float = 60.0
+    USERS_CACHE_NEGATIVE_TTL: float = 5.0
+    USERS_CACHE_STALE_WHILE_REVALIDATE: float = 0.0
+    USERS_CACHE_STALE_IF_ERROR: float = 0.0
+    USERS_CACHE_LISTEN: bool = True
+    USERS_CACHE_BACKEND: str = 'memory'
+    USERS_CACHE_NEAR_TTL: float = 5.0
+    USERS_CACHE_REDIS_URL: str = 'redis://localhost:6379/0'
+    USERS_CACHE_REDIS_TIMEOUT: float = 0.1
+    USERS_CACHE_REDIS_POOL_SIZE: int = 10
+    USERS_CACHE_SHARED_PATH: str = '/dev/shm/users-cache'
+    USERS_CACHE_SHARED_SLOTS: int = 16384
+    USERS_CACHE_SHARED_SLOT_SIZE: int = 1024
+
+    PASSWORD_HASH_BACKEND: str = 'process'
+    PASSWORD_HASH_WORKERS: Optional[int] = None
+    PASSWORD_HASH_PROFILE: str = 'recommended'
+    PASSWORD_HASH_TARGET_MS: float = 100.0
+
+    COGNITO_MAX_POOL_CONNECTIONS: int = 50
+    COGNITO_CONNECT_TIMEOUT: float = 2.0
+    COGNITO_READ_TIMEOUT: float = 5.0
+    COGNITO_RETRY_MODE: str = 'standard'
+    COGNITO_MAX_ATTEMPTS: int = 3
+    COGNITO_JWKS_LIFESPAN: float = 3600.0
+    COGNITO_TOKEN_CACHE_MAX_ENTRIES: int = 10000
@@ -0,0 +1,302 @@
+from typing import AsyncIterable, Optional
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from tech.domain.exceptions import UserAlreadyExistsError
+from tech.infra.databases.user_export import EXPORT_FORMATS
+from tech.use_cases.users.create_user_use_case import AsyncCreateUserUseCase
+from tech.use_cases.users.bulk_import_users_use_case import AsyncBulkImportUsersUseCase
+from tech.use_cases.users.list_users_use_case import AsyncListUsersUseCase
+from tech.use_cases.users.get_user_use_case import AsyncGetUserUseCase
+from tech.use_cases.users.get_user_by_cpf_use_case import AsyncGetUserByCpfUseCase
+from tech.use_cases.users.get_users_batch_use_case import AsyncGetUsersBatchUseCase
+from tech.use_cases.users.update_user_use_case import AsyncUpdateUserUseCase
+from tech.use_cases.users.patch_user_use_case import AsyncPatchUserUseCase
+from tech.use_cases.users.delete_user_use_case import AsyncDeleteUserUseCase
+from tech.use_cases.users.count_users_use_case import AsyncCountUsersUseCase
+from tech.use_cases.users.export_users_use_case import ExportUsersUseCase
+from tech.interfaces.presenters.user_presenter import UserPresenter
+from tech.interfaces.schemas.user_import_reader import aread_user_rows
+from tech.interfaces.schemas.user_schema import UserBatchSchema, UserPatchSchema, UserSchema
+
+class AsyncUserController:
+    """
+    Asyncio twin of UserController, awaiting the async use cases.
+
+    Errors are mapped to HTTP responses exactly as in UserController.
+    """
+
+    def __init__(
+        self,
+        create_user_use_case: AsyncCreateUserUseCase,
+        list_users_use_case: AsyncListUsersUseCase,
+        get_user_use_case: AsyncGetUserUseCase,
+        get_user_by_cpf_use_case: AsyncGetUserByCpfUseCase,
+        update_user_use_case: AsyncUpdateUserUseCase,
+        delete_user_use_case: AsyncDeleteUserUseCase,
+        patch_user_use_case: AsyncPatchUserUseCase,
+        count_users_use_case: Optional[AsyncCountUsersUseCase] = None,
+        export_users_use_case: Optional[ExportUsersUseCase] = None,
+        bulk_import_users_use_case: Optional[AsyncBulkImportUsersUseCase] = None,
+        get_users_batch_use_case: Optional[AsyncGetUsersBatchUseCase] = None
+    ):
+        """
+        Initializes the AsyncUserController with the required use cases.
+
+        Args:
+            create_user_use_case (AsyncCreateUserUseCase): Use case for creating a user.
+            list_users_use_case (AsyncListUsersUseCase): Use case for listing users.
+            get_user_use_case (AsyncGetUserUseCase): Use case for retrieving a user by ID.
+            get_user_by_cpf_use_case (AsyncGetUserByCpfUseCase): Use case for retrieving a user by CPF.
+            update_user_use_case (AsyncUpdateUserUseCase): Use case for updating a user.
+            delete_user_use_case (AsyncDeleteUserUseCase): Use case for deleting a user.
+            patch_user_use_case (AsyncPatchUserUseCase): Use case for partially updating a user.
+            count_users_use_case (AsyncCountUsersUseCase): Use case for counting users.
+            export_users_use_case (ExportUsersUseCase): Use case for exporting all users.
+            bulk_import_users_use_case (AsyncBulkImportUsersUseCase): Use case for importing many users.
+            get_users_batch_use_case (AsyncGetUsersBatchUseCase): Use case for retrieving many users at once.
+        """
+        self.create_user_use_case = create_user_use_case
+        self.list_users_use_case = list_users_use_case
+        self.get_user_use_case = get_user_use_case
+        self.get_user_by_cpf_use_case = get_user_by_cpf_use_case
+        self.update_user_use_case = update_user_use_case
+        self.delete_user_use_case = delete_user_use_case
+        self.patch_user_use_case = patch_user_use_case
+        self.count_users_use_case = count_users_use_case
+        self.export_users_use_case = export_users_use_case
+        self.bulk_import_users_use_case = bulk_import_users_use_case
+        self.get_users_batch_use_case = get_users_batch_use_case
+
+    async def create_user(self, user_data: UserSchema) -> dict:
+        """
+        Creates a new user and returns a formatted response.
+
+        Args:
+            user_data (UserSchema): The data required to create a new user.
+
+        Returns:
+            dict: The formatted response containing user details.
+
+        Raises:
+            HTTPException: If a user with the same username, email, or CPF already exists.
+        """
+        try:
+            user = await self.create_user_use_case.execute(user_data)
+            return UserPresenter.present_user(user)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    async def bulk_import_users(self, chunks: AsyncIterable[bytes], import_format: str) -> dict:
+        """
+        Imports every user of a streamed NDJSON or CSV body.
+
+        Args:
+            chunks (AsyncIterable[bytes]): The request body, chunk by chunk.
+            import_format (str): 'ndjson' or 'csv'.
+
+        Returns:
+            dict: The counts per outcome and the result of every row.
+
+        Raises:
+            HTTPException: If the format is not supported or the body is not UTF-8.
+        """
+        try:
+            return await self.bulk_import_users_use_case.execute(aread_user_rows(chunks, import_format))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    async def list_users(self, limit: int, skip: int) -> list:
+        """
+        Retrieves a paginated list of users.
+
+        Args:
+            limit (int): The maximum number of users to return.
+            skip (int): The number of users to skip.
+
+        Returns:
+            list: A list of formatted user details.
+        """
+        users = await self.list_users_use_case.execute(limit, skip)
+        return UserPresenter.present_user_list(users)
+
+    async def list_users_page(self, limit: int, cursor: str) -> dict:
+        """
+        Retrieves one page of users using keyset (cursor) pagination.
+
+        Args:
+            limit (int): The maximum number of users to return.
+            cursor (str): The cursor of the page to read; empty for the first page.
+
+        Returns:
+            dict: The formatted users and the cursor of the next page.
+
+        Raises:
+            HTTPException: If the cursor is malformed.
+        """
+        try:
+            users, next_cursor = await self.list_users_use_case.execute_cursor(cursor, limit)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return UserPresenter.present_user_page(users, next_cursor)
+
+    async def count_users(self, mode: str) -> dict:
+        """
+        Counts users, exactly or from database statistics.
+
+        Args:
+            mode (str): 'auto', 'exact' or 'approximate'.
+
+        Returns:
+            dict: The `count` and whether it is `exact`.
+
+        Raises:
+            HTTPException: If the mode is unknown.
+        """
+        try:
+            return await self.count_users_use_case.execute(mode)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    async def export_users(self, export_format: str) -> StreamingResponse:
+        """
+        Streams every user as CSV or NDJSON.
+
+        Args:
+            export_format (str): 'csv' or 'ndjson'.
+
+        Returns:
+            StreamingResponse: The export, sent as it is read from the database.
+
+        Raises:
+            HTTPException: If the format is not supported.
+        """
+        try:
+            chunks = self.export_users_use_case.execute(export_format)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return StreamingResponse(
+            chunks,
+            media_type=EXPORT_FORMATS[export_format],
+            headers={'Content-Disposition': f'attachment; filename="users.{export_format}"'},
+        )
+
+    async def get_user(self, user_id: int) -> dict:
+        """
+        Retrieves a user by their unique ID.
+
+        Args:
+            user_id (int): The ID of the user to retrieve.
+
+        Returns:
+            dict: The formatted response containing user details.
+
+        Raises:
+            HTTPException: If no user is found with the given ID.
+        """
+        try:
+            user = await self.get_user_use_case.execute(user_id)
+            return UserPresenter.present_user(user)
+        except ValueError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+
+    async def get_user_by_cpf(self, cpf: str) -> dict:
+        """
+        Retrieves a user by their CPF.
+
+        Args:
+            cpf (str): The CPF of the user.
+
+        Returns:
+            dict: The formatted response containing user details.
+
+        Raises:
+            HTTPException: If no user is found with the given CPF.
+        """
+        try:
+            user = await self.get_user_by_cpf_use_case.execute(cpf)
+            return UserPresenter.present_user(user)
+        except ValueError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+
+    async def get_users_batch(self, batch: UserBatchSchema) -> dict:
+        """
+        Retrieves many users by ID and/or CPF at once.
+
+        Args:
+            batch (UserBatchSchema): The IDs and CPFs to look up.
+
+        Returns:
+            dict: Every requested ID and CPF mapped to the formatted user, or null.
+
+        Raises:
+            HTTPException: If the batch is larger than allowed.
+        """
+        try:
+            by_id, by_cpf = await self.get_users_batch_use_case.execute(batch.ids, batch.cpfs)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return UserPresenter.present_user_batch(by_id, by_cpf)
+
+    async def update_user(self, user_id: int, user_data: UserSchema) -> dict:
+        """
+        Updates a user's information.
+
+        Args:
+            user_id (int): The ID of the user to update.
+            user_data (UserSchema): The updated user details.
+
+        Returns:
+            dict: The formatted response containing the updated user details.
+
+        Raises:
+            HTTPException: If the user is not found, or the username, email or
+                CPF is already in use.
+        """
+        try:
+            updated_user = await self.update_user_use_case.execute(user_id, user_data)
+            return UserPresenter.present_user(updated_user)
+        except UserAlreadyExistsError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+
+    async def patch_user(self, user_id: int, user_data: UserPatchSchema) -> dict:
+        """
+        Partially updates a user's information.
+
+        Args:
+            user_id (int): The ID of the user to update.
+            user_data (UserPatchSchema): The fields to change.
+
+        Returns:
+            dict: The formatted response containing the updated user details.
+
+        Raises:
+            HTTPException: If the user is not found, or a new username, email or
+                CPF is already in use.
+        """
+        try:
+            updated_user = await self.patch_user_use_case.execute(user_id, user_data)
+            return UserPresenter.present_user(updated_user)
+        except UserAlreadyExistsError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+
+    async def delete_user(self, user_id: int) -> dict:
+        """
+        Deletes a user by their unique ID.
+
+        Args:
+            user_id (int): The ID of the user to delete.
+
+        Returns:
+            dict: A success message confirming deletion.
+
+        Raises:
+            HTTPException: If the user is not found.
+        """
+        try:
+            return await self.delete_user_use_case.execute(user_id)
+        except ValueError as e:
+            raise HTTPException(status_code=404, detail=str(e))
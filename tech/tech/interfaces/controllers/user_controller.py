@@ -1,12 +1,22 @@
+from typing import Iterable, Optional
 from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from tech.domain.exceptions import UserAlreadyExistsError
+from tech.infra.databases.user_export import EXPORT_FORMATS
 from tech.use_cases.users.create_user_use_case import CreateUserUseCase
+from tech.use_cases.users.bulk_import_users_use_case import BulkImportUsersUseCase
 from tech.use_cases.users.list_users_use_case import ListUsersUseCase
 from tech.use_cases.users.get_user_use_case import GetUserUseCase
 from tech.use_cases.users.get_user_by_cpf_use_case import GetUserByCpfUseCase
+from tech.use_cases.users.get_users_batch_use_case import GetUsersBatchUseCase
 from tech.use_cases.users.update_user_use_case import UpdateUserUseCase
+from tech.use_cases.users.patch_user_use_case import PatchUserUseCase
 from tech.use_cases.users.delete_user_use_case import DeleteUserUseCase
+from tech.use_cases.users.count_users_use_case import CountUsersUseCase
+from tech.use_cases.users.export_users_use_case import ExportUsersUseCase
 from tech.interfaces.presenters.user_presenter import UserPresenter
-from tech.interfaces.schemas.user_schema import UserSchema
+from tech.interfaces.schemas.user_import_reader import read_user_rows
+from tech.interfaces.schemas.user_schema import UserBatchSchema, UserPatchSchema, UserSchema
 
 class UserController:
     """
@@ -20,7 +30,12 @@ class UserController:
         get_user_use_case: GetUserUseCase,
         get_user_by_cpf_use_case: GetUserByCpfUseCase,
         update_user_use_case: UpdateUserUseCase,
-        delete_user_use_case: DeleteUserUseCase
+        delete_user_use_case: DeleteUserUseCase,
+        patch_user_use_case: Optional[PatchUserUseCase] = None,
+        count_users_use_case: Optional[CountUsersUseCase] = None,
+        export_users_use_case: Optional[ExportUsersUseCase] = None,
+        bulk_import_users_use_case: Optional[BulkImportUsersUseCase] = None,
+        get_users_batch_use_case: Optional[GetUsersBatchUseCase] = None
     ):
         """
         Initializes the UserController with the required use cases.
@@ -32,6 +47,11 @@ class UserController:
             get_user_by_cpf_use_case (GetUserByCpfUseCase): Use case for retrieving a user by CPF.
             update_user_use_case (UpdateUserUseCase): Use case for updating a user.
             delete_user_use_case (DeleteUserUseCase): Use case for deleting a user.
+            patch_user_use_case (PatchUserUseCase): Use case for partially updating a user.
+            count_users_use_case (CountUsersUseCase): Use case for counting users.
+            export_users_use_case (ExportUsersUseCase): Use case for exporting all users.
+            bulk_import_users_use_case (BulkImportUsersUseCase): Use case for importing many users.
+            get_users_batch_use_case (GetUsersBatchUseCase): Use case for retrieving many users at once.
         """
         self.create_user_use_case = create_user_use_case
         self.list_users_use_case = list_users_use_case
@@ -39,6 +59,11 @@ class UserController:
         self.get_user_by_cpf_use_case = get_user_by_cpf_use_case
         self.update_user_use_case = update_user_use_case
         self.delete_user_use_case = delete_user_use_case
+        self.patch_user_use_case = patch_user_use_case
+        self.count_users_use_case = count_users_use_case
+        self.export_users_use_case = export_users_use_case
+        self.bulk_import_users_use_case = bulk_import_users_use_case
+        self.get_users_batch_use_case = get_users_batch_use_case
 
     def create_user(self, user_data: UserSchema) -> dict:
         """
@@ -59,6 +84,25 @@ class UserController:
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
+    def bulk_import_users(self, chunks: Iterable[bytes], import_format: str) -> dict:
+        """
+        Imports every user of a streamed NDJSON or CSV body.
+
+        Args:
+            chunks (Iterable[bytes]): The request body, chunk by chunk.
+            import_format (str): 'ndjson' or 'csv'.
+
+        Returns:
+            dict: The counts per outcome and the result of every row.
+
+        Raises:
+            HTTPException: If the format is not supported or the body is not UTF-8.
+        """
+        try:
+            return self.bulk_import_users_use_case.execute(read_user_rows(chunks, import_format))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
     def list_users(self, limit: int, skip: int) -> list:
         """
         Retrieves a paginated list of users.
@@ -73,6 +117,67 @@ class UserController:
         users = self.list_users_use_case.execute(limit, skip)
         return UserPresenter.present_user_list(users)
 
+    def list_users_page(self, limit: int, cursor: str) -> dict:
+        """
+        Retrieves one page of users using keyset (cursor) pagination.
+
+        Args:
+            limit (int): The maximum number of users to return.
+            cursor (str): The cursor of the page to read; empty for the first page.
+
+        Returns:
+            dict: The formatted users and the cursor of the next page.
+
+        Raises:
+            HTTPException: If the cursor is malformed.
+        """
+        try:
+            users, next_cursor = self.list_users_use_case.execute_cursor(cursor, limit)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return UserPresenter.present_user_page(users, next_cursor)
+
+    def count_users(self, mode: str) -> dict:
+        """
+        Counts users, exactly or from database statistics.
+
+        Args:
+            mode (str): 'auto', 'exact' or 'approximate'.
+
+        Returns:
+            dict: The `count` and whether it is `exact`.
+
+        Raises:
+            HTTPException: If the mode is unknown.
+        """
+        try:
+            return self.count_users_use_case.execute(mode)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    def export_users(self, export_format: str) -> StreamingResponse:
+        """
+        Streams every user as CSV or NDJSON.
+
+        Args:
+            export_format (str): 'csv' or 'ndjson'.
+
+        Returns:
+            StreamingResponse: The export, sent as it is read from the database.
+
+        Raises:
+            HTTPException: If the format is not supported.
+        """
+        try:
+            chunks = self.export_users_use_case.execute(export_format)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return StreamingResponse(
+            chunks,
+            media_type=EXPORT_FORMATS[export_format],
+            headers={'Content-Disposition': f'attachment; filename="users.{export_format}"'},
+        )
+
     def get_user(self, user_id: int) -> dict:
         """
         Retrieves a user by their unique ID.
@@ -111,6 +216,25 @@ class UserController:
         except ValueError as e:
             raise HTTPException(status_code=404, detail=str(e))
 
+    def get_users_batch(self, batch: UserBatchSchema) -> dict:
+        """
+        Retrieves many users by ID and/or CPF at once.
+
+        Args:
+            batch (UserBatchSchema): The IDs and CPFs to look up.
+
+        Returns:
+            dict: Every requested ID and CPF mapped to the formatted user, or null.
+
+        Raises:
+            HTTPException: If the batch is larger than allowed.
+        """
+        try:
+            by_id, by_cpf = self.get_users_batch_use_case.execute(batch.ids, batch.cpfs)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return UserPresenter.present_user_batch(by_id, by_cpf)
+
     def update_user(self, user_id: int, user_data: UserSchema) -> dict:
         """
         Updates a user's information.
@@ -123,11 +247,37 @@ class UserController:
             dict: The formatted response containing the updated user details.
 
         Raises:
-            HTTPException: If the user is not found.
+            HTTPException: If the user is not found, or the username, email or
+                CPF is already in use.
         """
         try:
             updated_user = self.update_user_use_case.execute(user_id, user_data)
             return UserPresenter.present_user(updated_user)
+        except UserAlreadyExistsError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+
+    def patch_user(self, user_id: int, user_data: UserPatchSchema) -> dict:
+        """
+        Partially updates a user's information.
+
+        Args:
+            user_id (int): The ID of the user to update.
+            user_data (UserPatchSchema): The fields to change.
+
+        Returns:
+            dict: The formatted response containing the updated user details.
+
+        Raises:
+            HTTPException: If the user is not found, or a new username, email or
+                CPF is already in use.
+        """
+        try:
+            updated_user = self.patch_user_use_case.execute(user_id, user_data)
+            return UserPresenter.present_user(updated_user)
+        except UserAlreadyExistsError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except ValueError as e:
             raise HTTPException(status_code=404, detail=str(e))
 
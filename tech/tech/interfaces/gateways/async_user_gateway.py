@@ -0,0 +1,278 @@
+from typing import Callable, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from tech.domain.entities.users import User
+from tech.interfaces.repositories.async_user_repository import AsyncUserRepository
+from tech.infra.repositories.async_sql_alchemy_user_repository import AsyncSQLAlchemyUserRepository
+from tech.infra.cache.memory_cache import MISSING, MemoryCache
+from tech.infra.cache.user_cache import UserCache
+from tech.infra.repositories.user_loader import AsyncUserLoader
+
+class AsyncUserGateway(AsyncUserRepository):
+    """
+    Asyncio twin of UserGateway, adapting the async use cases to the async repository.
+    """
+
+    def __init__(self, session: AsyncSession, user_loader: Optional[AsyncUserLoader] = None,
+                 user_cache: Optional[UserCache] = None, count_cache: Optional[MemoryCache] = None):
+        """
+        Initializes the AsyncUserGateway with an async database session.
+
+        Args:
+            session (AsyncSession): The async SQLAlchemy session used for database transactions.
+            user_loader (AsyncUserLoader): Optional batcher that coalesces concurrent
+                lookups by ID and CPF into single queries.
+            user_cache (UserCache): Optional read-through cache for lookups by ID and
+                CPF, invalidated by every write made through this gateway.
+            count_cache (MemoryCache): Optional TTL cache of the exact and
+                estimated user counts.
+        """
+        self.repository = AsyncSQLAlchemyUserRepository(session)
+        self.user_loader = user_loader
+        self.user_cache = user_cache
+        self.count_cache = count_cache
+
+    async def add(self, user: User) -> User:
+        """
+        Adds a new user to the repository.
+
+        Args:
+            user (User): The user entity to be added.
+
+        Returns:
+            User: The added user with an assigned ID.
+        """
+        added = await self.repository.add(user)
+        await self._invalidate(added.id, added.cpf)
+        return added
+
+    async def add_many(self, users: List[User]) -> List[Optional[str]]:
+        """
+        Adds many users at once, skipping the ones that already exist.
+
+        Args:
+            users (List[User]): The user entities to add.
+
+        Returns:
+            List[Optional[str]]: For each user, None when it was added, otherwise
+            the conflicting field.
+        """
+        conflicts = await self.repository.add_many(users)
+        if self.user_cache:
+            await self.user_cache.ainvalidate_many(
+                [(user.id, user.cpf) for user in users if user.id is not None]
+            )
+        return conflicts
+
+    async def get_by_id(self, user_id: int) -> User:
+        """
+        Retrieves a user by its unique ID.
+
+        Args:
+            user_id (int): The ID of the user.
+
+        Returns:
+            User: The user entity if found.
+        """
+        if self.user_cache:
+            return await self.user_cache.aget_by_id(user_id, lambda: self._load_by_id(user_id))
+        return await self._load_by_id(user_id)
+
+    async def get_by_id_for_update(self, user_id: int) -> Optional[User]:
+        """
+        Retrieves a user from the primary database, bypassing the cache and
+        the batch loader, and locks its row.
+
+        Args:
+            user_id (int): The ID of the user.
+
+        Returns:
+            Optional[User]: The user entity if found.
+        """
+        return await self.repository.get_by_id_for_update(user_id)
+
+    async def get_by_cpf(self, cpf: str) -> User:
+        """
+        Retrieves a user by CPF.
+
+        Args:
+            cpf (str): The CPF of the user.
+
+        Returns:
+            User: The user entity if found.
+        """
+        if self.user_cache:
+            return await self.user_cache.aget_by_cpf(cpf, lambda: self._load_by_cpf(cpf))
+        return await self._load_by_cpf(cpf)
+
+    async def _load_by_id(self, user_id: int) -> Optional[User]:
+        if self.user_loader:
+            return await self.user_loader.get_by_id(user_id)
+        return await self.repository.get_by_id(user_id)
+
+    async def _load_by_cpf(self, cpf: str) -> Optional[User]:
+        if self.user_loader:
+            return await self.user_loader.get_by_cpf(cpf)
+        return await self.repository.get_by_cpf(cpf)
+
+    async def _invalidate(self, user_id: Optional[int], cpf: Optional[str] = None) -> None:
+        if self.user_cache:
+            await self.user_cache.ainvalidate_many([(user_id, cpf)])
+
+    async def get_by_username_or_email_or_cpf(self, username: str, email: str, cpf: str) -> User:
+        """
+        Retrieves a user by username, email, or CPF.
+
+        Args:
+            username (str): The username to search for.
+            email (str): The email to search for.
+            cpf (str): The CPF to search for.
+
+        Returns:
+            User: The user entity if found.
+        """
+        return await self.repository.get_by_username_or_email_or_cpf(username, email, cpf)
+
+    async def list_users(self, limit: int, skip: int):
+        """
+        Retrieves a paginated list of users.
+
+        Args:
+            limit (int): The number of users to retrieve.
+            skip (int): The number of users to skip before retrieving.
+
+        Returns:
+            list: A list of user entities.
+        """
+        return await self.repository.list_users(limit, skip)
+
+    async def list_users_after(self, after_id: Optional[int], limit: int):
+        """
+        Retrieves the users whose ID follows `after_id`, ordered by ID.
+
+        Args:
+            after_id (Optional[int]): The last ID of the previous page, or None for the first page.
+            limit (int): The number of users to retrieve.
+
+        Returns:
+            list: A list of user entities.
+        """
+        return await self.repository.list_users_after(after_id, limit)
+
+    async def get_by_ids(self, user_ids: List[int]) -> List[User]:
+        """
+        Retrieves the users with the given IDs.
+
+        Args:
+            user_ids (List[int]): The IDs to look up.
+
+        Returns:
+            List[User]: The users found.
+        """
+        return await self.repository.get_by_ids(user_ids)
+
+    async def get_by_cpfs(self, cpfs: List[str]) -> List[User]:
+        """
+        Retrieves the users with the given CPFs.
+
+        Args:
+            cpfs (List[str]): The CPFs to look up.
+
+        Returns:
+            List[User]: The users found.
+        """
+        return await self.repository.get_by_cpfs(cpfs)
+
+    async def count_users(self) -> int:
+        """
+        Counts every user exactly.
+
+        Returns:
+            int: The number of users.
+        """
+        return await self._counted('exact', self.repository.count_users)
+
+    async def estimate_user_count(self) -> Optional[int]:
+        """
+        Estimates the number of users from database statistics.
+
+        Returns:
+            Optional[int]: The estimate, or None when unavailable.
+        """
+        return await self._counted('estimate', self.repository.estimate_user_count)
+
+    async def _counted(self, key: str, count: Callable):
+        if self.count_cache is None:
+            return await count()
+        value = self.count_cache.get(key)
+        if value is MISSING:
+            value = await count()
+            self.count_cache.set(key, value)
+        return value
+
+    async def update(self, user: User) -> Optional[User]:
+        """
+        Updates an existing user's information.
+
+        Args:
+            user (User): The user entity with updated information.
+
+        Returns:
+            Optional[User]: The updated user entity, or None if the user does not exist.
+        """
+        updated = await self.repository.update(user)
+        await self._invalidate(user.id, user.cpf)
+        return updated
+
+    async def update_fields(self, user_id: int, changes: dict) -> None:
+        """
+        Writes only the given columns of an existing user.
+
+        Args:
+            user_id (int): The ID of the user.
+            changes (dict): The new values, keyed by field name.
+        """
+        await self.repository.update_fields(user_id, changes)
+        await self._invalidate(user_id, changes.get('cpf'))
+
+    async def get_password_hash(self, user_id: int) -> Optional[str]:
+        """
+        Retrieves the stored password hash of a user, which the cache does not keep.
+
+        Args:
+            user_id (int): The ID of the user.
+
+        Returns:
+            Optional[str]: The hash, or None if the user does not exist.
+        """
+        return await self.repository.get_password_hash(user_id)
+
+    async def update_password(self, user_id: int, stale_hash: str, hashed_password: str) -> bool:
+        """
+        Replaces a stale password hash, unless it changed since it was read.
+
+        Args:
+            user_id (int): The ID of the user.
+            stale_hash (str): The hash the new one was computed from.
+            hashed_password (str): The new password hash.
+
+        Returns:
+            bool: True if the stale hash was still stored and was replaced.
+        """
+        updated = await self.repository.update_password(user_id, stale_hash, hashed_password)
+        if updated:
+            await self._invalidate(user_id)
+        return updated
+
+    async def delete(self, user_id: int) -> bool:
+        """
+        Deletes a user from the repository.
+
+        Args:
+            user_id (int): The ID of the user to be deleted.
+
+        Returns:
+            bool: True if the user existed and was deleted.
+        """
+        deleted = await self.repository.delete(user_id)
+        await self._invalidate(user_id)
+        return deleted
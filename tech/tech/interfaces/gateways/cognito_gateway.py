@@ -1,10 +1,15 @@
 import boto3
+import jwt
 import os
 import hmac
 import hashlib
 import base64
-import json
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Optional
+from botocore.config import Config
+from tech.infra.cache.token_cache import REVOKED, VerifiedTokenCache
+
+JWKS_TIMEOUT = 5
 
 class CognitoGateway:
     """Gateway for interacting with Amazon Cognito services.
@@ -12,14 +17,25 @@ class CognitoGateway:
     This class encapsulates all interactions with AWS Cognito, providing methods
     for authentication, token verification, and user management operations.
     It maintains a boto3 Cognito client and handles AWS credentials.
+
+    Creating the client loads the service model and its connection pool, so
+    the application shares one gateway (see `get_cognito_gateway`); boto3
+    clients are safe to use from many threads.
     """
 
-    def __init__(self):
+    def __init__(self, client_config: Optional[Config] = None, jwks_lifespan: float = 3600.0,
+                 token_cache_size: int = 10000):
         """Initializes the CognitoGateway with AWS configuration.
 
         Sets up the AWS Cognito client with the appropriate region and credentials.
         Configures the User Pool ID, Client ID, and Client Secret needed for
         Cognito operations.
+
+        Args:
+            client_config (Optional[Config]): botocore settings for the client's
+                connection pool, timeouts and retries.
+            jwks_lifespan (float): Seconds the User Pool's key set is cached.
+            token_cache_size (int): The most verified tokens remembered at once.
         """
         self.region = "us-east-1"
         self.user_pool_id = "us-east-1_k6nq9jjr3"
@@ -30,10 +46,14 @@ class CognitoGateway:
             "cognito-idp",
             region_name=self.region,
             aws_access_key_id=os.environ.get('AWS_ACCESS_KEY_ID', 'SUA_ACCESS_KEY_ID'),
-            aws_secret_access_key=os.environ.get('AWS_SECRET_ACCESS_KEY', 'SUA_SECRET_ACCESS_KEY')
+            aws_secret_access_key=os.environ.get('AWS_SECRET_ACCESS_KEY', 'SUA_SECRET_ACCESS_KEY'),
+            config=client_config
         )
 
-        self.jwks_url = f"https://cognito-idp.{self.region}.amazonaws.com/{self.user_pool_id}/.well-known/jwks.json"
+        self.issuer = f"https://cognito-idp.{self.region}.amazonaws.com/{self.user_pool_id}"
+        self.jwks_url = f"{self.issuer}/.well-known/jwks.json"
+        self.jwks_client = jwt.PyJWKClient(self.jwks_url, lifespan=jwks_lifespan, timeout=JWKS_TIMEOUT)
+        self.token_cache = VerifiedTokenCache(token_cache_size)
 
     def authenticate(self, cpf: str, password: str) -> dict:
         """Authenticates a user with CPF and password.
@@ -104,144 +124,149 @@ class CognitoGateway:
         ).digest()
         return base64.b64encode(dig).decode()
 
-    def _decode_jwt_manually(self, token: str) -> dict:
-        """Manually decodes a JWT token without using external libraries.
+    def verify_token(self, token: str) -> Dict:
+        """Verifies a JWT token and extracts user information.
+
+        Checks the RS256 signature against the User Pool's JSON Web Key Set,
+        then the `exp`, `iss` and audience claims (`aud` for ID tokens,
+        `client_id` for access tokens). The key set is fetched once and cached
+        for `jwks_lifespan` seconds; a token signed with an unknown `kid`
+        triggers a refetch, so rotated keys are picked up without a restart.
+        Admin status comes from the token's `cognito:groups` claim, so no call
+        to Cognito is made per verification.
 
-        Splits the JWT token into its components and decodes the payload (claims).
-        Does not verify the signature.
+        The result is kept in a bounded cache keyed by the token's SHA-256
+        until the token expires, so a token already seen is not verified
+        again; tokens passed to `revoke_token` are rejected from then on.
 
         Args:
-            token (str): The JWT token to decode.
+            token (str): The JWT token to verify.
 
         Returns:
-            dict: The decoded claims from the token.
+            dict: User information including username, attributes, and admin status.
 
         Raises:
-            ValueError: If the token format is invalid or decoding fails.
+            ValueError: If the token is malformed, badly signed, expired,
+                revoked, or issued for another User Pool or app client.
+        """
+        user_data = self.token_cache.get(token)
+        if user_data is REVOKED:
+            raise ValueError("Invalid token: revoked")
+        if user_data is not None:
+            return user_data
+
+        claims = self._verify_claims(token)
+
+        username = claims.get("cognito:username", claims.get("username", claims.get("sub", "")))
+        if not username:
+            raise ValueError("Token does not contain user identifier")
+
+        user_data = {
+            "username": username,
+            "attributes": {
+                "sub": claims.get("sub", ""),
+                "email": claims.get("email", "")
+            },
+            "is_admin": "admin" in claims.get("cognito:groups", [])
+        }
+        self.token_cache.put(token, user_data, claims["exp"])
+        return user_data
+
+    def revoke_token(self, token: str) -> None:
+        """Rejects a token before it expires, e.g. on logout.
+
+        Tokens that do not verify are rejected anyway and are ignored.
+
+        Args:
+            token (str): The JWT token to revoke.
         """
-        parts = token.split('.')
-        if len(parts) < 2:
-            raise ValueError("Invalid JWT format - not enough segments")
+        try:
+            claims = self._verify_claims(token)
+        except ValueError:
+            return
+        self.token_cache.revoke(token, claims["exp"])
 
-        payload = parts[1]
+    def _verify_claims(self, token: str) -> dict:
+        """Checks a token's signature, expiry, issuer and audience.
 
-        padding = 4 - (len(payload) % 4)
-        if padding < 4:
-            payload += '=' * padding
+        Args:
+            token (str): The JWT token to verify.
 
-        payload = payload.replace('-', '+').replace('_', '/')
+        Returns:
+            dict: The verified claims.
 
+        Raises:
+            ValueError: If the token does not verify.
+        """
         try:
-            decoded_bytes = base64.b64decode(payload)
+            signing_key = self.jwks_client.get_signing_key_from_jwt(token)
+            claims = jwt.decode(
+                token,
+                signing_key.key,
+                algorithms=["RS256"],
+                issuer=self.issuer,
+                options={"require": ["exp", "iss", "token_use"], "verify_aud": False},
+            )
+        except jwt.PyJWKClientConnectionError as e:
+            print(f"Failed to fetch the Cognito key set: {str(e)}")
+            raise ValueError(f"Token verification failed: {str(e)}")
+        except jwt.PyJWTError as e:
+            raise ValueError(f"Invalid token: {str(e)}")
 
-            return json.loads(decoded_bytes.decode('utf-8'))
-        except Exception as e:
-            print(f"Failed to decode JWT payload: {str(e)}")
-            raise ValueError(f"Failed to decode JWT: {str(e)}")
+        self._verify_audience(claims)
+        return claims
 
-    def verify_token(self, token: str) -> Dict:
-        """Verifies a JWT token and extracts user information.
+    def _verify_audience(self, claims: dict) -> None:
+        """Checks that the token was issued for this app client.
 
-        Decodes the token to extract user information, then uses the Cognito API
-        to verify the user's existence and group memberships. Determines if the
-        user is an admin based on group membership.
+        Cognito ID tokens carry the app client in `aud`, access tokens in
+        `client_id`.
 
         Args:
-            token (str): The JWT token to verify.
-
-        Returns:
-            dict: User information including username, attributes, and admin status.
+            claims (dict): The verified token claims.
 
         Raises:
-            ValueError: If token verification fails, user is not found, or other errors occur.
-            Exception: For unexpected errors during verification.
+            ValueError: If the token type is unknown or the audience does not match.
         """
-        try:
-            print(f"Starting token verification: {token[:20]}...")
-
-            try:
-                try:
-                    decoded_token = self._decode_jwt_manually(token)
-                except Exception as jwt_error:
-                    print(f"JWT decode error: {str(jwt_error)}")
-                    raise ValueError(f"Invalid JWT format: {str(jwt_error)}")
-
-                print(f"Token decoded: {decoded_token}")
-
-                if "cognito:groups" in decoded_token:
-                    groups = decoded_token.get("cognito:groups", [])
-                    username = decoded_token.get("cognito:username", decoded_token.get("sub", ""))
-
-                    user_data = {
-                        "username": username,
-                        "attributes": {
-                            "sub": decoded_token.get("sub", ""),
-                            "email": decoded_token.get("email", "")
-                        },
-                        "is_admin": "admin" in groups
-                    }
-
-                    print(f"Group information found in token: {groups}")
-                    print(f"User {username} {'is' if user_data['is_admin'] else 'is not'} an admin")
-
-                    return user_data
-
-                username = decoded_token.get("sub", decoded_token.get("cognito:username", ""))
-                if not username:
-                    raise ValueError("Token does not contain user identifier")
-
-                print(f"Username/sub extracted from token: {username}")
-            except ValueError as e:
-                raise e
-            except Exception as e:
-                print(f"Error decoding token: {str(e)}")
-                raise ValueError(f"Invalid token: {str(e)}")
-
-            try:
-                user_response = self.client.admin_get_user(
-                    UserPoolId=self.user_pool_id,
-                    Username=username
-                )
-
-                user_data = {
-                    "username": user_response.get("Username", ""),
-                    "attributes": {}
-                }
-
-                for attr in user_response.get("UserAttributes", []):
-                    user_data["attributes"][attr["Name"]] = attr["Value"]
-
-                print(f"User information obtained: {user_data['username']}")
-            except self.client.exceptions.UserNotFoundException:
-                print(f"User not found: {username}")
-                raise ValueError(f"User not found: {username}")
-            except Exception as e:
-                print(f"Error getting user information: {str(e)}")
-                raise ValueError(f"Failed to get user information: {str(e)}")
-
-            try:
-                groups_response = self.client.admin_list_groups_for_user(
-                    UserPoolId=self.user_pool_id,
-                    Username=username
-                )
-
-                print(f"Groups obtained: {[g.get('GroupName') for g in groups_response.get('Groups', [])]}")
-
-                user_data["is_admin"] = any(
-                    group.get("GroupName") == "admin"
-                    for group in groups_response.get("Groups", [])
-                )
-
-                print(f"User {username} {'is' if user_data['is_admin'] else 'is not'} an admin")
-
-                return user_data
-
-            except Exception as e:
-                print(f"Error checking admin status: {str(e)}")
-                raise ValueError(f"Failed to verify admin status: {str(e)}")
-
-        except ValueError as e:
-            raise e
-        except Exception as e:
-            print(f"Unexpected error in token verification: {str(e)}")
-            raise ValueError(f"Token verification failed: {str(e)}")
\ No newline at end of file
+        token_use = claims["token_use"]
+        if token_use == "id":
+            audience = claims.get("aud")
+        elif token_use == "access":
+            audience = claims.get("client_id")
+        else:
+            raise ValueError(f"Invalid token: unexpected token_use {token_use!r}")
+
+        if audience != self.client_id:
+            raise ValueError("Invalid token: issued for another client")
+
+
+def create_client_config(settings) -> Config:
+    """Builds the botocore configuration of the Cognito client from Settings.
+
+    Args:
+        settings (Settings): The application settings.
+
+    Returns:
+        Config: Pool size, connect/read timeouts and retry policy.
+    """
+    return Config(
+        max_pool_connections=settings.COGNITO_MAX_POOL_CONNECTIONS,
+        connect_timeout=settings.COGNITO_CONNECT_TIMEOUT,
+        read_timeout=settings.COGNITO_READ_TIMEOUT,
+        retries={'mode': settings.COGNITO_RETRY_MODE, 'max_attempts': settings.COGNITO_MAX_ATTEMPTS},
+    )
+
+
+@lru_cache
+def get_cognito_gateway() -> CognitoGateway:
+    """Returns the application-wide Cognito gateway, created on first use.
+
+    Returns:
+        CognitoGateway: The shared gateway, configured from Settings.
+    """
+    from tech.infra.settings.settings import Settings
+
+    settings = Settings()
+    return CognitoGateway(
+        create_client_config(settings), settings.COGNITO_JWKS_LIFESPAN, settings.COGNITO_TOKEN_CACHE_MAX_ENTRIES
+    )
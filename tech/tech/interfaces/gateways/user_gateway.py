@@ -1,21 +1,35 @@
+from typing import Callable, List, Optional
 from sqlalchemy.orm import Session
 from tech.domain.entities.users import User
 from tech.interfaces.repositories.user_repository import UserRepository
 from tech.infra.repositories.sql_alchemy_user_repository import SQLAlchemyUserRepository
+from tech.infra.cache.memory_cache import MISSING, MemoryCache
+from tech.infra.cache.user_cache import UserCache
+from tech.infra.repositories.user_loader import UserLoader
 
 class UserGateway(UserRepository):
     """
     Gateway that acts as an adapter between use cases and the database repository.
     """
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, user_loader: Optional[UserLoader] = None,
+                 user_cache: Optional[UserCache] = None, count_cache: Optional[MemoryCache] = None):
         """
         Initializes the UserGateway with a database session.
 
         Args:
             session (Session): The SQLAlchemy session used for database transactions.
+            user_loader (UserLoader): Optional batcher that coalesces concurrent
+                lookups by ID and CPF into single queries.
+            user_cache (UserCache): Optional read-through cache for lookups by ID and
+                CPF, invalidated by every write made through this gateway.
+            count_cache (MemoryCache): Optional TTL cache of the exact and
+                estimated user counts.
         """
         self.repository = SQLAlchemyUserRepository(session)
+        self.user_loader = user_loader
+        self.user_cache = user_cache
+        self.count_cache = count_cache
 
     def add(self, user: User) -> User:
         """
@@ -27,7 +41,27 @@ class UserGateway(UserRepository):
         Returns:
             User: The added user with an assigned ID.
         """
-        return self.repository.add(user)
+        added = self.repository.add(user)
+        self._invalidate(added.id, added.cpf)
+        return added
+
+    def add_many(self, users: List[User]) -> List[Optional[str]]:
+        """
+        Adds many users at once, skipping the ones that already exist.
+
+        Args:
+            users (List[User]): The user entities to add.
+
+        Returns:
+            List[Optional[str]]: For each user, None when it was added, otherwise
+            the conflicting field.
+        """
+        conflicts = self.repository.add_many(users)
+        if self.user_cache:
+            self.user_cache.invalidate_many(
+                [(user.id, user.cpf) for user in users if user.id is not None]
+            )
+        return conflicts
 
     def get_by_id(self, user_id: int) -> User:
         """
@@ -39,7 +73,22 @@ class UserGateway(UserRepository):
         Returns:
             User: The user entity if found.
         """
-        return self.repository.get_by_id(user_id)
+        if self.user_cache:
+            return self.user_cache.get_by_id(user_id, lambda: self._load_by_id(user_id))
+        return self._load_by_id(user_id)
+
+    def get_by_id_for_update(self, user_id: int) -> Optional[User]:
+        """
+        Retrieves a user from the primary database, bypassing the cache and
+        the batch loader, and locks its row.
+
+        Args:
+            user_id (int): The ID of the user.
+
+        Returns:
+            Optional[User]: The user entity if found.
+        """
+        return self.repository.get_by_id_for_update(user_id)
 
     def get_by_cpf(self, cpf: str) -> User:
         """
@@ -51,8 +100,24 @@ class UserGateway(UserRepository):
         Returns:
             User: The user entity if found.
         """
+        if self.user_cache:
+            return self.user_cache.get_by_cpf(cpf, lambda: self._load_by_cpf(cpf))
+        return self._load_by_cpf(cpf)
+
+    def _load_by_id(self, user_id: int) -> Optional[User]:
+        if self.user_loader:
+            return self.user_loader.get_by_id(user_id)
+        return self.repository.get_by_id(user_id)
+
+    def _load_by_cpf(self, cpf: str) -> Optional[User]:
+        if self.user_loader:
+            return self.user_loader.get_by_cpf(cpf)
         return self.repository.get_by_cpf(cpf)
 
+    def _invalidate(self, user_id: Optional[int], cpf: Optional[str] = None) -> None:
+        if self.user_cache:
+            self.user_cache.invalidate(user_id, cpf)
+
     def get_by_username_or_email_or_cpf(self, username: str, email: str, cpf: str) -> User:
         """
         Retrieves a user by username, email, or CPF.
@@ -80,7 +145,71 @@ class UserGateway(UserRepository):
         """
         return self.repository.list_users(limit, skip)
 
-    def update(self, user: User) -> User:
+    def list_users_after(self, after_id: Optional[int], limit: int):
+        """
+        Retrieves the users whose ID follows `after_id`, ordered by ID.
+
+        Args:
+            after_id (Optional[int]): The last ID of the previous page, or None for the first page.
+            limit (int): The number of users to retrieve.
+
+        Returns:
+            list: A list of user entities.
+        """
+        return self.repository.list_users_after(after_id, limit)
+
+    def get_by_ids(self, user_ids: List[int]) -> List[User]:
+        """
+        Retrieves the users with the given IDs.
+
+        Args:
+            user_ids (List[int]): The IDs to look up.
+
+        Returns:
+            List[User]: The users found.
+        """
+        return self.repository.get_by_ids(user_ids)
+
+    def get_by_cpfs(self, cpfs: List[str]) -> List[User]:
+        """
+        Retrieves the users with the given CPFs.
+
+        Args:
+            cpfs (List[str]): The CPFs to look up.
+
+        Returns:
+            List[User]: The users found.
+        """
+        return self.repository.get_by_cpfs(cpfs)
+
+    def count_users(self) -> int:
+        """
+        Counts every user exactly.
+
+        Returns:
+            int: The number of users.
+        """
+        return self._counted('exact', self.repository.count_users)
+
+    def estimate_user_count(self) -> Optional[int]:
+        """
+        Estimates the number of users from database statistics.
+
+        Returns:
+            Optional[int]: The estimate, or None when unavailable.
+        """
+        return self._counted('estimate', self.repository.estimate_user_count)
+
+    def _counted(self, key: str, count: Callable):
+        if self.count_cache is None:
+            return count()
+        value = self.count_cache.get(key)
+        if value is MISSING:
+            value = count()
+            self.count_cache.set(key, value)
+        return value
+
+    def update(self, user: User) -> Optional[User]:
         """
         Updates an existing user's information.
 
@@ -88,15 +217,74 @@ class UserGateway(UserRepository):
             user (User): The user entity with updated information.
 
         Returns:
-            User: The updated user entity.
+            Optional[User]: The updated user entity, or None if the user does not exist.
+        """
+        updated = self.repository.update(user)
+        self._invalidate(user.id, user.cpf)
+        return updated
+
+    def update_fields(self, user_id: int, changes: dict) -> None:
+        """
+        Writes only the given columns of an existing user.
+
+        Args:
+            user_id (int): The ID of the user.
+            changes (dict): The new values, keyed by field name.
+        """
+        self.repository.update_fields(user_id, changes)
+        self._invalidate(user_id, changes.get('cpf'))
+
+    def get_password_hash(self, user_id: int) -> Optional[str]:
+        """
+        Retrieves the stored password hash of a user, which the cache does not keep.
+
+        Args:
+            user_id (int): The ID of the user.
+
+        Returns:
+            Optional[str]: The hash, or None if the user does not exist.
         """
-        return self.repository.update(user)
+        return self.repository.get_password_hash(user_id)
 
-    def delete(self, user: User):
+    def update_password(self, user_id: int, stale_hash: str, hashed_password: str) -> bool:
+        """
+        Replaces a stale password hash, unless it changed since it was read.
+
+        Args:
+            user_id (int): The ID of the user.
+            stale_hash (str): The hash the new one was computed from.
+            hashed_password (str): The new password hash.
+
+        Returns:
+            bool: True if the stale hash was still stored and was replaced.
+        """
+        updated = self.repository.update_password(user_id, stale_hash, hashed_password)
+        if updated:
+            self._invalidate(user_id)
+        return updated
+
+    def count_legacy_password_hashes(self, current_prefix: str) -> int:
+        """
+        Counts users whose password hash still uses legacy parameters.
+
+        Args:
+            current_prefix (str): The prefix of hashes made with the current parameters.
+
+        Returns:
+            int: The number of stale hashes.
+        """
+        return self.repository.count_legacy_password_hashes(current_prefix)
+
+    def delete(self, user_id: int) -> bool:
         """
         Deletes a user from the repository.
 
         Args:
-            user (User): The user entity to be deleted.
+            user_id (int): The ID of the user to be deleted.
+
+        Returns:
+            bool: True if the user existed and was deleted.
         """
-        self.repository.delete(user)
+        deleted = self.repository.delete(user_id)
+        self._invalidate(user_id)
+        return deleted
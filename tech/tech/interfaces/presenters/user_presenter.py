@@ -1,3 +1,6 @@
+from typing import Dict, Optional
+
+
 class UserPresenter:
     """
     Handles the formatting of user-related responses.
@@ -36,3 +39,38 @@ class UserPresenter:
             list: A list of dictionaries containing formatted user details.
         """
         return [UserPresenter.present_user(user) for user in users]
+
+    @staticmethod
+    def present_user_page(users: list, next_cursor: Optional[str]) -> dict:
+        """
+        Formats one page of a cursor-paginated user list.
+
+        Args:
+            users (list): The user entities on the page.
+            next_cursor (Optional[str]): The cursor of the next page, None on the last page.
+
+        Returns:
+            dict: The formatted users under `items` and the `next_cursor`.
+        """
+        return {
+            "items": UserPresenter.present_user_list(users),
+            "next_cursor": next_cursor,
+        }
+
+    @staticmethod
+    def present_user_batch(by_id: Dict[int, Optional[object]], by_cpf: Dict[str, Optional[object]]) -> dict:
+        """
+        Formats the result of a batch lookup.
+
+        Args:
+            by_id (Dict[int, Optional[object]]): The requested IDs mapped to their user entity or None.
+            by_cpf (Dict[str, Optional[object]]): The requested CPFs mapped to their user entity or None.
+
+        Returns:
+            dict: `ids` and `cpfs`, each mapping every requested key to the
+            formatted user, or to null when it was not found.
+        """
+        return {
+            "ids": {str(user_id): UserPresenter.present_user(user) if user else None for user_id, user in by_id.items()},
+            "cpfs": {cpf: UserPresenter.present_user(user) if user else None for cpf, user in by_cpf.items()},
+        }
@@ -0,0 +1,221 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from tech.domain.entities.users import User
+
+
+class AsyncUserRepository(ABC):
+    """Asyncio twin of UserRepository, defining the awaitable operations
+    that the infrastructure should implement."""
+
+    @abstractmethod
+    async def add(self, user: User) -> User:
+        """Adds a new user to the repository.
+
+        Args:
+            user (User): The user entity to be added.
+
+        Returns:
+            User: The added user with an assigned ID.
+        """
+        pass
+
+    @abstractmethod
+    async def add_many(self, users: List[User]) -> List[Optional[str]]:
+        """Adds many users at once, skipping the ones that already exist.
+
+        Args:
+            users (List[User]): The user entities to be added. Each one that is
+                inserted gets its ID assigned.
+
+        Returns:
+            List[Optional[str]]: For each user, None when it was added, otherwise
+            the field ('username', 'email' or 'cpf') that is already in use.
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """Retrieves a user by its ID.
+
+        Args:
+            user_id (int): The ID of the user.
+
+        Returns:
+            Optional[User]: The user entity if found, otherwise None.
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_id_for_update(self, user_id: int) -> Optional[User]:
+        """Retrieves a user from the primary database and locks its row.
+
+        Never served by a cache or a replica, so the result can be compared
+        with a requested change; the lock is held until the next commit.
+
+        Args:
+            user_id (int): The ID of the user.
+
+        Returns:
+            Optional[User]: The user entity if found, otherwise None.
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_username_or_email_or_cpf(self, username: str, email: str, cpf: str) -> Optional[User]:
+        """Fetches a user by username, email, or CPF.
+
+        Args:
+            username (str): The user's username.
+            email (str): The user's email.
+            cpf (str): The user's CPF (Brazilian ID).
+
+        Returns:
+            Optional[User]: The matching user entity if found, otherwise None.
+        """
+        pass
+
+    @abstractmethod
+    async def list_users(self, limit: int, skip: int) -> List[User]:
+        """Retrieves a list of users with pagination.
+
+        Args:
+            limit (int): The number of users to retrieve.
+            skip (int): The number of users to skip before retrieving.
+
+        Returns:
+            List[User]: A list of user entities.
+        """
+        pass
+
+    @abstractmethod
+    async def list_users_after(self, after_id: Optional[int], limit: int) -> List[User]:
+        """Retrieves the users whose ID follows `after_id`, ordered by ID.
+
+        Args:
+            after_id (Optional[int]): The last ID of the previous page, or None for the first page.
+            limit (int): The number of users to retrieve.
+
+        Returns:
+            List[User]: A list of user entities.
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_cpf(self, cpf: str) -> Optional[User]:
+        """Retrieves a user by CPF.
+
+        Args:
+            cpf (str): The CPF of the user.
+
+        Returns:
+            Optional[User]: The user entity if found, otherwise None.
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_ids(self, user_ids: List[int]) -> List[User]:
+        """Retrieves every user whose ID is in the given list, in one query.
+
+        Args:
+            user_ids (List[int]): The IDs to look up.
+
+        Returns:
+            List[User]: The users found, in no particular order.
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_cpfs(self, cpfs: List[str]) -> List[User]:
+        """Retrieves every user whose CPF is in the given list, in one query.
+
+        Args:
+            cpfs (List[str]): The CPFs to look up.
+
+        Returns:
+            List[User]: The users found, in no particular order.
+        """
+        pass
+
+    @abstractmethod
+    async def count_users(self) -> int:
+        """Counts every user exactly.
+
+        Returns:
+            int: The number of users.
+        """
+        pass
+
+    @abstractmethod
+    async def estimate_user_count(self) -> Optional[int]:
+        """Estimates the number of users without scanning the table.
+
+        Returns:
+            Optional[int]: The estimate, or None when no statistics are available.
+        """
+        pass
+
+    @abstractmethod
+    async def update(self, user: User) -> Optional[User]:
+        """Updates an existing user's information.
+
+        Args:
+            user (User): The user entity with updated information.
+
+        Returns:
+            Optional[User]: The updated user entity, or None if the user does not exist.
+
+        Raises:
+            UserAlreadyExistsError: If the username, email or CPF is already in use.
+        """
+        pass
+
+    @abstractmethod
+    async def update_fields(self, user_id: int, changes: dict) -> None:
+        """Writes only the given columns of an existing user.
+
+        Args:
+            user_id (int): The ID of the user.
+            changes (dict): The new values, keyed by field name.
+
+        Raises:
+            UserAlreadyExistsError: If a new username, email or CPF is already in use.
+        """
+        pass
+
+    @abstractmethod
+    async def get_password_hash(self, user_id: int) -> Optional[str]:
+        """Retrieves the stored password hash of a user.
+
+        Args:
+            user_id (int): The ID of the user.
+
+        Returns:
+            Optional[str]: The hash, or None if the user does not exist.
+        """
+        pass
+
+    @abstractmethod
+    async def update_password(self, user_id: int, stale_hash: str, hashed_password: str) -> bool:
+        """Replaces a stale password hash, unless it changed since it was read.
+
+        Args:
+            user_id (int): The ID of the user.
+            stale_hash (str): The hash the new one was computed from.
+            hashed_password (str): The new password hash.
+
+        Returns:
+            bool: True if the stale hash was still stored and was replaced.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, user_id: int) -> bool:
+        """Deletes a user from the repository.
+
+        Args:
+            user_id (int): The ID of the user to be deleted.
+
+        Returns:
+            bool: True if the user existed and was deleted, otherwise False.
+        """
+        pass
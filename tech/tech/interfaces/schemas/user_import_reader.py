@@ -0,0 +1,121 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional, Union
+
+IMPORT_FORMATS = ('ndjson', 'csv')
+
+Row = Union[dict, str]
+
+
+class UserRowReader:
+    """
+    Incremental parser turning a request body, chunk by chunk, into user rows.
+
+    Only the current partial line is buffered, so the body never has to fit in
+    memory. Every record must be on a single line: one JSON object per line for
+    NDJSON, or a header line followed by one record per line for CSV. A line
+    that is not valid JSON is returned as the raw string, so the caller can
+    report it as an invalid row instead of rejecting the whole import.
+    """
+
+    def __init__(self, import_format: str):
+        """
+        Initializes the reader.
+
+        Args:
+            import_format (str): 'ndjson' or 'csv'.
+
+        Raises:
+            ValueError: If the format is not supported.
+        """
+        if import_format not in IMPORT_FORMATS:
+            raise ValueError(f'Unsupported import format: {import_format}')
+        self.import_format = import_format
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._pending = ''
+        self._header: Optional[List[str]] = None
+
+    def feed(self, chunk: bytes) -> List[Row]:
+        """
+        Parses the complete lines available after adding a chunk.
+
+        Args:
+            chunk (bytes): The next piece of the body.
+
+        Returns:
+            List[Row]: The rows completed by this chunk.
+        """
+        lines = (self._pending + self._decoder.decode(chunk)).split('\n')
+        self._pending = lines.pop()
+        return self._parse(lines)
+
+    def close(self) -> List[Row]:
+        """
+        Parses whatever is left once the body has ended.
+
+        Returns:
+            List[Row]: The last row, if the body did not end with a newline.
+        """
+        rest = self._pending + self._decoder.decode(b'', final=True)
+        self._pending = ''
+        return self._parse([rest])
+
+    def _parse(self, lines: List[str]) -> List[Row]:
+        rows = []
+        for line in lines:
+            line = line.rstrip('\r')
+            if not line.strip():
+                continue
+            row = self._parse_line(line)
+            if row is not None:
+                rows.append(row)
+        return rows
+
+    def _parse_line(self, line: str) -> Optional[Row]:
+        if self.import_format == 'ndjson':
+            try:
+                return json.loads(line)
+            except ValueError:
+                return line
+        values = next(csv.reader([line]))
+        if self._header is None:
+            self._header = [name.strip() for name in values]
+            return None
+        return dict(zip(self._header, values))
+
+
+def read_user_rows(chunks: Iterable[bytes], import_format: str) -> Iterator[Row]:
+    """
+    Iterates the user rows of a body given as an iterable of chunks.
+
+    Args:
+        chunks (Iterable[bytes]): The body, chunk by chunk.
+        import_format (str): 'ndjson' or 'csv'.
+
+    Returns:
+        Iterator[Row]: The parsed rows.
+    """
+    reader = UserRowReader(import_format)
+    for chunk in chunks:
+        yield from reader.feed(chunk)
+    yield from reader.close()
+
+
+async def aread_user_rows(chunks: AsyncIterable[bytes], import_format: str) -> AsyncIterator[Row]:
+    """
+    Asyncio twin of `read_user_rows`.
+
+    Args:
+        chunks (AsyncIterable[bytes]): The body, chunk by chunk.
+        import_format (str): 'ndjson' or 'csv'.
+
+    Returns:
+        AsyncIterator[Row]: The parsed rows.
+    """
+    reader = UserRowReader(import_format)
+    async for chunk in chunks:
+        for row in reader.feed(chunk):
+            yield row
+    for row in reader.close():
+        yield row
@@ -1,5 +1,6 @@
+from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
 
 
 class UserSchema(BaseModel):
@@ -9,6 +10,25 @@ class UserSchema(BaseModel):
     cpf: str
 
 
+class UserPatchSchema(BaseModel):
+    username: Optional[str] = None
+    email: Optional[EmailStr] = None
+    password: Optional[str] = None
+    cpf: Optional[str] = None
+
+    @field_validator('cpf')
+    @classmethod
+    def validate_cpf(cls, cpf: Optional[str]) -> Optional[str]:
+        if cpf is not None and (len(cpf) != 11 or not cpf.isdigit()):
+            raise ValueError('CPF must contain exactly 11 digits and be numeric.')
+        return cpf
+
+
+class UserBatchSchema(BaseModel):
+    ids: list[int] = []
+    cpfs: list[str] = []
+
+
 class UserDB(UserSchema):
     id: int
 
@@ -0,0 +1,175 @@
+from typing import AsyncIterable, Iterable, List, Optional, Tuple
+from pydantic import ValidationError
+from tech.domain.entities.users import User
+from tech.interfaces.schemas.user_schema import UserSchema
+from tech.domain.security import HashingService, get_hashing_service
+from tech.interfaces.repositories.user_repository import UserRepository
+from tech.interfaces.repositories.async_user_repository import AsyncUserRepository
+
+BULK_BATCH_SIZE = 1000
+
+
+def validate_row(row) -> Tuple[Optional[UserSchema], Optional[str]]:
+    """
+    Validates one imported row.
+
+    Args:
+        row: The parsed row; anything other than a mapping is invalid.
+
+    Returns:
+        Tuple[Optional[UserSchema], Optional[str]]: The validated data, or the
+        reason the row was rejected.
+    """
+    try:
+        user_data = UserSchema.model_validate(row)
+    except ValidationError as error:
+        return None, '; '.join(
+            f"{'.'.join(str(part) for part in detail['loc']) or 'row'}: {detail['msg']}"
+            for detail in error.errors()
+        )
+    if len(user_data.cpf) != 11 or not user_data.cpf.isdigit():
+        return None, 'CPF must contain exactly 11 digits and be numeric.'
+    return user_data, None
+
+
+class _ImportReport(object):
+    """Accumulates the per-row outcome of an import."""
+
+    def __init__(self):
+        self.results = []
+        self.counts = {'created': 0, 'conflict': 0, 'invalid': 0}
+
+    def invalid(self, row_number: int, error: str) -> None:
+        self.counts['invalid'] += 1
+        self.results.append({'row': row_number, 'status': 'invalid', 'error': error})
+
+    def merged(self, batch: List[Tuple[int, UserSchema]], users: List[User],
+               conflicts: List[Optional[str]]) -> None:
+        for (row_number, _), user, field in zip(batch, users, conflicts):
+            if field is None:
+                self.counts['created'] += 1
+                self.results.append({'row': row_number, 'status': 'created', 'id': user.id})
+            else:
+                self.counts['conflict'] += 1
+                self.results.append({'row': row_number, 'status': 'conflict', 'field': field})
+
+    def as_dict(self) -> dict:
+        self.results.sort(key=lambda result: result['row'])
+        return {**self.counts, 'results': self.results}
+
+
+class BulkImportUsersUseCase(object):
+    """
+    Handles the import of many users in one request.
+
+    Rows are validated as they are read and grouped into batches; each batch is
+    hashed across the hashing service's workers at once and merged by the
+    repository in a single transaction, with rows that collide with an
+    existing user reported instead of failing the import.
+    """
+
+    def __init__(self, user_repository: UserRepository, hashing_service: Optional[HashingService] = None,
+                 batch_size: int = BULK_BATCH_SIZE):
+        """
+        Initializes the BulkImportUsersUseCase with the provided repository.
+
+        Args:
+            user_repository (UserRepository): The repository responsible for user-related data operations.
+            hashing_service (HashingService): The service that hashes passwords off the request thread.
+                                              Defaults to the application-wide service.
+            batch_size (int): The number of valid rows hashed and merged together.
+        """
+        self.user_repository = user_repository
+        self.hashing_service = hashing_service or get_hashing_service()
+        self.batch_size = batch_size
+
+    def execute(self, rows: Iterable) -> dict:
+        """
+        Executes the import.
+
+        Args:
+            rows (Iterable): The parsed rows, read lazily.
+
+        Returns:
+            dict: The number of rows `created`, in `conflict` and `invalid`, and
+            the outcome of every row in `results`, numbered from 1.
+        """
+        report = _ImportReport()
+        batch = []
+        for row_number, row in enumerate(rows, start=1):
+            user_data, error = validate_row(row)
+            if error:
+                report.invalid(row_number, error)
+                continue
+            batch.append((row_number, user_data))
+            if len(batch) >= self.batch_size:
+                self._import(batch, report)
+                batch = []
+        if batch:
+            self._import(batch, report)
+        return report.as_dict()
+
+    def _import(self, batch: List[Tuple[int, UserSchema]], report: _ImportReport) -> None:
+        hashes = self.hashing_service.hash_many([user_data.password for _, user_data in batch])
+        users = [
+            User(username=user_data.username, password=hashed, cpf=user_data.cpf, email=user_data.email)
+            for (_, user_data), hashed in zip(batch, hashes)
+        ]
+        report.merged(batch, users, self.user_repository.add_many(users))
+
+
+class AsyncBulkImportUsersUseCase(object):
+    """
+    Asyncio twin of BulkImportUsersUseCase.
+    """
+
+    def __init__(self, user_repository: AsyncUserRepository, hashing_service: Optional[HashingService] = None,
+                 batch_size: int = BULK_BATCH_SIZE):
+        """
+        Initializes the AsyncBulkImportUsersUseCase with the provided repository.
+
+        Args:
+            user_repository (AsyncUserRepository): The async repository for user-related data operations.
+            hashing_service (HashingService): The service that hashes passwords off the event loop.
+                                              Defaults to the application-wide service.
+            batch_size (int): The number of valid rows hashed and merged together.
+        """
+        self.user_repository = user_repository
+        self.hashing_service = hashing_service or get_hashing_service()
+        self.batch_size = batch_size
+
+    async def execute(self, rows: AsyncIterable) -> dict:
+        """
+        Executes the import.
+
+        Args:
+            rows (AsyncIterable): The parsed rows, read lazily.
+
+        Returns:
+            dict: The number of rows `created`, in `conflict` and `invalid`, and
+            the outcome of every row in `results`, numbered from 1.
+        """
+        report = _ImportReport()
+        batch = []
+        row_number = 0
+        async for row in rows:
+            row_number += 1
+            user_data, error = validate_row(row)
+            if error:
+                report.invalid(row_number, error)
+                continue
+            batch.append((row_number, user_data))
+            if len(batch) >= self.batch_size:
+                await self._import(batch, report)
+                batch = []
+        if batch:
+            await self._import(batch, report)
+        return report.as_dict()
+
+    async def _import(self, batch: List[Tuple[int, UserSchema]], report: _ImportReport) -> None:
+        hashes = await self.hashing_service.ahash_many([user_data.password for _, user_data in batch])
+        users = [
+            User(username=user_data.username, password=hashed, cpf=user_data.cpf, email=user_data.email)
+            for (_, user_data), hashed in zip(batch, hashes)
+        ]
+        report.merged(batch, users, await self.user_repository.add_many(users))
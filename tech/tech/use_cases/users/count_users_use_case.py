@@ -0,0 +1,102 @@
+from tech.interfaces.repositories.user_repository import UserRepository
+from tech.interfaces.repositories.async_user_repository import AsyncUserRepository
+
+COUNT_MODES = ('auto', 'exact', 'approximate')
+EXACT_THRESHOLD = 10000
+
+
+def _choose(mode: str, estimate, exact_threshold: int) -> bool:
+    """
+    Tells whether an estimate can be returned instead of an exact count.
+
+    Args:
+        mode (str): 'auto', 'exact' or 'approximate'.
+        estimate (Optional[int]): The planner estimate, if any.
+        exact_threshold (int): Below this estimate 'auto' counts exactly.
+
+    Returns:
+        bool: True if the estimate should be used.
+    """
+    if estimate is None or mode == 'exact':
+        return False
+    return mode == 'approximate' or estimate >= exact_threshold
+
+
+class CountUsersUseCase(object):
+    """
+    Handles counting users cheaply.
+
+    'approximate' reads the planner statistics and 'exact' runs `count(*)`.
+    'auto' uses the estimate for large tables and an exact count for small
+    ones, where the scan is cheap. The gateway can keep both numbers in a
+    shared TTL cache, so repeated calls (for example on every page of an admin
+    UI) do not hit the database at all.
+    """
+
+    def __init__(self, user_repository: UserRepository, exact_threshold: int = EXACT_THRESHOLD):
+        """
+        Initializes the CountUsersUseCase with the provided repository.
+
+        Args:
+            user_repository (UserRepository): The repository responsible for user-related data operations.
+            exact_threshold (int): Estimated size below which 'auto' counts exactly.
+        """
+        self.user_repository = user_repository
+        self.exact_threshold = exact_threshold
+
+    def execute(self, mode: str = 'auto') -> dict:
+        """
+        Executes the count.
+
+        Args:
+            mode (str): 'auto', 'exact' or 'approximate'.
+
+        Returns:
+            dict: The `count` and whether it is `exact`.
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+        if mode not in COUNT_MODES:
+            raise ValueError(f'Invalid count mode: {mode}')
+        estimate = None if mode == 'exact' else self.user_repository.estimate_user_count()
+        if _choose(mode, estimate, self.exact_threshold):
+            return {'count': estimate, 'exact': False}
+        return {'count': self.user_repository.count_users(), 'exact': True}
+
+
+class AsyncCountUsersUseCase(object):
+    """
+    Asyncio twin of CountUsersUseCase.
+    """
+
+    def __init__(self, user_repository: AsyncUserRepository, exact_threshold: int = EXACT_THRESHOLD):
+        """
+        Initializes the AsyncCountUsersUseCase with the provided repository.
+
+        Args:
+            user_repository (AsyncUserRepository): The async repository for user-related data operations.
+            exact_threshold (int): Estimated size below which 'auto' counts exactly.
+        """
+        self.user_repository = user_repository
+        self.exact_threshold = exact_threshold
+
+    async def execute(self, mode: str = 'auto') -> dict:
+        """
+        Executes the count.
+
+        Args:
+            mode (str): 'auto', 'exact' or 'approximate'.
+
+        Returns:
+            dict: The `count` and whether it is `exact`.
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+        if mode not in COUNT_MODES:
+            raise ValueError(f'Invalid count mode: {mode}')
+        estimate = None if mode == 'exact' else await self.user_repository.estimate_user_count()
+        if _choose(mode, estimate, self.exact_threshold):
+            return {'count': estimate, 'exact': False}
+        return {'count': await self.user_repository.count_users(), 'exact': True}
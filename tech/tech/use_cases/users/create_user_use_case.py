@@ -1,25 +1,31 @@
+from typing import Optional
 from tech.domain.entities.users import User
 from tech.interfaces.schemas.user_schema import UserSchema
-from tech.domain.security import get_password_hash
+from tech.domain.security import HashingService, get_hashing_service
 from tech.interfaces.repositories.user_repository import UserRepository
+from tech.interfaces.repositories.async_user_repository import AsyncUserRepository
 
 class CreateUserUseCase(object):
     """
     Handles the creation of a new user.
 
-    This use case validates the provided user data, checks for existing users
-    with the same username, email, or CPF, and hashes the user's password
-    before persisting the user in the repository.
+    This use case validates the provided user data and hashes the user's
+    password before persisting the user in the repository. Duplicates are
+    detected by the repository's single INSERT against the unique constraints,
+    which also closes the race between two concurrent signups.
     """
 
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: UserRepository, hashing_service: Optional[HashingService] = None):
         """
         Initializes the CreateUserUseCase with the provided repository.
 
         Args:
             user_repository (UserRepository): The repository responsible for user-related data operations.
+            hashing_service (HashingService): The service that hashes passwords off the request thread.
+                                              Defaults to the application-wide service.
         """
         self.user_repository = user_repository
+        self.hashing_service = hashing_service or get_hashing_service()
 
     def execute(self, user_data: UserSchema) -> User:
         """
@@ -32,23 +38,64 @@ class CreateUserUseCase(object):
             User: The created User entity.
 
         Raises:
-            ValueError: If the CPF is invalid or if a user with the same username, email, or CPF already exists.
+            ValueError: If the CPF is invalid.
+            UserAlreadyExistsError: If the username, email, or CPF is already in use.
         """
         if len(user_data.cpf) != 11 or not user_data.cpf.isdigit():
             raise ValueError('CPF must contain exactly 11 digits and be numeric.')
 
-        existing_user = self.user_repository.get_by_username_or_email_or_cpf(
-            user_data.username, user_data.email, user_data.cpf
+        new_user = User(
+            username=user_data.username,
+            password=self.hashing_service.hash(user_data.password),
+            cpf=user_data.cpf,
+            email=user_data.email,
         )
 
-        if existing_user:
-            raise ValueError('User already exists')
+        return self.user_repository.add(new_user)
+
+
+class AsyncCreateUserUseCase(object):
+    """
+    Asyncio twin of CreateUserUseCase.
+
+    The password is hashed on the hashing service's pool and the repository is
+    awaited, so the event loop is never blocked.
+    """
+
+    def __init__(self, user_repository: AsyncUserRepository, hashing_service: Optional[HashingService] = None):
+        """
+        Initializes the AsyncCreateUserUseCase with the provided repository.
+
+        Args:
+            user_repository (AsyncUserRepository): The async repository for user-related data operations.
+            hashing_service (HashingService): The service that hashes passwords off the event loop.
+                                              Defaults to the application-wide service.
+        """
+        self.user_repository = user_repository
+        self.hashing_service = hashing_service or get_hashing_service()
+
+    async def execute(self, user_data: UserSchema) -> User:
+        """
+        Executes the creation of a new user.
+
+        Args:
+            user_data (UserSchema): The data required to create a new user.
+
+        Returns:
+            User: The created User entity.
+
+        Raises:
+            ValueError: If the CPF is invalid.
+            UserAlreadyExistsError: If the username, email, or CPF is already in use.
+        """
+        if len(user_data.cpf) != 11 or not user_data.cpf.isdigit():
+            raise ValueError('CPF must contain exactly 11 digits and be numeric.')
 
         new_user = User(
             username=user_data.username,
-            password=get_password_hash(user_data.password),
+            password=await self.hashing_service.ahash(user_data.password),
             cpf=user_data.cpf,
             email=user_data.email,
         )
 
-        return self.user_repository.add(new_user)
+        return await self.user_repository.add(new_user)
@@ -1,11 +1,12 @@
 from tech.interfaces.repositories.user_repository import UserRepository
+from tech.interfaces.repositories.async_user_repository import AsyncUserRepository
 
 class DeleteUserUseCase(object):
     """
     Handles the deletion of a user by their unique ID.
 
-    This use case ensures that the user exists before deleting them
-    from the repository.
+    The user is deleted with a single `DELETE ... RETURNING id`; a missing
+    user is detected from the delete affecting no row, without fetching it first.
     """
 
     def __init__(self, user_repository: UserRepository):
@@ -30,8 +31,38 @@ class DeleteUserUseCase(object):
         Raises:
             ValueError: If no user is found with the given ID.
         """
-        user = self.user_repository.get_by_id(user_id)
-        if not user:
+        if not self.user_repository.delete(user_id):
+            raise ValueError('User not found')
+        return {"message": "User deleted"}
+
+
+class AsyncDeleteUserUseCase(object):
+    """
+    Asyncio twin of DeleteUserUseCase.
+    """
+
+    def __init__(self, user_repository: AsyncUserRepository):
+        """
+        Initializes the AsyncDeleteUserUseCase with the provided repository.
+
+        Args:
+            user_repository (AsyncUserRepository): The async repository for user-related data operations.
+        """
+        self.user_repository = user_repository
+
+    async def execute(self, user_id: int) -> dict:
+        """
+        Executes the deletion of a user.
+
+        Args:
+            user_id (int): The unique identifier of the user to delete.
+
+        Returns:
+            dict: A success message confirming the deletion.
+
+        Raises:
+            ValueError: If no user is found with the given ID.
+        """
+        if not await self.user_repository.delete(user_id):
             raise ValueError('User not found')
-        self.user_repository.delete(user)
         return {"message": "User deleted"}
@@ -0,0 +1,35 @@
+from typing import Iterator
+from tech.infra.databases.user_export import UserExporter
+
+class ExportUsersUseCase(object):
+    """
+    Handles the bulk export of the user directory.
+
+    The export is streamed from the database as it is produced, so nightly
+    syncs no longer page through `GET /users/` building entities and
+    presenter dictionaries for every row.
+    """
+
+    def __init__(self, user_exporter: UserExporter):
+        """
+        Initializes the ExportUsersUseCase with the provided exporter.
+
+        Args:
+            user_exporter (UserExporter): The exporter streaming rows from the database.
+        """
+        self.user_exporter = user_exporter
+
+    def execute(self, export_format: str) -> Iterator[bytes]:
+        """
+        Executes the export.
+
+        Args:
+            export_format (str): 'csv' or 'ndjson'.
+
+        Returns:
+            Iterator[bytes]: The encoded export, chunk by chunk.
+
+        Raises:
+            ValueError: If the format is not supported.
+        """
+        return self.user_exporter.stream(export_format)
@@ -1,4 +1,5 @@
 from tech.interfaces.repositories.user_repository import UserRepository
+from tech.interfaces.repositories.async_user_repository import AsyncUserRepository
 
 class GetUserByCpfUseCase(object):
     """
@@ -34,3 +35,36 @@ class GetUserByCpfUseCase(object):
         if not user:
             raise ValueError('User not found')
         return user
+
+
+class AsyncGetUserByCpfUseCase(object):
+    """
+    Asyncio twin of GetUserByCpfUseCase.
+    """
+
+    def __init__(self, user_repository: AsyncUserRepository):
+        """
+        Initializes the AsyncGetUserByCpfUseCase with the provided repository.
+
+        Args:
+            user_repository (AsyncUserRepository): The async repository for user-related data operations.
+        """
+        self.user_repository = user_repository
+
+    async def execute(self, cpf: str):
+        """
+        Executes the retrieval of a user by CPF.
+
+        Args:
+            cpf (str): The CPF of the user.
+
+        Returns:
+            User: The retrieved User entity.
+
+        Raises:
+            ValueError: If no user is found with the given CPF.
+        """
+        user = await self.user_repository.get_by_cpf(cpf)
+        if not user:
+            raise ValueError('User not found')
+        return user
@@ -1,4 +1,5 @@
 from tech.interfaces.repositories.user_repository import UserRepository
+from tech.interfaces.repositories.async_user_repository import AsyncUserRepository
 
 class GetUserUseCase(object):
     """
@@ -34,3 +35,36 @@ class GetUserUseCase(object):
         if not user:
             raise ValueError('User not found')
         return user
+
+
+class AsyncGetUserUseCase(object):
+    """
+    Asyncio twin of GetUserUseCase.
+    """
+
+    def __init__(self, user_repository: AsyncUserRepository):
+        """
+        Initializes the AsyncGetUserUseCase with the provided repository.
+
+        Args:
+            user_repository (AsyncUserRepository): The async repository for user-related data operations.
+        """
+        self.user_repository = user_repository
+
+    async def execute(self, user_id: int):
+        """
+        Executes the retrieval of a user by ID.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+
+        Returns:
+            User: The retrieved User entity.
+
+        Raises:
+            ValueError: If no user is found with the given ID.
+        """
+        user = await self.user_repository.get_by_id(user_id)
+        if not user:
+            raise ValueError('User not found')
+        return user
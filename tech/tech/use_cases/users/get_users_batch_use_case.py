@@ -0,0 +1,106 @@
+import re
+from typing import Dict, List, Optional, Tuple
+from tech.domain.entities.users import User
+from tech.interfaces.repositories.user_repository import UserRepository
+from tech.interfaces.repositories.async_user_repository import AsyncUserRepository
+
+MAX_BATCH_SIZE = 100
+
+
+def _check_batch(user_ids: List[int], cpfs: List[str], max_batch_size: int) -> None:
+    if len(user_ids) + len(cpfs) > max_batch_size:
+        raise ValueError(f'A batch may contain at most {max_batch_size} ids and CPFs')
+
+
+def _cpf_digits(cpf: str) -> str:
+    # The repository matches CPFs by blind index, which ignores punctuation.
+    return re.sub(r'\D', '', cpf)
+
+
+def _map_batch(user_ids: List[int], cpfs: List[str], by_id: List[User],
+               by_cpf: List[User]) -> Tuple[Dict[int, Optional[User]], Dict[str, Optional[User]]]:
+    found_ids = {user.id: user for user in by_id}
+    found_cpfs = {_cpf_digits(user.cpf): user for user in by_cpf}
+    return (
+        {user_id: found_ids.get(user_id) for user_id in user_ids},
+        {cpf: found_cpfs.get(_cpf_digits(cpf)) for cpf in cpfs},
+    )
+
+
+class GetUsersBatchUseCase(object):
+    """
+    Handles the retrieval of many users by ID and/or CPF at once.
+
+    Each kind of key is resolved with a single query, so rendering a list of N
+    users costs one request and at most two queries instead of N of each.
+    """
+
+    def __init__(self, user_repository: UserRepository, max_batch_size: int = MAX_BATCH_SIZE):
+        """
+        Initializes the GetUsersBatchUseCase with the provided repository.
+
+        Args:
+            user_repository (UserRepository): The repository responsible for user-related data operations.
+            max_batch_size (int): The most ids and CPFs accepted in one batch, combined.
+        """
+        self.user_repository = user_repository
+        self.max_batch_size = max_batch_size
+
+    def execute(self, user_ids: List[int], cpfs: List[str]) -> Tuple[Dict[int, Optional[User]], Dict[str, Optional[User]]]:
+        """
+        Executes the batch retrieval.
+
+        Args:
+            user_ids (List[int]): The IDs to look up.
+            cpfs (List[str]): The CPFs to look up.
+
+        Returns:
+            Tuple[Dict[int, Optional[User]], Dict[str, Optional[User]]]: Every
+            requested ID and CPF mapped to its user, or to None when not found.
+
+        Raises:
+            ValueError: If the batch is larger than allowed.
+        """
+        user_ids, cpfs = list(dict.fromkeys(user_ids)), list(dict.fromkeys(cpfs))
+        _check_batch(user_ids, cpfs, self.max_batch_size)
+        by_id = self.user_repository.get_by_ids(user_ids) if user_ids else []
+        by_cpf = self.user_repository.get_by_cpfs(cpfs) if cpfs else []
+        return _map_batch(user_ids, cpfs, by_id, by_cpf)
+
+
+class AsyncGetUsersBatchUseCase(object):
+    """
+    Asyncio twin of GetUsersBatchUseCase.
+    """
+
+    def __init__(self, user_repository: AsyncUserRepository, max_batch_size: int = MAX_BATCH_SIZE):
+        """
+        Initializes the AsyncGetUsersBatchUseCase with the provided repository.
+
+        Args:
+            user_repository (AsyncUserRepository): The async repository for user-related data operations.
+            max_batch_size (int): The most ids and CPFs accepted in one batch, combined.
+        """
+        self.user_repository = user_repository
+        self.max_batch_size = max_batch_size
+
+    async def execute(self, user_ids: List[int], cpfs: List[str]) -> Tuple[Dict[int, Optional[User]], Dict[str, Optional[User]]]:
+        """
+        Executes the batch retrieval.
+
+        Args:
+            user_ids (List[int]): The IDs to look up.
+            cpfs (List[str]): The CPFs to look up.
+
+        Returns:
+            Tuple[Dict[int, Optional[User]], Dict[str, Optional[User]]]: Every
+            requested ID and CPF mapped to its user, or to None when not found.
+
+        Raises:
+            ValueError: If the batch is larger than allowed.
+        """
+        user_ids, cpfs = list(dict.fromkeys(user_ids)), list(dict.fromkeys(cpfs))
+        _check_batch(user_ids, cpfs, self.max_batch_size)
+        by_id = await self.user_repository.get_by_ids(user_ids) if user_ids else []
+        by_cpf = await self.user_repository.get_by_cpfs(cpfs) if cpfs else []
+        return _map_batch(user_ids, cpfs, by_id, by_cpf)
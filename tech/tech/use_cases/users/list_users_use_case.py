@@ -1,21 +1,85 @@
+import base64
+import binascii
+from typing import List, Optional, Tuple
+from tech.domain.entities.users import User
 from tech.interfaces.repositories.user_repository import UserRepository
+from tech.interfaces.repositories.async_user_repository import AsyncUserRepository
+
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Encodes the last ID of a page as an opaque cursor.
+
+    Args:
+        last_id (int): The ID of the last user on the page.
+
+    Returns:
+        str: A URL-safe cursor for the next page.
+    """
+    return base64.urlsafe_b64encode(f'id:{last_id}'.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Optional[int]:
+    """
+    Decodes a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (str): The cursor sent by the client; empty for the first page.
+
+    Returns:
+        Optional[int]: The ID the next page starts after, or None for the first page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    if not cursor:
+        return None
+    try:
+        decoded = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        prefix, _, last_id = decoded.partition(':')
+        if prefix != 'id':
+            raise ValueError
+        return int(last_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError('Invalid cursor')
+
+
+def clamp_page_size(limit: int, max_page_size: int) -> int:
+    """
+    Bounds a requested page size to [1, max_page_size].
+
+    Args:
+        limit (int): The page size requested by the client.
+        max_page_size (int): The server-side maximum.
+
+    Returns:
+        int: The page size actually used.
+    """
+    return max(1, min(limit, max_page_size))
+
 
 class ListUsersUseCase(object):
     """
     Handles the retrieval of users with pagination.
 
     This use case interacts with the repository to fetch a subset of users
-    based on the provided pagination parameters.
+    based on the provided pagination parameters. Besides LIMIT/OFFSET it offers
+    keyset pagination through opaque cursors, whose cost does not grow with
+    the depth of the page. Page sizes are capped by `max_page_size`.
     """
 
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: UserRepository, max_page_size: int = MAX_PAGE_SIZE):
         """
         Initializes the ListUsersUseCase with the provided repository.
 
         Args:
             user_repository (UserRepository): The repository responsible for user-related data operations.
+            max_page_size (int): The largest page a client may request.
         """
         self.user_repository = user_repository
+        self.max_page_size = max_page_size
 
     def execute(self, limit: int, skip: int) -> list:
         """
@@ -28,4 +92,79 @@ class ListUsersUseCase(object):
         Returns:
             list: A list of User entities.
         """
-        return self.user_repository.list_users(limit, skip)
+        return self.user_repository.list_users(clamp_page_size(limit, self.max_page_size), skip)
+
+    def execute_cursor(self, cursor: str, limit: int) -> Tuple[List[User], Optional[str]]:
+        """
+        Executes the listing of one page of users after a cursor.
+
+        One extra row is fetched to tell whether another page exists, so the
+        last page has no `next_cursor`.
+
+        Args:
+            cursor (str): The cursor returned with the previous page; empty for the first page.
+            limit (int): The maximum number of users to retrieve.
+
+        Returns:
+            Tuple[List[User], Optional[str]]: The users and the cursor of the next page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        after_id = decode_cursor(cursor)
+        limit = clamp_page_size(limit, self.max_page_size)
+        users = self.user_repository.list_users_after(after_id, limit + 1)
+        if len(users) > limit:
+            return users[:limit], encode_cursor(users[limit - 1].id)
+        return users, None
+
+
+class AsyncListUsersUseCase(object):
+    """
+    Asyncio twin of ListUsersUseCase.
+    """
+
+    def __init__(self, user_repository: AsyncUserRepository, max_page_size: int = MAX_PAGE_SIZE):
+        """
+        Initializes the AsyncListUsersUseCase with the provided repository.
+
+        Args:
+            user_repository (AsyncUserRepository): The async repository for user-related data operations.
+            max_page_size (int): The largest page a client may request.
+        """
+        self.user_repository = user_repository
+        self.max_page_size = max_page_size
+
+    async def execute(self, limit: int, skip: int) -> list:
+        """
+        Executes the listing of users with pagination.
+
+        Args:
+            limit (int): The maximum number of users to retrieve.
+            skip (int): The number of users to skip before starting retrieval.
+
+        Returns:
+            list: A list of User entities.
+        """
+        return await self.user_repository.list_users(clamp_page_size(limit, self.max_page_size), skip)
+
+    async def execute_cursor(self, cursor: str, limit: int) -> Tuple[List[User], Optional[str]]:
+        """
+        Executes the listing of one page of users after a cursor.
+
+        Args:
+            cursor (str): The cursor returned with the previous page; empty for the first page.
+            limit (int): The maximum number of users to retrieve.
+
+        Returns:
+            Tuple[List[User], Optional[str]]: The users and the cursor of the next page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        after_id = decode_cursor(cursor)
+        limit = clamp_page_size(limit, self.max_page_size)
+        users = await self.user_repository.list_users_after(after_id, limit + 1)
+        if len(users) > limit:
+            return users[:limit], encode_cursor(users[limit - 1].id)
+        return users, None
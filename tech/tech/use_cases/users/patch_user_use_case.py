@@ -0,0 +1,119 @@
+from typing import Optional
+from tech.domain.security import HashingService, get_hashing_service
+from tech.interfaces.repositories.user_repository import UserRepository
+from tech.interfaces.repositories.async_user_repository import AsyncUserRepository
+from tech.interfaces.schemas.user_schema import UserPatchSchema
+
+class PatchUserUseCase(object):
+    """
+    Handles partial updates of a user's information.
+
+    Only the fields present in the request and different from the stored values
+    are written. The password is hashed only when a new one is supplied, and a
+    request that changes nothing does not write to the repository at all.
+
+    The stored values are read with `get_by_id_for_update`, from the primary
+    and never from a cache or replica, so a stale copy cannot hide a change.
+    """
+
+    def __init__(self, user_repository: UserRepository, hashing_service: Optional[HashingService] = None):
+        """
+        Initializes the PatchUserUseCase with the provided repository.
+
+        Args:
+            user_repository (UserRepository): The repository responsible for user-related data operations.
+            hashing_service (HashingService): The service that hashes passwords off the request thread.
+                                              Defaults to the application-wide service.
+        """
+        self.user_repository = user_repository
+        self.hashing_service = hashing_service or get_hashing_service()
+
+    def execute(self, user_id: int, user_data: UserPatchSchema):
+        """
+        Executes the partial update of a user's information.
+
+        Args:
+            user_id (int): The unique identifier of the user to update.
+            user_data (UserPatchSchema): The fields to change.
+
+        Returns:
+            User: The updated User entity.
+
+        Raises:
+            ValueError: If no user is found with the given ID.
+            UserAlreadyExistsError: If a new username, email or CPF is already in use.
+        """
+        user = self.user_repository.get_by_id_for_update(user_id)
+        if not user:
+            raise ValueError('User not found')
+
+        requested = user_data.model_dump(exclude_unset=True, exclude_none=True)
+        changes = {
+            field: value
+            for field, value in requested.items()
+            if field != 'password' and getattr(user, field) != value
+        }
+        if 'password' in requested:
+            changes['password'] = self.hashing_service.hash(requested['password'])
+
+        if not changes:
+            return user
+
+        self.user_repository.update_fields(user_id, changes)
+        for field, value in changes.items():
+            setattr(user, field, value)
+        return user
+
+
+class AsyncPatchUserUseCase(object):
+    """
+    Asyncio twin of PatchUserUseCase.
+    """
+
+    def __init__(self, user_repository: AsyncUserRepository, hashing_service: Optional[HashingService] = None):
+        """
+        Initializes the AsyncPatchUserUseCase with the provided repository.
+
+        Args:
+            user_repository (AsyncUserRepository): The async repository for user-related data operations.
+            hashing_service (HashingService): The service that hashes passwords off the event loop.
+                                              Defaults to the application-wide service.
+        """
+        self.user_repository = user_repository
+        self.hashing_service = hashing_service or get_hashing_service()
+
+    async def execute(self, user_id: int, user_data: UserPatchSchema):
+        """
+        Executes the partial update of a user's information.
+
+        Args:
+            user_id (int): The unique identifier of the user to update.
+            user_data (UserPatchSchema): The fields to change.
+
+        Returns:
+            User: The updated User entity.
+
+        Raises:
+            ValueError: If no user is found with the given ID.
+            UserAlreadyExistsError: If a new username, email or CPF is already in use.
+        """
+        user = await self.user_repository.get_by_id_for_update(user_id)
+        if not user:
+            raise ValueError('User not found')
+
+        requested = user_data.model_dump(exclude_unset=True, exclude_none=True)
+        changes = {
+            field: value
+            for field, value in requested.items()
+            if field != 'password' and getattr(user, field) != value
+        }
+        if 'password' in requested:
+            changes['password'] = await self.hashing_service.ahash(requested['password'])
+
+        if not changes:
+            return user
+
+        await self.user_repository.update_fields(user_id, changes)
+        for field, value in changes.items():
+            setattr(user, field, value)
+        return user
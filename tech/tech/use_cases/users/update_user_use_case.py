@@ -1,23 +1,30 @@
-from tech.domain.security import get_password_hash
+from typing import Optional
+from tech.domain.entities.users import User
+from tech.domain.security import HashingService, get_hashing_service
 from tech.interfaces.repositories.user_repository import UserRepository
+from tech.interfaces.repositories.async_user_repository import AsyncUserRepository
 from tech.interfaces.schemas.user_schema import UserSchema
 
 class UpdateUserUseCase(object):
     """
     Handles the updating of a user's information.
 
-    This use case retrieves an existing user, validates their existence,
-    and applies the updates provided in the input data.
+    The new values are written in a single `UPDATE ... RETURNING`; the user is
+    not fetched beforehand, and a missing user is detected from the update
+    returning no row.
     """
 
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: UserRepository, hashing_service: Optional[HashingService] = None):
         """
         Initializes the UpdateUserUseCase with the provided repository.
 
         Args:
             user_repository (UserRepository): The repository responsible for user-related data operations.
+            hashing_service (HashingService): The service that hashes passwords off the request thread.
+                                              Defaults to the application-wide service.
         """
         self.user_repository = user_repository
+        self.hashing_service = hashing_service or get_hashing_service()
 
     def execute(self, user_id: int, user_data: UserSchema):
         """
@@ -32,14 +39,63 @@ class UpdateUserUseCase(object):
 
         Raises:
             ValueError: If no user is found with the given ID.
+            UserAlreadyExistsError: If the username, email or CPF is already in use.
         """
-        user = self.user_repository.get_by_id(user_id)
-        if not user:
+        user = User(
+            id=user_id,
+            username=user_data.username,
+            password=self.hashing_service.hash(user_data.password),
+            email=user_data.email,
+            cpf=user_data.cpf,
+        )
+
+        updated_user = self.user_repository.update(user)
+        if not updated_user:
             raise ValueError('User not found')
+        return updated_user
+
+
+class AsyncUpdateUserUseCase(object):
+    """
+    Asyncio twin of UpdateUserUseCase.
+    """
+
+    def __init__(self, user_repository: AsyncUserRepository, hashing_service: Optional[HashingService] = None):
+        """
+        Initializes the AsyncUpdateUserUseCase with the provided repository.
 
-        user.username = user_data.username
-        user.password = get_password_hash(user_data.password)
-        user.email = user_data.email
-        user.cpf = user_data.cpf
+        Args:
+            user_repository (AsyncUserRepository): The async repository for user-related data operations.
+            hashing_service (HashingService): The service that hashes passwords off the event loop.
+                                              Defaults to the application-wide service.
+        """
+        self.user_repository = user_repository
+        self.hashing_service = hashing_service or get_hashing_service()
+
+    async def execute(self, user_id: int, user_data: UserSchema):
+        """
+        Executes the update of a user's information.
 
-        return self.user_repository.update(user)
+        Args:
+            user_id (int): The unique identifier of the user to update.
+            user_data (UserSchema): The updated user information.
+
+        Returns:
+            User: The updated User entity.
+
+        Raises:
+            ValueError: If no user is found with the given ID.
+            UserAlreadyExistsError: If the username, email or CPF is already in use.
+        """
+        user = User(
+            id=user_id,
+            username=user_data.username,
+            password=await self.hashing_service.ahash(user_data.password),
+            email=user_data.email,
+            cpf=user_data.cpf,
+        )
+
+        updated_user = await self.user_repository.update(user)
+        if not updated_user:
+            raise ValueError('User not found')
+        return updated_user
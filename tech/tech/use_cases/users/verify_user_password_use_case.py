@@ -0,0 +1,50 @@
+from typing import Optional
+from tech.domain.security import HashingService, get_hashing_service
+from tech.interfaces.repositories.user_repository import UserRepository
+
+class VerifyUserPasswordUseCase(object):
+    """
+    Handles local verification of a user's password.
+
+    Every successful verification also migrates the stored hash to the current
+    argon2 profile when it was made with legacy parameters. Only those stale
+    rows are written, so hashes move to new parameters incrementally as users
+    are verified.
+    """
+
+    def __init__(self, user_repository: UserRepository, hashing_service: Optional[HashingService] = None):
+        """
+        Initializes the VerifyUserPasswordUseCase with the provided repository.
+
+        Args:
+            user_repository (UserRepository): The repository responsible for user-related data operations.
+            hashing_service (HashingService): The service that verifies passwords off the request thread.
+                                              Defaults to the application-wide service.
+        """
+        self.user_repository = user_repository
+        self.hashing_service = hashing_service or get_hashing_service()
+
+    def execute(self, cpf: str, password: str) -> bool:
+        """
+        Executes the verification of a user's password.
+
+        Args:
+            cpf (str): The CPF of the user.
+            password (str): The plain text password to check.
+
+        Returns:
+            bool: True if the user exists and the password matches.
+        """
+        user = self.user_repository.get_by_cpf(cpf)
+        if not user:
+            return False
+
+        # Users served from the cache carry no password hash.
+        stored_hash = user.password or self.user_repository.get_password_hash(user.id)
+        if not stored_hash:
+            return False
+
+        valid, updated_hash = self.hashing_service.verify_and_update(password, stored_hash)
+        if valid and updated_hash:
+            self.user_repository.update_password(user.id, stored_hash, updated_hash)
+        return valid
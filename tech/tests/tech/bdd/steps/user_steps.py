@@ -3,6 +3,7 @@ from behave import given, when, then
 from unittest.mock import Mock, patch
 from fastapi import HTTPException
 from tech.domain.entities.users import User
+from tech.domain.exceptions import UserAlreadyExistsError
 from tech.interfaces.schemas.user_schema import UserSchema
 
 
@@ -49,10 +50,10 @@ def step_impl(context):
                 existing_user = user
                 break
 
-        mock_repo.get_by_username_or_email_or_cpf.return_value = existing_user
-
-        # If no existing user, configure add method
-        if not existing_user:
+        # The database rejects duplicates on INSERT; simulate the unique violation
+        if existing_user:
+            mock_repo.add.side_effect = UserAlreadyExistsError('cpf')
+        else:
             new_user = User(
                 id=len(context.users) + 1,
                 username=row['username'],
@@ -1,9 +1,13 @@
+import os
 import pytest
 from unittest.mock import Mock
 from datetime import datetime
 from sqlalchemy.orm import Session
 from tech.domain.entities.users import User
 
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("CPF_INDEX_KEY", "test-cpf-index-key")
+
 
 @pytest.fixture
 def mock_session():
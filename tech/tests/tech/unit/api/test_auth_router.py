@@ -104,21 +104,14 @@ class TestAuthRouter:
         assert response.status_code == 422
 
 
-@patch("tech.interfaces.gateways.cognito_gateway.CognitoGateway")
-@patch("tech.use_cases.authenticate.authenticate_user_use_case.AuthenticateUserUseCase")
-def test_get_auth_controller_dependency(mock_use_case_class, mock_cognito_class):
-    """Test the get_auth_controller dependency function directly."""
+@patch("tech.api.auth_router.AuthenticateUserUseCase")
+def test_get_auth_controller_dependency(mock_use_case_class):
+    """Test that the controller is built around the injected, shared gateway."""
     from tech.api.auth_router import get_auth_controller
 
     mock_cognito = Mock()
-    mock_use_case = Mock()
-    mock_cognito_class.return_value = mock_cognito
-    mock_use_case_class.return_value = mock_use_case
 
-    mock_session = Mock()
-
-    controller = get_auth_controller(session=mock_session)
+    controller = get_auth_controller(cognito_gateway=mock_cognito)
 
     assert isinstance(controller, AuthController)
-    mock_cognito_class.assert_called_once()
     mock_use_case_class.assert_called_once_with(mock_cognito)
\ No newline at end of file
@@ -1,10 +1,13 @@
 # tests/unit/api/test_user_router.py
 import pytest
+from typing import Optional
 from unittest.mock import Mock, patch, MagicMock
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request, Response
+from fastapi.responses import StreamingResponse
 from fastapi.testclient import TestClient
+from tech.infra.cache.user_cache import STALE_WARNING, stale_read, stale_response_headers
 from tech.interfaces.controllers.user_controller import UserController
-from tech.interfaces.schemas.user_schema import UserSchema
+from tech.interfaces.schemas.user_schema import UserBatchSchema, UserPatchSchema, UserSchema
 
 # Create a mock app with mock dependencies
 app = FastAPI()
@@ -14,22 +17,51 @@ mock_controller = Mock(spec=UserController)
 def create_user(user: UserSchema):
     return mock_controller.create_user(user)
 
+@app.post("/bulk")
+async def bulk_import_users(request: Request, format: str = "ndjson"):
+    return mock_controller.bulk_import_users([await request.body()], format)
+
+@app.post("/batch")
+def get_users_batch(batch: UserBatchSchema):
+    return mock_controller.get_users_batch(batch)
+
+@app.get("/count")
+def count_users(mode: str = "auto"):
+    return mock_controller.count_users(mode)
+
+@app.get("/export")
+def export_users(format: str = "csv"):
+    return mock_controller.export_users(format)
+
 @app.get("/{user_id}")
-def get_user(user_id: int):
-    return mock_controller.get_user(user_id)
+def get_user(user_id: int, response: Response):
+    user = mock_controller.get_user(user_id)
+    response.headers.update(stale_response_headers())
+    return user
 
 @app.get("/cpf/{cpf}")
-def get_user_by_cpf(cpf: str):
-    return mock_controller.get_user_by_cpf(cpf)
+def get_user_by_cpf(cpf: str, response: Response):
+    user = mock_controller.get_user_by_cpf(cpf)
+    response.headers.update(stale_response_headers())
+    return user
 
 @app.get("/")
-def list_users(limit: int = 10, skip: int = 0):
+def list_users(response: Response, limit: int = 10, skip: int = 0, cursor: Optional[str] = None,
+               include_total: bool = False):
+    if include_total:
+        response.headers["X-Total-Count"] = str(mock_controller.count_users("auto")["count"])
+    if cursor is not None:
+        return mock_controller.list_users_page(limit, cursor)
     return mock_controller.list_users(limit, skip)
 
 @app.put("/{user_id}")
 def update_user(user_id: int, user: UserSchema):
     return mock_controller.update_user(user_id, user)
 
+@app.patch("/{user_id}")
+def patch_user(user_id: int, user: UserPatchSchema):
+    return mock_controller.patch_user(user_id, user)
+
 @app.delete("/{user_id}")
 def delete_user(user_id: int):
     return mock_controller.delete_user(user_id)
@@ -96,6 +128,21 @@ class TestUserRouter:
         assert response_data["id"] == 1
 
         mock_controller.get_user_by_cpf.assert_called_once_with("12345678901")
+        assert "Warning" not in response.headers
+
+    def test_get_user_by_cpf_flags_stale_answer(self):
+        def serve_stale(cpf):
+            stale_read.set((75.4, STALE_WARNING))
+            return {"id": 1, "username": "testuser", "email": "test@example.com"}
+
+        mock_controller.get_user_by_cpf.side_effect = serve_stale
+
+        response = client.get("/cpf/12345678901")
+
+        assert response.status_code == 200
+        assert response.headers["Age"] == "75"
+        assert response.headers["Warning"] == STALE_WARNING
+        mock_controller.get_user_by_cpf.side_effect = None
 
     def test_list_users_endpoint(self):
         mock_controller.list_users.return_value = [
@@ -127,6 +174,67 @@ class TestUserRouter:
 
         mock_controller.list_users.assert_called_once_with(1, 2)
 
+    def test_list_users_with_cursor(self):
+        mock_controller.list_users_page.return_value = {
+            "items": [{"id": 4, "username": "user4", "email": "user4@example.com"}],
+            "next_cursor": "aWQ6NA"
+        }
+
+        response = client.get("/?limit=1&cursor=aWQ6Mw")
+
+        assert response.status_code == 200
+        assert response.json()["next_cursor"] == "aWQ6NA"
+        mock_controller.list_users_page.assert_called_once_with(1, "aWQ6Mw")
+        mock_controller.list_users.assert_not_called()
+
+    def test_count_users_endpoint(self):
+        mock_controller.count_users.return_value = {"count": 1200000, "exact": False}
+
+        response = client.get("/count?mode=approximate")
+
+        assert response.status_code == 200
+        assert response.json() == {"count": 1200000, "exact": False}
+        mock_controller.count_users.assert_called_once_with("approximate")
+
+    def test_bulk_import_users_endpoint(self):
+        mock_controller.bulk_import_users.return_value = {"created": 1, "conflict": 0, "invalid": 0, "results": []}
+
+        response = client.post("/bulk?format=csv", content=b"username,email,password,cpf\n")
+
+        assert response.status_code == 200
+        assert response.json()["created"] == 1
+        mock_controller.bulk_import_users.assert_called_once_with([b"username,email,password,cpf\n"], "csv")
+
+    def test_get_users_batch_endpoint(self):
+        mock_controller.get_users_batch.return_value = {"ids": {"1": None}, "cpfs": {}}
+
+        response = client.post("/batch", json={"ids": [1]})
+
+        assert response.status_code == 200
+        assert response.json() == {"ids": {"1": None}, "cpfs": {}}
+        assert mock_controller.get_users_batch.call_args[0][0].ids == [1]
+
+    def test_export_users_endpoint(self):
+        mock_controller.export_users.return_value = StreamingResponse(
+            iter([b"id,username,email,cpf\n", b"1,user,user@example.com,12345678901\n"]),
+            media_type="text/csv",
+        )
+
+        response = client.get("/export?format=csv")
+
+        assert response.status_code == 200
+        assert response.text.splitlines()[1] == "1,user,user@example.com,12345678901"
+        mock_controller.export_users.assert_called_once_with("csv")
+
+    def test_list_users_with_total_header(self):
+        mock_controller.list_users.return_value = []
+        mock_controller.count_users.return_value = {"count": 42, "exact": True}
+
+        response = client.get("/?include_total=true")
+
+        assert response.headers["X-Total-Count"] == "42"
+        mock_controller.count_users.assert_called_once_with("auto")
+
     def test_update_user_endpoint(self):
         mock_controller.update_user.return_value = {
             "id": 1,
@@ -152,6 +260,27 @@ class TestUserRouter:
 
         mock_controller.update_user.assert_called_once()
 
+    def test_patch_user_endpoint(self):
+        mock_controller.patch_user.return_value = {
+            "id": 1,
+            "username": "testuser",
+            "email": "new@example.com"
+        }
+
+        response = client.patch("/1", json={"email": "new@example.com"})
+
+        assert response.status_code == 200
+        assert response.json()["email"] == "new@example.com"
+        user_id, user = mock_controller.patch_user.call_args[0]
+        assert user_id == 1
+        assert user.model_dump(exclude_unset=True) == {"email": "new@example.com"}
+
+    def test_patch_user_rejects_invalid_cpf(self):
+        response = client.patch("/1", json={"cpf": "123"})
+
+        assert response.status_code == 422
+        mock_controller.patch_user.assert_not_called()
+
     def test_delete_user_endpoint(self):
         mock_controller.delete_user.return_value = {"message": "User deleted"}
 
@@ -177,4 +306,15 @@ class TestUserRouter:
 def test_original_router_imports():
     from tech.api.users_router import router, get_user_controller
     assert router is not None
-    assert callable(get_user_controller)
\ No newline at end of file
+    assert callable(get_user_controller)
+
+def test_only_export_controller_gets_an_exporter():
+    """Test that replica selection for exports is not part of every users request."""
+    from tech.api.users_router import get_user_controller, get_user_export_controller
+
+    controller = get_user_controller(session=Mock(), hashing_service=Mock(), user_loader=None, user_cache=None)
+    assert controller.export_users_use_case is None
+
+    exporter = Mock()
+    export_controller = get_user_export_controller(controller=controller, user_exporter=exporter)
+    assert export_controller.export_users_use_case.user_exporter is exporter
@@ -0,0 +1,35 @@
+import hashlib
+import hmac
+from tech.domain.security import get_cpf_blind_index, verify_cpf
+
+
+class TestCpfBlindIndex:
+    """Unit tests for the keyed CPF blind index."""
+
+    def test_index_is_deterministic_hmac(self):
+        """Test that the index is the HMAC-SHA256 of the CPF digits."""
+        expected = hmac.new(b"key", b"12345678901", hashlib.sha256).hexdigest()
+
+        assert get_cpf_blind_index("12345678901", b"key") == expected
+        assert get_cpf_blind_index("12345678901", b"key") == expected
+
+    def test_index_ignores_punctuation(self):
+        """Test that formatted and bare CPFs share an index."""
+        assert get_cpf_blind_index("123.456.789-01", b"key") == get_cpf_blind_index("12345678901", b"key")
+
+    def test_index_depends_on_key(self):
+        """Test that a different key produces a different index."""
+        assert get_cpf_blind_index("12345678901", b"key") != get_cpf_blind_index("12345678901", b"other")
+
+    def test_default_key_comes_from_settings(self):
+        """Test that the configured key is used when none is given."""
+        assert get_cpf_blind_index("12345678901") == get_cpf_blind_index(
+            "12345678901", b"test-cpf-index-key"
+        )
+
+    def test_verify_cpf(self):
+        """Test checking a CPF against a stored index."""
+        index = get_cpf_blind_index("12345678901", b"key")
+
+        assert verify_cpf("12345678901", index, b"key") is True
+        assert verify_cpf("98765432101", index, b"key") is False
@@ -0,0 +1,82 @@
+import pytest
+from tech.domain import security
+from tech.domain.security import (
+    HASH_PROFILES,
+    HashProfile,
+    HashingService,
+    calibrate_profile,
+    resolve_hash_profile,
+)
+
+
+class TestHashProfiles:
+    """Unit tests for argon2 cost profiles and calibration."""
+
+    def teardown_method(self):
+        """Restore the default hasher after tests that reconfigure it."""
+        security.configure_password_hashing(HASH_PROFILES["recommended"])
+
+    def test_resolve_named_profile(self):
+        """Test that a named profile resolves to its parameters."""
+        assert resolve_hash_profile("balanced", 100) == HashProfile(2, 19456, 1)
+
+    def test_resolve_unknown_profile(self):
+        """Test that an unknown profile name is rejected."""
+        with pytest.raises(ValueError) as exc_info:
+            resolve_hash_profile("turbo", 100)
+
+        assert "Unknown hash profile" in str(exc_info.value)
+
+    def test_service_hashes_with_profile(self):
+        """Test that new hashes carry the configured argon2 parameters."""
+        service = HashingService(backend="inline", profile=HASH_PROFILES["low-memory"])
+
+        hashed = service.hash("Password123")
+
+        assert "$m=9216,t=4,p=1$" in hashed
+        assert service.stats()["profile"] == HASH_PROFILES["low-memory"]._asdict()
+
+    def test_calibration_adds_passes_within_budget(self):
+        """Test that spare budget is spent on extra passes."""
+        profile = calibrate_profile(100, memory_cost=19456, measure=lambda p: 0.03)
+
+        assert profile == HashProfile(time_cost=3, memory_cost=19456, parallelism=1)
+
+    def test_calibration_reduces_memory_when_over_budget(self):
+        """Test that memory is halved until one pass fits the budget."""
+        measured = []
+
+        def measure(profile):
+            measured.append(profile.memory_cost)
+            return profile.memory_cost / 19456 * 0.2
+
+        profile = calibrate_profile(110, memory_cost=19456, measure=measure)
+
+        assert measured == [19456, 9728]
+        assert profile == HashProfile(time_cost=1, memory_cost=9728, parallelism=1)
+
+    def test_calibration_caps_time_cost(self):
+        """Test that a very fast host does not produce unbounded passes."""
+        profile = calibrate_profile(100, max_time_cost=5, measure=lambda p: 0.001)
+
+        assert profile.time_cost == 5
+
+    def test_calibration_rejects_non_positive_target(self):
+        """Test that the target must be positive."""
+        with pytest.raises(ValueError):
+            calibrate_profile(0)
+
+    def test_verify_and_update_migrates_legacy_hash(self):
+        """Test that a legacy hash is upgraded and counted after verification."""
+        legacy_hash = HashingService(backend="inline", profile=HASH_PROFILES["low-memory"]).hash("Password123")
+        service = HashingService(backend="inline", profile=HASH_PROFILES["balanced"])
+
+        assert security.password_hash_needs_rehash(legacy_hash) is True
+        valid, updated_hash = service.verify_and_update("Password123", legacy_hash)
+
+        assert valid is True
+        assert updated_hash.startswith(security.current_hash_prefix())
+        assert security.password_hash_needs_rehash(updated_hash) is False
+        assert service.verify_and_update("Password123", updated_hash) == (True, None)
+        assert service.verify_and_update("wrong", legacy_hash) == (False, None)
+        assert service.stats()["rehashed"] == 1
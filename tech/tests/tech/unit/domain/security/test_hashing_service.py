@@ -0,0 +1,88 @@
+import asyncio
+import pytest
+from tech.domain.security import HashingService, verify_password
+
+
+class TestHashingService:
+    """Unit tests for the HashingService."""
+
+    def teardown_method(self):
+        """Release any pool created by a test."""
+        if getattr(self, "service", None):
+            self.service.shutdown()
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend name is rejected."""
+        with pytest.raises(ValueError) as exc_info:
+            HashingService(backend="gpu")
+
+        assert "Unknown hashing backend" in str(exc_info.value)
+
+    def test_inline_backend_hash_and_verify(self):
+        """Test hashing and verifying on the caller's thread."""
+        self.service = HashingService(backend="inline")
+
+        hashed = self.service.hash("Password123")
+
+        assert hashed.startswith("$argon2id$")
+        assert verify_password("Password123", hashed)
+        assert self.service.verify("Password123", hashed) is True
+        assert self.service.verify("wrong", hashed) is False
+        assert self.service.max_workers == 1
+
+    def test_thread_backend_is_awaitable(self):
+        """Test the awaitable API on the thread pool backend."""
+        self.service = HashingService(backend="thread", max_workers=2)
+
+        async def run():
+            hashed = await self.service.ahash("Password123")
+            return hashed, await self.service.averify("Password123", hashed)
+
+        hashed, valid = asyncio.run(run())
+
+        assert hashed.startswith("$argon2id$")
+        assert valid is True
+
+    def test_hash_many_keeps_order(self):
+        """Test that a batch is hashed across the pool in input order."""
+        self.service = HashingService(backend="thread", max_workers=2)
+
+        hashes = self.service.hash_many(["first", "second", "third"])
+        async_hashes = asyncio.run(self.service.ahash_many(["first", "second"]))
+
+        assert [verify_password(p, h) for p, h in zip(["first", "second", "third"], hashes)] == [True] * 3
+        assert [verify_password(p, h) for p, h in zip(["first", "second"], async_hashes)] == [True] * 2
+        assert self.service.stats()["submitted"] == 5
+
+    def test_process_backend(self):
+        """Test hashing on the process pool backend."""
+        self.service = HashingService(backend="process", max_workers=1)
+
+        hashed = self.service.hash("Password123")
+
+        assert self.service.verify("Password123", hashed) is True
+
+    def test_stats_track_latency_and_queue(self):
+        """Test that stats report completed operations and an empty queue."""
+        self.service = HashingService(backend="thread", max_workers=1)
+
+        self.service.hash("Password123")
+        stats = self.service.stats()
+
+        assert stats["backend"] == "thread"
+        assert stats["workers"] == 1
+        assert stats["submitted"] == 1
+        assert stats["failed"] == 0
+        assert stats["queue_depth"] == 0
+        assert stats["in_flight"] == 0
+        assert stats["hash"]["count"] == 1
+        assert stats["hash"]["p50_ms"] > 0
+
+    def test_failed_operation_is_counted(self):
+        """Test that errors are propagated and counted."""
+        self.service = HashingService(backend="inline")
+
+        with pytest.raises(Exception):
+            self.service.verify("Password123", "not-a-hash")
+
+        assert self.service.stats()["failed"] == 1
@@ -0,0 +1,87 @@
+from tech.infra.cache.backends import MemoryBackend, TwoTierBackend
+from tech.infra.cache.memory_cache import MemoryCache
+
+
+def memory_backend(ttl=60):
+    return MemoryBackend(MemoryCache(max_entries=100, ttl=ttl))
+
+
+class TestMemoryBackend:
+    """Unit tests for the in-process cache backend."""
+
+    def test_get_set_delete(self):
+        """Test that values round-trip and missing keys read as None."""
+        # Arrange
+        backend = memory_backend()
+
+        # Act
+        backend.set("a", b"1")
+        backend.set("b", b"2")
+        backend.delete(["a"])
+
+        # Assert
+        assert backend.get("a") is None
+        assert backend.get("b") == b"2"
+        assert backend.stats()["backend"] == "memory"
+
+
+class TestTwoTierBackend:
+    """Unit tests for the near/far cache backend."""
+
+    def setup_method(self):
+        self.near = memory_backend()
+        self.far = memory_backend()
+        self.backend = TwoTierBackend(self.near, self.far, near_ttl=5)
+
+    def test_far_hit_fills_near_tier(self):
+        """Test that a value found only in the far tier is copied to the near one."""
+        # Arrange
+        self.far.set("a", b"1")
+
+        # Act
+        value = self.backend.get("a")
+
+        # Assert
+        assert value == b"1"
+        assert self.near.get("a") == b"1"
+
+    def test_writes_reach_both_tiers(self):
+        """Test that set and delete apply to both tiers."""
+        # Act
+        self.backend.set("a", b"1")
+
+        # Assert
+        assert (self.near.get("a"), self.far.get("a")) == (b"1", b"1")
+        self.backend.delete(["a"])
+        assert (self.near.get("a"), self.far.get("a")) == (None, None)
+
+    def test_local_eviction_keeps_far_tier(self):
+        """Test that evictions announced by other processes only touch the near tier."""
+        # Arrange
+        self.backend.set("a", b"1")
+
+        # Act
+        self.backend.evict_local(["a"])
+        self.backend.clear_local()
+
+        # Assert
+        assert self.near.get("a") is None
+        assert self.far.get("a") == b"1"
+
+    def test_clear_drops_both_tiers(self):
+        """Test that a full clear also empties the shared far tier."""
+        # Arrange
+        self.backend.set("a", b"1")
+
+        # Act
+        self.backend.clear()
+
+        # Assert
+        assert (self.near.get("a"), self.far.get("a")) == (None, None)
+
+    def test_near_ttl_caps_entry_ttl(self):
+        """Test that the near tier never keeps a value longer than near_ttl."""
+        # Assert
+        assert self.backend._near_ttl(60) == 5
+        assert self.backend._near_ttl(2) == 2
+        assert self.backend._near_ttl(None) == 5
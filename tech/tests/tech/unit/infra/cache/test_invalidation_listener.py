@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+from tech.infra.cache.invalidation_listener import UserCacheInvalidationListener, start_user_cache_listener
+from tech.infra.cache.user_cache import UserCache
+
+
+class FakeConnection:
+    """Delivers queued payloads, then stops the listener."""
+
+    def __init__(self, listener, payloads):
+        self.listener = listener
+        self.payloads = payloads
+        self.executed = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, statement):
+        self.executed.append(statement)
+
+    def notifies(self, timeout=None):
+        for payload in self.payloads:
+            yield SimpleNamespace(payload=payload)
+        self.listener._stop.set()
+
+
+class TestUserCacheInvalidationListener:
+    """Unit tests for the LISTEN/NOTIFY cache invalidation listener."""
+
+    def setup_method(self):
+        self.user_cache = Mock(spec=UserCache)
+        self.listener = UserCacheInvalidationListener("postgresql://db", self.user_cache)
+
+    def test_handle_evicts_id_and_cpf_index(self):
+        """Test that a notification evicts the user's ID and CPF keys."""
+        # Act
+        self.listener.handle('{"id": 7, "cpf_index": "abc"}')
+
+        # Assert
+        self.user_cache.invalidate_index.assert_called_once_with(7, "abc")
+        assert self.listener.notifications == 1
+
+    def test_unreadable_payload_clears_cache(self):
+        """Test that a payload that cannot be parsed clears the local entries."""
+        # Act
+        self.listener.handle("not json")
+
+        # Assert
+        self.user_cache.clear_local.assert_called_once()
+        self.user_cache.invalidate_index.assert_not_called()
+
+    def test_listen_once_clears_then_handles_notifications(self):
+        """Test that connecting clears the local entries and notifications are applied."""
+        # Arrange
+        connection = FakeConnection(self.listener, ['{"id": 1, "cpf_index": null}'])
+        self.listener.connect = Mock(return_value=connection)
+
+        # Act
+        self.listener.listen_once()
+
+        # Assert
+        assert connection.executed == ["LISTEN users_changed"]
+        self.user_cache.clear_local.assert_called_once()
+        self.user_cache.invalidate_index.assert_called_once_with(1, None)
+        assert self.listener.connections == 1
+
+    def test_run_reconnects_after_error(self):
+        """Test that a failed connection is retried."""
+        # Arrange
+        connection = FakeConnection(self.listener, [])
+        self.listener.reconnect_delay = 0
+        self.listener.connect = Mock(side_effect=[OSError("down"), connection])
+
+        # Act
+        self.listener.run()
+
+        # Assert
+        assert self.listener.connect.call_count == 2
+        assert self.listener.connections == 1
+
+    def test_listener_starts_only_for_postgresql_with_cache(self, monkeypatch):
+        """Test that the listener is skipped without a cache or on other databases."""
+        # Arrange
+        start = MagicMock()
+        monkeypatch.setattr(UserCacheInvalidationListener, "start", start)
+
+        # Act
+        listener = start_user_cache_listener("postgresql+psycopg://u:p@db/app", self.user_cache)
+
+        # Assert
+        assert start_user_cache_listener("sqlite:///db", self.user_cache) is None
+        assert start_user_cache_listener("postgresql+psycopg://db/app", None) is None
+        assert listener.dsn == "postgresql://u:p@db/app"
+        start.assert_called_once()
@@ -0,0 +1,79 @@
+from tech.infra.cache.memory_cache import MISSING, MemoryCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestMemoryCache:
+    """Unit tests for the bounded LRU + TTL cache."""
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that reading an entry protects it from eviction."""
+        cache = MemoryCache(max_entries=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+
+        assert cache.get("b") is MISSING
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+        assert cache.stats()["evictions"] == 1
+
+    def test_entries_expire(self):
+        """Test that expired entries are dropped and counted."""
+        clock = FakeClock()
+        cache = MemoryCache(max_entries=10, ttl=5, clock=clock)
+        cache.set("a", None)
+
+        assert cache.get("a") is None
+        clock.now = 5
+        assert cache.get("a") is MISSING
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["expirations"], stats["entries"]) == (1, 1, 1, 0)
+        assert stats["hit_ratio"] == 0.5
+
+    def test_entry_ttl_overrides_default(self):
+        """Test that an entry stored with its own TTL expires on that schedule."""
+        clock = FakeClock()
+        cache = MemoryCache(max_entries=10, ttl=60, clock=clock)
+        cache.set("a", 1, ttl=5)
+        cache.set("b", 2, ttl=0)
+
+        assert cache.get("b") is MISSING
+        clock.now = 5
+        assert cache.get("a") is MISSING
+
+    def test_delete_and_clear(self):
+        """Test that entries can be dropped one by one or all at once."""
+        cache = MemoryCache(max_entries=10, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.delete("a")
+        cache.delete("missing")
+        assert cache.get("a") is MISSING
+        cache.clear()
+        assert cache.stats()["entries"] == 0
+
+    def test_zero_size_disables_caching(self):
+        """Test that a cache without room never stores values."""
+        cache = MemoryCache(max_entries=0, ttl=60)
+
+        cache.set("a", 1)
+
+        assert cache.get("a") is MISSING
+
+    def test_zero_ttl_disables_caching(self):
+        """Test that a TTL of zero never stores values."""
+        cache = MemoryCache(max_entries=10, ttl=0)
+
+        cache.set("a", 1)
+
+        assert cache.get("a") is MISSING
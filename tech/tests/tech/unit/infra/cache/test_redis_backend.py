@@ -0,0 +1,96 @@
+import socket
+import time
+
+from benchmarks.fake_redis import FakeRedisServer
+from tech.infra.cache.redis_backend import RedisBackend, encode_command
+
+
+def unused_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestRedisBackend:
+    """Unit tests for the Redis-protocol cache backend, against a local fake server."""
+
+    def setup_method(self):
+        self.server = FakeRedisServer().__enter__()
+        self.backend = RedisBackend(self.server.url, ttl=60, prefix="test:")
+
+    def teardown_method(self):
+        self.backend.close()
+        self.server.__exit__(None, None, None)
+
+    def test_encode_command(self):
+        """Test the RESP encoding of a command."""
+        assert encode_command("GET", "k") == b"*2\r\n$3\r\nGET\r\n$1\r\nk\r\n"
+
+    def test_get_set_delete(self):
+        """Test that values round-trip with the key prefix and a TTL."""
+        # Act
+        self.backend.set("a", b"\x00value")
+        self.backend.set("b", b"2")
+        self.backend.delete(["b"])
+
+        # Assert
+        assert self.backend.get("a") == b"\x00value"
+        assert self.backend.get("b") is None
+        assert set(self.server.data) == {b"test:a"}
+        assert self.backend.stats()["hits"] == 1
+
+    def test_entries_expire(self):
+        """Test that the TTL is sent in milliseconds."""
+        # Act
+        self.backend.set("a", b"1", ttl=0.01)
+        time.sleep(0.02)
+
+        # Assert
+        assert self.backend.get("a") is None
+
+    def test_connections_are_reused(self):
+        """Test that commands share a pooled connection."""
+        # Act
+        for _ in range(5):
+            self.backend.get("a")
+
+        # Assert
+        assert self.backend._pool.qsize() == 1
+
+    def test_unreachable_server_reads_as_miss(self):
+        """Test that a failed call is counted and treated as a miss."""
+        # Arrange
+        backend = RedisBackend(f"redis://127.0.0.1:{unused_port()}/0", timeout=0.05)
+
+        # Act
+        value = backend.get("a")
+        backend.set("a", b"1")
+
+        # Assert
+        assert value is None
+        assert backend.stats()["errors"] == 2
+
+    def test_local_eviction_leaves_shared_entries(self):
+        """Test that evictions announced by other processes do not touch the server."""
+        # Arrange
+        self.backend.set("a", b"1")
+
+        # Act
+        self.backend.evict_local(["a"])
+        self.backend.clear_local()
+
+        # Assert
+        assert self.backend.get("a") == b"1"
+
+    def test_clear_drops_prefixed_keys_only(self):
+        """Test that clearing removes this backend's keys and leaves other prefixes."""
+        # Arrange
+        self.backend.set("a", b"1")
+        self.backend.set("b", b"2")
+        self.server.data[b"other:a"] = (b"3", None)
+
+        # Act
+        self.backend.clear()
+
+        # Assert
+        assert set(self.server.data) == {b"other:a"}
@@ -0,0 +1,148 @@
+import multiprocessing
+
+import pytest
+from tech.infra.cache.shared_memory_backend import SharedMemoryBackend
+
+
+CPF_KEY = "cpf:" + "ab" * 32
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def read_and_delete(path, queue):
+    backend = SharedMemoryBackend(path, slots=64, slot_size=256)
+    queue.put(backend.get("id:1"))
+    backend.delete(["id:1"])
+    backend.set("id:2", b"from child")
+
+
+class TestSharedMemoryBackend:
+    """Unit tests for the memory-mapped cache backend shared by workers."""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+
+    def make(self, tmp_path, **options):
+        options = {"slots": 64, "slot_size": 256, "clock": self.clock, **options}
+        return SharedMemoryBackend(str(tmp_path / "users-cache"), **options)
+
+    def test_get_set_delete(self, tmp_path):
+        """Test that values round-trip and deleted keys read as None."""
+        # Arrange
+        backend = self.make(tmp_path)
+
+        # Act
+        backend.set("id:1", b"user")
+        backend.set("id:1", b"newer")
+        backend.set(CPF_KEY, b"1")
+        backend.delete([CPF_KEY])
+
+        # Assert
+        assert backend.get("id:1") == b"newer"
+        assert backend.get(CPF_KEY) is None
+        stats = backend.stats()
+        assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 1, 1)
+
+    def test_clear_local_keeps_shared_segment(self, tmp_path):
+        """Test that a local-only clear leaves the entries other workers read."""
+        # Arrange
+        backend = self.make(tmp_path)
+        backend.set("id:1", b"user")
+
+        # Act
+        backend.clear_local()
+
+        # Assert
+        assert backend.get("id:1") == b"user"
+
+    def test_entries_expire(self, tmp_path):
+        """Test that an entry is not served past its TTL."""
+        # Arrange
+        backend = self.make(tmp_path, ttl=60)
+        backend.set("id:1", b"user", ttl=5)
+
+        # Act
+        self.clock.now += 5
+
+        # Assert
+        assert backend.get("id:1") is None
+
+    def test_full_window_evicts_entry_closest_to_expiry(self, tmp_path):
+        """Test that a key whose probe window is full replaces the soonest-expiring entry."""
+        # Arrange
+        backend = self.make(tmp_path, slots=2, probe=2)
+        backend.set("a", b"1", ttl=10)
+        backend.set("b", b"2", ttl=50)
+
+        # Act
+        backend.set("c", b"3", ttl=50)
+
+        # Assert
+        assert (backend.get("a"), backend.get("b"), backend.get("c")) == (None, b"2", b"3")
+        assert backend.stats()["evictions"] == 1
+
+    def test_oversized_values_are_skipped(self, tmp_path):
+        """Test that a value larger than a slot is not cached."""
+        # Arrange
+        backend = self.make(tmp_path)
+
+        # Act
+        backend.set("id:1", b"x" * 1000)
+
+        # Assert
+        assert backend.get("id:1") is None
+        assert backend.stats()["oversized"] == 1
+
+    def test_layout_change_is_rejected(self, tmp_path):
+        """Test that a segment created with another geometry is left intact."""
+        # Arrange
+        self.make(tmp_path).set("id:1", b"user")
+
+        # Act
+        with pytest.raises(ValueError):
+            self.make(tmp_path, slots=32)
+
+        # Assert
+        assert self.make(tmp_path).get("id:1") == b"user"
+
+    def test_unrecognized_file_is_initialized(self, tmp_path):
+        """Test that a file without a segment header is reset."""
+        # Arrange
+        (tmp_path / "users-cache").write_bytes(b"garbage")
+
+        # Act
+        backend = self.make(tmp_path)
+        backend.set("id:1", b"user")
+
+        # Assert
+        assert backend.get("id:1") == b"user"
+
+    def test_slot_size_must_fit_header_and_key(self, tmp_path):
+        """Test that slots too small for a key are rejected."""
+        with pytest.raises(ValueError):
+            self.make(tmp_path, slot_size=128)
+
+    def test_writes_are_visible_to_other_processes(self, tmp_path):
+        """Test that another worker sees, and can invalidate, what this one stored."""
+        # Arrange
+        path = str(tmp_path / "users-cache")
+        backend = SharedMemoryBackend(path, slots=64, slot_size=256)
+        backend.set("id:1", b"from parent")
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+
+        # Act
+        child = context.Process(target=read_and_delete, args=(path, queue))
+        child.start()
+        child.join(30)
+
+        # Assert
+        assert queue.get(timeout=5) == b"from parent"
+        assert backend.get("id:1") is None
+        assert backend.get("id:2") == b"from child"
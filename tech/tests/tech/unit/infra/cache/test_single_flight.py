@@ -0,0 +1,71 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from tech.infra.cache.single_flight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight:
+    """Unit tests for per-key call de-duplication across threads."""
+
+    def test_concurrent_callers_share_one_call(self):
+        """Test that callers arriving during a call wait for its result."""
+        flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def load():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "value"
+
+        with ThreadPoolExecutor(3) as pool:
+            first = pool.submit(flight.do, "key", load)
+            started.wait(5)
+            others = [pool.submit(flight.do, "key", load) for _ in range(2)]
+            while flight.shared < 2:
+                pass
+            release.set()
+            results = [first.result()] + [other.result() for other in others]
+
+        assert results == ["value"] * 3
+        assert calls == [1]
+
+    def test_exception_is_shared_and_key_released(self):
+        """Test that a failure reaches the caller and does not stick to the key."""
+        flight = SingleFlight()
+
+        def broken():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            flight.do("key", broken)
+        assert flight.do("key", lambda: 1) == 1
+
+
+class TestAsyncSingleFlight:
+    """Unit tests for the asyncio single-flight group."""
+
+    def test_concurrent_awaits_share_one_call(self):
+        """Test that concurrent awaits of the same key run the coroutine once."""
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        async def run():
+            flight = AsyncSingleFlight()
+            results = await asyncio.gather(*(flight.do("key", load) for _ in range(3)))
+            await asyncio.sleep(0)
+            return results, flight
+
+        results, flight = asyncio.run(run())
+
+        assert results == ["value"] * 3
+        assert calls == [1]
+        assert flight.shared == 2
+        assert flight._calls == {}
@@ -0,0 +1,73 @@
+from tech.infra.cache.token_cache import REVOKED, VerifiedTokenCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+USER = {"username": "test_user", "attributes": {"sub": "s"}, "is_admin": False}
+
+
+class TestVerifiedTokenCache:
+    """Unit tests for the verified-token cache."""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.cache = VerifiedTokenCache(max_entries=2, clock=self.clock)
+
+    def test_entries_live_until_token_expiry(self):
+        """Test that a verified token is served until its exp and not after."""
+        # Arrange
+        self.cache.put("token", USER, expires_at=1060)
+
+        # Act
+        before = self.cache.get("token")
+        self.clock.now = 1060
+        after = self.cache.get("token")
+
+        # Assert
+        assert before == USER
+        assert after is None
+
+    def test_tokens_are_keyed_by_digest(self):
+        """Test that raw tokens are not kept and callers get their own copy."""
+        # Arrange
+        self.cache.put("token", USER, expires_at=1060)
+
+        # Act
+        self.cache.get("token")["attributes"]["sub"] = "changed"
+
+        # Assert
+        assert "token" not in self.cache._entries._entries
+        assert self.cache.get("token") == USER
+
+    def test_cache_is_bounded(self):
+        """Test that the least recently used token is evicted."""
+        # Act
+        for token in ("a", "b", "c"):
+            self.cache.put(token, USER, expires_at=1060)
+
+        # Assert
+        assert self.cache.get("a") is None
+        assert self.cache.stats()["evictions"] == 1
+
+    def test_revoked_tokens_are_rejected_until_expiry(self):
+        """Test that revocation drops the token and survives later puts and evictions."""
+        # Arrange
+        self.cache.put("token", USER, expires_at=1060)
+
+        # Act
+        self.cache.revoke("token", expires_at=1060)
+        self.cache.put("token", USER, expires_at=1060)
+        for token in ("a", "b", "c"):
+            self.cache.put(token, USER, expires_at=1060)
+
+        # Assert
+        assert self.cache.get("token") is REVOKED
+        assert self.cache.stats()["revoked"] == 1
+        self.clock.now = 1060
+        assert self.cache.get("token") is None
@@ -0,0 +1,229 @@
+import asyncio
+
+import pytest
+from unittest.mock import Mock
+from sqlalchemy.exc import OperationalError
+from tech.domain.entities.users import User
+from tech.domain.security import get_cpf_blind_index
+from benchmarks.fake_redis import FakeRedisServer
+from tech.infra.cache.backends import MemoryBackend, TwoTierBackend
+from tech.infra.cache.memory_cache import MemoryCache
+from tech.infra.cache.redis_backend import RedisBackend
+from tech.infra.cache.user_cache import (
+    REVALIDATION_FAILED_WARNING,
+    STALE_WARNING,
+    UserCache,
+    decode_user,
+    encode_user,
+    stale_read,
+    stale_response_headers,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_user(cpf="12345678901"):
+    return User(id=1, username="user", email="user@example.com", password="hash", cpf=cpf)
+
+
+class TestUserCache:
+    """Unit tests for the read-through user cache."""
+
+    def setup_method(self):
+        self.cache = UserCache(MemoryBackend(MemoryCache(max_entries=100, ttl=60)))
+
+    def test_lookup_by_id_is_loaded_once(self):
+        """Test that the second lookup is served from the cache, as a copy."""
+        load = Mock(return_value=make_user())
+
+        first = self.cache.get_by_id(1, load)
+        second = self.cache.get_by_id(1, load)
+
+        load.assert_called_once()
+        assert second.username == "user"
+        assert first is not second
+
+    def test_lookup_by_cpf_reuses_id_entry(self):
+        """Test that a user loaded by ID also answers lookups by its CPF."""
+        self.cache.get_by_id(1, lambda: make_user())
+        load = Mock()
+
+        assert self.cache.get_by_cpf("12345678901", load).id == 1
+        load.assert_not_called()
+
+    def test_missing_users_are_not_cached_without_negative_ttl(self):
+        """Test that not-found results are loaded again when negative caching is off."""
+        load = Mock(return_value=None)
+
+        assert self.cache.get_by_id(1, load) is None
+        assert self.cache.get_by_id(1, load) is None
+        assert load.call_count == 2
+
+    def test_missing_cpf_is_remembered(self):
+        """Test that a not-found CPF is answered from the cache within the negative TTL."""
+        clock = FakeClock()
+        cache = UserCache(MemoryBackend(MemoryCache(max_entries=100, ttl=60, clock=clock)), negative_ttl=5)
+        load = Mock(return_value=None)
+
+        assert cache.get_by_cpf("12345678901", load) is None
+        assert cache.get_by_cpf("12345678901", load) is None
+        load.assert_called_once()
+        assert cache.stats()["negative_hits"] == 1
+
+        clock.now = 5
+        assert cache.get_by_cpf("12345678901", load) is None
+        assert load.call_count == 2
+
+    def test_creating_user_drops_negative_entries(self):
+        """Test that invalidating a created user's ID and CPF forgets they were missing."""
+        cache = UserCache(MemoryBackend(MemoryCache(max_entries=100, ttl=60)), negative_ttl=5)
+        cache.get_by_id(1, lambda: None)
+        cache.get_by_cpf("12345678901", lambda: None)
+
+        cache.invalidate(1, "12345678901")
+
+        assert cache.get_by_id(1, lambda: make_user()).id == 1
+        assert cache.get_by_cpf("12345678901", Mock()).id == 1
+
+    def test_invalidation_retires_id_and_cpf(self):
+        """Test that after a write both keys are loaded again."""
+        self.cache.get_by_id(1, lambda: make_user())
+        self.cache.invalidate(1)
+        load = Mock(return_value=make_user(cpf="10987654321"))
+
+        assert self.cache.get_by_cpf("12345678901", Mock(return_value=None)) is None
+        assert self.cache.get_by_id(1, load).cpf == "10987654321"
+
+    def test_load_racing_with_write_is_not_stored(self):
+        """Test that a value read before a concurrent write is not cached."""
+        def load():
+            self.cache.invalidate(1)
+            return make_user()
+
+        self.cache.get_by_id(1, load)
+
+        assert self.cache.cache.stats()["entries"] == 0
+
+    def test_async_lookups(self):
+        """Test the awaitable variants."""
+        async def load():
+            return make_user()
+
+        async def run():
+            await self.cache.aget_by_id(1, load)
+            return await self.cache.aget_by_cpf("12345678901", load)
+
+        assert asyncio.run(run()).id == 1
+        assert self.cache.stats()["hits"] == 2
+
+    def test_invalidate_index_drops_negative_cpf_entry(self):
+        """Test that a write announced by blind index drops the remembered miss."""
+        cache = UserCache(MemoryBackend(MemoryCache(max_entries=100, ttl=60)), negative_ttl=5)
+        cache.get_by_cpf("12345678901", lambda: None)
+
+        cache.invalidate_index(1, get_cpf_blind_index("12345678901"))
+
+        assert cache.get_by_cpf("12345678901", lambda: make_user()).id == 1
+
+    def test_user_round_trips_through_bytes(self):
+        """Test that the serialized form keeps every field of the entity but the password."""
+        user = make_user()
+
+        encoded = encode_user(user)
+        decoded = decode_user(encoded)
+
+        assert b"hash" not in encoded
+        assert decoded.password is None
+        assert vars(decoded) == {**vars(user), "password": None}
+
+    def test_processes_share_the_far_tier(self):
+        """Test that a user loaded by one process is served to another from the shared tier."""
+        with FakeRedisServer() as server:
+            def two_tier():
+                near = MemoryBackend(MemoryCache(max_entries=100, ttl=5))
+                return UserCache(TwoTierBackend(near, RedisBackend(server.url, ttl=60)), negative_ttl=5)
+
+            first, second = two_tier(), two_tier()
+            first.get_by_cpf("12345678901", lambda: make_user())
+            load = Mock()
+
+            assert second.get_by_cpf("12345678901", load).id == 1
+            assert second.get_by_cpf("12345678901", load).id == 1
+            load.assert_not_called()
+            assert server.commands.count("GET") == 3
+
+            second.invalidate(1)
+            assert first.cache.far.get("id:1") is None
+
+
+class TestStaleUserCache:
+    """Unit tests for stale-while-revalidate and stale-if-error lookups."""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.refresh = Mock(return_value=make_user())
+        self.cache = UserCache(
+            MemoryBackend(MemoryCache(max_entries=100, ttl=600)),
+            ttl=60, stale_while_revalidate=30, stale_if_error=300,
+            refresh=self.refresh, clock=self.clock,
+        )
+        self.cache.get_by_id(1, lambda: make_user())
+        stale_read.set(None)
+
+    def test_fresh_entry_is_not_flagged(self):
+        """Test that an entry younger than the TTL is served as is."""
+        self.clock.now = 59
+
+        assert self.cache.get_by_id(1, Mock()).id == 1
+        assert stale_response_headers() == {}
+
+    def test_stale_entry_is_served_while_refreshing(self):
+        """Test that an entry within the revalidation window is served and refreshed in the background."""
+        self.clock.now = 75
+        load = Mock()
+
+        user = self.cache.get_by_id(1, load)
+        self.cache._refresher.shutdown(wait=True)
+
+        assert user.id == 1
+        load.assert_not_called()
+        self.refresh.assert_called_once_with(1)
+        assert stale_response_headers() == {"Age": "75", "Warning": STALE_WARNING}
+        assert self.cache.stats()["refreshes"] == 1
+        assert self.cache.get_by_id(1, load).id == 1
+        load.assert_not_called()
+
+    def test_stale_entry_is_served_when_database_fails(self):
+        """Test that an entry past the revalidation window is served when loading fails."""
+        self.clock.now = 200
+        load = Mock(side_effect=OperationalError("SELECT", {}, Exception("failover")))
+
+        user = self.cache.get_by_cpf("12345678901", load)
+
+        assert user.id == 1
+        load.assert_called_once()
+        assert stale_response_headers()["Warning"] == REVALIDATION_FAILED_WARNING
+        assert self.cache.stats()["stale_on_error"] == 1
+
+    def test_database_errors_propagate_past_max_stale_age(self):
+        """Test that entries older than the stale-if-error window are never served."""
+        self.clock.now = 361
+        load = Mock(side_effect=OperationalError("SELECT", {}, Exception("failover")))
+
+        with pytest.raises(OperationalError):
+            self.cache.get_by_id(1, load)
+
+    def test_async_stale_if_error(self):
+        """Test the awaitable variant serving a stale entry when loading fails."""
+        self.clock.now = 200
+
+        async def load():
+            raise OperationalError("SELECT", {}, Exception("failover"))
+
+        assert asyncio.run(self.cache.aget_by_id(1, load)).id == 1
@@ -0,0 +1,36 @@
+from sqlalchemy import create_engine, insert, select
+from tech.domain.security import get_cpf_blind_index
+from tech.infra.databases.cpf_index_backfill import backfill_cpf_index
+from tech.infra.repositories.sql_alchemy_models import SQLAlchemyUser, table_registry
+
+
+class TestCpfIndexBackfill:
+    """Unit tests for the CPF blind index backfill."""
+
+    def setup_method(self):
+        """Create an in-memory users table with rows missing their index."""
+        self.engine = create_engine("sqlite:///:memory:")
+        table_registry.metadata.create_all(self.engine)
+        with self.engine.begin() as connection:
+            connection.execute(insert(SQLAlchemyUser), [
+                {"username": f"user{i}", "email": f"user{i}@example.com",
+                 "password": "hash", "cpf": f"{i:011d}"}
+                for i in range(1, 6)
+            ])
+
+    def test_backfills_every_missing_row_in_batches(self):
+        """Test that all rows get their index across several batches."""
+        with self.engine.begin() as connection:
+            updated = backfill_cpf_index(connection, b"key", batch_size=2)
+            rows = connection.execute(select(SQLAlchemyUser.cpf, SQLAlchemyUser.cpf_index)).all()
+
+        assert updated == 5
+        assert all(row.cpf_index == get_cpf_blind_index(row.cpf, b"key") for row in rows)
+
+    def test_only_missing_rows_are_updated(self):
+        """Test that a second run skips rows that already have an index."""
+        with self.engine.begin() as connection:
+            backfill_cpf_index(connection, b"key")
+
+            assert backfill_cpf_index(connection, b"key") == 0
+            assert backfill_cpf_index(connection, b"rotated", only_missing=False) == 5
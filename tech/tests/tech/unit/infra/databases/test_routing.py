@@ -0,0 +1,147 @@
+import pytest
+from sqlalchemy import create_engine, insert, select, update
+from sqlalchemy.pool import StaticPool
+from tech.infra.databases.routing import ReadYourWritesWindow, ReplicaSet, RoutingSession
+from tech.infra.repositories.sql_alchemy_models import SQLAlchemyUser, table_registry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_database(name):
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    table_registry.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(SQLAlchemyUser).values(
+            username=name, email=f"{name}@example.com", password="hash", cpf="12345678901"
+        ))
+    return engine
+
+
+class TestReplicaSet:
+    """Unit tests for replica selection and health checks."""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.first = make_database("first")
+        self.second = make_database("second")
+        self.replicas = ReplicaSet([self.first, self.second], health_interval=5, clock=self.clock)
+
+    def test_round_robin(self):
+        """Test that healthy replicas are used in turn."""
+        assert [self.replicas.choose() for _ in range(4)] == [
+            self.first, self.second, self.first, self.second
+        ]
+        assert [r["reads"] for r in self.replicas.stats()["replicas"]] == [2, 2]
+
+    def test_unhealthy_replica_is_skipped_until_probe_succeeds(self):
+        """Test that a failed replica leaves rotation and is probed before returning."""
+        # Arrange
+        self.replicas.mark_unhealthy(self.first)
+
+        # Act & Assert
+        assert [self.replicas.choose() for _ in range(2)] == [self.second, self.second]
+        assert self.replicas.stats()["replicas"][0]["healthy"] is False
+
+        self.clock.now += 5
+        assert self.replicas.choose() == self.first
+        assert self.replicas.stats()["replicas"][0]["healthy"] is True
+
+    def test_failed_probe_keeps_replica_out(self):
+        """Test that a replica failing its probe stays out for another interval."""
+        # Arrange
+        self.replicas.mark_unhealthy(self.first)
+        self.replicas.mark_unhealthy(self.second)
+        self.clock.now += 5
+        self.replicas._probe = lambda engine: False
+
+        # Act & Assert
+        assert self.replicas.choose() is None
+        assert self.replicas.stats()["primary_fallbacks"] == 1
+
+    def test_connection_errors_mark_replica_unhealthy(self):
+        """Test that a replica that cannot be reached is taken out passively."""
+        # Arrange
+        broken = create_engine("sqlite:////nonexistent-dir/replica.db")
+        replicas = ReplicaSet([broken], clock=self.clock)
+
+        # Act
+        with pytest.raises(Exception):
+            broken.connect()
+
+        # Assert
+        assert replicas.stats()["replicas"][0]["healthy"] is False
+
+
+class TestReadYourWritesWindow:
+    """Unit tests for the per-client pin window."""
+
+    def test_pin_expires(self):
+        clock = FakeClock()
+        window = ReadYourWritesWindow(2, clock=clock)
+
+        window.pin("client-a")
+
+        assert window.is_pinned("client-a")
+        assert not window.is_pinned("client-b")
+        assert not window.is_pinned(None)
+        clock.now += 2
+        assert not window.is_pinned("client-a")
+
+
+class TestRoutingSession:
+    """Unit tests for statement routing between primary and replicas."""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.primary = make_database("primary")
+        self.replica = make_database("replica")
+        self.replicas = ReplicaSet([self.replica], clock=self.clock)
+        self.window = ReadYourWritesWindow(2, clock=self.clock)
+
+    def session(self, client_id="client-a"):
+        return RoutingSession(self.primary, self.replicas, self.window, client_id)
+
+    def read_username(self, session):
+        return session.scalar(select(SQLAlchemyUser.username))
+
+    def test_reads_go_to_replica(self):
+        """Test that a plain SELECT is served by a replica."""
+        with self.session() as session:
+            assert self.read_username(session) == "replica"
+
+    def test_writes_go_to_primary_and_pin_client(self):
+        """Test that writes hit the primary and the writer reads from it afterwards."""
+        # Act
+        with self.session() as session:
+            session.execute(update(SQLAlchemyUser).values(username="changed"))
+            assert self.read_username(session) == "changed"
+            session.commit()
+
+        # Assert
+        with self.session() as session:
+            assert self.read_username(session) == "changed"
+        with self.session("client-b") as session:
+            assert self.read_username(session) == "replica"
+
+        self.clock.now += 2
+        with self.session() as session:
+            assert self.read_username(session) == "replica"
+
+    def test_locking_reads_go_to_primary(self):
+        """Test that SELECT ... FOR UPDATE is never sent to a replica."""
+        with self.session() as session:
+            assert session.scalar(select(SQLAlchemyUser.username).with_for_update()) == "primary"
+            assert self.read_username(session) == "replica"
+
+    def test_falls_back_to_primary_without_healthy_replica(self):
+        """Test that reads use the primary when every replica is down."""
+        self.replicas.mark_unhealthy(self.replica)
+
+        with self.session() as session:
+            assert self.read_username(session) == "primary"
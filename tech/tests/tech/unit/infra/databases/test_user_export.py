@@ -0,0 +1,56 @@
+import json
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.pool import StaticPool
+from tech.infra.databases.user_export import COPY_QUERIES, UserExporter
+from tech.infra.repositories.sql_alchemy_models import SQLAlchemyUser, table_registry
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    table_registry.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for index in range(5):
+            connection.execute(insert(SQLAlchemyUser).values(
+                username=f"user{index}", email=f"user{index}@example.com",
+                password="hash", cpf=f"1234567890{index}"
+            ))
+    return engine
+
+
+class TestUserExporter:
+    """Unit tests for the streaming user export."""
+
+    def test_csv_export(self, engine):
+        """Test that the CSV export has a header and no password column."""
+        # Act
+        body = b"".join(UserExporter(engine, batch_size=2).stream("csv")).decode()
+
+        # Assert
+        lines = body.splitlines()
+        assert lines[0] == "id,username,email,cpf"
+        assert lines[1] == "1,user0,user0@example.com,12345678900"
+        assert len(lines) == 6
+        assert "hash" not in body
+
+    def test_ndjson_export_is_streamed_in_batches(self, engine):
+        """Test that NDJSON rows are produced in chunks of the batch size."""
+        # Act
+        chunks = list(UserExporter(engine, batch_size=2).stream("ndjson"))
+
+        # Assert
+        assert len(chunks) == 3
+        rows = [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+        assert [row["id"] for row in rows] == [1, 2, 3, 4, 5]
+        assert rows[0] == {"id": 1, "username": "user0", "email": "user0@example.com", "cpf": "12345678900"}
+
+    def test_unsupported_format(self, engine):
+        """Test that unknown formats are rejected before any query runs."""
+        with pytest.raises(ValueError, match="Unsupported export format: xml"):
+            UserExporter(engine).stream("xml")
+
+    def test_copy_queries_skip_password(self):
+        """Test that the PostgreSQL COPY queries never select the password hash."""
+        assert all("password" not in query for query in COPY_QUERIES.values())
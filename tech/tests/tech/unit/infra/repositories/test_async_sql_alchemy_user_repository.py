@@ -0,0 +1,172 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+from sqlalchemy.exc import IntegrityError
+from tech.domain.entities.users import User
+from tech.domain.exceptions import UserAlreadyExistsError
+from tech.domain.security import get_cpf_blind_index
+from tech.infra.repositories.async_sql_alchemy_user_repository import AsyncSQLAlchemyUserRepository
+from tech.infra.repositories.sql_alchemy_models import SQLAlchemyUser
+
+
+class TestAsyncSQLAlchemyUserRepository:
+    """Unit tests for the AsyncSQLAlchemyUserRepository."""
+
+    def setup_method(self):
+        """Set up test dependencies."""
+        self.mock_session = Mock()
+        self.mock_session.commit = AsyncMock()
+        self.mock_session.refresh = AsyncMock()
+        self.mock_session.scalar = AsyncMock()
+        self.mock_session.execute = AsyncMock()
+        self.mock_session.delete = AsyncMock()
+        self.repository = AsyncSQLAlchemyUserRepository(self.mock_session)
+
+        self.domain_user = User(
+            id=1,
+            username="testuser",
+            email="test@example.com",
+            password="hashed_password",
+            cpf="12345678901"
+        )
+
+        self.db_user = Mock(spec=SQLAlchemyUser)
+        self.db_user.id = 1
+        self.db_user.username = "testuser"
+        self.db_user.email = "test@example.com"
+        self.db_user.password = "hashed_password"
+        self.db_user.cpf = "12345678901"
+
+    def test_add_user(self):
+        """Test that adding a user awaits one INSERT ... RETURNING id and the commit."""
+        # Arrange
+        self.mock_session.scalar.return_value = 7
+
+        # Act
+        result = asyncio.run(self.repository.add(self.domain_user))
+
+        # Assert
+        statement = self.mock_session.scalar.call_args.args[0]
+        assert statement.compile().params["cpf_index"] == get_cpf_blind_index("12345678901")
+        self.mock_session.commit.assert_awaited_once()
+        self.mock_session.refresh.assert_not_called()
+        assert result.id == 7
+
+    def test_add_user_conflict(self):
+        """Test that a unique violation is rolled back and reported with its field."""
+        # Arrange
+        self.mock_session.rollback = AsyncMock()
+        self.mock_session.scalar.side_effect = IntegrityError(
+            "INSERT", {}, Exception("UNIQUE constraint failed: users.cpf_index")
+        )
+
+        # Act & Assert
+        with pytest.raises(UserAlreadyExistsError) as exc_info:
+            asyncio.run(self.repository.add(self.domain_user))
+        assert exc_info.value.field == "cpf"
+        self.mock_session.rollback.assert_awaited_once()
+
+    def test_get_by_id_found(self):
+        """Test retrieving a user by ID when found."""
+        # Arrange
+        self.mock_session.scalar.return_value = self.db_user
+
+        # Act
+        result = asyncio.run(self.repository.get_by_id(1))
+
+        # Assert
+        self.mock_session.scalar.assert_awaited_once()
+        assert isinstance(result, User)
+        assert result.username == "testuser"
+
+    def test_get_by_cpf_not_found(self):
+        """Test that a CPF lookup without a match returns None."""
+        # Arrange
+        self.mock_session.scalar.return_value = None
+
+        # Act
+        result = asyncio.run(self.repository.get_by_cpf("12345678901"))
+
+        # Assert
+        statement = self.mock_session.scalar.call_args.args[0]
+        assert "users.cpf_index" in str(statement)
+        assert result is None
+
+    def test_list_users(self):
+        """Test listing users maps every row to the domain entity."""
+        # Arrange
+        scalars = Mock()
+        scalars.all.return_value = [self.db_user]
+        self.mock_session.scalars = AsyncMock(return_value=scalars)
+
+        # Act
+        result = asyncio.run(self.repository.list_users(10, 0))
+
+        # Assert
+        assert [user.id for user in result] == [1]
+
+    def test_update_fields_issues_single_update(self):
+        """Test that a partial update is one awaited UPDATE plus commit."""
+        # Act
+        asyncio.run(self.repository.update_fields(1, {"cpf": "98765432100"}))
+
+        # Assert
+        statement = self.mock_session.execute.call_args.args[0]
+        assert set(statement.compile().params) >= {"cpf", "cpf_index", "id_1"}
+        self.mock_session.commit.assert_awaited_once()
+
+    def test_update_fields_conflict(self):
+        """Test that a unique violation on a partial update is reported with its field."""
+        # Arrange
+        self.mock_session.rollback = AsyncMock()
+        self.mock_session.execute.side_effect = IntegrityError(
+            "UPDATE", {}, Exception("UNIQUE constraint failed: users.email")
+        )
+
+        # Act & Assert
+        with pytest.raises(UserAlreadyExistsError) as exc_info:
+            asyncio.run(self.repository.update_fields(1, {"email": "taken@example.com"}))
+        assert exc_info.value.field == "email"
+        self.mock_session.rollback.assert_awaited_once()
+
+    def test_update_returns_row_from_single_statement(self):
+        """Test that an update awaits one UPDATE ... RETURNING and maps the row."""
+        # Arrange
+        self.mock_session.scalar.return_value = self.db_user
+
+        # Act
+        result = asyncio.run(self.repository.update(self.domain_user))
+
+        # Assert
+        assert "RETURNING" in str(self.mock_session.scalar.call_args.args[0])
+        self.mock_session.refresh.assert_not_called()
+        assert result.id == 1
+
+    def test_update_conflict(self):
+        """Test that a unique violation on an update is reported with its field."""
+        # Arrange
+        self.mock_session.rollback = AsyncMock()
+        self.mock_session.scalar.side_effect = IntegrityError(
+            "UPDATE", {}, Exception("UNIQUE constraint failed: users.username")
+        )
+
+        # Act & Assert
+        with pytest.raises(UserAlreadyExistsError) as exc_info:
+            asyncio.run(self.repository.update(self.domain_user))
+        assert exc_info.value.field == "username"
+        self.mock_session.rollback.assert_awaited_once()
+
+    def test_delete_existing_user(self):
+        """Test that deleting an existing user is one DELETE ... RETURNING id."""
+        # Arrange
+        self.mock_session.scalar.return_value = 1
+
+        # Act
+        result = asyncio.run(self.repository.delete(1))
+
+        # Assert
+        assert "RETURNING users.id" in str(self.mock_session.scalar.call_args.args[0])
+        self.mock_session.delete.assert_not_called()
+        self.mock_session.commit.assert_awaited_once()
+        assert result is True
@@ -2,7 +2,10 @@
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from tech.domain.entities.users import User
+from tech.domain.exceptions import UserAlreadyExistsError
+from tech.domain.security import get_cpf_blind_index
 from tech.infra.repositories.sql_alchemy_user_repository import SQLAlchemyUserRepository
 from tech.infra.repositories.sql_alchemy_models import SQLAlchemyUser
 
@@ -45,27 +48,52 @@ class TestSQLAlchemyUserRepository:
         assert domain_user.password == self.db_user.password
         assert domain_user.cpf == self.db_user.cpf
 
-    @patch('tech.infra.repositories.sql_alchemy_user_repository.SQLAlchemyUser')
-    def test_add_user(self, mock_user_class):
-        """Test adding a new user to the database."""
+    def test_add_user(self):
+        """Test that adding a user is a single INSERT ... RETURNING id without refresh."""
         # Arrange
-        mock_user_class.return_value = self.db_user
+        self.mock_session.scalar.return_value = 7
 
         # Act
         result = self.repository.add(self.domain_user)
 
         # Assert
-        # Check that SQLAlchemyUser was instantiated with correct parameters
-        mock_user_class.assert_called_once()
-
-        # Check repository operations
-        self.mock_session.add.assert_called_once_with(self.db_user)
+        statement = self.mock_session.scalar.call_args.args[0]
+        assert str(statement).startswith("INSERT INTO users")
+        assert "RETURNING users.id" in str(statement)
+        params = statement.compile().params
+        assert params["cpf_index"] == get_cpf_blind_index("12345678901")
+        assert "id" not in params
+
+        self.mock_session.add.assert_not_called()
         self.mock_session.commit.assert_called_once()
-        self.mock_session.refresh.assert_called_once_with(self.db_user)
-
-        # Check the result
+        self.mock_session.refresh.assert_not_called()
         assert result == self.domain_user
-        assert result.id == self.db_user.id  # ID should be updated
+        assert result.id == 7
+
+    def test_add_user_maps_unique_violation_to_field(self):
+        """Test that a unique violation becomes UserAlreadyExistsError naming the field."""
+        # Arrange
+        self.mock_session.scalar.side_effect = IntegrityError(
+            "INSERT", {}, Exception("UNIQUE constraint failed: users.email")
+        )
+
+        # Act & Assert
+        with pytest.raises(UserAlreadyExistsError) as exc_info:
+            self.repository.add(self.domain_user)
+        assert exc_info.value.field == "email"
+        self.mock_session.rollback.assert_called_once()
+        self.mock_session.commit.assert_not_called()
+
+    def test_add_user_reraises_other_integrity_errors(self):
+        """Test that integrity errors unrelated to uniqueness are not masked."""
+        # Arrange
+        error = IntegrityError("INSERT", {}, Exception("NOT NULL constraint failed: users.password"))
+        self.mock_session.scalar.side_effect = error
+
+        # Act & Assert
+        with pytest.raises(IntegrityError):
+            self.repository.add(self.domain_user)
+        self.mock_session.rollback.assert_called_once()
 
     def test_get_by_id_found(self):
         """Test retrieving a user by ID when found."""
@@ -84,6 +112,19 @@ class TestSQLAlchemyUserRepository:
         self.mock_session.scalar.assert_called_once()
         # The 'select' instance check is removed as it causes TypeError
 
+    def test_get_by_id_for_update_locks_row(self):
+        """Test that the row is read with SELECT ... FOR UPDATE."""
+        # Arrange
+        self.mock_session.scalar.return_value = self.db_user
+
+        # Act
+        result = self.repository.get_by_id_for_update(1)
+
+        # Assert
+        assert result.id == 1
+        statement = self.mock_session.scalar.call_args[0][0]
+        assert statement._for_update_arg is not None
+
     def test_get_by_id_not_found(self):
         """Test retrieving a user by ID when not found."""
         # Arrange
@@ -146,6 +187,11 @@ class TestSQLAlchemyUserRepository:
         assert result.id == 1
         assert result.cpf == "12345678901"
 
+        # The lookup goes through the blind index, never the plain CPF
+        statement = self.mock_session.scalar.call_args[0][0]
+        assert "users.cpf_index = :cpf_index_1" in str(statement)
+        assert statement.compile().params["cpf_index_1"] == get_cpf_blind_index("12345678901")
+
         # Verify select query
         self.mock_session.scalar.assert_called_once()
         # The 'select' instance check is removed as it causes TypeError
@@ -162,6 +208,41 @@ class TestSQLAlchemyUserRepository:
         assert result is None
         self.mock_session.scalar.assert_called_once()
 
+    def test_get_by_ids_single_query(self):
+        """Test that many IDs are resolved with one IN query."""
+        # Arrange
+        self.mock_session.scalars.return_value = [self.db_user]
+
+        # Act
+        result = self.repository.get_by_ids([1, 2])
+
+        # Assert
+        assert [user.id for user in result] == [1]
+        statement = self.mock_session.scalars.call_args[0][0]
+        assert "users.id IN" in str(statement)
+        self.mock_session.scalars.assert_called_once()
+
+    def test_get_by_cpfs_uses_blind_indexes(self):
+        """Test that many CPFs are resolved through their blind indexes."""
+        # Arrange
+        self.mock_session.scalars.return_value = [self.db_user]
+
+        # Act
+        result = self.repository.get_by_cpfs(["12345678901", "99999999999"])
+
+        # Assert
+        assert [user.cpf for user in result] == ["12345678901"]
+        statement = self.mock_session.scalars.call_args[0][0]
+        assert "users.cpf_index IN" in str(statement)
+        params = statement.compile(compile_kwargs={"render_postcompile": True}).params
+        assert get_cpf_blind_index("12345678901") in params.values()
+
+    def test_get_by_ids_empty(self):
+        """Test that an empty batch does not query the database."""
+        assert self.repository.get_by_ids([]) == []
+        assert self.repository.get_by_cpfs([]) == []
+        self.mock_session.scalars.assert_not_called()
+
     def test_list_users(self):
         """Test listing users with pagination."""
         # Arrange
@@ -191,12 +272,95 @@ class TestSQLAlchemyUserRepository:
         self.mock_session.scalars.assert_called_once()
         # The 'select' instance check is removed as it causes TypeError
 
+    def test_list_users_orders_by_id(self):
+        """Test that offset pagination is ordered by primary key."""
+        # Arrange
+        self.mock_session.scalars.return_value.all.return_value = []
+
+        # Act
+        self.repository.list_users(limit=10, skip=20)
+
+        # Assert
+        sql = str(self.mock_session.scalars.call_args.args[0])
+        assert "ORDER BY users.id" in sql
+        assert "OFFSET" in sql
+
+    def test_list_users_after_uses_keyset(self):
+        """Test that cursor pagination is a range on the primary key without OFFSET."""
+        # Arrange
+        self.mock_session.scalars.return_value.all.return_value = [self.db_user]
+
+        # Act
+        result = self.repository.list_users_after(after_id=100, limit=5)
+
+        # Assert
+        statement = self.mock_session.scalars.call_args.args[0]
+        sql = str(statement)
+        assert "WHERE users.id >" in sql
+        assert "ORDER BY users.id" in sql
+        assert "OFFSET" not in sql
+        assert statement.compile().params["id_1"] == 100
+        assert [user.id for user in result] == [1]
+
+    def test_list_users_after_first_page(self):
+        """Test that the first page has no lower bound."""
+        # Arrange
+        self.mock_session.scalars.return_value.all.return_value = []
+
+        # Act
+        self.repository.list_users_after(after_id=None, limit=5)
+
+        # Assert
+        assert "WHERE" not in str(self.mock_session.scalars.call_args.args[0])
+
+    def test_count_users(self):
+        """Test that the exact count is a single count(*)."""
+        # Arrange
+        self.mock_session.scalar.return_value = 12
+
+        # Act
+        result = self.repository.count_users()
+
+        # Assert
+        assert "count(*)" in str(self.mock_session.scalar.call_args.args[0])
+        assert result == 12
+
+    def test_estimate_user_count_on_postgres(self):
+        """Test that the estimate reads pg_class.reltuples."""
+        # Arrange
+        self.mock_session.bind.dialect.name = "postgresql"
+        self.mock_session.scalar.return_value = 1234567.0
+
+        # Act
+        result = self.repository.estimate_user_count()
+
+        # Assert
+        assert "pg_class" in str(self.mock_session.scalar.call_args.args[0])
+        assert result == 1234567
+
+    def test_estimate_user_count_never_analyzed(self):
+        """Test that tables without statistics (reltuples = -1) give no estimate."""
+        # Arrange
+        self.mock_session.bind.dialect.name = "postgresql"
+        self.mock_session.scalar.return_value = -1.0
+
+        # Act & Assert
+        assert self.repository.estimate_user_count() is None
+
+    def test_estimate_user_count_other_databases(self):
+        """Test that non-PostgreSQL databases give no estimate."""
+        # Arrange
+        self.mock_session.bind.dialect.name = "sqlite"
+
+        # Act & Assert
+        assert self.repository.estimate_user_count() is None
+        self.mock_session.scalar.assert_not_called()
+
     def test_update_user_found(self):
-        """Test updating a user when found."""
+        """Test that an update is a single UPDATE ... RETURNING without load or refresh."""
         # Arrange
+        self.db_user.username = "updated_user"
         self.mock_session.scalar.return_value = self.db_user
-
-        # Update the domain user
         updated_user = User(
             id=1,
             username="updated_user",
@@ -209,22 +373,24 @@ class TestSQLAlchemyUserRepository:
         result = self.repository.update(updated_user)
 
         # Assert
-        # Check the db_user was updated correctly
-        assert self.db_user.username == "updated_user"
-        assert self.db_user.email == "updated@example.com"
-        assert self.db_user.password == "new_password"
-        assert self.db_user.cpf == "12345678901"
+        statement = self.mock_session.scalar.call_args.args[0]
+        sql = str(statement)
+        assert sql.startswith("UPDATE users SET")
+        assert "RETURNING" in sql
+        params = statement.compile().params
+        assert params["username"] == "updated_user"
+        assert params["password"] == "new_password"
+        assert params["cpf_index"] == get_cpf_blind_index("12345678901")
+        assert params["id_1"] == 1
 
-        # Check repository operations
         self.mock_session.scalar.assert_called_once()
         self.mock_session.commit.assert_called_once()
-        self.mock_session.refresh.assert_called_once_with(self.db_user)
-
-        # Check the result
-        assert result == updated_user
+        self.mock_session.refresh.assert_not_called()
+        assert isinstance(result, User)
+        assert result.username == "updated_user"
 
     def test_update_user_not_found(self):
-        """Test updating a user when not found."""
+        """Test that an update matching no row returns None."""
         # Arrange
         self.mock_session.scalar.return_value = None
 
@@ -233,32 +399,137 @@ class TestSQLAlchemyUserRepository:
 
         # Assert
         self.mock_session.scalar.assert_called_once()
-        self.mock_session.commit.assert_not_called()
         self.mock_session.refresh.assert_not_called()
-        assert result == self.domain_user  # Should return the original user
+        assert result is None
+
+    def test_update_user_maps_unique_violation_to_field(self):
+        """Test that an update taking another user's CPF is reported as a conflict."""
+        # Arrange
+        self.mock_session.scalar.side_effect = IntegrityError(
+            "UPDATE", {}, Exception("UNIQUE constraint failed: users.cpf_index")
+        )
+
+        # Act & Assert
+        with pytest.raises(UserAlreadyExistsError) as exc_info:
+            self.repository.update(self.domain_user)
+        assert exc_info.value.field == "cpf"
+        self.mock_session.rollback.assert_called_once()
+        self.mock_session.commit.assert_not_called()
 
     def test_delete_user_found(self):
-        """Test deleting a user when found."""
+        """Test that a delete is a single DELETE ... RETURNING id."""
         # Arrange
-        self.mock_session.scalar.return_value = self.db_user
+        self.mock_session.scalar.return_value = 1
 
         # Act
-        self.repository.delete(self.domain_user)
+        result = self.repository.delete(1)
 
         # Assert
-        self.mock_session.scalar.assert_called_once()
-        self.mock_session.delete.assert_called_once_with(self.db_user)
+        statement = self.mock_session.scalar.call_args.args[0]
+        assert str(statement).startswith("DELETE FROM users WHERE users.id =")
+        assert "RETURNING users.id" in str(statement)
+        self.mock_session.delete.assert_not_called()
         self.mock_session.commit.assert_called_once()
+        assert result is True
 
     def test_delete_user_not_found(self):
-        """Test deleting a user when not found."""
+        """Test that a delete matching no row returns False."""
         # Arrange
         self.mock_session.scalar.return_value = None
 
         # Act
-        self.repository.delete(self.domain_user)
+        result = self.repository.delete(999)
 
         # Assert
         self.mock_session.scalar.assert_called_once()
-        self.mock_session.delete.assert_not_called()
-        self.mock_session.commit.assert_not_called()
\ No newline at end of file
+        assert result is False
+
+    def test_get_password_hash(self):
+        """Test that only the password column is read."""
+        # Arrange
+        self.mock_session.scalar.return_value = "stored_hash"
+
+        # Act
+        result = self.repository.get_password_hash(1)
+
+        # Assert
+        statement = self.mock_session.scalar.call_args.args[0]
+        assert str(statement).startswith("SELECT users.password \nFROM users")
+        assert result == "stored_hash"
+
+    def test_update_password_replaces_stale_hash(self):
+        """Test that only the password column of a row still holding the stale hash is written."""
+        # Arrange
+        self.mock_session.scalar.return_value = 1
+
+        # Act
+        result = self.repository.update_password(1, "stale_hash", "new_hash")
+
+        # Assert
+        statement = self.mock_session.scalar.call_args.args[0]
+        params = statement.compile().params
+        assert set(params) == {"password", "updated_at", "id_1", "password_1"}
+        assert (params["password_1"], params["password"]) == ("stale_hash", "new_hash")
+        self.mock_session.commit.assert_called_once()
+        self.mock_session.refresh.assert_not_called()
+        assert result is True
+
+    def test_update_password_skips_changed_hash(self):
+        """Test that a hash changed since it was read is not overwritten."""
+        # Arrange
+        self.mock_session.scalar.return_value = None
+
+        # Act
+        result = self.repository.update_password(1, "stale_hash", "new_hash")
+
+        # Assert
+        assert result is False
+
+    def test_count_legacy_password_hashes(self):
+        """Test counting hashes that do not use the current parameters."""
+        # Arrange
+        self.mock_session.scalar.return_value = 3
+
+        # Act
+        result = self.repository.count_legacy_password_hashes("$argon2id$v=19$m=19456,t=2,p=1$")
+
+        # Assert
+        assert result == 3
+        statement = self.mock_session.scalar.call_args[0][0]
+        assert "users.password NOT LIKE" in str(statement)
+
+    def test_update_fields_writes_only_changed_columns(self):
+        """Test that a partial update writes only the given columns in one statement."""
+        # Act
+        self.repository.update_fields(1, {"email": "new@example.com"})
+
+        # Assert
+        statement = self.mock_session.execute.call_args[0][0]
+        assert set(statement.compile().params) == {"email", "updated_at", "id_1"}
+        self.mock_session.commit.assert_called_once()
+        self.mock_session.scalar.assert_not_called()
+        self.mock_session.refresh.assert_not_called()
+
+    def test_update_fields_maps_unique_violation_to_field(self):
+        """Test that taking another user's username is reported as a conflict."""
+        # Arrange
+        self.mock_session.execute.side_effect = IntegrityError(
+            "UPDATE", {}, Exception("UNIQUE constraint failed: users.username")
+        )
+
+        # Act & Assert
+        with pytest.raises(UserAlreadyExistsError) as exc_info:
+            self.repository.update_fields(1, {"username": "taken"})
+        assert exc_info.value.field == "username"
+        self.mock_session.rollback.assert_called_once()
+        self.mock_session.commit.assert_not_called()
+
+    def test_update_fields_keeps_cpf_index_in_sync(self):
+        """Test that changing the CPF also updates its blind index."""
+        # Act
+        self.repository.update_fields(1, {"cpf": "98765432101"})
+
+        # Assert
+        params = self.mock_session.execute.call_args[0][0].compile().params
+        assert params["cpf"] == "98765432101"
+        assert params["cpf_index"] == get_cpf_blind_index("98765432101")
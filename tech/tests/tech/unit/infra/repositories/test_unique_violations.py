@@ -0,0 +1,80 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from tech.domain.entities.users import User
+from tech.domain.exceptions import UserAlreadyExistsError
+from tech.infra.repositories.sql_alchemy_models import table_registry
+from tech.infra.repositories.sql_alchemy_user_repository import SQLAlchemyUserRepository
+from tech.infra.repositories.unique_violations import conflicting_field
+
+
+class FakeDiag:
+    def __init__(self, constraint_name):
+        self.constraint_name = constraint_name
+
+
+class FakePostgresError(Exception):
+    def __init__(self, constraint_name, message=""):
+        super().__init__(message)
+        self.diag = FakeDiag(constraint_name)
+
+
+class TestConflictingField:
+    """Unit tests for mapping unique violations to user fields."""
+
+    @pytest.mark.parametrize("constraint, field", [
+        ("users_username_key", "username"),
+        ("users_email_key", "email"),
+        ("uq_users_cpf", "cpf"),
+        ("ix_users_cpf_index", "cpf"),
+    ])
+    def test_postgres_constraint_names(self, constraint, field):
+        """Test that PostgreSQL constraint names are mapped to fields."""
+        error = IntegrityError("INSERT", {}, FakePostgresError(constraint))
+
+        assert conflicting_field(error) == field
+
+    def test_postgres_detail_fallback(self):
+        """Test that the Key (column)= detail is used for unknown constraint names."""
+        error = IntegrityError(
+            "INSERT", {}, FakePostgresError("custom_name", "DETAIL:  Key (email)=(a@b.c) already exists.")
+        )
+
+        assert conflicting_field(error) == "email"
+
+    def test_other_violations_are_not_mapped(self):
+        """Test that non-unique integrity errors are not mapped."""
+        error = IntegrityError("INSERT", {}, Exception("NOT NULL constraint failed: users.password"))
+
+        assert conflicting_field(error) is None
+
+
+class TestAddConflictsOnSQLite:
+    """Checks the single-INSERT creation path against a real SQLite database."""
+
+    def setup_method(self):
+        engine = create_engine("sqlite://")
+        table_registry.metadata.create_all(engine)
+        self.session = Session(engine)
+        self.repository = SQLAlchemyUserRepository(self.session)
+        self.repository.add(User(username="taken", email="taken@example.com",
+                                 password="hash", cpf="12345678901"))
+
+    def teardown_method(self):
+        self.session.close()
+
+    @pytest.mark.parametrize("username, email, cpf, field", [
+        ("taken", "new@example.com", "10987654321", "username"),
+        ("new", "taken@example.com", "10987654321", "email"),
+        ("new", "new@example.com", "12345678901", "cpf"),
+    ])
+    def test_conflicting_field_is_reported(self, username, email, cpf, field):
+        """Test that each duplicated field is reported and the session stays usable."""
+        with pytest.raises(UserAlreadyExistsError) as exc_info:
+            self.repository.add(User(username=username, email=email, password="hash", cpf=cpf))
+
+        assert exc_info.value.field == field
+        created = self.repository.add(User(username="other", email="other@example.com",
+                                           password="hash", cpf="11111111111"))
+        assert created.id == 2
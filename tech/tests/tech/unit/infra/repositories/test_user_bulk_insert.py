@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+from tech.domain.entities.users import User
+from tech.infra.repositories.sql_alchemy_models import SQLAlchemyUser, table_registry
+from tech.infra.repositories.sql_alchemy_user_repository import SQLAlchemyUserRepository
+from tech.infra.repositories.user_bulk_insert import insert_users
+
+
+def make_user(name, cpf, email=None):
+    return User(username=name, password="hash", cpf=cpf, email=email or f"{name}@example.com")
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    table_registry.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+class TestInsertUsers:
+    """Unit tests for the staged bulk insert, against a real SQLite database."""
+
+    def test_inserts_every_new_user(self, session):
+        """Test that new users are inserted and get their IDs."""
+        users = [make_user(f"user{i}", f"1234567890{i}") for i in range(3)]
+
+        conflicts = insert_users(session, users)
+
+        assert conflicts == [None, None, None]
+        assert [user.id for user in users] == [1, 2, 3]
+        assert session.scalar(select(func.count()).select_from(SQLAlchemyUser)) == 3
+
+    def test_reports_conflicting_field_per_row(self, session):
+        """Test conflicts with existing users and with earlier rows of the batch."""
+        # Arrange
+        insert_users(session, [make_user("taken", "11111111111")])
+        users = [
+            make_user("taken", "22222222222", "other@example.com"),
+            make_user("fresh", "33333333333", "taken@example.com"),
+            make_user("cpf", "11111111111"),
+            make_user("first", "44444444444"),
+            make_user("first", "55555555555", "second@example.com"),
+        ]
+
+        # Act
+        conflicts = insert_users(session, users)
+
+        # Assert
+        assert conflicts == ["username", "email", "cpf", None, "username"]
+        assert [user.id for user in users] == [None, None, None, 2, None]
+
+    def test_empty_batch(self, session):
+        """Test that an empty batch does not touch the database."""
+        assert insert_users(session, []) == []
+
+    def test_repository_commits_batch(self, session):
+        """Test that the repository commits the merged batch."""
+        repository = SQLAlchemyUserRepository(session)
+
+        assert repository.add_many([make_user("user", "12345678901")]) == [None]
+        session.rollback()
+        assert session.scalar(select(func.count()).select_from(SQLAlchemyUser)) == 1
@@ -0,0 +1,51 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from tech.domain.security import get_cpf_blind_index
+from tech.infra.repositories.sql_alchemy_models import SQLAlchemyUser, table_registry
+from tech.infra.repositories.user_loader import UserLoader
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    table_registry.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(SQLAlchemyUser).values(
+            username="user", email="user@example.com", password="hash",
+            cpf="12345678901", cpf_index=get_cpf_blind_index("12345678901")
+        ))
+    return engine
+
+
+class TestUserLoader:
+    """Unit tests for the user lookup batcher, against a real SQLite database."""
+
+    def test_lookups_by_id_and_cpf(self, engine):
+        """Test that both kinds of lookup resolve through their batch queries."""
+        loader = UserLoader(lambda: Session(engine), window=0.01)
+
+        assert loader.get_by_id(1).username == "user"
+        assert loader.get_by_id(2) is None
+        assert loader.get_by_cpf("12345678901").id == 1
+        assert loader.stats()["by_cpf"]["batches"] == 1
+
+    def test_formatted_cpf_finds_stored_digits(self, engine):
+        """Test that a CPF with punctuation matches the user as the unbatched lookup does."""
+        loader = UserLoader(lambda: Session(engine), window=0.01)
+
+        assert loader.get_by_cpf("123.456.789-01").id == 1
+
+    def test_callers_get_their_own_copy(self, engine):
+        """Test that de-duplicated callers cannot see each other's changes."""
+        loader = UserLoader(lambda: Session(engine), window=0.1)
+
+        with ThreadPoolExecutor(2) as pool:
+            first, second = pool.map(loader.get_by_id, [1, 1])
+
+        first.email = "changed@example.com"
+        assert second.email == "user@example.com"
+        assert loader.stats()["by_id"]["batches"] == 1
@@ -0,0 +1,97 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from tech.infra.batch_loader import AsyncBatchLoader, BatchLoader
+
+
+class TestBatchLoader:
+    """Unit tests for the thread-based lookup batcher."""
+
+    def setup_method(self):
+        self.calls = []
+
+    def load_many(self, keys):
+        self.calls.append(sorted(keys))
+        return {key: key * 10 for key in keys if key != 0}
+
+    def test_concurrent_lookups_share_one_batch(self):
+        """Test that lookups in the same window run one query, de-duplicated."""
+        loader = BatchLoader(self.load_many, window=0.2, max_batch=100)
+
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(loader.load, [1, 2, 1, 3, 0, 2, 3, 1]))
+
+        assert results == [10, 20, 10, 30, None, 20, 30, 10]
+        assert self.calls == [[0, 1, 2, 3]]
+        stats = loader.stats()
+        assert (stats["batches"], stats["keys"], stats["deduplicated"]) == (1, 4, 4)
+        assert stats["window_wait"]["count"] == 1
+
+    def test_full_batch_is_sent_early(self):
+        """Test that reaching max_batch distinct keys skips the rest of the window."""
+        loader = BatchLoader(self.load_many, window=5, max_batch=2)
+
+        with ThreadPoolExecutor(2) as pool:
+            assert list(pool.map(loader.load, [1, 2])) == [10, 20]
+
+        assert loader.stats()["window_wait"]["max_ms"] < 5000
+
+    def test_failure_reaches_every_caller(self):
+        """Test that a failed batch raises in each waiting caller."""
+        def broken(keys):
+            raise RuntimeError("database down")
+
+        loader = BatchLoader(broken, window=0.05)
+
+        with ThreadPoolExecutor(2) as pool:
+            futures = [pool.submit(loader.load, key) for key in (1, 2)]
+            for future in futures:
+                with pytest.raises(RuntimeError, match="database down"):
+                    future.result()
+        assert loader.stats()["failed_batches"] == 1
+
+    def test_in_flight_key_is_shared(self):
+        """Test that a key already being loaded is not queried again."""
+        started, release = threading.Event(), threading.Event()
+
+        def slow(keys):
+            self.calls.append(sorted(keys))
+            started.set()
+            release.wait(5)
+            return {key: key for key in keys}
+
+        loader = BatchLoader(slow, window=0, max_batch=100)
+        with ThreadPoolExecutor(2) as pool:
+            first = pool.submit(loader.load, 7)
+            started.wait(5)
+            second = pool.submit(loader.load, 7)
+            release.set()
+            assert (first.result(), second.result()) == (7, 7)
+
+        assert self.calls == [[7]]
+        assert loader.stats()["deduplicated"] == 1
+
+
+class TestAsyncBatchLoader:
+    """Unit tests for the asyncio lookup batcher."""
+
+    def test_concurrent_lookups_share_one_batch(self):
+        """Test that concurrent awaits in the same window run one query."""
+        calls = []
+
+        async def load_many(keys):
+            calls.append(sorted(keys))
+            return {key: str(key) for key in keys}
+
+        async def run():
+            loader = AsyncBatchLoader(load_many, window=0.01, max_batch=3)
+            results = await asyncio.gather(*(loader.load(key) for key in [1, 2, 2, 3, 4]))
+            return results, loader.stats()
+
+        results, stats = asyncio.run(run())
+
+        assert results == ["1", "2", "2", "3", "4"]
+        assert calls == [[1, 2, 3], [4]]
+        assert (stats["batches"], stats["deduplicated"], stats["max_batch_size"]) == (2, 1, 3)
@@ -0,0 +1,27 @@
+from tech.infra.metrics import LatencyWindow, percentile
+
+
+class TestLatencyWindow:
+    """Unit tests for the latency helpers."""
+
+    def test_percentile_nearest_rank(self):
+        """Test nearest-rank percentiles over a sorted sequence."""
+        samples = [0.1, 0.2, 0.3, 0.4]
+
+        assert percentile(samples, 0.5) == 0.2
+        assert percentile(samples, 0.99) == 0.4
+        assert percentile([], 0.5) == 0.0
+
+    def test_snapshot_uses_recent_window(self):
+        """Test that totals cover every sample but percentiles only the window."""
+        window = LatencyWindow(size=2)
+        window.record(0.001)
+        window.record(0.002)
+        window.record(0.003)
+
+        snapshot = window.snapshot()
+
+        assert snapshot["count"] == 3
+        assert snapshot["avg_ms"] == 2.0
+        assert snapshot["p50_ms"] == 2.0
+        assert snapshot["max_ms"] == 3.0
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+from unittest.mock import Mock
+from fastapi import HTTPException
+from tech.interfaces.controllers.async_user_controller import AsyncUserController
+from tech.use_cases.users.create_user_use_case import AsyncCreateUserUseCase
+from tech.use_cases.users.list_users_use_case import AsyncListUsersUseCase
+from tech.use_cases.users.get_user_use_case import AsyncGetUserUseCase
+from tech.use_cases.users.get_user_by_cpf_use_case import AsyncGetUserByCpfUseCase
+from tech.use_cases.users.update_user_use_case import AsyncUpdateUserUseCase
+from tech.use_cases.users.delete_user_use_case import AsyncDeleteUserUseCase
+from tech.use_cases.users.patch_user_use_case import AsyncPatchUserUseCase
+from tech.interfaces.schemas.user_schema import UserSchema
+from tech.domain.entities.users import User
+
+
+class TestAsyncUserController:
+    def setup_method(self):
+        self.create_user_use_case = Mock(spec=AsyncCreateUserUseCase)
+        self.list_users_use_case = Mock(spec=AsyncListUsersUseCase)
+        self.get_user_use_case = Mock(spec=AsyncGetUserUseCase)
+        self.get_user_by_cpf_use_case = Mock(spec=AsyncGetUserByCpfUseCase)
+        self.update_user_use_case = Mock(spec=AsyncUpdateUserUseCase)
+        self.delete_user_use_case = Mock(spec=AsyncDeleteUserUseCase)
+        self.patch_user_use_case = Mock(spec=AsyncPatchUserUseCase)
+
+        self.controller = AsyncUserController(
+            self.create_user_use_case,
+            self.list_users_use_case,
+            self.get_user_use_case,
+            self.get_user_by_cpf_use_case,
+            self.update_user_use_case,
+            self.delete_user_use_case,
+            self.patch_user_use_case
+        )
+
+        self.user = User(
+            id=1,
+            username="testuser",
+            email="test@example.com",
+            password="hashed_password",
+            cpf="12345678901"
+        )
+
+    def test_create_user_success(self):
+        # Arrange
+        self.create_user_use_case.execute.return_value = self.user
+        user_data = UserSchema(
+            username="testuser",
+            email="test@example.com",
+            password="password123",
+            cpf="12345678901"
+        )
+
+        # Act
+        result = asyncio.run(self.controller.create_user(user_data))
+
+        # Assert
+        self.create_user_use_case.execute.assert_awaited_once_with(user_data)
+        assert result["id"] == 1
+        assert "password" not in result
+
+    def test_get_user_not_found(self):
+        # Arrange
+        self.get_user_use_case.execute.side_effect = ValueError("User not found")
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(self.controller.get_user(99))
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "User not found"
+
+    def test_delete_user_success(self):
+        # Arrange
+        self.delete_user_use_case.execute.return_value = {"message": "User deleted"}
+
+        # Act
+        result = asyncio.run(self.controller.delete_user(1))
+
+        # Assert
+        assert result == {"message": "User deleted"}
@@ -8,8 +8,14 @@ from tech.use_cases.users.get_user_use_case import GetUserUseCase
 from tech.use_cases.users.get_user_by_cpf_use_case import GetUserByCpfUseCase
 from tech.use_cases.users.update_user_use_case import UpdateUserUseCase
 from tech.use_cases.users.delete_user_use_case import DeleteUserUseCase
-from tech.interfaces.schemas.user_schema import UserSchema
+from tech.use_cases.users.patch_user_use_case import PatchUserUseCase
+from tech.use_cases.users.count_users_use_case import CountUsersUseCase
+from tech.use_cases.users.export_users_use_case import ExportUsersUseCase
+from tech.use_cases.users.bulk_import_users_use_case import BulkImportUsersUseCase
+from tech.use_cases.users.get_users_batch_use_case import GetUsersBatchUseCase
+from tech.interfaces.schemas.user_schema import UserBatchSchema, UserPatchSchema, UserSchema
 from tech.domain.entities.users import User
+from tech.domain.exceptions import UserAlreadyExistsError
 
 
 class TestUserController:
@@ -21,6 +27,11 @@ class TestUserController:
         self.get_user_by_cpf_use_case = Mock(spec=GetUserByCpfUseCase)
         self.update_user_use_case = Mock(spec=UpdateUserUseCase)
         self.delete_user_use_case = Mock(spec=DeleteUserUseCase)
+        self.patch_user_use_case = Mock(spec=PatchUserUseCase)
+        self.count_users_use_case = Mock(spec=CountUsersUseCase)
+        self.export_users_use_case = Mock(spec=ExportUsersUseCase)
+        self.bulk_import_users_use_case = Mock(spec=BulkImportUsersUseCase)
+        self.get_users_batch_use_case = Mock(spec=GetUsersBatchUseCase)
 
         self.controller = UserController(
             self.create_user_use_case,
@@ -28,7 +39,12 @@ class TestUserController:
             self.get_user_use_case,
             self.get_user_by_cpf_use_case,
             self.update_user_use_case,
-            self.delete_user_use_case
+            self.delete_user_use_case,
+            self.patch_user_use_case,
+            self.count_users_use_case,
+            self.export_users_use_case,
+            self.bulk_import_users_use_case,
+            self.get_users_batch_use_case
         )
 
         # Mock de usuário para testes
@@ -61,6 +77,110 @@ class TestUserController:
         mock_present_user.assert_called_once_with(self.mock_user)
         assert result == expected_response
 
+    def test_list_users_page(self):
+        # Arrange
+        self.list_users_use_case.execute_cursor.return_value = ([self.mock_user], "next")
+
+        # Act
+        result = self.controller.list_users_page(10, "")
+
+        # Assert
+        self.list_users_use_case.execute_cursor.assert_called_once_with("", 10)
+        assert result == {
+            "items": [{"id": 1, "username": "testuser", "email": "test@example.com", "cpf": "12345678901"}],
+            "next_cursor": "next",
+        }
+
+    def test_list_users_page_invalid_cursor(self):
+        # Arrange
+        self.list_users_use_case.execute_cursor.side_effect = ValueError("Invalid cursor")
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            self.controller.list_users_page(10, "garbage")
+        assert exc_info.value.status_code == 400
+
+    def test_count_users(self):
+        # Arrange
+        self.count_users_use_case.execute.return_value = {"count": 5, "exact": True}
+
+        # Act
+        result = self.controller.count_users("exact")
+
+        # Assert
+        self.count_users_use_case.execute.assert_called_once_with("exact")
+        assert result == {"count": 5, "exact": True}
+
+    def test_count_users_invalid_mode(self):
+        # Arrange
+        self.count_users_use_case.execute.side_effect = ValueError("Invalid count mode: fast")
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            self.controller.count_users("fast")
+        assert exc_info.value.status_code == 400
+
+    def test_export_users(self):
+        # Arrange
+        self.export_users_use_case.execute.return_value = iter([b'{"id": 1}\n'])
+
+        # Act
+        result = self.controller.export_users("ndjson")
+
+        # Assert
+        self.export_users_use_case.execute.assert_called_once_with("ndjson")
+        assert result.media_type == "application/x-ndjson"
+        assert result.headers["content-disposition"] == 'attachment; filename="users.ndjson"'
+
+    def test_export_users_invalid_format(self):
+        # Arrange
+        self.export_users_use_case.execute.side_effect = ValueError("Unsupported export format: xml")
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            self.controller.export_users("xml")
+        assert exc_info.value.status_code == 400
+
+    def test_bulk_import_users(self):
+        # Arrange
+        self.bulk_import_users_use_case.execute.side_effect = lambda rows: {"rows": list(rows)}
+
+        # Act
+        result = self.controller.bulk_import_users([b'{"username": "a"}\n'], "ndjson")
+
+        # Assert
+        assert result == {"rows": [{"username": "a"}]}
+
+    def test_bulk_import_users_invalid_format(self):
+        # Arrange
+        self.bulk_import_users_use_case.execute.side_effect = lambda rows: list(rows)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            self.controller.bulk_import_users([b""], "xml")
+        assert exc_info.value.status_code == 400
+
+    def test_get_users_batch(self):
+        # Arrange
+        self.get_users_batch_use_case.execute.return_value = ({1: self.mock_user, 2: None}, {})
+
+        # Act
+        result = self.controller.get_users_batch(UserBatchSchema(ids=[1, 2]))
+
+        # Assert
+        self.get_users_batch_use_case.execute.assert_called_once_with([1, 2], [])
+        assert result["ids"]["1"]["username"] == "testuser"
+        assert result["ids"]["2"] is None
+
+    def test_get_users_batch_too_large(self):
+        # Arrange
+        self.get_users_batch_use_case.execute.side_effect = ValueError("A batch may contain at most 100 ids and CPFs")
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            self.controller.get_users_batch(UserBatchSchema(ids=list(range(101))))
+        assert exc_info.value.status_code == 400
+
     def test_create_user_error(self):
         # Arrange
         error_message = "User already exists"
@@ -181,6 +301,17 @@ class TestUserController:
         assert exc_info.value.detail == error_message
         self.update_user_use_case.execute.assert_called_once_with(999, self.user_data)
 
+    def test_update_user_conflict(self):
+        # Arrange
+        self.update_user_use_case.execute.side_effect = UserAlreadyExistsError("username")
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            self.controller.update_user(1, self.user_data)
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "User already exists: username is already in use"
+
     def test_delete_user_success(self):
         # Arrange
         success_message = {"message": "User deleted"}
@@ -205,4 +336,42 @@ class TestUserController:
         # Verify
         assert exc_info.value.status_code == 404
         assert exc_info.value.detail == error_message
-        self.delete_user_use_case.execute.assert_called_once_with(999)
\ No newline at end of file
+        self.delete_user_use_case.execute.assert_called_once_with(999)
+
+    @patch("tech.interfaces.presenters.user_presenter.UserPresenter.present_user")
+    def test_patch_user_success(self, mock_present_user):
+        # Arrange
+        patch_data = UserPatchSchema(email="new@example.com")
+        self.patch_user_use_case.execute.return_value = self.mock_user
+        expected_response = {"id": 1, "username": "testuser", "email": "new@example.com", "cpf": "12345678901"}
+        mock_present_user.return_value = expected_response
+
+        # Act
+        result = self.controller.patch_user(1, patch_data)
+
+        # Assert
+        self.patch_user_use_case.execute.assert_called_once_with(1, patch_data)
+        mock_present_user.assert_called_once_with(self.mock_user)
+        assert result == expected_response
+
+    def test_patch_user_not_found(self):
+        # Arrange
+        self.patch_user_use_case.execute.side_effect = ValueError("User not found")
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            self.controller.patch_user(999, UserPatchSchema(email="new@example.com"))
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "User not found"
+
+    def test_patch_user_conflict(self):
+        # Arrange
+        self.patch_user_use_case.execute.side_effect = UserAlreadyExistsError("email")
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            self.controller.patch_user(1, UserPatchSchema(email="taken@example.com"))
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "User already exists: email is already in use"
@@ -1,10 +1,13 @@
 # tests/unit/interfaces/gateways/test_cognito_gateway.py
-import pytest
-import boto3
-import json
 import base64
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
 from unittest.mock import Mock, patch, MagicMock
-from tech.interfaces.gateways.cognito_gateway import CognitoGateway
+from tech.interfaces.gateways.cognito_gateway import CognitoGateway, create_client_config, get_cognito_gateway
 
 
 class TestCognitoGateway:
@@ -48,7 +51,8 @@ class TestCognitoGateway:
             "cognito-idp",
             region_name=self.gateway.region,
             aws_access_key_id="SUA_ACCESS_KEY_ID",
-            aws_secret_access_key="SUA_SECRET_ACCESS_KEY"
+            aws_secret_access_key="SUA_SECRET_ACCESS_KEY",
+            config=None
         )
 
         # Check that the gateway has the expected attributes
@@ -123,112 +127,192 @@ class TestCognitoGateway:
 
         assert "User not found" in str(exc_info.value)
 
-    def test_decode_jwt_manually(self):
-        """Test that _decode_jwt_manually correctly decodes a JWT token."""
-        # Create a simple JWT token (header.payload.signature)
-        payload = {"sub": "user123", "name": "Test User"}
-        payload_json = json.dumps(payload)
-        payload_b64 = base64.b64encode(payload_json.encode()).decode()
-        payload_b64 = payload_b64.replace('+', '-').replace('/', '_').rstrip('=')
+    def test_verify_token_invalid_format(self):
+        """Test token verification with an invalid token format."""
+        # Act & Assert
+        with pytest.raises(ValueError) as exc_info:
+            self.gateway.verify_token("invalid-token-no-dots")
+
+        assert "Invalid token" in str(exc_info.value)
+
+
+SIGNING_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+OTHER_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
 
-        mock_token = f"header.{payload_b64}.signature"
+def key_set(*keys):
+    """Builds a JWKS document for (kid, private key) pairs."""
+    jwks = []
+    for kid, key in keys:
+        jwk = RSAAlgorithm.to_jwk(key.public_key(), as_dict=True)
+        jwk.update(kid=kid, alg="RS256", use="sig")
+        jwks.append(jwk)
+    return {"keys": jwks}
+
+
+class TestCognitoTokenVerification:
+    """Unit tests for local JWT verification against a cached key set."""
+
+    def setup_method(self):
+        """Set up a gateway whose key set is served locally."""
+        with patch("boto3.client"):
+            self.gateway = CognitoGateway()
+        self.fetch = patch.object(
+            self.gateway.jwks_client, "fetch_data", return_value=key_set(("key-1", SIGNING_KEY))
+        ).start()
 
+    def teardown_method(self):
+        """Clean up after tests."""
+        patch.stopall()
+
+    def make_token(self, key=SIGNING_KEY, kid="key-1", **claims):
+        """Signs an ID token for the gateway's pool and client."""
+        payload = {
+            "sub": "user-sub-id",
+            "cognito:username": "test_user",
+            "email": "test@example.com",
+            "iss": self.gateway.issuer,
+            "aud": self.gateway.client_id,
+            "token_use": "id",
+            "exp": int(time.time()) + 300,
+            **claims,
+        }
+        return jwt.encode(payload, key, algorithm="RS256", headers={"kid": kid})
+
+    def test_verify_id_token_with_groups(self):
+        """Test that a valid ID token yields the user and admin status without AWS calls."""
         # Act
-        result = self.gateway._decode_jwt_manually(mock_token)
+        result = self.gateway.verify_token(self.make_token(**{"cognito:groups": ["admin", "users"]}))
 
         # Assert
-        assert result == payload
+        assert result == {
+            "username": "test_user",
+            "attributes": {"sub": "user-sub-id", "email": "test@example.com"},
+            "is_admin": True,
+        }
+        self.gateway.client.admin_get_user.assert_not_called()
+        self.gateway.client.admin_list_groups_for_user.assert_not_called()
 
-    def test_verify_token_with_groups_in_token(self):
-        """Test token verification when groups info is in the token."""
+    def test_verify_access_token_without_groups(self):
+        """Test that access tokens are matched on client_id and have no admin rights without groups."""
         # Arrange
-        # Mock the _decode_jwt_manually method
-        with patch.object(self.gateway, '_decode_jwt_manually') as mock_decode:
-            mock_decode.return_value = {
-                "cognito:username": "test_user",
-                "sub": "user-sub-id",
-                "email": "test@example.com",
-                "cognito:groups": ["admin", "users"]
-            }
+        token = self.make_token(aud=None, token_use="access", client_id=self.gateway.client_id,
+                                username="test_user")
 
-            # Act
-            result = self.gateway.verify_token("mock-token")
+        # Act
+        result = self.gateway.verify_token(token)
 
-            # Assert
-            mock_decode.assert_called_once_with("mock-token")
-            assert result["username"] == "test_user"
-            assert result["attributes"]["sub"] == "user-sub-id"
-            assert result["attributes"]["email"] == "test@example.com"
-            assert result["is_admin"] is True
+        # Assert
+        assert result["username"] == "test_user"
+        assert result["is_admin"] is False
 
-    def test_verify_token_admin_check_with_api(self):
-        """Test token verification when admin status needs to be checked via API."""
+    def test_key_set_is_fetched_once(self):
+        """Test that the key set is cached across verifications."""
+        # Act
+        for _ in range(3):
+            self.gateway.verify_token(self.make_token())
+
+        # Assert
+        self.fetch.assert_called_once()
+
+    def test_unknown_kid_refreshes_key_set(self):
+        """Test that a token signed with a rotated key triggers a refetch."""
         # Arrange
-        # Mock the _decode_jwt_manually method
-        with patch.object(self.gateway, '_decode_jwt_manually') as mock_decode:
-            mock_decode.return_value = {
-                "sub": "user-sub-id",
-                "email": "test@example.com"
-                # No cognito:groups in token
-            }
+        self.gateway.verify_token(self.make_token())
+        self.fetch.return_value = key_set(("key-1", SIGNING_KEY), ("key-2", OTHER_KEY))
 
-            # Mock the admin_get_user response
-            self.mock_cognito_client.admin_get_user.return_value = {
-                "Username": "test_user",
-                "UserAttributes": [
-                    {"Name": "sub", "Value": "user-sub-id"},
-                    {"Name": "email", "Value": "test@example.com"}
-                ]
-            }
+        # Act
+        result = self.gateway.verify_token(self.make_token(key=OTHER_KEY, kid="key-2"))
 
-            # Mock the admin_list_groups_for_user response
-            self.mock_cognito_client.admin_list_groups_for_user.return_value = {
-                "Groups": [
-                    {"GroupName": "admin"},
-                    {"GroupName": "users"}
-                ]
-            }
+        # Assert
+        assert result["username"] == "test_user"
+        assert self.fetch.call_count == 2
 
-            # Act
-            result = self.gateway.verify_token("mock-token")
-
-            # Assert
-            mock_decode.assert_called_once_with("mock-token")
-            self.mock_cognito_client.admin_get_user.assert_called_once_with(
-                UserPoolId=self.gateway.user_pool_id,
-                Username="user-sub-id"
-            )
-            self.mock_cognito_client.admin_list_groups_for_user.assert_called_once_with(
-                UserPoolId=self.gateway.user_pool_id,
-                Username="user-sub-id"
-            )
-            assert result["username"] == "test_user"
-            assert result["attributes"]["sub"] == "user-sub-id"
-            assert result["attributes"]["email"] == "test@example.com"
-            assert result["is_admin"] is True
+    def test_verified_token_is_cached(self):
+        """Test that verifying the same token again skips signature verification."""
+        # Arrange
+        token = self.make_token(**{"cognito:groups": ["admin"]})
+        first = self.gateway.verify_token(token)
 
-    def test_verify_token_invalid_format(self):
-        """Test token verification with an invalid token format."""
+        # Act
+        with patch("jwt.decode") as mock_decode:
+            second = self.gateway.verify_token(token)
+
+        # Assert
+        mock_decode.assert_not_called()
+        assert second == first
+        assert self.gateway.token_cache.stats()["hits"] == 1
+
+    def test_revoked_token_is_rejected(self):
+        """Test that a revoked token no longer verifies, even when it was cached."""
+        # Arrange
+        token = self.make_token()
+        self.gateway.verify_token(token)
+
+        # Act
+        self.gateway.revoke_token(token)
+
+        # Assert
+        with pytest.raises(ValueError, match="revoked"):
+            self.gateway.verify_token(token)
+
+    @pytest.mark.parametrize("token_args", [
+        {"key": OTHER_KEY},
+        {"exp": int(time.time()) - 10},
+        {"iss": "https://cognito-idp.us-east-1.amazonaws.com/another-pool"},
+        {"aud": "another-client"},
+        {"token_use": "refresh"},
+    ])
+    def test_rejected_tokens(self, token_args):
+        """Test that bad signatures, expired tokens and foreign issuers or clients are rejected."""
         # Act & Assert
-        with pytest.raises(ValueError) as exc_info:
-            self.gateway.verify_token("invalid-token-no-dots")
+        with pytest.raises(ValueError, match="Invalid token"):
+            self.gateway.verify_token(self.make_token(**token_args))
+
+    def test_unreachable_key_set(self):
+        """Test that a failure to fetch the key set is reported as a verification failure."""
+        # Arrange
+        self.fetch.side_effect = jwt.PyJWKClientConnectionError("timed out")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Token verification failed"):
+            self.gateway.verify_token(self.make_token())
+
 
-        assert "Invalid JWT format" in str(exc_info.value)
+class TestCognitoClientConfiguration:
+    """Unit tests for the shared, tuned Cognito client."""
 
-    def test_user_not_found_during_verification(self):
-        """Test token verification when user is not found."""
+    def test_client_config_comes_from_settings(self):
+        """Test that pool size, timeouts and retries are taken from Settings."""
         # Arrange
-        with patch.object(self.gateway, '_decode_jwt_manually') as mock_decode:
-            mock_decode.return_value = {
-                "sub": "nonexistent-user-id"
-            }
+        settings = Mock(
+            COGNITO_MAX_POOL_CONNECTIONS=64,
+            COGNITO_CONNECT_TIMEOUT=1.5,
+            COGNITO_READ_TIMEOUT=4.0,
+            COGNITO_RETRY_MODE="adaptive",
+            COGNITO_MAX_ATTEMPTS=5,
+        )
 
-            # Use the exception already defined in setup_method
-            self.mock_cognito_client.admin_get_user.side_effect = self.mock_cognito_client.exceptions.UserNotFoundException(
-                "User does not exist")
+        # Act
+        config = create_client_config(settings)
+
+        # Assert
+        assert config.max_pool_connections == 64
+        assert (config.connect_timeout, config.read_timeout) == (1.5, 4.0)
+        assert config.retries == {"mode": "adaptive", "max_attempts": 5}
 
-            # Act & Assert
-            with pytest.raises(ValueError) as exc_info:
-                self.gateway.verify_token("mock-token")
+    @patch("boto3.client")
+    def test_gateway_is_created_once(self, mock_boto3_client):
+        """Test that every caller shares one gateway and one boto3 client."""
+        # Arrange
+        get_cognito_gateway.cache_clear()
 
-            assert "User not found" in str(exc_info.value)
\ No newline at end of file
+        # Act
+        first = get_cognito_gateway()
+        second = get_cognito_gateway()
+
+        # Assert
+        assert first is second
+        mock_boto3_client.assert_called_once()
+        assert mock_boto3_client.call_args.kwargs["config"].max_pool_connections == 50
+        get_cognito_gateway.cache_clear()
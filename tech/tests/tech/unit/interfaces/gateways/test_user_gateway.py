@@ -4,6 +4,9 @@ from unittest.mock import Mock, patch
 from tech.domain.entities.users import User
 from tech.interfaces.gateways.user_gateway import UserGateway
 from tech.infra.repositories.sql_alchemy_user_repository import SQLAlchemyUserRepository
+from tech.infra.cache.memory_cache import MemoryCache
+from tech.infra.cache.user_cache import UserCache
+from tech.infra.repositories.user_loader import UserLoader
 
 
 class TestUserGateway:
@@ -151,16 +154,136 @@ class TestUserGateway:
     def test_delete(self):
         """Test that delete method delegates to repository."""
         # Arrange
-        mock_user = User(
-            id=1,
-            username="testuser",
-            email="test@example.com",
-            password="hashed_password",
-            cpf="12345678901"
+        self.mock_repository.delete.return_value = True
+
+        # Act
+        result = self.gateway.delete(1)
+
+        # Assert
+        self.mock_repository.delete.assert_called_once_with(1)
+        assert result is True
+
+    def test_get_password_hash(self):
+        """Test that get_password_hash method delegates to repository."""
+        # Arrange
+        self.mock_repository.get_password_hash.return_value = "stored_hash"
+
+        # Act
+        result = self.gateway.get_password_hash(1)
+
+        # Assert
+        self.mock_repository.get_password_hash.assert_called_once_with(1)
+        assert result == "stored_hash"
+
+    def test_update_password(self):
+        """Test that update_password method delegates to repository."""
+        # Arrange
+        self.mock_repository.update_password.return_value = True
+
+        # Act
+        result = self.gateway.update_password(1, "stale_hash", "new_hash")
+
+        # Assert
+        self.mock_repository.update_password.assert_called_once_with(1, "stale_hash", "new_hash")
+        assert result is True
+
+    def test_counts_are_cached(self):
+        """Test that exact and estimated counts are read once per cache TTL."""
+        # Arrange
+        gateway = UserGateway(self.mock_session, count_cache=MemoryCache(8, 30))
+        self.mock_repository.count_users.return_value = 7
+        self.mock_repository.estimate_user_count.return_value = None
+
+        # Act
+        counts = [gateway.count_users(), gateway.count_users()]
+        estimates = [gateway.estimate_user_count(), gateway.estimate_user_count()]
+
+        # Assert
+        assert counts == [7, 7]
+        assert estimates == [None, None]
+        self.mock_repository.count_users.assert_called_once()
+        self.mock_repository.estimate_user_count.assert_called_once()
+
+    def test_count_legacy_password_hashes(self):
+        """Test that count_legacy_password_hashes method delegates to repository."""
+        # Arrange
+        self.mock_repository.count_legacy_password_hashes.return_value = 7
+
+        # Act
+        result = self.gateway.count_legacy_password_hashes("$argon2id$v=19$m=19456,t=2,p=1$")
+
+        # Assert
+        self.mock_repository.count_legacy_password_hashes.assert_called_once_with(
+            "$argon2id$v=19$m=19456,t=2,p=1$"
         )
+        assert result == 7
+
+    def test_update_fields(self):
+        """Test that update_fields method delegates to repository."""
+        # Act
+        self.gateway.update_fields(1, {"email": "new@example.com"})
+
+        # Assert
+        self.mock_repository.update_fields.assert_called_once_with(1, {"email": "new@example.com"})
+
+    def test_lookups_go_through_loader(self):
+        """Test that single-user lookups use the batcher when one is given."""
+        # Arrange
+        loader = Mock(spec=UserLoader)
+        gateway = UserGateway(self.mock_session, loader)
+
+        # Act
+        gateway.get_by_id(1)
+        gateway.get_by_cpf("12345678901")
+
+        # Assert
+        loader.get_by_id.assert_called_once_with(1)
+        loader.get_by_cpf.assert_called_once_with("12345678901")
+        self.mock_repository.get_by_id.assert_not_called()
+        self.mock_repository.get_by_cpf.assert_not_called()
+
+    def test_get_by_id_for_update_bypasses_cache_and_loader(self):
+        """Test that locking reads always reach the repository."""
+        # Arrange
+        cache = Mock(spec=UserCache)
+        gateway = UserGateway(self.mock_session, user_loader=Mock(spec=UserLoader), user_cache=cache)
+
+        # Act
+        gateway.get_by_id_for_update(1)
+
+        # Assert
+        self.mock_repository.get_by_id_for_update.assert_called_once_with(1)
+        cache.get_by_id.assert_not_called()
+
+    def test_writes_invalidate_cache(self):
+        """Test that lookups go through the cache and writes invalidate it."""
+        # Arrange
+        cache = Mock(spec=UserCache)
+        gateway = UserGateway(self.mock_session, user_cache=cache)
+
+        # Act
+        gateway.get_by_id(1)
+        gateway.update_fields(1, {"cpf": "10987654321"})
+        gateway.update_password(1, "stale_hash", "hash")
+        gateway.delete(1)
+
+        # Assert
+        cache.get_by_id.assert_called_once()
+        assert [c.args for c in cache.invalidate.call_args_list] == [
+            (1, "10987654321"), (1, None), (1, None)
+        ]
+
+    def test_bulk_insert_invalidates_cache_once(self):
+        """Test that the users created by a bulk insert are invalidated in one call."""
+        # Arrange
+        cache = Mock(spec=UserCache)
+        gateway = UserGateway(self.mock_session, user_cache=cache)
+        created = User(username="a", password="h", cpf="12345678901", email="a@example.com", id=5)
+        skipped = User(username="b", password="h", cpf="10987654321", email="b@example.com")
+        self.mock_repository.add_many.return_value = [None, "email"]
 
         # Act
-        self.gateway.delete(mock_user)
+        gateway.add_many([created, skipped])
 
         # Assert
-        self.mock_repository.delete.assert_called_once_with(mock_user)
\ No newline at end of file
+        cache.invalidate_many.assert_called_once_with([(5, "12345678901")])
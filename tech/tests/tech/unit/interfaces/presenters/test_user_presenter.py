@@ -69,4 +69,13 @@ class TestUserPresenter:
 
         # Assert
         assert isinstance(result, list)
-        assert len(result) == 0
\ No newline at end of file
+        assert len(result) == 0
+    def test_present_user_batch(self):
+        """Test that a batch keeps every requested key, with null for missing users."""
+        # Act
+        result = UserPresenter.present_user_batch({1: self.mock_user, 2: None}, {"00000000000": None})
+
+        # Assert
+        assert result["ids"]["1"]["username"] == "testuser"
+        assert result["ids"]["2"] is None
+        assert result["cpfs"] == {"00000000000": None}
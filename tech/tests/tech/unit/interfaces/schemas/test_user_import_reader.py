@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+from tech.interfaces.schemas.user_import_reader import UserRowReader, aread_user_rows, read_user_rows
+
+
+def split(body, size):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class TestUserRowReader:
+    """Unit tests for the incremental import parser."""
+
+    def test_ndjson_rows_split_across_chunks(self):
+        """Test that lines are reassembled whatever the chunk boundaries."""
+        body = '{"username": "joão"}\n\n{"username": "maria"}'.encode()
+
+        rows = list(read_user_rows(split(body, 3), "ndjson"))
+
+        assert rows == [{"username": "joão"}, {"username": "maria"}]
+
+    def test_malformed_ndjson_line_is_returned_raw(self):
+        """Test that a bad line becomes a row of its own instead of an error."""
+        rows = list(read_user_rows([b'{"username": "a"}\n{broken\n'], "ndjson"))
+
+        assert rows == [{"username": "a"}, "{broken"]
+
+    def test_csv_uses_header(self):
+        """Test that CSV records are mapped by the header line."""
+        body = b'username,email,password,cpf\r\nana,"ana@example.com",pw,12345678901\r\n'
+
+        rows = list(read_user_rows(split(body, 5), "csv"))
+
+        assert rows == [{"username": "ana", "email": "ana@example.com", "password": "pw", "cpf": "12345678901"}]
+
+    def test_async_reader(self):
+        """Test the asyncio variant over an async body."""
+        async def body():
+            yield b'{"username": "a"}\n{"user'
+            yield b'name": "b"}\n'
+
+        async def run():
+            return [row async for row in aread_user_rows(body(), "ndjson")]
+
+        assert asyncio.run(run()) == [{"username": "a"}, {"username": "b"}]
+
+    def test_unsupported_format(self):
+        """Test that unknown formats are rejected."""
+        with pytest.raises(ValueError, match="Unsupported import format: xml"):
+            UserRowReader("xml")
@@ -0,0 +1,96 @@
+import asyncio
+
+from unittest.mock import Mock
+from tech.domain.security import HashingService
+from tech.interfaces.repositories.user_repository import UserRepository
+from tech.interfaces.repositories.async_user_repository import AsyncUserRepository
+from tech.use_cases.users.bulk_import_users_use_case import (
+    AsyncBulkImportUsersUseCase,
+    BulkImportUsersUseCase,
+    validate_row,
+)
+
+
+def row(name, cpf="12345678901"):
+    return {"username": name, "email": f"{name}@example.com", "password": "secret", "cpf": cpf}
+
+
+def assign_ids(users):
+    for index, user in enumerate(users):
+        user.id = index + 1
+    return [None] * len(users)
+
+
+class TestBulkImportUsersUseCase:
+    """Unit tests for the BulkImportUsersUseCase."""
+
+    def setup_method(self):
+        """Set up test dependencies."""
+        self.user_repository = Mock(spec=UserRepository)
+        self.hashing_service = Mock(spec=HashingService)
+        self.hashing_service.hash_many.side_effect = lambda passwords: [f"hashed_{p}" for p in passwords]
+        self.use_case = BulkImportUsersUseCase(self.user_repository, self.hashing_service, batch_size=2)
+
+    def test_imports_in_batches(self):
+        """Test that valid rows are hashed and merged batch by batch."""
+        # Arrange
+        self.user_repository.add_many.side_effect = assign_ids
+
+        # Act
+        result = self.use_case.execute(iter([row("a"), row("b"), row("c")]))
+
+        # Assert
+        assert self.user_repository.add_many.call_count == 2
+        assert self.hashing_service.hash_many.call_args_list[0].args == (["secret", "secret"],)
+        first_batch = self.user_repository.add_many.call_args_list[0].args[0]
+        assert [user.password for user in first_batch] == ["hashed_secret", "hashed_secret"]
+        assert result["created"] == 3
+        assert [r["id"] for r in result["results"]] == [1, 2, 1]
+
+    def test_reports_invalid_rows_and_conflicts_in_row_order(self):
+        """Test that every row gets an outcome, numbered from 1."""
+        # Arrange
+        self.user_repository.add_many.side_effect = lambda users: ["email"] * len(users)
+
+        # Act
+        result = self.use_case.execute([row("a", cpf="123"), "{broken", row("b")])
+
+        # Assert
+        assert result["invalid"] == 2
+        assert result["conflict"] == 1
+        assert result["results"] == [
+            {"row": 1, "status": "invalid", "error": "CPF must contain exactly 11 digits and be numeric."},
+            {"row": 2, "status": "invalid", "error": "row: Input should be a valid dictionary or instance of UserSchema"},
+            {"row": 3, "status": "conflict", "field": "email"},
+        ]
+
+    def test_validate_row_reports_missing_fields(self):
+        """Test that missing fields are named in the error."""
+        user_data, error = validate_row({"username": "a"})
+
+        assert user_data is None
+        assert "email: Field required" in error
+
+
+class TestAsyncBulkImportUsersUseCase:
+    """Unit tests for the AsyncBulkImportUsersUseCase."""
+
+    def test_imports_async_rows(self):
+        """Test the asyncio variant end to end over an async iterable."""
+        # Arrange
+        user_repository = Mock(spec=AsyncUserRepository)
+        user_repository.add_many.side_effect = assign_ids
+        hashing_service = Mock(spec=HashingService)
+        hashing_service.ahash_many.side_effect = lambda passwords: [f"hashed_{p}" for p in passwords]
+        use_case = AsyncBulkImportUsersUseCase(user_repository, hashing_service, batch_size=10)
+
+        async def rows():
+            yield row("a")
+            yield {"username": "b"}
+
+        # Act
+        result = asyncio.run(use_case.execute(rows()))
+
+        # Assert
+        assert (result["created"], result["invalid"]) == (1, 1)
+        user_repository.add_many.assert_awaited_once()
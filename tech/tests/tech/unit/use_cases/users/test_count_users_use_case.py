@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+from unittest.mock import Mock
+from tech.interfaces.repositories.user_repository import UserRepository
+from tech.interfaces.repositories.async_user_repository import AsyncUserRepository
+from tech.use_cases.users.count_users_use_case import AsyncCountUsersUseCase, CountUsersUseCase
+
+
+class TestCountUsersUseCase:
+    """Unit tests for the CountUsersUseCase."""
+
+    def setup_method(self):
+        """Set up test dependencies."""
+        self.user_repository = Mock(spec=UserRepository)
+        self.use_case = CountUsersUseCase(self.user_repository, exact_threshold=1000)
+
+    def test_auto_uses_estimate_for_large_tables(self):
+        """Test that auto mode skips count(*) when the estimate is large."""
+        # Arrange
+        self.user_repository.estimate_user_count.return_value = 5_000_000
+
+        # Act
+        result = self.use_case.execute("auto")
+
+        # Assert
+        assert result == {"count": 5_000_000, "exact": False}
+        self.user_repository.count_users.assert_not_called()
+
+    def test_auto_counts_small_tables_exactly(self):
+        """Test that auto mode counts exactly below the threshold."""
+        # Arrange
+        self.user_repository.estimate_user_count.return_value = 40
+        self.user_repository.count_users.return_value = 42
+
+        # Act
+        result = self.use_case.execute("auto")
+
+        # Assert
+        assert result == {"count": 42, "exact": True}
+
+    def test_approximate_falls_back_without_statistics(self):
+        """Test that approximate mode counts exactly when no estimate exists."""
+        # Arrange
+        self.user_repository.estimate_user_count.return_value = None
+        self.user_repository.count_users.return_value = 3
+
+        # Act
+        result = self.use_case.execute("approximate")
+
+        # Assert
+        assert result == {"count": 3, "exact": True}
+
+    def test_exact_never_estimates(self):
+        """Test that exact mode goes straight to count(*)."""
+        # Arrange
+        self.user_repository.count_users.return_value = 7
+
+        # Act
+        result = self.use_case.execute("exact")
+
+        # Assert
+        assert result == {"count": 7, "exact": True}
+        self.user_repository.estimate_user_count.assert_not_called()
+
+    def test_invalid_mode(self):
+        """Test that unknown modes are rejected before querying."""
+        with pytest.raises(ValueError, match="Invalid count mode"):
+            self.use_case.execute("fast")
+        self.user_repository.estimate_user_count.assert_not_called()
+
+
+class TestAsyncCountUsersUseCase:
+    """Unit tests for the AsyncCountUsersUseCase."""
+
+    def test_auto_uses_estimate_for_large_tables(self):
+        """Test that the async use case awaits the estimate and skips count(*)."""
+        # Arrange
+        user_repository = Mock(spec=AsyncUserRepository)
+        user_repository.estimate_user_count.return_value = 2_000_000
+        use_case = AsyncCountUsersUseCase(user_repository)
+
+        # Act
+        result = asyncio.run(use_case.execute("auto"))
+
+        # Assert
+        assert result == {"count": 2_000_000, "exact": False}
+        user_repository.count_users.assert_not_called()
@@ -1,9 +1,14 @@
+import asyncio
+
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from tech.domain.entities.users import User
+from tech.domain.exceptions import UserAlreadyExistsError
+from tech.domain.security import HashingService
 from tech.interfaces.schemas.user_schema import UserSchema
 from tech.interfaces.repositories.user_repository import UserRepository
-from tech.use_cases.users.create_user_use_case import CreateUserUseCase
+from tech.interfaces.repositories.async_user_repository import AsyncUserRepository
+from tech.use_cases.users.create_user_use_case import AsyncCreateUserUseCase, CreateUserUseCase
 
 
 class TestCreateUserUseCase:
@@ -12,7 +17,8 @@ class TestCreateUserUseCase:
     def setup_method(self):
         """Set up test dependencies."""
         self.user_repository = Mock(spec=UserRepository)
-        self.use_case = CreateUserUseCase(self.user_repository)
+        self.hashing_service = Mock(spec=HashingService)
+        self.use_case = CreateUserUseCase(self.user_repository, self.hashing_service)
         self.user_data = UserSchema(
             username="testuser",
             email="test@example.com",
@@ -25,34 +31,30 @@ class TestCreateUserUseCase:
         # Arrange
         self.user_repository.get_by_username_or_email_or_cpf.return_value = None
 
-        # Mock the get_password_hash function
-        with patch("tech.use_cases.users.create_user_use_case.get_password_hash") as mock_get_hash:
-            mock_get_hash.return_value = "hashed_password"
-
-            # Configure the add method to return a user
-            mock_user = User(
-                id=1,
-                username=self.user_data.username,
-                email=self.user_data.email,
-                password="hashed_password",
-                cpf=self.user_data.cpf
-            )
-            self.user_repository.add.return_value = mock_user
-
-            # Act
-            result = self.use_case.execute(self.user_data)
-
-            # Assert
-            self.user_repository.get_by_username_or_email_or_cpf.assert_called_once_with(
-                self.user_data.username, self.user_data.email, self.user_data.cpf
-            )
-            mock_get_hash.assert_called_once_with(self.user_data.password)
-            self.user_repository.add.assert_called_once()
-            assert isinstance(result, User)
-            assert result.username == self.user_data.username
-            assert result.email == self.user_data.email
-            assert result.password == "hashed_password"
-            assert result.cpf == self.user_data.cpf
+        self.hashing_service.hash.return_value = "hashed_password"
+
+        # Configure the add method to return a user
+        mock_user = User(
+            id=1,
+            username=self.user_data.username,
+            email=self.user_data.email,
+            password="hashed_password",
+            cpf=self.user_data.cpf
+        )
+        self.user_repository.add.return_value = mock_user
+
+        # Act
+        result = self.use_case.execute(self.user_data)
+
+        # Assert
+        self.user_repository.get_by_username_or_email_or_cpf.assert_not_called()
+        self.hashing_service.hash.assert_called_once_with(self.user_data.password)
+        self.user_repository.add.assert_called_once()
+        assert isinstance(result, User)
+        assert result.username == self.user_data.username
+        assert result.email == self.user_data.email
+        assert result.password == "hashed_password"
+        assert result.cpf == self.user_data.cpf
 
     def test_invalid_cpf_format(self):
         """Test that an invalid CPF format raises a ValueError."""
@@ -89,20 +91,58 @@ class TestCreateUserUseCase:
         assert "CPF must contain exactly 11 digits and be numeric" in str(exc_info.value)
 
     def test_user_already_exists(self):
-        """Test that trying to create a user that already exists raises a ValueError."""
+        """Test that a unique violation reported by the repository propagates with its field."""
         # Arrange
-        existing_user = User(
-            id=1,
-            username="existinguser",
-            email="existing@example.com",
-            password="hashed_password",
-            cpf="12345678901"
-        )
-        self.user_repository.get_by_username_or_email_or_cpf.return_value = existing_user
+        self.hashing_service.hash.return_value = "hashed_password"
+        self.user_repository.add.side_effect = UserAlreadyExistsError("email")
 
         # Act & Assert
         with pytest.raises(ValueError) as exc_info:
             self.use_case.execute(self.user_data)
 
         assert "User already exists" in str(exc_info.value)
-        self.user_repository.add.assert_not_called()
\ No newline at end of file
+        assert exc_info.value.field == "email"
+        self.user_repository.get_by_username_or_email_or_cpf.assert_not_called()
+
+
+class TestAsyncCreateUserUseCase:
+    """Unit tests for the AsyncCreateUserUseCase."""
+
+    def setup_method(self):
+        """Set up test dependencies."""
+        self.user_repository = Mock(spec=AsyncUserRepository)
+        self.hashing_service = Mock(spec=HashingService)
+        self.use_case = AsyncCreateUserUseCase(self.user_repository, self.hashing_service)
+        self.user_data = UserSchema(
+            username="testuser",
+            email="test@example.com",
+            password="Password123",
+            cpf="12345678901"
+        )
+
+    def test_successful_user_creation(self):
+        """Test that the password is hashed on the pool and the user awaited into the repository."""
+        # Arrange
+        self.user_repository.get_by_username_or_email_or_cpf.return_value = None
+        self.hashing_service.ahash.return_value = "hashed_password"
+        self.user_repository.add.side_effect = lambda user: user
+
+        # Act
+        result = asyncio.run(self.use_case.execute(self.user_data))
+
+        # Assert
+        self.hashing_service.ahash.assert_awaited_once_with("Password123")
+        self.hashing_service.hash.assert_not_called()
+        self.user_repository.add.assert_awaited_once()
+        assert result.password == "hashed_password"
+
+    def test_existing_user(self):
+        """Test that a conflict reported by the repository propagates."""
+        # Arrange
+        self.hashing_service.ahash.return_value = "hashed_password"
+        self.user_repository.add.side_effect = UserAlreadyExistsError("cpf")
+
+        # Act & Assert
+        with pytest.raises(UserAlreadyExistsError, match="User already exists: cpf"):
+            asyncio.run(self.use_case.execute(self.user_data))
+        self.user_repository.get_by_username_or_email_or_cpf.assert_not_called()
@@ -0,0 +1,34 @@
+import pytest
+from unittest.mock import Mock
+from tech.infra.databases.user_export import UserExporter
+from tech.use_cases.users.export_users_use_case import ExportUsersUseCase
+
+
+class TestExportUsersUseCase:
+    """Unit tests for the ExportUsersUseCase."""
+
+    def setup_method(self):
+        """Set up test dependencies."""
+        self.user_exporter = Mock(spec=UserExporter)
+        self.use_case = ExportUsersUseCase(self.user_exporter)
+
+    def test_execute(self):
+        """Test that the exporter stream is returned as is."""
+        # Arrange
+        self.user_exporter.stream.return_value = iter([b"id,username,email,cpf\n"])
+
+        # Act
+        result = self.use_case.execute("csv")
+
+        # Assert
+        self.user_exporter.stream.assert_called_once_with("csv")
+        assert list(result) == [b"id,username,email,cpf\n"]
+
+    def test_execute_unsupported_format(self):
+        """Test that an unsupported format propagates as ValueError."""
+        # Arrange
+        self.user_exporter.stream.side_effect = ValueError("Unsupported export format: xml")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unsupported export format"):
+            self.use_case.execute("xml")
@@ -1,8 +1,11 @@
+import asyncio
+
 import pytest
 from unittest.mock import Mock
 from tech.domain.entities.users import User
 from tech.interfaces.repositories.user_repository import UserRepository
-from tech.use_cases.users.get_user_use_case import GetUserUseCase
+from tech.interfaces.repositories.async_user_repository import AsyncUserRepository
+from tech.use_cases.users.get_user_use_case import AsyncGetUserUseCase, GetUserUseCase
 
 
 class TestGetUserUseCase:
@@ -38,4 +41,35 @@ class TestGetUserUseCase:
             self.use_case.execute(user_id)
 
         assert "User not found" in str(exc_info.value)
-        self.user_repository.get_by_id.assert_called_once_with(user_id)
\ No newline at end of file
+        self.user_repository.get_by_id.assert_called_once_with(user_id)
+
+
+class TestAsyncGetUserUseCase:
+    """Unit tests for the AsyncGetUserUseCase."""
+
+    def setup_method(self):
+        """Set up test dependencies."""
+        self.user_repository = Mock(spec=AsyncUserRepository)
+        self.use_case = AsyncGetUserUseCase(self.user_repository)
+
+    def test_get_existing_user(self):
+        """Test retrieving an existing user by ID."""
+        # Arrange
+        mock_user = Mock(spec=User)
+        self.user_repository.get_by_id.return_value = mock_user
+
+        # Act
+        result = asyncio.run(self.use_case.execute(1))
+
+        # Assert
+        self.user_repository.get_by_id.assert_awaited_once_with(1)
+        assert result == mock_user
+
+    def test_get_non_existent_user(self):
+        """Test that a missing user raises ValueError."""
+        # Arrange
+        self.user_repository.get_by_id.return_value = None
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="User not found"):
+            asyncio.run(self.use_case.execute(99))
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+from unittest.mock import Mock
+from tech.domain.entities.users import User
+from tech.interfaces.repositories.user_repository import UserRepository
+from tech.interfaces.repositories.async_user_repository import AsyncUserRepository
+from tech.use_cases.users.get_users_batch_use_case import AsyncGetUsersBatchUseCase, GetUsersBatchUseCase
+
+
+def make_user(user_id, cpf):
+    return User(id=user_id, username=f"user{user_id}", email=f"user{user_id}@example.com",
+                password="hash", cpf=cpf)
+
+
+class TestGetUsersBatchUseCase:
+    """Unit tests for the GetUsersBatchUseCase."""
+
+    def setup_method(self):
+        """Set up test dependencies."""
+        self.user_repository = Mock(spec=UserRepository)
+        self.use_case = GetUsersBatchUseCase(self.user_repository, max_batch_size=3)
+
+    def test_maps_found_and_missing_keys(self):
+        """Test that every requested key is present, missing ones as None."""
+        # Arrange
+        user = make_user(1, "12345678901")
+        self.user_repository.get_by_ids.return_value = [user]
+        self.user_repository.get_by_cpfs.return_value = [user]
+
+        # Act
+        by_id, by_cpf = self.use_case.execute([1, 2, 1], ["12345678901"])
+
+        # Assert
+        assert by_id == {1: user, 2: None}
+        assert by_cpf == {"12345678901": user}
+        self.user_repository.get_by_ids.assert_called_once_with([1, 2])
+
+    def test_maps_formatted_cpf_to_stored_user(self):
+        """Test that a CPF with punctuation maps to the user the query matched."""
+        # Arrange
+        user = make_user(1, "12345678901")
+        self.user_repository.get_by_cpfs.return_value = [user]
+
+        # Act
+        _, by_cpf = self.use_case.execute([], ["123.456.789-01"])
+
+        # Assert
+        assert by_cpf == {"123.456.789-01": user}
+        self.user_repository.get_by_cpfs.assert_called_once_with(["123.456.789-01"])
+
+    def test_skips_queries_for_empty_lists(self):
+        """Test that only the requested kind of key is queried."""
+        # Arrange
+        self.user_repository.get_by_ids.return_value = []
+
+        # Act
+        by_id, by_cpf = self.use_case.execute([5], [])
+
+        # Assert
+        assert (by_id, by_cpf) == ({5: None}, {})
+        self.user_repository.get_by_cpfs.assert_not_called()
+
+    def test_rejects_oversized_batch(self):
+        """Test that ids and CPFs together are capped."""
+        with pytest.raises(ValueError, match="at most 3"):
+            self.use_case.execute([1, 2], ["12345678901", "10987654321"])
+        self.user_repository.get_by_ids.assert_not_called()
+
+
+class TestAsyncGetUsersBatchUseCase:
+    """Unit tests for the AsyncGetUsersBatchUseCase."""
+
+    def test_maps_found_and_missing_keys(self):
+        """Test the asyncio variant."""
+        # Arrange
+        user_repository = Mock(spec=AsyncUserRepository)
+        user = make_user(1, "12345678901")
+        user_repository.get_by_cpfs.return_value = [user]
+        use_case = AsyncGetUsersBatchUseCase(user_repository)
+
+        # Act
+        by_id, by_cpf = asyncio.run(use_case.execute([], ["12345678901", "10987654321"]))
+
+        # Assert
+        assert by_id == {}
+        assert by_cpf == {"12345678901": user, "10987654321": None}
+        user_repository.get_by_ids.assert_not_called()
@@ -2,7 +2,11 @@ import pytest
 from unittest.mock import Mock
 from tech.domain.entities.users import User
 from tech.interfaces.repositories.user_repository import UserRepository
-from tech.use_cases.users.list_users_use_case import ListUsersUseCase
+from tech.use_cases.users.list_users_use_case import (
+    ListUsersUseCase,
+    decode_cursor,
+    encode_cursor,
+)
 
 
 class TestListUsersUseCase:
@@ -58,4 +62,58 @@ class TestListUsersUseCase:
         # Assert
         self.user_repository.list_users.assert_called_once_with(limit, skip)
         assert result == []
-        assert len(result) == 0
\ No newline at end of file
+        assert len(result) == 0
+
+    def test_limit_is_capped(self):
+        """Test that the page size never exceeds the server-side maximum."""
+        # Arrange
+        use_case = ListUsersUseCase(self.user_repository, max_page_size=50)
+        self.user_repository.list_users.return_value = []
+
+        # Act
+        use_case.execute(10_000, 0)
+
+        # Assert
+        self.user_repository.list_users.assert_called_once_with(50, 0)
+
+    def test_cursor_round_trip(self):
+        """Test that cursors are opaque strings that decode back to the ID."""
+        cursor = encode_cursor(42)
+
+        assert "42" not in cursor
+        assert decode_cursor(cursor) == 42
+        assert decode_cursor("") is None
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", encode_cursor(1)[:-1] + "@", "eDox"])
+    def test_invalid_cursor(self, cursor):
+        """Test that malformed cursors are rejected."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(cursor)
+
+    def test_first_page_with_more_results(self):
+        """Test that a full page fetches one extra row and returns a next cursor."""
+        # Arrange
+        users = [User(id=n, username=f"u{n}", email=f"u{n}@e.com", password="h", cpf="1") for n in (1, 2, 3)]
+        self.user_repository.list_users_after.return_value = users
+
+        # Act
+        page, next_cursor = self.use_case.execute_cursor("", 2)
+
+        # Assert
+        self.user_repository.list_users_after.assert_called_once_with(None, 3)
+        assert page == users[:2]
+        assert decode_cursor(next_cursor) == 2
+
+    def test_last_page_has_no_cursor(self):
+        """Test that the last page returns no next cursor."""
+        # Arrange
+        users = [User(id=5, username="u5", email="u5@e.com", password="h", cpf="1")]
+        self.user_repository.list_users_after.return_value = users
+
+        # Act
+        page, next_cursor = self.use_case.execute_cursor(encode_cursor(4), 2)
+
+        # Assert
+        self.user_repository.list_users_after.assert_called_once_with(4, 3)
+        assert page == users
+        assert next_cursor is None
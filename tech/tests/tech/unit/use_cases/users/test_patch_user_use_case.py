@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+from unittest.mock import Mock
+from tech.domain.entities.users import User
+from tech.domain.security import HashingService
+from tech.interfaces.schemas.user_schema import UserPatchSchema
+from tech.interfaces.repositories.user_repository import UserRepository
+from tech.interfaces.repositories.async_user_repository import AsyncUserRepository
+from tech.use_cases.users.patch_user_use_case import AsyncPatchUserUseCase, PatchUserUseCase
+
+
+class TestPatchUserUseCase:
+    """Unit tests for the PatchUserUseCase."""
+
+    def setup_method(self):
+        """Set up test dependencies."""
+        self.user_repository = Mock(spec=UserRepository)
+        self.hashing_service = Mock(spec=HashingService)
+        self.use_case = PatchUserUseCase(self.user_repository, self.hashing_service)
+        self.user = User(
+            id=1,
+            username="testuser",
+            email="test@example.com",
+            password="hashed_password",
+            cpf="12345678901"
+        )
+        self.user_repository.get_by_id_for_update.return_value = self.user
+
+    def test_single_field_update_skips_hashing(self):
+        """Test that changing the email writes only the email and never hashes."""
+        # Act
+        result = self.use_case.execute(1, UserPatchSchema(email="new@example.com"))
+
+        # Assert
+        self.user_repository.update_fields.assert_called_once_with(1, {"email": "new@example.com"})
+        self.hashing_service.hash.assert_not_called()
+        assert result.email == "new@example.com"
+        assert result.password == "hashed_password"
+
+    def test_new_password_is_hashed(self):
+        """Test that a supplied password is hashed and written."""
+        # Arrange
+        self.hashing_service.hash.return_value = "new_hash"
+
+        # Act
+        result = self.use_case.execute(1, UserPatchSchema(password="NewPassword123"))
+
+        # Assert
+        self.hashing_service.hash.assert_called_once_with("NewPassword123")
+        self.user_repository.update_fields.assert_called_once_with(1, {"password": "new_hash"})
+        assert result.password == "new_hash"
+
+    def test_unchanged_values_are_not_written(self):
+        """Test that values equal to the stored ones are dropped from the update."""
+        # Act
+        self.use_case.execute(1, UserPatchSchema(username="testuser", cpf="98765432101"))
+
+        # Assert
+        self.user_repository.update_fields.assert_called_once_with(1, {"cpf": "98765432101"})
+
+    def test_stored_values_bypass_cached_reads(self):
+        """Test that the diff is made against the locked primary row, not a cached copy."""
+        # Act
+        self.use_case.execute(1, UserPatchSchema(email="new@example.com"))
+
+        # Assert
+        self.user_repository.get_by_id_for_update.assert_called_once_with(1)
+        self.user_repository.get_by_id.assert_not_called()
+
+    def test_no_op_update_does_not_write(self):
+        """Test that a patch changing nothing short-circuits without a write."""
+        # Act
+        result = self.use_case.execute(1, UserPatchSchema(email="test@example.com"))
+
+        # Assert
+        assert result is self.user
+        self.user_repository.update_fields.assert_not_called()
+        self.hashing_service.hash.assert_not_called()
+
+    def test_patch_nonexistent_user(self):
+        """Test that patching a non-existent user raises a ValueError."""
+        # Arrange
+        self.user_repository.get_by_id_for_update.return_value = None
+
+        # Act & Assert
+        with pytest.raises(ValueError) as exc_info:
+            self.use_case.execute(999, UserPatchSchema(email="new@example.com"))
+
+        assert "User not found" in str(exc_info.value)
+        self.user_repository.update_fields.assert_not_called()
+
+
+class TestAsyncPatchUserUseCase:
+    """Unit tests for the AsyncPatchUserUseCase."""
+
+    def setup_method(self):
+        """Set up test dependencies."""
+        self.user_repository = Mock(spec=AsyncUserRepository)
+        self.hashing_service = Mock(spec=HashingService)
+        self.use_case = AsyncPatchUserUseCase(self.user_repository, self.hashing_service)
+        self.user_repository.get_by_id_for_update.return_value = User(
+            id=1,
+            username="testuser",
+            email="test@example.com",
+            password="hashed_password",
+            cpf="12345678901"
+        )
+
+    def test_password_change_is_hashed_on_the_pool(self):
+        """Test that a new password is awaited from the hashing pool and written alone."""
+        # Arrange
+        self.hashing_service.ahash.return_value = "new_hash"
+
+        # Act
+        result = asyncio.run(self.use_case.execute(1, UserPatchSchema(password="NewPassword1")))
+
+        # Assert
+        self.hashing_service.ahash.assert_awaited_once_with("NewPassword1")
+        self.user_repository.update_fields.assert_awaited_once_with(1, {"password": "new_hash"})
+        assert result.password == "new_hash"
+
+    def test_user_not_found(self):
+        """Test that patching a missing user raises ValueError."""
+        # Arrange
+        self.user_repository.get_by_id_for_update.return_value = None
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="User not found"):
+            asyncio.run(self.use_case.execute(99, UserPatchSchema(email="new@example.com")))
+        self.user_repository.update_fields.assert_not_called()
@@ -1,6 +1,7 @@
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from tech.domain.entities.users import User
+from tech.domain.security import HashingService
 from tech.interfaces.schemas.user_schema import UserSchema
 from tech.interfaces.repositories.user_repository import UserRepository
 from tech.use_cases.users.update_user_use_case import UpdateUserUseCase
@@ -12,7 +13,8 @@ class TestUpdateUserUseCase:
     def setup_method(self):
         """Set up test dependencies."""
         self.user_repository = Mock(spec=UserRepository)
-        self.use_case = UpdateUserUseCase(self.user_repository)
+        self.hashing_service = Mock(spec=HashingService)
+        self.use_case = UpdateUserUseCase(self.user_repository, self.hashing_service)
         self.user_data = UserSchema(
             username="updated_user",
             email="updated@example.com",
@@ -22,38 +24,35 @@ class TestUpdateUserUseCase:
         self.user_id = 1
 
     def test_successful_user_update(self):
-        """Test successful update of a user when the user exists."""
+        """Test that an update is written without fetching the user first."""
         # Arrange
         mock_user = Mock(spec=User)
-        self.user_repository.get_by_id.return_value = mock_user
         self.user_repository.update.return_value = mock_user
+        self.hashing_service.hash.return_value = "new_hashed_password"
 
         # Act
-        with patch("tech.use_cases.users.update_user_use_case.get_password_hash") as mock_get_hash:
-            mock_get_hash.return_value = "new_hashed_password"
-            result = self.use_case.execute(self.user_id, self.user_data)
+        result = self.use_case.execute(self.user_id, self.user_data)
 
         # Assert
-        self.user_repository.get_by_id.assert_called_once_with(self.user_id)
-
-        # Verify that user attributes were updated correctly
-        assert mock_user.username == self.user_data.username
-        assert mock_user.password == "new_hashed_password"
-        assert mock_user.email == self.user_data.email
-        assert mock_user.cpf == self.user_data.cpf
-
-        self.user_repository.update.assert_called_once_with(mock_user)
+        self.user_repository.get_by_id.assert_not_called()
+        self.hashing_service.hash.assert_called_once_with(self.user_data.password)
+
+        written = self.user_repository.update.call_args.args[0]
+        assert written.id == self.user_id
+        assert written.username == self.user_data.username
+        assert written.password == "new_hashed_password"
+        assert written.email == self.user_data.email
+        assert written.cpf == self.user_data.cpf
         assert result == mock_user
 
     def test_update_nonexistent_user(self):
-        """Test that updating a non-existent user raises a ValueError."""
+        """Test that an update matching no user raises a ValueError."""
         # Arrange
-        self.user_repository.get_by_id.return_value = None
+        self.user_repository.update.return_value = None
 
         # Act & Assert
         with pytest.raises(ValueError) as exc_info:
             self.use_case.execute(self.user_id, self.user_data)
 
         assert "User not found" in str(exc_info.value)
-        self.user_repository.get_by_id.assert_called_once_with(self.user_id)
-        self.user_repository.update.assert_not_called()
\ No newline at end of file
+        self.user_repository.get_by_id.assert_not_called()
@@ -0,0 +1,90 @@
+from unittest.mock import Mock
+from tech.domain.entities.users import User
+from tech.domain.security import HashingService
+from tech.interfaces.repositories.user_repository import UserRepository
+from tech.use_cases.users.verify_user_password_use_case import VerifyUserPasswordUseCase
+
+
+class TestVerifyUserPasswordUseCase:
+    """Unit tests for the VerifyUserPasswordUseCase."""
+
+    def setup_method(self):
+        """Set up test dependencies."""
+        self.user_repository = Mock(spec=UserRepository)
+        self.hashing_service = Mock(spec=HashingService)
+        self.use_case = VerifyUserPasswordUseCase(self.user_repository, self.hashing_service)
+        self.user = User(
+            id=1,
+            username="testuser",
+            email="test@example.com",
+            password="legacy_hash",
+            cpf="12345678901"
+        )
+
+    def test_valid_password_with_current_hash(self):
+        """Test that a current hash is not rewritten."""
+        # Arrange
+        self.user_repository.get_by_cpf.return_value = self.user
+        self.hashing_service.verify_and_update.return_value = (True, None)
+
+        # Act
+        result = self.use_case.execute("12345678901", "Password123")
+
+        # Assert
+        assert result is True
+        self.hashing_service.verify_and_update.assert_called_once_with("Password123", "legacy_hash")
+        self.user_repository.update_password.assert_not_called()
+
+    def test_valid_password_with_stale_hash_is_migrated(self):
+        """Test that a stale hash is replaced after a successful verification."""
+        # Arrange
+        self.user_repository.get_by_cpf.return_value = self.user
+        self.hashing_service.verify_and_update.return_value = (True, "current_hash")
+
+        # Act
+        result = self.use_case.execute("12345678901", "Password123")
+
+        # Assert
+        assert result is True
+        self.user_repository.update_password.assert_called_once_with(1, "legacy_hash", "current_hash")
+
+    def test_cached_user_hash_is_read_from_repository(self):
+        """Test that a user loaded without its hash is verified against the stored one."""
+        # Arrange
+        self.user.password = None
+        self.user_repository.get_by_cpf.return_value = self.user
+        self.user_repository.get_password_hash.return_value = "legacy_hash"
+        self.hashing_service.verify_and_update.return_value = (True, None)
+
+        # Act
+        result = self.use_case.execute("12345678901", "Password123")
+
+        # Assert
+        assert result is True
+        self.user_repository.get_password_hash.assert_called_once_with(1)
+        self.hashing_service.verify_and_update.assert_called_once_with("Password123", "legacy_hash")
+
+    def test_invalid_password(self):
+        """Test that a wrong password is rejected and nothing is written."""
+        # Arrange
+        self.user_repository.get_by_cpf.return_value = self.user
+        self.hashing_service.verify_and_update.return_value = (False, None)
+
+        # Act
+        result = self.use_case.execute("12345678901", "wrong")
+
+        # Assert
+        assert result is False
+        self.user_repository.update_password.assert_not_called()
+
+    def test_unknown_user(self):
+        """Test that an unknown CPF is rejected without hashing."""
+        # Arrange
+        self.user_repository.get_by_cpf.return_value = None
+
+        # Act
+        result = self.use_case.execute("99999999999", "Password123")
+
+        # Assert
+        assert result is False
+        self.hashing_service.verify_and_update.assert_not_called()